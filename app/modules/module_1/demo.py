@@ -6,7 +6,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.modules.module_1.base import ChannelStatus, UserRole
+from app.modules.module_1.base import ChannelNotFoundException, ChannelStatus, UserNotFoundException, UserRole
 from app.modules.module_1.implementations import PersonalChannel, BrandChannel, KidsChannel
 from app.modules.module_1.repository import UserRepository, ChannelRepository
 
@@ -126,19 +126,7 @@ def edit_user(repo: UserRepository):
         new_user.is_active = new_active
 
         # Kayıt ve Index Güncelleme
-        users = getattr(repo, "_UserRepository__users")
-        username_index = getattr(repo, "_UserRepository__username_index")
-        email_index = getattr(repo, "_UserRepository__email_index")
-
-        username_index.pop(u.username.lower(), None)
-        email_index.pop(u.mail.lower(), None)
-
-        users[user_id] = new_user
-        username_index[new_user.username.lower()] = new_user.user_id
-        email_index[new_user.mail.lower()] = new_user.user_id
-
-        setattr(repo, "_UserRepository__last_modified", datetime.now())
-        getattr(repo, "_save_to_file")()
+        repo.update_user(new_user)
 
         print("Kullanıcı başarıyla güncellendi.")
 
@@ -148,23 +136,11 @@ def edit_user(repo: UserRepository):
 def delete_user(repo: UserRepository):
     user_id = ask_required("User ID")
 
-    users = getattr(repo, "_UserRepository__users")
-    if user_id not in users:
+    try:
+        repo.delete_user(user_id)
+        print("Kullanıcı silindi")
+    except UserNotFoundException:
         print("Kullanıcı bulunamadı")
-        return
-
-    username_index = getattr(repo, "_UserRepository__username_index")
-    email_index = getattr(repo, "_UserRepository__email_index")
-    u = users[user_id]
-
-    username_index.pop(u.username.lower(), None)
-    email_index.pop(u.mail.lower(), None)
-    del users[user_id]
-
-    setattr(repo, "_UserRepository__last_modified", datetime.now())
-    getattr(repo, "_save_to_file")()
-
-    print("Kullanıcı silindi")
 
 
 
@@ -210,11 +186,7 @@ def edit_channel(repo: ChannelRepository):
     ch.category = ask_required(f"Category (mevcut: {getattr(ch, 'category', 'other')})")
     ch.updated_at = datetime.now()
 
-    channels = getattr(repo, "_ChannelRepository__channels")
-    channels[ch.channel_id] = ch
-
-    setattr(repo, "_ChannelRepository__last_modified", datetime.now())
-    getattr(repo, "_save_to_file")()
+    repo.update_channel(ch)
 
     print("Kanal güncellendi")
 
@@ -236,26 +208,11 @@ def change_channel_status(repo: ChannelRepository):
 def delete_channel(repo: ChannelRepository):
     channel_id = ask_required("Channel ID")
 
-    channels = getattr(repo, "_ChannelRepository__channels")
-    if channel_id not in channels:
+    try:
+        repo.delete_channel(channel_id)
+        print("Kanal silindi")
+    except ChannelNotFoundException:
         print("Kanal bulunamadı")
-        return
-
-    owner_index = getattr(repo, "_ChannelRepository__owner_index")
-    type_index = getattr(repo, "_ChannelRepository__type_index")
-    ch = channels[channel_id]
-
-    if ch.owner_id in owner_index and channel_id in owner_index[ch.owner_id]:
-        owner_index[ch.owner_id].remove(channel_id)
-    if ch.channel_type in type_index and channel_id in type_index[ch.channel_type]:
-        type_index[ch.channel_type].remove(channel_id)
-
-    del channels[channel_id]
-
-    setattr(repo, "_ChannelRepository__last_modified", datetime.now())
-    getattr(repo, "_save_to_file")()
-
-    print("Kanal silindi")
 
 
 
@@ -0,0 +1,685 @@
+import atexit
+import json
+import os
+import queue
+import re
+import tempfile
+import threading
+import weakref
+from collections.abc import MutableMapping, Sequence
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class ChangeJournal:
+    # Append-only değişiklik günlüğü (write-ahead journal)
+    # Her satır tek bir JSON kaydıdır: {"op": "put"|"del", "id": ..., "record": {...}}
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self.entry_count = 0
+        self.__handle = None
+
+    def append(self, entry: Dict[str, Any]):
+        # Tek kaydı dosyanın sonuna ekle, dosyanın geri kalanına dokunma
+        if self.__handle is None:
+            self.__handle = open(self.path, 'a', encoding='utf-8')
+        self.__handle.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self.__handle.flush()
+        if self.fsync:
+            os.fsync(self.__handle.fileno())
+        self.entry_count += 1
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        # Günlükteki kayıtları sırayla döndür; yarım kalmış son satır atlanır
+        self.entry_count = 0
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    print(f"System >> Journal satiri okunamadi, atlandi: {self.path}")
+                    continue
+                self.entry_count += 1
+                yield entry
+
+    def read_since(self, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+        # offset'ten sonra eklenmiş (başka süreçlerin yazdığı) tam satırları oku ve yeni offset'i döndür.
+        # Yarım kalmış son satır okunmaz, bir sonraki çağrıda tamamlanmış haliyle okunur
+        if not os.path.exists(self.path):
+            return [], 0
+        with open(self.path, 'rb') as file:
+            file.seek(offset)
+            data = file.read()
+        end = data.rfind(b'\n') + 1
+        entries = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                print(f"System >> Journal satiri okunamadi, atlandi: {self.path}")
+        self.entry_count += len(entries)
+        return entries, offset + end
+
+    def reset(self):
+        # Snapshot yazıldıktan sonra günlüğü boşalt
+        self.close()
+        with open(self.path, 'w', encoding='utf-8'):
+            pass
+        self.entry_count = 0
+
+    def close(self):
+        if self.__handle is not None:
+            self.__handle.close()
+            self.__handle = None
+
+    @staticmethod
+    def path_for(data_file: str) -> str:
+        return data_file + ".journal"
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_MEMBER_KEY = re.compile(r'[ \t\n\r]*"((?:[^"\\]|\\.)*)"[ \t\n\r]*:[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+class _JsonStream:
+    # Dosyayı parça parça okuyarak JSON değerlerini tek tek çözen küçük okuyucu.
+    # Tampon sadece henüz işlenmemiş kısmı tutar, bu yüzden bellek kullanımı kayıt boyutuyla sınırlıdır.
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON stream: '{char}' bekleniyordu, '{found}' bulundu")
+        self.pos += 1
+
+    def member_key(self) -> str:
+        # Hızlı yol: '"anahtar":' kalıbını tek regex ile oku; tampon sınırındaysa genel yola düş
+        match = _MEMBER_KEY.match(self.buffer, self.pos)
+        if match is not None and match.end() < len(self.buffer):
+            self.pos = match.end()
+            key = match.group(1)
+            return json.loads(f'"{key}"') if '\\' in key else key
+
+        key = self.value()
+        self.expect(':')
+        return key
+
+    def value(self) -> Any:
+        if self.pos >= len(self.buffer) or self.buffer[self.pos] in ' \t\n\r':
+            self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Değer tamponun sonunda bölünmüş olabilir, daha fazla oku ve tekrar dene
+                if self._fill():
+                    continue
+                raise
+            # Tamponun tam sonunda biten sayı yarım okunmuş olabilir
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_section(path: str, section: str, chunk_size: int = 1 << 20,
+                      opener: Callable[..., TextIO] = open) -> Iterator[Tuple[str, Any]]:
+    # {"<section>": {id: kayıt, ...}, ...} yapısındaki dosyadan kayıtları tek tek döndür.
+    # json.load gibi tüm ağacı belleğe almaz; diğer üst seviye anahtarlar okunup atlanır.
+    # opener: dosyayı metin olarak açan fonksiyon (sıkıştırılmış snapshot için gzip.open)
+    with opener(path, 'rt', encoding='utf-8') as file:
+        stream = _JsonStream(file, chunk_size)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if key == section:
+                stream.expect('{')
+                if stream.peek() != '}':
+                    while True:
+                        record_id = stream.member_key()
+                        yield record_id, stream.value()
+                        if stream.peek() != ',':
+                            break
+                        stream.pos += 1
+                stream.expect('}')
+            else:
+                stream.value()
+
+            if stream.peek() != ',':
+                break
+            stream.pos += 1
+        stream.expect('}')
+
+
+def iter_snapshot_records(path: str, section: str, stream: bool = True,
+                          opener: Callable[..., TextIO] = open) -> Iterable[Tuple[str, Any]]:
+    # stream=False: ham kayıtların zaten bellekte tutulacağı durumda (lazy mod) hızlı C ayrıştırıcısı
+    # kullanılır; ağacın kendisi son veri yapısı olduğu için ek bellek maliyeti yoktur.
+    if stream:
+        return iter_json_section(path, section, opener=opener)
+    with opener(path, 'rt', encoding='utf-8') as file:
+        return json.load(file).get(section, {}).items()
+
+
+def should_compact(journal: Optional[ChangeJournal], record_count: int,
+                   min_entries: int, ratio: float) -> bool:
+    # Günlük, snapshot boyutunun belirli bir oranını geçince sıkıştırma yapılır.
+    # Eşik kayıt sayısıyla büyüdüğü için yazma başına maliyet amortize O(1) kalır.
+    if journal is None:
+        return False
+    return journal.entry_count >= max(min_entries, int(record_count * ratio))
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    # Dosyanın değişip değişmediğini anlamak için (inode, mtime_ns, size); dosya yoksa None.
+    # atomic_write her yazmada yeni dosyayı rename ettiği için aynı saniyedeki yazmalarda da inode değişir
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class FileLock:
+    # Süreçler arası advisory kilit: <data_file>.lock dosyası üzerinde fcntl.flock.
+    # Aynı süreçteki thread'ler RLock ile sıralanır ve kilit yeniden girilebilir: iç içe çağrılar dosyayı
+    # tekrar kilitlemez, paylaşımlı kilit içinde istenen özel kilit yükseltilir.
+    # fcntl olmayan platformlarda (Windows) sadece süreç içi kilit uygulanır.
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__thread_lock = threading.RLock()
+        self.__depth = 0
+        self.__exclusive = False
+        self.__file = None
+        if fcntl is None:
+            print(f"System >> fcntl yok, {path} icin sadece surec ici kilit kullanilacak")
+
+    def exclusive(self):
+        return self.__hold(True)
+
+    def shared(self):
+        return self.__hold(False)
+
+    @contextmanager
+    def __hold(self, exclusive: bool):
+        with self.__thread_lock:
+            upgraded = False
+            if fcntl is not None and (self.__depth == 0 or (exclusive and not self.__exclusive)):
+                if self.__file is None:
+                    self.__file = open(self.path, 'a+b')
+                fcntl.flock(self.__file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                upgraded = self.__depth > 0
+            if self.__depth == 0 or upgraded:
+                self.__exclusive = exclusive
+            self.__depth += 1
+            try:
+                yield
+            finally:
+                self.__depth -= 1
+                if fcntl is not None and self.__depth == 0:
+                    fcntl.flock(self.__file.fileno(), fcntl.LOCK_UN)
+                elif upgraded:
+                    # Yükseltilen kilit dıştaki paylaşımlı bloğa geri döner
+                    fcntl.flock(self.__file.fileno(), fcntl.LOCK_SH)
+                    self.__exclusive = False
+
+    def close(self):
+        with self.__thread_lock:
+            if self.__file is not None and self.__depth == 0:
+                self.__file.close()
+                self.__file = None
+
+
+def atomic_write(path: str, write_fn: Callable[[Any], Any], binary: bool = False, fsync: bool = True):
+    # Geçici dosyaya yaz + fsync + rename: yarıda kalan yazma eski dosyayı bozmaz
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8')) as file:
+            write_fn(file)
+            file.flush()
+            if fsync:
+                os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # Rename işleminin kendisinin de diske yazıldığından emin ol (POSIX)
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def atomic_write_json(path: str, data: Dict[str, Any], indent: Optional[int] = 2, fsync: bool = True):
+    atomic_write(path, lambda file: json.dump(data, file, indent=indent, ensure_ascii=False), fsync=fsync)
+
+
+class GroupCommitter:
+    # Belirli bir zaman penceresi veya işlem sayısı içindeki değişiklikleri tek yazmada birleştirir.
+    # window=None ve max_ops=1 iken her değişiklik anında yazılır (eski davranış).
+
+    def __init__(self, flush_fn: Callable[[], None], window: Optional[float] = None, max_ops: Optional[int] = 1,
+                 guard: Optional[Callable[[], Any]] = None):
+        if window is not None and window <= 0:
+            raise ValueError("commit window must be positive")
+        if max_ops is not None and max_ops < 1:
+            raise ValueError("commit max_ops must be at least 1")
+
+        self.window = window
+        self.max_ops = max_ops
+        self.pending = 0
+        self.__flush_fn = flush_fn
+        # guard: yazmadan önce alınacak dış kilit (ör. süreçler arası dosya kilidi). Zamanlayıcı thread'i de
+        # önce onu alır; böylece kilit sırası her yerde aynıdır (önce guard, sonra committer kilidi)
+        self.__guard = guard
+        self.__lock = threading.RLock()
+        self.__timer = None
+
+        if self.enabled:
+            atexit.register(_flush_at_exit, weakref.ref(self))
+
+    @property
+    def enabled(self) -> bool:
+        return self.window is not None or (self.max_ops or 0) > 1
+
+    def record(self, durable: Optional[bool] = None):
+        # Bir değişikliği kaydet; durable=True ise bekleyenlerle birlikte hemen yaz
+        with self.__lock:
+            self.pending += 1
+            if durable or not self.enabled or (self.max_ops is not None and self.pending >= self.max_ops):
+                self.flush()
+            elif self.window is not None and self.__timer is None:
+                self.__timer = threading.Timer(self.window, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def flush(self):
+        # Bekleyen değişiklikleri tek atomik yazmayla diske aktar (bekleyen yoksa dış kilit de alınmaz)
+        if not self.pending and self.__timer is None:
+            return
+        with self.__guard() if self.__guard is not None else nullcontext(), self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.pending:
+                return
+            self.__flush_fn()
+            self.pending = 0
+
+
+def _flush_at_exit(committer_ref):
+    committer = committer_ref()
+    if committer is not None:
+        try:
+            committer.flush()
+        except Exception as e:
+            print(f"System >> Cikista bekleyen degisiklikler yazilamadi: {e}")
+
+
+class WriteBehindQueue:
+    # Write-behind: değişiklik bellekte uygulanınca kaydın id'si sınırlı bir kuyruğa alınır ve çağıran hemen döner.
+    # Arka plan thread'i kuyruğu write_fn(id listesi) ile kalıcı katmana yazar. Aynı kayda art arda yapılan
+    # değişiklikler kuyrukta tek girdi olarak birleşir; bir yazma o ana kadar biriken tüm id'leri kapsar.
+    # Kuyruk doluyken (backpressure):
+    #   "block": yer açılana kadar bekle (block_timeout dolarsa queue.Full)
+    #   "sync" : çağıran thread bekleyenleri kendisi yazar
+    #   "error": hemen queue.Full
+    # Yazma hata verirse id'ler kuyruğa geri konur ve retry_interval sonra tekrar denenir.
+    BACKPRESSURE_POLICIES = ("block", "sync", "error")
+
+    def __init__(self, write_fn: Callable[[List[str]], None], max_pending: int = 10000,
+                 backpressure: str = "block", block_timeout: Optional[float] = None, linger: float = 0.0,
+                 retry_interval: float = 1.0, guard: Optional[Callable[[], Any]] = None,
+                 name: str = "write-behind"):
+        if max_pending < 1:
+            raise ValueError("write-behind max_pending must be at least 1")
+        if backpressure not in self.BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{backpressure}', "
+                             f"expected one of {list(self.BACKPRESSURE_POLICIES)}")
+
+        self.max_pending = max_pending
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.linger = linger  # ilk değişiklikten sonra daha fazlasını toplamak için bekleme (saniye)
+        self.retry_interval = retry_interval
+        self.writes = 0  # yapılan toplu yazma sayısı
+        self.last_error = None
+        self.__write_fn = write_fn
+        # guard: yazmadan önce alınacak dış kilit (süreçler arası dosya kilidi), kilit sırası GroupCommitter ile aynı
+        self.__guard = guard
+        self.__pending = {}  # insertion-ordered set: yazılmayı bekleyen id'ler
+        self.__in_flight = 0
+        self.__submitted = 0  # submit sıra numarası
+        self.__written = 0  # başarıyla yazılan en son sıra numarası
+        self.__failures = 0
+        self.__urgent = 0  # bekleyen flush() çağrıları: linger/retry beklemesi kısa kesilir
+        self.__closed = False
+        self.__cond = threading.Condition()
+        self.__write_lock = threading.Lock()
+
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+        self.__thread.start()
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    @property
+    def pending(self) -> int:
+        return len(self.__pending) + self.__in_flight
+
+    def submit(self, record_ids: Iterable[str]):
+        caller_runs = False
+        with self.__cond:
+            if self.__closed:
+                raise RuntimeError("write-behind queue is closed")
+            new = [record_id for record_id in record_ids if record_id not in self.__pending]
+            if new and len(self.__pending) + len(new) > self.max_pending:
+                if self.backpressure == "error":
+                    raise queue.Full(f"write-behind queue is full ({self.max_pending} pending records)")
+                if self.backpressure == "sync":
+                    caller_runs = True
+                # Tek seferde sınırdan büyük gönderim (toplu ekleme) kuyruk boşalınca kabul edilir
+                elif not self.__cond.wait_for(
+                        lambda: len(self.__pending) + len(new) <= self.max_pending or not self.__pending,
+                        timeout=self.block_timeout):
+                    raise queue.Full(f"write-behind queue is full ({self.max_pending} pending records)")
+
+            self.__pending.update(dict.fromkeys(new))
+            self.__submitted += 1
+            self.__cond.notify_all()
+
+        if caller_runs:
+            self.drain()
+
+    def drain(self) -> bool:
+        # Bekleyenleri çağıran thread'de hemen yaz (durable yazma ve "sync" backpressure için)
+        with self.__guard() if self.__guard is not None else nullcontext(), self.__write_lock:
+            with self.__cond:
+                batch = list(self.__pending)
+                target = self.__submitted
+                self.__pending = {}
+                self.__in_flight = len(batch)
+            try:
+                if batch:
+                    self.__write_fn(batch)
+                    self.writes += 1
+            except Exception as e:
+                self.last_error = e
+                print(f"System >> Arka plan yazmasi basarisiz, tekrar denenecek: {e}")
+                with self.__cond:
+                    # Yazılamayan id'ler sıranın başına geri konur
+                    self.__pending = {**dict.fromkeys(batch), **self.__pending}
+                    self.__failures += 1
+                return False
+            finally:
+                with self.__cond:
+                    self.__in_flight = 0
+                    self.__cond.notify_all()
+
+            with self.__cond:
+                self.__written = max(self.__written, target)
+                self.__cond.notify_all()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # Bu çağrıya kadar kuyruğa alınan değişiklikler yazılana kadar bekle; timeout dolarsa False döner.
+        # Beklerken arka plan yazması hata verirse hata burada yükseltilir
+        if not self.__thread.is_alive():
+            return self.drain()
+        with self.__cond:
+            target = self.__submitted
+            failures = self.__failures
+            self.__urgent += 1
+            self.__cond.notify_all()
+            try:
+                done = self.__cond.wait_for(lambda: self.__written >= target or self.__failures != failures,
+                                            timeout=timeout)
+            finally:
+                self.__urgent -= 1
+            if self.__written < target and self.__failures != failures:
+                raise self.last_error
+            return done
+
+    def close(self, timeout: Optional[float] = None):
+        # Kuyruğu kapat, bekleyenleri yaz ve thread'i durdur
+        with self.__cond:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__cond.notify_all()
+        self.__thread.join(timeout)
+        if self.__pending:
+            self.drain()
+
+    def __run(self):
+        while True:
+            with self.__cond:
+                self.__cond.wait_for(lambda: self.__pending or self.__closed)
+                if not self.__pending:
+                    return
+                if self.linger and not self.__closed:
+                    self.__cond.wait_for(lambda: self.__urgent or self.__closed, timeout=self.linger)
+
+            if not self.drain():
+                with self.__cond:
+                    if self.__closed:
+                        return  # çıkışta son deneme close() içinde çağıran thread'de yapılır
+                    self.__cond.wait_for(lambda: self.__closed, timeout=self.retry_interval)
+
+
+def _close_at_exit(queue_ref):
+    write_queue = queue_ref()
+    if write_queue is not None:
+        try:
+            write_queue.close()
+        except Exception as e:
+            print(f"System >> Cikista bekleyen degisiklikler yazilamadi: {e}")
+
+
+_MISSING = object()
+
+
+class UnitOfWork:
+    # batch() bloğu boyunca yapılan bellek içi değişikliklerin kaydı.
+    # Blok başarısız olursa kayıtlı geri alma adımları ters sırayla çalıştırılır.
+
+    def __init__(self):
+        self.created = []  # blokta eklenen kayıtlar + ekleme öncesi çakışan değerler
+        self.changed_ids = {}  # insertion-ordered set: bloktaki değişen kayıt id'leri
+        self.__undo = []
+
+    def track(self, mapping: Dict[Any, Any], key: Any) -> Any:
+        # mapping[key] değerini geri alınabilir yap, eski değeri (yoksa None) döndür
+        previous = mapping.get(key, _MISSING)
+
+        def undo():
+            if previous is _MISSING:
+                mapping.pop(key, None)
+            else:
+                mapping[key] = previous
+
+        self.__undo.append(undo)
+        return None if previous is _MISSING else previous
+
+    def track_attrs(self, obj: Any, *names: str):
+        # Nesne alanlarının mevcut değerlerini sakla, geri almada aynen yaz
+        values = {name: getattr(obj, name) for name in names}
+
+        def undo():
+            for name, value in values.items():
+                setattr(obj, name, value)
+
+        self.__undo.append(undo)
+
+    def on_rollback(self, fn: Callable[[], None]):
+        self.__undo.append(fn)
+
+    def mark_changed(self, record_id: str):
+        self.changed_ids[record_id] = None
+
+    def rollback(self):
+        while self.__undo:
+            self.__undo.pop()()
+
+
+class FragmentCache:
+    # record_id -> snapshot'a yazılmış haliyle kodlanmış kayıt parçası (JSON metni).
+    # Kayıt kaydı sırasında sadece kirli işaretlenen (veya önbellekte olmayan) kayıtlar yeniden kodlanır,
+    # diğerlerinin parçası olduğu gibi tekrar kullanılır. Kayıtları dışarıdan değiştiren kod mark_dirty çağırmalı.
+
+    def __init__(self, encode: Callable[[str, Any], str]):
+        self.__encode = encode
+        self.__fragments = {}
+        self.__epoch = 0  # her işaretlemede artar; kodlama sırasında değişen kayıt önbelleğe yazılmaz
+        self.encoded = 0  # toplam yeniden kodlanan kayıt sayısı (ölçüm ve testler için)
+
+    def __len__(self) -> int:
+        return len(self.__fragments)
+
+    def mark_dirty(self, record_id: str):
+        self.__fragments.pop(record_id, None)
+        self.__epoch += 1
+
+    def clear(self):
+        self.__fragments = {}
+        self.__epoch += 1
+
+    def render(self, items: Iterable[Tuple[str, Any]]) -> list:
+        # items: (record_id, saklanan kayıt) çiftleri; kayıt sırasıyla parçaları döndürür
+        fragments = self.__fragments
+        result = []
+        append = result.append
+        for record_id, stored in items:
+            fragment = fragments.get(record_id)
+            if fragment is None:
+                epoch = self.__epoch
+                fragment = self.__encode(record_id, stored)
+                self.encoded += 1
+                if epoch == self.__epoch:
+                    fragments[record_id] = fragment
+            append(fragment)
+        return result
+
+
+class LazyRecordMap(MutableMapping):
+    # id -> domain nesnesi eşlemesi. Dosyadan gelen kayıtlar ilk erişime kadar ham dict olarak tutulur,
+    # nesne ilk erişimde factory ile kurulur ve yerine yazılır (sonraki erişimler önbellekten).
+
+    def __init__(self, factory: Callable[[Dict[str, Any]], Any]):
+        self.__factory = factory
+        self.__data = {}
+
+    def put_raw(self, key: str, record: Dict[str, Any]):
+        self.__data[key] = record
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        # Değeri materialize etmeden döndür (ham dict veya nesne)
+        return self.__data.get(key, default)
+
+    def raw_items(self) -> Iterable[Tuple[str, Any]]:
+        return self.__data.items()
+
+    def materialized_count(self) -> int:
+        return sum(1 for value in self.__data.values() if type(value) is not dict)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.__data[key]
+        if type(value) is dict:
+            value = self.__factory(value)
+            if value is None:
+                # Bozuk kayıt: sessizce tutmak yerine eşlemeden çıkar
+                del self.__data[key]
+                raise KeyError(key)
+            self.__data[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        self.__data[key] = value
+
+    def __delitem__(self, key: str):
+        del self.__data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__data)
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+
+class LazySequence(Sequence):
+    # get_all_* için salt okunur görünüm: elemanlar sadece erişildiklerinde materialize edilir
+
+    def __init__(self, records: LazyRecordMap):
+        self.__records = records
+        self.__keys = list(records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.__records[key] for key in self.__keys[index]]
+        return self.__records[self.__keys[index]]
+
+    def __iter__(self):
+        for key in self.__keys:
+            yield self.__records[key]
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __repr__(self) -> str:
+        return f"<LazySequence {len(self.__keys)} records>"
+
+
+def iter_stored(records: Any) -> Iterable[Tuple[str, Any]]:
+    # (id, değer) çiftleri; lazy modda henüz kurulmamış kayıtlar ham dict olarak döner
+    if isinstance(records, LazyRecordMap):
+        return records.raw_items()
+    return records.items()
@@ -0,0 +1,266 @@
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .persistence import ChangeJournal, FileLock, atomic_write, atomic_write_json, file_signature
+from .repository import ChannelRepository, UserRepository
+
+REPLICA_STATE_FILE = "replication.json"
+_DATA_FILES = ("users.json", "channels.json")
+_SKIPPED_SUFFIXES = (".lock", ".tmp", ".pre-shard")
+
+
+class LogShippingReplica:
+    # Modül 1 data dizininin (users.json/channels.json, shard dizinleri ve journal) ikinci bir dizine
+    # log shipping ile kopyalanması. Her sync() çağrısında sadece değişen dosyalar taşınır; journal'a
+    # eklenen satırlar dosyanın sonuna eklenerek (baştan kopyalanmadan) taşınır. Replica dizinindeki
+    # read-only repository'ler okurken shared moddaki gibi sadece değişen kayıtları yükler, böylece
+    # rapor/dashboard süreçleri primary'deki yazan süreçle kilit paylaşmaz.
+    #   primary: veri dosyasının kilidi (<data_file>.lock) kopyalama boyunca okuyucu olarak tutulur,
+    #            yani snapshot + journal veya shard'lar + manifest yarım bir yazmanın ortasında taşınmaz
+    #   replica: kopyalar aynı kilit düzeniyle yazma kilidi altında yapılır, okuyucular yarım durumu görmez
+    # Taşınan dosyaların imzaları replica dizinindeki replication.json'a yazılır; süreç yeniden
+    # başlatıldığında kaldığı yerden devam eder. promote() sonrası replica primary olarak kullanılır.
+
+    def __init__(self, primary_dir: str, replica_dir: str, fsync: bool = True):
+        if os.path.abspath(primary_dir) == os.path.abspath(replica_dir):
+            raise ValueError("replica directory must be different from the primary directory")
+
+        self.primary_dir = primary_dir
+        self.replica_dir = replica_dir
+        self.fsync = fsync
+        self.last_error = None
+        self.shipped_bytes = 0  # bu süreçte taşınan toplam bayt
+        self.__state_path = os.path.join(replica_dir, REPLICA_STATE_FILE)
+        self.__shipped = {}  # primary'ye göre göreli yol -> taşındığı andaki file_signature
+        self.__last_sync = None
+        self.__promoted = False
+        self.__sync_lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__repositories = []  # open_repositories ile açılan read-only repository'ler
+
+        os.makedirs(replica_dir, exist_ok=True)
+        self._load_state()
+
+    @property
+    def promoted(self) -> bool:
+        return self.__promoted
+
+    def _load_state(self):
+        if not os.path.exists(self.__state_path):
+            return
+        with open(self.__state_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)['replication']
+        self.__promoted = state.get('promoted', False)
+        if state.get('last_sync'):
+            self.__last_sync = datetime.fromisoformat(state['last_sync'])
+        if os.path.abspath(state.get('primary_dir', '')) == os.path.abspath(self.primary_dir):
+            self.__shipped = {path: tuple(signature) for path, signature in state.get('files', {}).items()}
+        else:
+            print(f"System >> Replica farkli bir primary'den kopyalanmis, tum dosyalar yeniden tasinacak")
+
+    def _save_state(self):
+        atomic_write_json(self.__state_path, {'replication': {
+            'primary_dir': os.path.abspath(self.primary_dir),
+            'promoted': self.__promoted,
+            'last_sync': self.__last_sync.isoformat() if self.__last_sync else None,
+            'files': {path: list(signature) for path, signature in sorted(self.__shipped.items())},
+        }}, fsync=self.fsync)
+
+    def _data_paths(self, data_file: str) -> List[str]:
+        # Bir veri dosyasına ait, primary'de mevcut dosyaların göreli yolları (snapshot, journal, shard'lar)
+        paths = [data_file, os.path.basename(ChangeJournal.path_for(data_file))]
+        shard_dir = os.path.splitext(data_file)[0] + ".shards"
+        if os.path.isdir(os.path.join(self.primary_dir, shard_dir)):
+            paths.extend(os.path.join(shard_dir, name)
+                         for name in sorted(os.listdir(os.path.join(self.primary_dir, shard_dir))))
+        return [path for path in paths
+                if not path.endswith(_SKIPPED_SUFFIXES) and os.path.isfile(os.path.join(self.primary_dir, path))]
+
+    def _scan(self, data_file: str) -> Dict[str, Tuple[int, int, int]]:
+        return {path: file_signature(os.path.join(self.primary_dir, path)) for path in self._data_paths(data_file)}
+
+    def _shipped_for(self, data_file: str) -> Dict[str, Tuple[int, int, int]]:
+        shard_dir = os.path.splitext(data_file)[0] + ".shards" + os.sep
+        journal = os.path.basename(ChangeJournal.path_for(data_file))
+        return {path: signature for path, signature in self.__shipped.items()
+                if path in (data_file, journal) or path.startswith(shard_dir)}
+
+    def sync(self) -> int:
+        # Primary'deki değişiklikleri replica dizinine taşı; taşınan (kopyalanan/eklenen/silinen) dosya sayısını döndür
+        with self.__sync_lock:
+            if self.__promoted:
+                raise RuntimeError("replica has been promoted to primary, log shipping is stopped")
+            if not os.path.isdir(self.primary_dir):
+                raise FileNotFoundError(f"Primary data directory not found: {self.primary_dir}")
+
+            shipped = 0
+            for data_file in _DATA_FILES:
+                shipped += self._ship(data_file)
+            self.__last_sync = datetime.now()
+            if shipped:
+                self._save_state()
+            return shipped
+
+    def _ship(self, data_file: str) -> int:
+        primary_lock = FileLock(os.path.join(self.primary_dir, data_file + ".lock"))
+        replica_lock = FileLock(os.path.join(self.replica_dir, data_file + ".lock"))
+        try:
+            with primary_lock.shared():
+                current = self._scan(data_file)
+                previous = self._shipped_for(data_file)
+                changed = [path for path in current if current[path] != previous.get(path)]
+                removed = [path for path in previous if path not in current]
+                if not changed and not removed:
+                    return 0
+
+                journal = os.path.basename(ChangeJournal.path_for(data_file))
+                # Snapshot aynı kaldıysa journal'ın sadece yeni satırları eklenir; snapshot değiştiyse
+                # (primary sıkıştırdı) journal baştan kopyalanır
+                snapshot_changed = any(path != journal for path in changed + removed)
+                with replica_lock.exclusive():
+                    for path in changed:
+                        if path == journal and not snapshot_changed and self._append_tail(path, previous.get(path),
+                                                                                          current[path]):
+                            continue
+                        self._copy(path)
+                    for path in removed:
+                        replica_path = os.path.join(self.replica_dir, path)
+                        if os.path.exists(replica_path):
+                            os.remove(replica_path)
+                        self.__shipped.pop(path, None)
+                    for path in changed:
+                        self.__shipped[path] = current[path]
+                return len(changed) + len(removed)
+        finally:
+            primary_lock.close()
+            replica_lock.close()
+
+    def _copy(self, path: str):
+        source = os.path.join(self.primary_dir, path)
+        target = os.path.join(self.replica_dir, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(source, 'rb') as file:
+            atomic_write(target, lambda out: shutil.copyfileobj(file, out), binary=True, fsync=self.fsync)
+        self.shipped_bytes += os.path.getsize(target)
+
+    def _append_tail(self, path: str, old: Optional[Tuple[int, int, int]], new: Tuple[int, int, int]) -> bool:
+        # Aynı journal dosyası büyüdüyse ve replica'daki kopya taşınan boyuttaysa sadece yeni baytları ekle
+        target = os.path.join(self.replica_dir, path)
+        if old is None or old[0] != new[0] or new[2] < old[2] or file_signature(target) is None:
+            return False
+        if os.path.getsize(target) != old[2]:
+            return False
+        with open(os.path.join(self.primary_dir, path), 'rb') as source, open(target, 'ab') as out:
+            source.seek(old[2])
+            tail = source.read(new[2] - old[2])
+            out.write(tail)
+            out.flush()
+            if self.fsync:
+                os.fsync(out.fileno())
+        self.shipped_bytes += len(tail)
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        # Replikasyon gecikmesi: primary'de henüz taşınmamış dosyalar, bayt farkı ve en eski taşınmamış
+        # değişikliğin yaşı (saniye). Primary'ye sadece stat çağrısı yapılır.
+        pending_files = 0
+        pending_bytes = 0
+        oldest_change = None
+        if not self.__promoted and os.path.isdir(self.primary_dir):
+            for data_file in _DATA_FILES:
+                current = self._scan(data_file)
+                previous = self._shipped_for(data_file)
+                for path in set(current) | set(previous):
+                    signature, shipped = current.get(path), previous.get(path)
+                    if signature == shipped:
+                        continue
+                    pending_files += 1
+                    if signature is None:
+                        continue
+                    same_file = shipped is not None and shipped[0] == signature[0] and signature[2] >= shipped[2]
+                    pending_bytes += signature[2] - shipped[2] if same_file else signature[2]
+                    changed_at = signature[1] / 1e9
+                    oldest_change = changed_at if oldest_change is None else min(oldest_change, changed_at)
+
+        lag_seconds = max(0.0, time.time() - oldest_change) if oldest_change is not None else 0.0
+        return {
+            'in_sync': pending_files == 0,
+            'lag_seconds': lag_seconds,
+            'pending_files': pending_files,
+            'pending_bytes': pending_bytes,
+            'last_sync': self.__last_sync.isoformat() if self.__last_sync else None,
+            'shipped_bytes': self.shipped_bytes,
+            'promoted': self.__promoted,
+        }
+
+    def start(self, interval: float = 1.0):
+        # interval saniyede bir sync() çalıştıran arka plan thread'ini başlat
+        if interval <= 0:
+            raise ValueError("replication interval must be positive")
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, args=(interval,), name="log-shipping", daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __run(self, interval: float):
+        while not self.__stop.is_set():
+            try:
+                self.sync()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+                print(f"System >> Log shipping basarisiz, tekrar denenecek: {e}")
+            self.__stop.wait(interval)
+
+    def open_repositories(self, **options) -> Tuple[UserRepository, ChannelRepository]:
+        # Replica dizinindeki (user_repo, channel_repo) çifti. Yükseltilmemiş replica'da repository'ler
+        # read-only'dir; shard düzeni ve journal primary'den taşınan dosyalardan bulunur.
+        users_file = os.path.join(self.replica_dir, "users.json")
+        channels_file = os.path.join(self.replica_dir, "channels.json")
+        read_only = not self.__promoted
+        journal = options.pop('journal', os.path.exists(ChangeJournal.path_for(users_file)))
+        user_repo = UserRepository(users_file, journal=journal, shards=self._shard_count(users_file),
+                                   shared=True, read_only=read_only, **options)
+        channel_repo = ChannelRepository(channels_file, shards=self._shard_count(channels_file),
+                                         shared=True, read_only=read_only, **options)
+        if read_only:
+            self.__repositories.extend([user_repo, channel_repo])
+        return user_repo, channel_repo
+
+    @staticmethod
+    def _shard_count(data_file: str) -> Optional[int]:
+        manifest_path = os.path.join(os.path.splitext(data_file)[0] + ".shards", "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            return int(json.load(file)['manifest']['shard_count'])
+
+    def promote(self):
+        # Replica'yı primary yap: log shipping durur, primary erişilebiliyorsa son değişiklikler taşınır,
+        # bu replica'dan açılmış repository'ler yazılabilir olur
+        self.stop()
+        if not self.__promoted and os.path.isdir(self.primary_dir):
+            try:
+                self.sync()
+            except OSError as e:
+                print(f"System >> Yukseltme oncesi son senkronizasyon yapilamadi: {e}")
+        with self.__sync_lock:
+            self.__promoted = True
+            self._save_state()
+        for repo in self.__repositories:
+            repo.promote()
+        self.__repositories = []
+        print(f"System >> Replica primary olarak yukseltildi: {self.replica_dir}")
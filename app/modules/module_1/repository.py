@@ -1,8 +1,9 @@
 # commit 5
-import json
+import functools
 import os
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from .base import (
     AdminUser,
@@ -22,49 +23,155 @@ from .base import (
     ViewerUser,
 )
 from .implementations import BrandChannel, KidsChannel, PersonalChannel
+from .persistence import (
+    ChangeJournal,
+    FileLock,
+    FragmentCache,
+    GroupCommitter,
+    LazyRecordMap,
+    LazySequence,
+    UnitOfWork,
+    WriteBehindQueue,
+    file_signature,
+    iter_stored,
+    should_compact,
+)
+from .sharding import ShardedSnapshot
+from .snapshot_codecs import as_datetime, get_codec, read_snapshot
+
+
+# Kategori anahtarı: casefold + Türkçe ı/İ birleştirmesi. casefold tek başına "İ"yi "i" + birleşik nokta
+# (U+0307) yapar ve "ı"yı "i"den ayrı tutar; nokta atılıp ı -> i çevrilince "Müzik", "MÜZİK", "müzik" aynı,
+# casefold sayesinde de "Straße" ile "STRASSE" aynı anahtara düşer. JSON ve sqlite backend'leri bunu kullanır.
+_CATEGORY_FOLD = str.maketrans({"\u0131": "i", "\u0307": None})
+
+
+def category_key(category: str) -> str:
+    return category.casefold().translate(_CATEGORY_FOLD)
+
+
+def _writes(method):
+    # Shared modda metot süreçler arası yazma kilidi altında, diskteki son durum uygulandıktan sonra çalışır
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._exclusive():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _reads(method):
+    # Shared modda okumadan önce başka süreçlerin değişiklikleri uygulanır (dosyalar değişmediyse sadece stat)
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.refresh()
+        return method(self, *args, **kwargs)
+    return wrapper
 
 
 class UserRepository:
     # Kullanıcı veri erişim sınıfı - kullanıcı CRUD işlemleri için
 
-    def __init__(self, data_file: str = "users.json"):
+    def __init__(self, data_file: str = "users.json", journal: bool = False,
+                 compact_min_entries: int = 1000, compact_ratio: float = 0.5, lazy: bool = False,
+                 codec: str = "json", shards: Optional[int] = None, shared: bool = False,
+                 write_behind: bool = False, max_pending: int = 10000, backpressure: str = "block",
+                 read_only: bool = False):
         print(f"System >> Baslatildi UserRepository veri dosyalariyla: {data_file}")
 
         self.__data_file = data_file  # Private attribute
-        self.__users = {}  # Private attribute - user_id -> BaseUser
+        # Snapshot formatı: "json" (girintili JSON) veya "binary" (indeksleri de saklayan sütun bazlı format).
+        # Okurken format dosyanın başından tanınır, codec sadece yazma formatını belirler.
+        self.__codec = get_codec(codec)
+        # JSON codec'inde her kaydın kodlanmış hali saklanır, kayıtta sadece değişen kayıtlar yeniden kodlanır
+        self.__fragments = (FragmentCache(self._encode_user_fragment)
+                            if getattr(self.__codec, 'supports_fragments', False) else None)
+        # Lazy modda kayıtlar ham dict olarak tutulur, BaseUser ilk erişimde kurulur
+        self.__lazy = lazy
+        self.__users = self._new_user_map()  # Private attribute - user_id -> BaseUser
         self.__username_index = {}  # Private attribute - username -> user_id
         self.__email_index = {}  # Private attribute - email -> user_id
+        # user_id -> (username, email) anahtarları: nesne yerinde değiştirilse de eski anahtarlar bulunur
+        self.__indexed = {}
         self.__last_modified = datetime.now()  # Private attribute
 
-        # Dosya varsa yükle
-        if os.path.exists(self.__data_file):
-            self._load_from_file()
-        else:
-            print(f"System >> Veri dosyasi {data_file} boş repodan başlayarak mevcut değil")
-            self._initialize_empty_repository()
+        # Journal modu: her değişiklik users.json.journal dosyasına tek satır olarak eklenir,
+        # users.json sadece sıkıştırma (compact) sırasında yeniden yazılır
+        self.__journal = ChangeJournal(ChangeJournal.path_for(data_file)) if journal else None
+        self.__compact_min_entries = compact_min_entries
+        self.__compact_ratio = compact_ratio
+        self.__batch = None  # Private attribute - aktif batch() bloğunun UnitOfWork kaydı
+        # Shard modu: kayıtlar user_id hash'ine göre N dosyaya bölünür, değişiklikte sadece ilgili shard yazılır
+        self.__shards = ShardedSnapshot(data_file, 'users', shards, self.__codec) if shards else None
+        # Shared mod: aynı veri dosyalarını kullanan birden fazla süreç için. Yazmalar <data_file>.lock üzerinde
+        # süreçler arası kilitle yapılır, okumalar izlenen dosyalar değiştiyse sadece farkları yeniden yükler
+        # Read-only mod (replica): dosyaları başka bir süreç (log shipping) günceller, okumalar shared moddaki
+        # gibi değişiklikleri yükler, yazma metotları PermissionError verir
+        self.__read_only = read_only
+        shared = shared or read_only
+        self.__lock = FileLock(data_file + ".lock") if shared else None
+        self.__disk_state = {}  # izlenen dosya -> file_signature (bu sürecin son gördüğü/yazdığı hal)
+        self.__pending = set()  # shared modda değişmiş ama henüz diske yazılmamış kayıtlar
+        self.__writer = None  # Private attribute - write-behind kuyruğu
+
+        with self._open_lock(shared):
+            # Dosya varsa yükle
+            if (os.path.exists(self.__data_file) or (journal and os.path.exists(self.__journal.path))
+                    or (self.__shards is not None and self.__shards.exists())):
+                self._load_from_file()
+            else:
+                print(f"System >> Veri dosyasi {data_file} boş repodan başlayarak mevcut değil")
+                self._initialize_empty_repository()
+
+            if self.__shards is not None and not read_only:
+                self._finish_shard_migration()
+
+            if shared:
+                self.__pending.clear()
+                self.__disk_state = self._disk_state()
+
+        if write_behind:
+            self.__writer = self._create_writer(self._write_users, max_pending, backpressure, shared)
 
         print(f"System >> UserRepository baslatildi birlikte {len(self.__users)} users")
 
+    def _new_user_map(self):
+        return LazyRecordMap(self._deserialize_user) if self.__lazy else {}
+
     def _initialize_empty_repository(self):
         # Boş repository başlat
-        self.__users = {}
+        self.__users = self._new_user_map()
         self.__username_index = {}
         self.__email_index = {}
+        self.__indexed = {}
         self.__last_modified = datetime.now()
         print(f"System >> Bos repository baslatildi")
 
     def _load_from_file(self):
-        # Dosyadan kullanıcıları yükle
+        # Dosyadan kullanıcıları yükle (journal modunda snapshot + günlük)
         try:
-            with open(self.__data_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-
-            users_data = data.get('users', {})
-            for user_id, user_data in users_data.items():
-                user = self._deserialize_user(user_data)
-                if user:
-                    self.__users[user_id] = user
-                    self._update_indexes(user)
+            if self.__shards is not None and self.__shards.exists():
+                for user_id, user_data in self.__shards.load():
+                    self._load_record(user_id, user_data)
+            elif os.path.exists(self.__data_file):
+                # Kayıtlar dosyadan tek tek okunur ve indekslenir (eager modda tüm JSON ağacı bellekte tutulmaz)
+                records, indexes = read_snapshot(self.__data_file, 'users', stream=not self.__lazy)
+                if indexes and 'username' in indexes and 'email' in indexes:
+                    # Binary snapshot indeksleri hazır getirir, kayıt başına yeniden türetilmez
+                    self.__username_index = indexes['username']
+                    self.__email_index = indexes['email']
+                    loaded = [self._load_record(user_id, user_data, index=False) for user_id, user_data in records]
+                    if not all(loaded):
+                        self._rebuild_indexes()
+                    else:
+                        emails = {user_id: email_key for email_key, user_id in self.__email_index.items()}
+                        self.__indexed = {user_id: (username_key, emails.get(user_id))
+                                          for username_key, user_id in self.__username_index.items()}
+                else:
+                    for user_id, user_data in records:
+                        self._load_record(user_id, user_data)
+
+            if self.__journal is not None:
+                self._replay_journal()
 
             print(f"System >> Yuklendi (basarili) {len(self.__users)} kullanici dosyadan")
 
@@ -72,17 +179,202 @@ class UserRepository:
             print(f"System >> Dosyadan yükleme hatası: {e}")
             self._initialize_empty_repository()
 
-    def _save_to_file(self):
-        # Kullanıcıları dosyaya kaydet
-        try:
-            users_data = {user_id: self._serialize_user(user) for user_id, user in self.__users.items()}
-            data = {
-                'users': users_data,
-                'metadata': {'last_modified': self.__last_modified.isoformat(), 'total_users': len(self.__users)}
-            }
+    def _finish_shard_migration(self):
+        # Tek dosyadan shard düzenine geçiş (veya shard sayısı değişikliği) açılışta tamamlanır
+        if self.__shards.exists() and not self.__shards.dirty_count:
+            return
+        if not self.__shards.exists() and not self.__users:
+            return
+        print(f"System >> Kullanicilar {self.__shards.shard_count} shard dosyasina dagitiliyor")
+        self._save_to_file(changed_only=self.__shards.exists())
+        if os.path.exists(self.__data_file):
+            # Eski tek dosya artık okunmuyor; yedek olarak adı değiştirilerek saklanır
+            os.replace(self.__data_file, self.__data_file + ".pre-shard")
+
+    def _save_changes(self):
+        # Değişiklikleri yaz: shard modunda sadece kirli shard'lar, değilse tüm dosya
+        self._save_to_file(changed_only=True)
+
+    def mark_dirty(self, user_id: str):
+        # Kaydı değişmiş işaretle: bir sonraki kayıtta yeniden kodlanır (shard modunda shard'ı da yazılır).
+        # Kullanıcı nesnesini repository metotları dışında değiştiren kod bunu çağırmalı.
+        if self.__fragments is not None:
+            self.__fragments.mark_dirty(user_id)
+        if self.__shards is not None:
+            self.__shards.track(user_id)
+        if self.__lock is not None:
+            self.__pending.add(user_id)
+
+    def _open_lock(self, shared: bool):
+        # Açılıştaki yükleme: shared modda yazma kilidiyle, read-only modda okuyucu kilidiyle
+        if not shared:
+            return nullcontext()
+        return self.__lock.shared() if self.__read_only else self.__lock.exclusive()
+
+    def _exclusive(self):
+        if self.__read_only:
+            raise PermissionError(f"{self.__data_file} is opened read-only")
+        if self.__lock is None:
+            return nullcontext()
+        return self._locked_write()
+
+    @property
+    def read_only(self) -> bool:
+        return self.__read_only
+
+    def promote(self):
+        # Replica yükseltildiğinde repository yazılabilir hale gelir (shared modda kalır)
+        self.refresh()
+        self.__read_only = False
+
+    @contextmanager
+    def _locked_write(self):
+        with self.__lock.exclusive():
+            self._refresh_locked()
+            try:
+                yield
+            finally:
+                # Kilit tutulduğu sürece başka süreç yazamaz: dosyaların şimdiki hali bu sürecin gördüğü haldir
+                self.__disk_state = self._disk_state()
+
+    def _disk_state(self) -> Dict[str, Any]:
+        paths = self.__shards.watched_paths() if self.__shards is not None else [self.__data_file]
+        if self.__journal is not None:
+            paths.append(self.__journal.path)
+        return {path: file_signature(path) for path in paths}
+
+    def refresh(self) -> bool:
+        # Shared modda başka süreçlerin yaptığı değişiklikleri uygula; bir şey değiştiyse True döner.
+        # İzlenen dosyalar değişmediyse maliyet birkaç stat çağrısıdır; değiştiyse sadece değişen
+        # shard'lar ve journal'ın yeni satırları okunur, sadece farklı olan kayıtlar uygulanır.
+        if self.__lock is None or self._disk_state() == self.__disk_state:
+            return False
+        # Okuma sırasında yarım bir yazma (shard'lar + manifest, snapshot + journal) görülmesin
+        with self.__lock.shared():
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
+        state = self._disk_state()
+        previous = self.__disk_state
+        if state == previous:
+            return False
 
-            with open(self.__data_file, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+        journal_path = self.__journal.path if self.__journal is not None else None
+        changed = [path for path in state if path != journal_path and state[path] != previous.get(path)]
+        applied = 0
+        if changed:
+            if self.__shards is None:
+                # Dosya yoksa (ör. başka süreç shard düzenine geçti) kayıtlar silinmiş sayılmaz
+                if state[self.__data_file] is not None:
+                    applied += self._apply_disk_records(read_snapshot(self.__data_file, 'users')[0],
+                                                        list(self.__users))
+            elif self.__shards.manifest_path in changed:
+                # Düzen değişmiş (başka süreç yeniden dağıtmış), tüm shard'lar okunur
+                applied += self._apply_disk_records(self.__shards.load(), list(self.__users))
+            else:
+                shards = [index for index, path in enumerate(self.__shards.watched_paths()[1:]) if path in changed]
+                records = [record for shard in self.__shards.read_shards(shards) for record in shard]
+                applied += self._apply_disk_records(records, self.__shards.member_ids(shards))
+
+        if journal_path is not None and (changed or state[journal_path] != previous.get(journal_path)):
+            # Snapshot değiştiyse (başka süreç sıkıştırdı) veya günlük kısaldıysa baştan, değilse kaldığı yerden oku
+            old, new = previous.get(journal_path), state[journal_path]
+            start = old[2] if not changed and old and new and new[2] >= old[2] else 0
+            if start == 0:
+                self.__journal.entry_count = 0
+            entries, _ = self.__journal.read_since(start)
+            for entry in entries:
+                user_id = entry.get('id')
+                if user_id not in self.__pending:
+                    self._replace_from_disk(user_id, entry.get('record', {}) if entry.get('op') == 'put' else None)
+                    applied += 1
+
+        self.__disk_state = state
+        if applied:
+            print(f"System >> Baska surecin {applied} kullanici degisikligi yuklendi")
+        return applied > 0
+
+    def _apply_disk_records(self, records: Iterable[Any], scope: Iterable[str]) -> int:
+        # Diskten okunan kayıtları bellektekilerle karşılaştır, sadece farklı olanları uygula.
+        # scope içinde olup diskte bulunmayan kayıtlar başka süreçte silinmiştir.
+        # Bu süreçte değişmiş ama henüz yazılmamış kayıtlara (pending) dokunulmaz.
+        seen = set()
+        applied = 0
+        for user_id, user_data in records:
+            seen.add(user_id)
+            if user_id in self.__pending:
+                continue
+            stored = self.__users.peek(user_id) if self.__lazy else self.__users.get(user_id)
+            if stored is not None and (stored if type(stored) is dict else self._serialize_user(stored)) == user_data:
+                continue
+            self._replace_from_disk(user_id, user_data)
+            applied += 1
+
+        for user_id in scope:
+            if user_id not in seen and user_id not in self.__pending:
+                self._replace_from_disk(user_id, None)
+                applied += 1
+        return applied
+
+    def _replace_from_disk(self, user_id: str, user_data: Optional[Dict[str, Any]]):
+        # Kaydı diskteki haliyle değiştir (user_data None ise sil)
+        old_user = self.__users.peek(user_id) if self.__lazy else self.__users.get(user_id)
+        if old_user is not None:
+            self._remove_from_indexes(old_user, user_id)
+            del self.__users[user_id]
+        if user_data is not None:
+            self._load_record(user_id, user_data)
+        if self.__fragments is not None:
+            self.__fragments.mark_dirty(user_id)
+
+    def _encode_user_fragment(self, user_id: str, user: Any) -> str:
+        return self.__codec.encode_fragment(user_id, user if type(user) is dict else self._serialize_user(user))
+
+    @_writes
+    def _save_to_file(self, changed_only: bool = False):
+        # Kullanıcıları dosyaya kaydet (changed_only=False ise parça önbelleği de yok sayılır)
+        written = set(self.__pending)
+        self._write_snapshot(changed_only)
+        self.__pending -= written
+
+    def _write_snapshot(self, changed_only: bool):
+        try:
+            if self.__fragments is not None and not changed_only:
+                self.__fragments.clear()
+
+            if self.__shards is not None:
+                lookup = self.__users.peek if self.__lazy else self.__users.get
+                written = self.__shards.write(
+                    lookup, lambda user: user if type(user) is dict else self._serialize_user(user),
+                    self.__last_modified, full=not changed_only, fragments=self.__fragments)
+                if self.__journal is not None:
+                    self.__journal.reset()
+                print(f"System >> Kaydedildi (basarili) {written} kullanici shard dosyasi")
+                return
+
+            if self.__fragments is not None:
+                # Değişmemiş kayıtların önceki kayıttaki JSON parçaları aynen birleştirilir
+                fragments = self.__fragments.render(list(iter_stored(self.__users)))
+                metadata = {'last_modified': self.__last_modified.isoformat(), 'total_users': len(fragments)}
+                self.__codec.write_fragments(self.__data_file, 'users', fragments, metadata)
+                if self.__journal is not None:
+                    self.__journal.reset()
+                print(f"System >> Kaydedildi (basarili) {len(fragments)} kullanici dosyaya")
+                return
+
+            # Lazy modda hiç erişilmemiş kayıtlar zaten serileştirilmiş haldedir, tekrar kurulmaz
+            users_data = {user_id: user if type(user) is dict else self._serialize_user(user)
+                          for user_id, user in list(iter_stored(self.__users))}
+            metadata = {'last_modified': self.__last_modified.isoformat(), 'total_users': len(self.__users)}
+            indexes = None
+            if self.__codec.persists_indexes:
+                indexes = {'username': dict(self.__username_index), 'email': dict(self.__email_index)}
+
+            self.__codec.write(self.__data_file, 'users', users_data, metadata, indexes)
+
+            # Snapshot artık tüm değişiklikleri içeriyor, günlük boşaltılabilir
+            if self.__journal is not None:
+                self.__journal.reset()
 
             print(f"System >> Kaydedildi (basarili) {len(users_data)} kullanici dosyaya")
 
@@ -121,8 +413,8 @@ class UserRepository:
                 user_data['email'], user_data['password_hash'], role
             )
 
-            if 'created_at' in user_data:
-                user.created_at = datetime.fromisoformat(user_data['created_at'])
+            if user_data.get('created_at'):
+                user.created_at = as_datetime(user_data['created_at'])
             if 'is_active' in user_data:
                 user.is_active = user_data['is_active']
 
@@ -133,19 +425,206 @@ class UserRepository:
             return None
 
 
+    def _load_record(self, user_id: str, user_data: Dict[str, Any], index: bool = True) -> bool:
+        # Dosyadan gelen tek kaydı ekle; lazy modda nesne kurulmaz, indeksler ham kayıttan çıkarılır.
+        # Kayıt atlanırsa False döner
+        if self.__lazy:
+            if 'username' not in user_data or 'email' not in user_data:
+                print(f"System >> Eksik kullanici kaydi atlandi: {user_id}")
+                return False
+            self.__users.put_raw(user_id, user_data)
+            if index:
+                self._update_indexes(user_data, user_id)
+        else:
+            user = self._deserialize_user(user_data)
+            if not user:
+                return False
+            self.__users[user_id] = user
+            if index:
+                self._update_indexes(user)
+
+        if self.__shards is not None:
+            self.__shards.track(user_id, dirty=False)
+        return True
+
+    def _rebuild_indexes(self):
+        # Hazır gelen indeksler atlanan kayıtları gösterebilir, kayıtlardan yeniden kur
+        self.__username_index = {}
+        self.__email_index = {}
+        self.__indexed = {}
+        for user_id, user in list(iter_stored(self.__users)):
+            self._update_indexes(user, user_id)
+
+    def _replay_journal(self):
+        # Snapshot üzerine günlükteki değişiklikleri sırayla uygula
+        for entry in self.__journal.replay():
+            user_id = entry.get('id')
+            self._replace_from_disk(user_id, entry.get('record', {}) if entry.get('op') == 'put' else None)
+            # Günlükteki değişiklik henüz shard dosyasında yok
+            self.mark_dirty(user_id)
+
+    def _create_writer(self, write_fn, max_pending: int, backpressure: str, shared: bool) -> WriteBehindQueue:
+        # Shared modda yazıcı thread dosya kilidini bekler; kilidi tutan çağıranın kuyrukta beklemesi kilitlenir
+        if shared and backpressure == "block":
+            raise ValueError("backpressure='block' cannot be used with shared=True, use 'sync' or 'error'")
+        return WriteBehindQueue(write_fn, max_pending=max_pending, backpressure=backpressure,
+                                guard=self._exclusive, name="users-write-behind")
+
+    def _persist_user(self, user_id: str):
+        self._persist_users([user_id])
+
+    def _persist_users(self, user_ids: List[str]):
+        # Değişiklikleri kalıcı hale getir. Write-behind modunda id'ler arka plan kuyruğuna verilir ve hemen
+        # dönülür; değilse journal modunda kayıt başına tek satır eklenir, aksi halde tüm dosya
+        # (shard modunda sadece ilgili shard'lar) yazılır
+        for user_id in user_ids:
+            self.mark_dirty(user_id)
+        if self.__writer is not None:
+            self.__writer.submit(user_ids)
+        else:
+            self._write_users(user_ids)
+
+    def _write_users(self, user_ids: List[str]):
+        if self.__journal is None:
+            self._save_changes()
+            return
+
+        for user_id in user_ids:
+            user = self.__users.get(user_id)
+            if user is None:
+                self.__journal.append({'op': 'del', 'id': user_id})
+            else:
+                self.__journal.append({'op': 'put', 'id': user_id, 'record': self._serialize_user(user)})
+            self.__pending.discard(user_id)
+
+        if should_compact(self.__journal, len(self.__users), self.__compact_min_entries, self.__compact_ratio):
+            self.compact()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # Write-behind modunda kuyruktaki değişiklikler yazılana kadar bekle; timeout dolarsa False döner
+        if self.__writer is None:
+            return True
+        return self.__writer.flush(timeout)
+
+    def get_pending_write_count(self) -> int:
+        return self.__writer.pending if self.__writer is not None else 0
+
+    def compact(self):
+        # Snapshot'ı yeniden yaz ve günlüğü sıfırla
+        if self.__journal is None:
+            return
+        print(f"System >> Journal sikistiriliyor ({self.__journal.entry_count} kayit)")
+        self._save_changes()
+
+    def close(self):
+        if self.__writer is not None:
+            self.__writer.close()
+        if self.__journal is not None:
+            self.__journal.close()
+        if self.__lock is not None:
+            self.__lock.close()
+
+
 # commit 5.gun
 
 
-    def _update_indexes(self, user: BaseUser):
-        self.__username_index[user.username.lower()] = user.user_id
-        self.__email_index[user.email.lower()] = user.user_id
+    @staticmethod
+    def _index_keys(user: Any) -> tuple:
+        # BaseUser veya lazy modda ham kayıt (dict) için (username, email) indeks anahtarları
+        if type(user) is dict:
+            return user['username'].lower(), user['email'].lower()
+        return user.username.lower(), user.email.lower()
+
+    def _update_indexes(self, user: Any, user_id: Optional[str] = None):
+        # Kullanıcıyı indekslere ekle; daha önce farklı anahtarlarla indekslenmişse eski anahtarlar silinir
+        keys = self._index_keys(user)
+        user_id = user_id or user.user_id
+        previous = self.__indexed.get(user_id)
+        if previous is not None and previous != keys:
+            self._remove_from_indexes(user, user_id)
+        username_key, email_key = keys
+        self.__username_index[username_key] = user_id
+        self.__email_index[email_key] = user_id
+        self.__indexed[user_id] = keys
+
+    def _remove_from_indexes(self, user: Any, user_id: Optional[str] = None):
+        # Kaydedilen anahtarlar silinir (nesnenin şimdiki alanları yerinde değiştirilmiş olabilir)
+        user_id = user_id or user.user_id
+        username_key, email_key = self.__indexed.pop(user_id, None) or self._index_keys(user)
+        if self.__username_index.get(username_key) == user_id:
+            del self.__username_index[username_key]
+        if self.__email_index.get(email_key) == user_id:
+            del self.__email_index[email_key]
+
+    @contextmanager
+    def batch(self):
+        # Blok içinde create_user ve durum değişiklikleri sadece bellekteki dict ve indeksleri günceller.
+        # Doğrulama, duplicate kontrolü ve tek kayıt blok sonunda yapılır; hata olursa blok geri alınır.
+        if self.__batch is not None:
+            yield self
+            return
+
+        with self._exclusive():
+            self.__batch = UnitOfWork()
+            try:
+                yield self
+                self._commit_batch(self.__batch)
+                print(f"System >> Batch kaydedildi: {len(self.__batch.changed_ids)} kullanici")
+            except BaseException:
+                self.__batch.rollback()
+                print(f"System >> Batch geri alindi")
+                raise
+            finally:
+                self.__batch = None
+
+    def _stage_user(self, user: BaseUser) -> BaseUser:
+        # Batch içinde kullanıcıyı kontrol etmeden belleğe ekle, çakışan eski değerleri sakla
+        uow = self.__batch
+        username_key = str(user.username or '').lower()
+        email_key = str(user.email or '').lower()
+
+        previous = (
+            uow.track(self.__users, user.user_id),
+            uow.track(self.__username_index, username_key),
+            uow.track(self.__email_index, email_key),
+        )
+        uow.track(self.__indexed, user.user_id)
+        self.__users[user.user_id] = user
+        self.__username_index[username_key] = user.user_id
+        self.__email_index[email_key] = user.user_id
+        self.__indexed[user.user_id] = (username_key, email_key)
 
-    def create_user(self, user: BaseUser) -> BaseUser:
-        print(f"System >> Kullanici olusturma {user.user_id} username ile  '{user.username}'")
+        uow.created.append((user, previous))
+        uow.mark_changed(user.user_id)
+        return user
+
+    def _commit_batch(self, uow: UnitOfWork):
+        for user, (previous_user, previous_username, previous_email) in uow.created:
+            if not self._validate_user_data(user):
+                raise ValueError(f"User validation failed: {user.user_id}")
+            if previous_user is not None:
+                raise DuplicateUserException(f"User with ID {user.user_id} already exists")
+            if previous_username is not None:
+                raise DuplicateUserException(f"Username '{user.username}' already exists")
+            if previous_email is not None:
+                raise DuplicateUserException(f"Email '{user.email}' already exists")
+
+        if not uow.changed_ids:
+            return
+
+        self.__last_modified = datetime.now()
+        self._persist_users(list(uow.changed_ids))
 
+    @_writes
+    def create_user(self, user: BaseUser) -> BaseUser:
         if not isinstance(user, BaseUser):
             raise TypeError("User must be instance of BaseUser")
 
+        if self.__batch is not None:
+            return self._stage_user(user)
+
+        print(f"System >> Kullanici olusturma {user.user_id} username ile  '{user.username}'")
+
         if not self._validate_user_data(user):
             raise ValueError("User validation failed")
 
@@ -163,15 +642,91 @@ class UserRepository:
         self.__last_modified = datetime.now()
 
         try:
-            self._save_to_file()
+            self._persist_user(user.user_id)
             print(f"System >> Kullanici {user.user_id} olusturuldu ve kaydedildi (basarili)")
         except Exception as e:
             del self.__users[user.user_id]
+            self._remove_from_indexes(user)
             print(f"System >> Kullanıcı kaydedilirken hata oluştu, geri alındı: {e}")
             raise
 
         return user
 
+    @_writes
+    def create_users_bulk(self, records: Iterable[Any]) -> List[Dict[str, Any]]:
+        # Kayıtları akış halinde tek geçişte doğrula, nesneleri oluştur ve hepsini tek seferde kaydet.
+        # Hatalı kayıtlar atlanır; her kayıt için {'index', 'user_id', 'ok', 'error'} raporu döner.
+        report = []
+        created = []
+
+        for index, record in enumerate(records):
+            user_id = record.user_id if isinstance(record, BaseUser) else record.get('user_id')
+            try:
+                user = self._build_user(record)
+                username_key = user.username.lower()
+                email_key = user.email.lower()
+
+                # İndeksler bu döngüde güncellendiği için batch içi tekrarlar da burada yakalanır
+                if user.user_id in self.__users:
+                    raise DuplicateUserException(f"User with ID {user.user_id} already exists")
+                if username_key in self.__username_index:
+                    raise DuplicateUserException(f"Username '{user.username}' already exists")
+                if email_key in self.__email_index:
+                    raise DuplicateUserException(f"Email '{user.email}' already exists")
+            except Exception as e:
+                report.append({'index': index, 'user_id': user_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"})
+                continue
+
+            if self.__batch is not None:
+                for mapping, key in ((self.__users, user.user_id), (self.__username_index, username_key),
+                                     (self.__email_index, email_key), (self.__indexed, user.user_id)):
+                    self.__batch.track(mapping, key)
+                self.__batch.mark_changed(user.user_id)
+
+            self.__users[user.user_id] = user
+            self.__username_index[username_key] = user.user_id
+            self.__email_index[email_key] = user.user_id
+            self.__indexed[user.user_id] = (username_key, email_key)
+            created.append(user)
+            report.append({'index': index, 'user_id': user.user_id, 'ok': True, 'error': None})
+
+        # batch() içindeyse kayıt blok sonunda yapılır
+        if created and self.__batch is None:
+            self.__last_modified = datetime.now()
+            try:
+                self._persist_users([user.user_id for user in created])
+            except Exception as e:
+                for user in created:
+                    self.__users.pop(user.user_id, None)
+                    self._remove_from_indexes(user)
+                print(f"System >> Toplu kullanici kaydi basarisiz, geri alindi: {e}")
+                raise
+
+        print(f"System >> Toplu kullanici ekleme: {len(created)} eklendi, {len(report) - len(created)} reddedildi")
+        return report
+
+    def _build_user(self, record: Any) -> BaseUser:
+        # Toplu ekleme kaydından (dict) rolüne uygun kullanıcı nesnesi oluştur
+        if isinstance(record, BaseUser):
+            user = record
+        else:
+            role = record.get('role', UserRole.VIEWER)
+            role = role if isinstance(role, UserRole) else UserRole(role)
+            user_classes = {
+                UserRole.ADMIN: AdminUser,
+                UserRole.CONTENT_CREATOR: ContentCreatorUser,
+                UserRole.VIEWER: ViewerUser
+            }
+            password = record.get('password', record.get('password_hash'))
+            user = user_classes[role](record['user_id'], record['username'], record['email'], password, role)
+            if 'is_active' in record:
+                user.is_active = bool(record['is_active'])
+
+        if not self._validate_user_data(user):
+            raise ValueError("User validation failed")
+        return user
+
+    @_reads
     def get_user_by_id(self, user_id: str) -> BaseUser:
         # ID ile kullanıcı getir
         if not isinstance(user_id, str) or not user_id.strip():
@@ -183,6 +738,7 @@ class UserRepository:
 
         return self.__users[user_id]
 
+    @_reads
     def get_user_by_username(self, username: str) -> BaseUser:
         # Username ile kullanıcı getir
         if not isinstance(username, str) or not username.strip():
@@ -194,31 +750,117 @@ class UserRepository:
 
         return self.__users[self.__username_index[username_lower]]
 
+    @_reads
     def get_all_users(self) -> List[BaseUser]:
+        # Lazy modda kullanıcılar sadece erişildikçe kurulan bir görünüm döner
+        if self.__lazy:
+            return LazySequence(self.__users)
         return list(self.__users.values())
 
+    @_reads
     def get_users_by_role(self, role: UserRole) -> List[BaseUser]:
-        return [user for user in self.__users.values() if user.role == role]
+        # Rol ham kayıttan okunur, sadece eşleşen kullanıcılar materialize edilir
+        return [self.__users[user_id] for user_id, user in list(iter_stored(self.__users))
+                if (user['role'] if type(user) is dict else user.role.value) == role.value]
 
+    @_reads
     def get_user_count(self) -> int:
         return len(self.__users)
 
+    @_writes
     def set_user_active(self, user_id: str, is_active: bool) -> BaseUser:
         """Kullanıcının aktif/pasif durumunu değiştirir ve JSON'a kaydeder."""
         user = self.get_user_by_id(user_id)
+        if self.__batch is not None:
+            self.__batch.track_attrs(user, 'is_active')
+            user.is_active = bool(is_active)
+            self.__batch.mark_changed(user.user_id)
+            return user
+
         user.is_active = bool(is_active)
         self.__last_modified = datetime.now()
-        self._save_to_file()
+        self._persist_user(user.user_id)
         return user
 
+    @_writes
     def update_user_password(self, user_id: str, new_password: str) -> BaseUser:
         """Kullanıcının şifresini değiştirir ve JSON'a kaydeder."""
         user = self.get_user_by_id(user_id)
+        if self.__batch is not None:
+            self.__batch.track_attrs(user, '_password')
+            user.password = new_password
+            self.__batch.mark_changed(user.user_id)
+            return user
+
         user.password = new_password
         self.__last_modified = datetime.now()
-        self._save_to_file()
+        self._persist_user(user.user_id)
+        return user
+
+    @_writes
+    def update_user(self, user: BaseUser) -> BaseUser:
+        # Kullanıcının kaydını verilen nesneyle değiştir (username/email değişebilir); indeksler O(1) güncellenir
+        if not isinstance(user, BaseUser):
+            raise TypeError("User must be instance of BaseUser")
+        if not self._validate_user_data(user):
+            raise ValueError("User validation failed")
+
+        current = self.get_user_by_id(user.user_id)
+        username_key, email_key = self._index_keys(user)
+        if self.__username_index.get(username_key, user.user_id) != user.user_id:
+            raise DuplicateUserException(f"Username '{user.username}' already exists")
+        if self.__email_index.get(email_key, user.user_id) != user.user_id:
+            raise DuplicateUserException(f"Email '{user.email}' already exists")
+
+        if self.__batch is not None:
+            self.__batch.track(self.__users, user.user_id)
+            self.__batch.on_rollback(lambda: self._replace_indexes(user, current))
+            self._replace_user(current, user)
+            self.__batch.mark_changed(user.user_id)
+            return user
+
+        self._replace_user(current, user)
+        self.__last_modified = datetime.now()
+        try:
+            self._persist_user(user.user_id)
+        except Exception as e:
+            self._replace_user(user, current)
+            print(f"System >> Kullanici guncellenirken hata olustu, geri alindi: {e}")
+            raise
         return user
 
+    def _replace_user(self, current: Any, user: Any):
+        self._replace_indexes(current, user)
+        self.__users[user.user_id] = user
+
+    def _replace_indexes(self, current: Any, user: Any):
+        self._remove_from_indexes(current, user.user_id)
+        self._update_indexes(user, user.user_id)
+
+    @_writes
+    def delete_user(self, user_id: str):
+        user = self.get_user_by_id(user_id)
+        user_id = user.user_id
+        if self.__batch is not None:
+            self.__batch.track(self.__users, user_id)
+            self.__batch.on_rollback(lambda: self._update_indexes(user, user_id))
+            del self.__users[user_id]
+            self._remove_from_indexes(user, user_id)
+            self.__batch.mark_changed(user_id)
+            return
+
+        del self.__users[user_id]
+        self._remove_from_indexes(user, user_id)
+        self.__last_modified = datetime.now()
+        try:
+            self._persist_user(user_id)
+        except Exception as e:
+            self.__users[user_id] = user
+            self._update_indexes(user, user_id)
+            print(f"System >> Kullanici silinirken hata olustu, geri alindi: {e}")
+            raise
+        print(f"System >> Kullanici {user_id} silindi")
+
     def _validate_user_data(self, user: BaseUser) -> bool:
         # Hangi verinin gelmediğini anlamak için print ekleyelim
         if not user.user_id:
@@ -267,62 +909,307 @@ class UserRepository:
 class ChannelRepository:
     # Kanal veri erişim sınıfı - kanal CRUD işlemleri için
 
-    def __init__(self, data_file: str = "channels.json"):
+    def __init__(self, data_file: str = "channels.json", commit_window: Optional[float] = None,
+                 commit_max_ops: Optional[int] = None, lazy: bool = False, codec: str = "json",
+                 shards: Optional[int] = None, shared: bool = False, write_behind: bool = False,
+                 max_pending: int = 10000, backpressure: str = "block", read_only: bool = False):
         print(f"System >> ChannelRepository'nin veri dosyasıyla başlatılması: {data_file}")
 
         self.__data_file = data_file  # Private attribute
-        self.__channels = {}  # Private attribute - channel_id -> BaseChannel
-        self.__owner_index = {}  # Private attribute - owner_id -> List[channel_id]
-        self.__type_index = {}  # Private attribute - channel_type -> List[channel_id]
+        self.__codec = get_codec(codec)  # Private attribute - snapshot yazma formatı ("json" / "binary")
+        # JSON codec'inde her kaydın kodlanmış hali saklanır, kayıtta sadece değişen kayıtlar yeniden kodlanır
+        self.__fragments = (FragmentCache(self._encode_channel_fragment)
+                            if getattr(self.__codec, 'supports_fragments', False) else None)
+        # Lazy modda kayıtlar ham dict olarak tutulur, BaseChannel ilk erişimde kurulur
+        self.__lazy = lazy
+        self.__channels = self._new_channel_map()  # Private attribute - channel_id -> BaseChannel
+        # İndeks değerleri insertion-ordered set'tir ({channel_id: None}): ekleme/silme O(1), sıra korunur
+        self.__owner_index = {}  # Private attribute - owner_id -> {channel_id: None}
+        self.__type_index = {}  # Private attribute - channel_type -> {channel_id: None}
+        self.__category_index = {}  # Private attribute - category_key(category) -> {channel_id: None}
+        self.__status_index = {}  # Private attribute - ChannelStatus -> {channel_id: None}
+        # channel_id -> kaydın indekslere girdiği anahtarlar; nesne yerinde değiştirildiğinde eski kovalar buradan bulunur
+        self.__indexed = {}
         self.__last_modified = datetime.now()  # Private attribute
 
-        # Dosya varsa yükle
-        if os.path.exists(self.__data_file):
-            self._load_from_file()
-        else:
-            print(f"System >> Veri dosyasi {data_file} mevcut degil, boş depoyla başlayarak")
-            self._initialize_empty_repository()
+        # Group commit: commit_window saniye içindeki veya commit_max_ops adede kadar olan
+        # değişiklikler tek bir atomik yazmada birleştirilir. İkisi de verilmezse her değişiklik anında yazılır.
+        if commit_window is None and commit_max_ops is None:
+            commit_max_ops = 1
+        self.__committer = GroupCommitter(self._save_changes, window=commit_window, max_ops=commit_max_ops,
+                                          guard=self._exclusive)
+        self.__batch = None  # Private attribute - aktif batch() bloğunun UnitOfWork kaydı
+        # Shard modu: kayıtlar channel_id hash'ine göre N dosyaya bölünür, değişiklikte sadece ilgili shard yazılır
+        self.__shards = ShardedSnapshot(data_file, 'channels', shards, self.__codec) if shards else None
+        # Shared mod: aynı veri dosyalarını kullanan birden fazla süreç için. Yazmalar <data_file>.lock üzerinde
+        # süreçler arası kilitle yapılır, okumalar izlenen dosyalar değiştiyse sadece farkları yeniden yükler
+        # Read-only mod (replica): dosyaları başka bir süreç (log shipping) günceller, yazma metotları
+        # PermissionError verir
+        self.__read_only = read_only
+        shared = shared or read_only
+        self.__lock = FileLock(data_file + ".lock") if shared else None
+        self.__disk_state = {}  # izlenen dosya -> file_signature (bu sürecin son gördüğü/yazdığı hal)
+        self.__pending = set()  # shared modda değişmiş ama henüz diske yazılmamış kayıtlar
+        # Write-behind modu: değişiklik bellekte uygulanıp hemen dönülür, arka plan thread'i kuyruğu yazar
+        # (group commit ayarlarının yerine geçer)
+        self.__writer = None
+
+        with self._open_lock(shared):
+            # Dosya varsa yükle
+            if os.path.exists(self.__data_file) or (self.__shards is not None and self.__shards.exists()):
+                self._load_from_file()
+            else:
+                print(f"System >> Veri dosyasi {data_file} mevcut degil, boş depoyla başlayarak")
+                self._initialize_empty_repository()
+
+            if self.__shards is not None and not read_only:
+                self._finish_shard_migration()
+
+            if shared:
+                self.__pending.clear()
+                self.__disk_state = self._disk_state()
+
+        if write_behind:
+            if shared and backpressure == "block":
+                raise ValueError("backpressure='block' cannot be used with shared=True, use 'sync' or 'error'")
+            self.__writer = WriteBehindQueue(lambda channel_ids: self._save_changes(), max_pending=max_pending,
+                                             backpressure=backpressure, guard=self._exclusive,
+                                             name="channels-write-behind")
 
         print(f"System >> ChannelRepository initialized with {len(self.__channels)} channels")
 
+    def _new_channel_map(self):
+        return LazyRecordMap(self._deserialize_channel) if self.__lazy else {}
+
     def _initialize_empty_repository(self):
         # Boş repository başlat
-        self.__channels = {}
-        self.__owner_index = {}
-        self.__type_index = {}
+        self.__channels = self._new_channel_map()
+        self._reset_indexes()
         self.__last_modified = datetime.now()
         print(f"System >> Boş kanal deposu başlatıldı")
 
     def _load_from_file(self):
         # Dosyadan kanalları yükle
         try:
-            with open(self.__data_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-
-            channels_data = data.get('channels', {})
-            for channel_id, channel_data in channels_data.items():
-                channel = self._deserialize_channel(channel_data)
-                if channel:
+            # Kayıtlar dosyadan tek tek okunur ve indekslenir (eager modda tüm JSON ağacı bellekte tutulmaz)
+            if self.__shards is not None and self.__shards.exists():
+                records = self.__shards.load()
+            else:
+                # Binary snapshot'taki hazır owner/type indeksleri kullanılmaz: kategori/durum indeksleri ve
+                # kayıt başına anahtar eşlemesi zaten kayıt kayıt kurulur
+                records = read_snapshot(self.__data_file, 'channels', stream=not self.__lazy)[0]
+
+            for channel_id, channel_data in records:
+                if self.__lazy:
+                    # Nesne kurulmaz, indeksler ham kayıttan çıkarılır
+                    self.__channels.put_raw(channel_id, channel_data)
+                    self._update_indexes(channel_data, channel_id)
+                else:
+                    channel = self._deserialize_channel(channel_data)
+                    if not channel:
+                        continue
                     self.__channels[channel_id] = channel
                     self._update_indexes(channel)
 
+                if self.__shards is not None:
+                    self.__shards.track(channel_id, dirty=False)
+
             print(f"System >> Yüklendi (basariyla ){len(self.__channels)} kanallar dosyaya")
 
         except Exception as e:
             print(f"System >> Dosyadan kanallar yüklenirken hata oluştu: {e}")
             self._initialize_empty_repository()
 
-    def _save_to_file(self):
-        # Kanalları dosyaya kaydet
-        try:
-            channels_data = {cid: self._serialize_channel(ch) for cid, ch in self.__channels.items()}
-            data = {
-                'channels': channels_data,
-                'metadata': {'last_modified': self.__last_modified.isoformat(), 'total_channels': len(self.__channels)}
-            }
+    def _finish_shard_migration(self):
+        # Tek dosyadan shard düzenine geçiş (veya shard sayısı değişikliği) açılışta tamamlanır
+        if self.__shards.exists() and not self.__shards.dirty_count:
+            return
+        if not self.__shards.exists() and not self.__channels:
+            return
+        print(f"System >> Kanallar {self.__shards.shard_count} shard dosyasina dagitiliyor")
+        self._save_to_file(changed_only=self.__shards.exists())
+        if os.path.exists(self.__data_file):
+            # Eski tek dosya artık okunmuyor; yedek olarak adı değiştirilerek saklanır
+            os.replace(self.__data_file, self.__data_file + ".pre-shard")
+
+    def _save_changes(self):
+        # Group commit'in yazma fonksiyonu: shard modunda sadece kirli shard'lar, değilse tüm dosya
+        self._save_to_file(changed_only=True)
+
+    def mark_dirty(self, channel_id: str):
+        # Kaydı değişmiş işaretle: bir sonraki kayıtta yeniden kodlanır (shard modunda shard'ı da yazılır).
+        # Kanal nesnesini repository metotları dışında değiştiren kod bunu çağırmalı.
+        if self.__fragments is not None:
+            self.__fragments.mark_dirty(channel_id)
+        if self.__shards is not None:
+            self.__shards.track(channel_id)
+        if self.__lock is not None:
+            self.__pending.add(channel_id)
+        # Durum/kategori/sahip değişmişse kanal indekslerdeki kovasına taşınır
+        stored = self.__channels.peek(channel_id) if self.__lazy else self.__channels.get(channel_id)
+        if stored is not None:
+            self._update_indexes(stored, channel_id)
+
+    def _clear_dirty(self, channel_id: str):
+        # mark_dirty'yi geri al (kaydedilemeyen yeni kanal): shared modda bekleyen kayıt sayılmaz,
+        # yoksa refresh diskteki haliyle bu id'yi hiç güncellemez. Shard kirli kalabilir; yazmada
+        # bulunmayan kayıt üyelikten çıkarılır.
+        if self.__fragments is not None:
+            self.__fragments.mark_dirty(channel_id)
+        if self.__lock is not None:
+            self.__pending.discard(channel_id)
+
+    def _open_lock(self, shared: bool):
+        # Açılıştaki yükleme: shared modda yazma kilidiyle, read-only modda okuyucu kilidiyle
+        if not shared:
+            return nullcontext()
+        return self.__lock.shared() if self.__read_only else self.__lock.exclusive()
+
+    def _exclusive(self):
+        if self.__read_only:
+            raise PermissionError(f"{self.__data_file} is opened read-only")
+        if self.__lock is None:
+            return nullcontext()
+        return self._locked_write()
+
+    @property
+    def read_only(self) -> bool:
+        return self.__read_only
+
+    def promote(self):
+        # Replica yükseltildiğinde repository yazılabilir hale gelir (shared modda kalır)
+        self.refresh()
+        self.__read_only = False
+
+    @contextmanager
+    def _locked_write(self):
+        with self.__lock.exclusive():
+            self._refresh_locked()
+            try:
+                yield
+            finally:
+                # Kilit tutulduğu sürece başka süreç yazamaz: dosyaların şimdiki hali bu sürecin gördüğü haldir
+                self.__disk_state = self._disk_state()
+
+    def _disk_state(self) -> Dict[str, Any]:
+        paths = self.__shards.watched_paths() if self.__shards is not None else [self.__data_file]
+        return {path: file_signature(path) for path in paths}
+
+    def refresh(self) -> bool:
+        # Shared modda başka süreçlerin yaptığı değişiklikleri uygula; bir şey değiştiyse True döner.
+        # Group commit penceresinde bekleyen yerel değişiklikler diskteki eski halleriyle ezilmez.
+        if self.__lock is None or self._disk_state() == self.__disk_state:
+            return False
+        # Okuma sırasında yarım bir yazma (shard'lar + manifest, snapshot + journal) görülmesin
+        with self.__lock.shared():
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
+        state = self._disk_state()
+        previous = self.__disk_state
+        if state == previous:
+            return False
 
-            with open(self.__data_file, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+        changed = [path for path in state if state[path] != previous.get(path)]
+        if self.__shards is None:
+            # Dosya yoksa (ör. başka süreç shard düzenine geçti) kayıtlar silinmiş sayılmaz
+            applied = 0
+            if state[self.__data_file] is not None:
+                applied = self._apply_disk_records(read_snapshot(self.__data_file, 'channels')[0],
+                                                   list(self.__channels))
+        elif self.__shards.manifest_path in changed:
+            # Düzen değişmiş (başka süreç yeniden dağıtmış), tüm shard'lar okunur
+            applied = self._apply_disk_records(self.__shards.load(), list(self.__channels))
+        else:
+            shards = [index for index, path in enumerate(self.__shards.watched_paths()[1:]) if path in changed]
+            records = [record for shard in self.__shards.read_shards(shards) for record in shard]
+            applied = self._apply_disk_records(records, self.__shards.member_ids(shards))
+
+        self.__disk_state = state
+        if applied:
+            print(f"System >> Baska surecin {applied} kanal degisikligi yuklendi")
+        return applied > 0
+
+    def _apply_disk_records(self, records: Iterable[Any], scope: Iterable[str]) -> int:
+        # Diskten okunan kayıtları bellektekilerle karşılaştır, sadece farklı olanları uygula.
+        # scope içinde olup diskte bulunmayan kayıtlar başka süreçte silinmiştir.
+        seen = set()
+        applied = 0
+        for channel_id, channel_data in records:
+            seen.add(channel_id)
+            if channel_id in self.__pending:
+                continue
+            stored = self.__channels.peek(channel_id) if self.__lazy else self.__channels.get(channel_id)
+            if stored is not None and (
+                    stored if type(stored) is dict else self._serialize_channel(stored)) == channel_data:
+                continue
+            self._replace_from_disk(channel_id, channel_data)
+            applied += 1
+
+        for channel_id in scope:
+            if channel_id not in seen and channel_id not in self.__pending:
+                self._replace_from_disk(channel_id, None)
+                applied += 1
+        return applied
+
+    def _replace_from_disk(self, channel_id: str, channel_data: Optional[Dict[str, Any]]):
+        # Kaydı diskteki haliyle değiştir (channel_data None ise sil)
+        old_channel = self.__channels.peek(channel_id) if self.__lazy else self.__channels.get(channel_id)
+        if old_channel is not None:
+            self._remove_from_indexes(old_channel, channel_id)
+            del self.__channels[channel_id]
+        if channel_data is not None:
+            if self.__lazy:
+                self.__channels.put_raw(channel_id, channel_data)
+                self._update_indexes(channel_data, channel_id)
+            else:
+                channel = self._deserialize_channel(channel_data)
+                if channel:
+                    self.__channels[channel_id] = channel
+                    self._update_indexes(channel)
+            if self.__shards is not None:
+                self.__shards.track(channel_id, dirty=False)
+        if self.__fragments is not None:
+            self.__fragments.mark_dirty(channel_id)
+
+    def _encode_channel_fragment(self, channel_id: str, channel: Any) -> str:
+        return self.__codec.encode_fragment(
+            channel_id, channel if type(channel) is dict else self._serialize_channel(channel))
+
+    @_writes
+    def _save_to_file(self, changed_only: bool = False):
+        # Kanalları dosyaya kaydet (changed_only=False ise parça önbelleği de yok sayılır)
+        written = set(self.__pending)
+        self._write_snapshot(changed_only)
+        self.__pending -= written
+
+    def _write_snapshot(self, changed_only: bool):
+        try:
+            if self.__fragments is not None and not changed_only:
+                self.__fragments.clear()
+
+            if self.__shards is not None:
+                lookup = self.__channels.peek if self.__lazy else self.__channels.get
+                written = self.__shards.write(
+                    lookup, lambda channel: channel if type(channel) is dict else self._serialize_channel(channel),
+                    self.__last_modified, full=not changed_only, fragments=self.__fragments)
+                print(f"System >> Kaydedildi (basarili) {written} kanal shard dosyasi")
+                return
+
+            # Group commit zamanlayıcısı başka thread'den çağırabilir, önce anlık kopya alınır
+            if self.__fragments is not None:
+                # Değişmemiş kayıtların önceki kayıttaki JSON parçaları aynen birleştirilir
+                fragments = self.__fragments.render(list(iter_stored(self.__channels)))
+                metadata = {'last_modified': self.__last_modified.isoformat(), 'total_channels': len(fragments)}
+                self.__codec.write_fragments(self.__data_file, 'channels', fragments, metadata)
+                print(f"System >> Kaydedildi (basarili) {len(fragments)} kanallar dosyaya")
+                return
+
+            # Lazy modda hiç erişilmemiş kayıtlar zaten serileştirilmiş haldedir, tekrar kurulmaz
+            channels_data = {cid: ch if type(ch) is dict else self._serialize_channel(ch)
+                             for cid, ch in list(iter_stored(self.__channels))}
+            metadata = {'last_modified': self.__last_modified.isoformat(), 'total_channels': len(channels_data)}
+            self.__codec.write(self.__data_file, 'channels', channels_data, metadata, None)
 
             print(f"System >> Kaydedildi (basarili) {len(channels_data)} kanallar dosyaya")
 
@@ -345,6 +1232,7 @@ class ChannelRepository:
             'video_count': channel.video_count,
             'moderators': list(channel.moderators),
             'tags': list(channel.tags),
+            'category': channel.category,
             'channel_class': type(channel).__name__
         }
 
@@ -359,29 +1247,38 @@ class ChannelRepository:
                 'PublicChannel': PublicChannel,
                 'PrivateChannel': PrivateChannel,
                 'PremiumChannel': PremiumChannel,
-                'PersonelChannel': PersonalChannel,
+                'PersonalChannel': PersonalChannel,
                 'BrandChannel': BrandChannel,
                 'KidsChannel': KidsChannel
             }
 
             channel_cls = channel_classes.get(channel_class, PremiumChannel)
-            channel = channel_cls(
-                channel_data['channel_id'], channel_data['name'],
-                channel_data['description'], channel_data['owner_id'], channel_type
-            )
-
-            if 'catergory' in channel_data:
+            args = (channel_data['channel_id'], channel_data['name'],
+                    channel_data['description'], channel_data['owner_id'])
+            # Personal/Brand/Kids kanal tipini kendi __init__ içinde sabitler
+            if channel_cls in (PersonalChannel, BrandChannel, KidsChannel):
+                channel = channel_cls(*args)
+            else:
+                channel = channel_cls(*args, channel_type)
+
+            if 'category' in channel_data:
                 channel.category = channel_data['category']
 
             # Ek alanları ayarla
             if 'status' in channel_data:
                 channel.status = ChannelStatus(channel_data['status'])
-            if 'created_at' in channel_data:
-                channel.created_at = datetime.fromisoformat(channel_data['created_at'])
+            if channel_data.get('created_at'):
+                channel.created_at = as_datetime(channel_data['created_at'])
+            if channel_data.get('updated_at'):
+                channel.updated_at = as_datetime(channel_data['updated_at'])
             if 'subscriber_count' in channel_data:
                 channel.subscriber_count = channel_data['subscriber_count']
+            if 'video_count' in channel_data:
+                channel.video_count = channel_data['video_count']
             if 'moderators' in channel_data:
                 channel.moderators = set(channel_data['moderators'])
+            if 'tags' in channel_data:
+                channel.tags = list(channel_data['tags'])
 
             return channel
 
@@ -389,25 +1286,113 @@ class ChannelRepository:
             print(f"System >> Kanal seri durumdan çıkarılırken hata oluştu: {e}")
             return None
 
-    def _update_indexes(self, channel: BaseChannel):
-        # İndeksleri güncelle
-        if channel.owner_id not in self.__owner_index:
-            self.__owner_index[channel.owner_id] = []
-        if channel.channel_id not in self.__owner_index[channel.owner_id]:
-            self.__owner_index[channel.owner_id].append(channel.channel_id)
+    @staticmethod
+    def _index_keys(channel: Any) -> tuple:
+        # BaseChannel veya lazy modda ham kayıt (dict) için (owner_id, channel_type, kategori, durum) anahtarları.
+        # Kategori category_key ile katlanır: "Müzik", "MÜZİK" ve "müzik" aynı kovadadır
+        if type(channel) is dict:
+            return (channel['owner_id'], ChannelType(channel['channel_type']),
+                    category_key(channel.get('category', 'other')), ChannelStatus(channel['status']))
+        return channel.owner_id, channel.channel_type, category_key(channel.category), channel.status
+
+    def _reset_indexes(self):
+        self.__owner_index = {}
+        self.__type_index = {}
+        self.__category_index = {}
+        self.__status_index = {}
+        self.__indexed = {}
+
+    def _update_indexes(self, channel: Any, channel_id: Optional[str] = None):
+        # Kanalı indekslere ekle; daha önce farklı anahtarlarla indekslenmişse eski kovalardan çıkar.
+        # Anahtarlar değişmediyse indekslerdeki sırası korunur
+        keys = self._index_keys(channel)
+        channel_id = channel_id or channel.channel_id
+        previous = self.__indexed.get(channel_id)
+        if previous == keys:
+            return
+        if previous is not None:
+            self._remove_from_indexes(channel, channel_id)
+        for index, key in zip(self._indexes(), keys):
+            index.setdefault(key, {})[channel_id] = None
+        self.__indexed[channel_id] = keys
+
+    def _indexes(self) -> tuple:
+        # _index_keys ile aynı sırada
+        return self.__owner_index, self.__type_index, self.__category_index, self.__status_index
+
+    @contextmanager
+    def batch(self):
+        # Blok içinde create_channel ve durum/sayaç değişiklikleri sadece bellekte yapılır.
+        # Doğrulama, duplicate kontrolü ve tek _save_to_file blok sonunda; hata olursa blok geri alınır.
+        if self.__batch is not None:
+            yield self
+            return
+
+        with self._exclusive():
+            self.__batch = UnitOfWork()
+            try:
+                yield self
+                self._commit_batch(self.__batch)
+                print(f"System >> Batch kaydedildi: {len(self.__batch.changed_ids)} kanal")
+            except BaseException:
+                self.__batch.rollback()
+                print(f"System >> Batch geri alindi")
+                raise
+            finally:
+                self.__batch = None
+
+    def _stage_channel(self, channel: BaseChannel) -> BaseChannel:
+        # Batch içinde kanalı kontrol etmeden belleğe ekle
+        uow = self.__batch
+        previous = uow.track(self.__channels, channel.channel_id)
+        self.__channels[channel.channel_id] = channel
+
+        if previous is None:
+            self._update_indexes(channel)
+            uow.on_rollback(lambda: self._remove_from_indexes(channel))
 
-        if channel.channel_type not in self.__type_index:
-            self.__type_index[channel.channel_type] = []
-        if channel.channel_id not in self.__type_index[channel.channel_type]:
-            self.__type_index[channel.channel_type].append(channel.channel_id)
+        uow.created.append((channel, previous))
+        uow.mark_changed(channel.channel_id)
+        return channel
 
-    def create_channel(self, channel: BaseChannel) -> BaseChannel:
+    def _commit_batch(self, uow: UnitOfWork):
+        for channel, previous in uow.created:
+            if not self._validate_channel_data(channel):
+                raise ValueError(f"Channel validation failed: {channel.channel_id}")
+            if previous is not None:
+                raise DuplicateChannelException(f"Channel with ID {channel.channel_id} already exists")
+
+        if uow.changed_ids:
+            self.__last_modified = datetime.now()
+            for channel_id in uow.changed_ids:
+                self.mark_dirty(channel_id)
+            self._persist_channels(list(uow.changed_ids), durable=True)
+
+    def _remove_from_indexes(self, channel: Any, channel_id: Optional[str] = None):
+        # Kanal, indekslendiği anahtarların kovalarından çıkarılır (nesnenin şimdiki alanlarından değil)
+        channel_id = channel_id or channel.channel_id
+        keys = self.__indexed.pop(channel_id, None)
+        if keys is None:
+            return
+        for index, key in zip(self._indexes(), keys):
+            channel_ids = index.get(key)
+            if channel_ids is None:
+                continue
+            channel_ids.pop(channel_id, None)
+            if not channel_ids:
+                del index[key]
+
+    @_writes
+    def create_channel(self, channel: BaseChannel, durable: Optional[bool] = None) -> BaseChannel:
         # Yeni kanal oluştur
-        print(f"System >> Kanal olusturuluyor {channel.channel_id} adiyla '{channel.name}'")
-
         if not isinstance(channel, BaseChannel):
             raise TypeError("Channel must be instance of BaseChannel")
 
+        if self.__batch is not None:
+            return self._stage_channel(channel)
+
+        print(f"System >> Kanal olusturuluyor {channel.channel_id} adiyla '{channel.name}'")
+
         if not self._validate_channel_data(channel):
             raise ValueError("Channel validation failed")
 
@@ -419,17 +1404,21 @@ class ChannelRepository:
         self.__channels[channel.channel_id] = channel
         self._update_indexes(channel)
         self.__last_modified = datetime.now()
+        self.mark_dirty(channel.channel_id)
 
         try:
-            self._save_to_file()
+            self._persist_channels([channel.channel_id], durable)
             print(f"System >> Kanal {channel.channel_id} başarıyla oluşturuldu ve kaydedildi")
         except Exception as e:
             del self.__channels[channel.channel_id]
+            self._remove_from_indexes(channel)
+            self._clear_dirty(channel.channel_id)
             print(f"System >> Kanal kaydedilirken hata oluştu, geri alındı: {e}")
             raise
 
         return channel
 
+    @_reads
     def get_channel_by_id(self, channel_id: str) -> BaseChannel:
         # ID ile kanal getir
         if not isinstance(channel_id, str) or not channel_id.strip():
@@ -441,45 +1430,193 @@ class ChannelRepository:
 
         return self.__channels[channel_id]
 
+    @_reads
     def get_all_channels(self) -> List[BaseChannel]:
+        # Lazy modda kanallar sadece erişildikçe kurulan bir görünüm döner
+        if self.__lazy:
+            return LazySequence(self.__channels)
         return list(self.__channels.values())
 
+    @_reads
     def get_channels_by_owner(self, owner_id: str) -> List[BaseChannel]:
         if owner_id not in self.__owner_index:
             return []
 
-        channel_ids = self.__owner_index[owner_id]
+        channel_ids = list(self.__owner_index[owner_id])
         return [self.__channels[cid] for cid in channel_ids if cid in self.__channels]
 
+    @_reads
     def get_channels_by_type(self, channel_type: ChannelType) -> List[BaseChannel]:
         if channel_type not in self.__type_index:
             return []
 
-        channel_ids = self.__type_index[channel_type]
+        channel_ids = list(self.__type_index[channel_type])
         return [self.__channels[cid] for cid in channel_ids if cid in self.__channels]
 
+    @_reads
     def get_channel_count(self) -> int:
         return len(self.__channels)
 
-    def set_channel_status(self, channel_id: str, new_status: ChannelStatus) -> BaseChannel:
+    @_writes
+    def set_channel_status(self, channel_id: str, new_status: ChannelStatus,
+                           durable: Optional[bool] = None) -> BaseChannel:
         """Kanal durumunu değiştirir ve JSON'a kaydeder."""
         channel = self.get_channel_by_id(channel_id)
+        if self.__batch is not None:
+            # Geri alma adımları ters sırayla çalışır: önce alanlar geri yazılır, sonra indeks düzeltilir
+            self.__batch.on_rollback(lambda: self._update_indexes(channel))
+            self.__batch.track_attrs(channel, 'status', 'updated_at')
+            channel.change_status(new_status)
+            self._update_indexes(channel)
+            self.__batch.mark_changed(channel_id)
+            return channel
+
         channel.change_status(new_status)
         self.__last_modified = datetime.now()
-        self._save_to_file()
+        self.mark_dirty(channel_id)
+        self._persist_channels([channel_id], durable)
         return channel
 
-    def increment_channel_video_count(self, channel_id: str, delta: int = 1) -> BaseChannel:
+    @_writes
+    def increment_channel_video_count(self, channel_id: str, delta: int = 1,
+                                      durable: Optional[bool] = None) -> BaseChannel:
         # Kanal video sayacını artırır ve jsno'a kaydeder
         if delta <= 0:
             raise ValueError("delta must be positive")
         channel = self.get_channel_by_id(channel_id)
+        if self.__batch is not None:
+            self.__batch.track_attrs(channel, 'video_count', 'updated_at')
+            channel.video_count += delta
+            channel.updated_at = datetime.now()
+            self.__batch.mark_changed(channel_id)
+            return channel
+
         channel.video_count += delta
         channel.updated_at = datetime.now()
         self.__last_modified = datetime.now()
-        self._save_to_file()
+        self.mark_dirty(channel_id)
+        self._persist_channels([channel_id], durable)
+        return channel
+
+    @_writes
+    def update_channel(self, channel: BaseChannel, durable: Optional[bool] = None) -> BaseChannel:
+        # Kanalın kaydını verilen nesneyle değiştir (sahip/tip değişebilir); indeksler O(1) güncellenir
+        if not isinstance(channel, BaseChannel):
+            raise TypeError("Channel must be instance of BaseChannel")
+        if not self._validate_channel_data(channel):
+            raise ValueError("Channel validation failed")
+
+        current = self.get_channel_by_id(channel.channel_id)
+        if self.__batch is not None:
+            self.__batch.on_rollback(lambda: self._update_indexes(current, channel.channel_id))
+            self.__batch.track(self.__channels, channel.channel_id)
+            self._replace_channel(current, channel)
+            self.__batch.mark_changed(channel.channel_id)
+            return channel
+
+        self._replace_channel(current, channel)
+        self.__last_modified = datetime.now()
+        self.mark_dirty(channel.channel_id)
+        try:
+            self._persist_channels([channel.channel_id], durable)
+        except Exception as e:
+            self._replace_channel(channel, current)
+            print(f"System >> Kanal guncellenirken hata olustu, geri alindi: {e}")
+            raise
         return channel
 
+    def _replace_channel(self, current: Any, channel: Any):
+        # current aynı nesne olabilir (yerinde düzenleme); eski kovalar indekslenen anahtarlardan bulunur
+        self.__channels[channel.channel_id] = channel
+        self._update_indexes(channel, channel.channel_id)
+
+    @_writes
+    def delete_channel(self, channel_id: str, durable: Optional[bool] = None):
+        channel = self.get_channel_by_id(channel_id)
+        channel_id = channel.channel_id
+        if self.__batch is not None:
+            self.__batch.track(self.__channels, channel_id)
+            self.__batch.on_rollback(lambda: self._update_indexes(channel, channel_id))
+            del self.__channels[channel_id]
+            self._remove_from_indexes(channel, channel_id)
+            self.__batch.mark_changed(channel_id)
+            return
+
+        del self.__channels[channel_id]
+        self._remove_from_indexes(channel, channel_id)
+        self.__last_modified = datetime.now()
+        self.mark_dirty(channel_id)
+        try:
+            self._persist_channels([channel_id], durable)
+        except Exception as e:
+            self.__channels[channel_id] = channel
+            self._update_indexes(channel, channel_id)
+            print(f"System >> Kanal silinirken hata olustu, geri alindi: {e}")
+            raise
+        print(f"System >> Kanal {channel_id} silindi")
+
+    @_writes
+    def rename_owner(self, old_owner_id: str, new_owner_id: str, durable: Optional[bool] = None) -> int:
+        # Eski sahibin tüm kanallarını yeni sahibe aktar, aktarılan kanal sayısını döndür
+        if not isinstance(new_owner_id, str) or not new_owner_id.strip():
+            raise ValueError("Owner ID must be non-empty string")
+        new_owner_id = new_owner_id.strip()
+        channel_ids = list(self.__owner_index.get(old_owner_id, {}))
+        if not channel_ids or old_owner_id == new_owner_id:
+            return 0
+
+        channels = [self.get_channel_by_id(channel_id) for channel_id in channel_ids]
+        batch = self.__batch
+        if batch is not None:
+            # Geri alma ters sırayla: önce alanlar geri yazılır, sonra indeksler düzeltilir
+            batch.on_rollback(lambda: [self._update_indexes(channel) for channel in channels])
+            for channel in channels:
+                batch.track_attrs(channel, 'owner_id', 'updated_at')
+                batch.mark_changed(channel.channel_id)
+
+        now = datetime.now()
+        for channel in channels:
+            channel.owner_id = new_owner_id
+            channel.updated_at = now
+            self._update_indexes(channel)
+        if batch is not None:
+            return len(channel_ids)
+
+        self.__last_modified = now
+        for channel_id in channel_ids:
+            self.mark_dirty(channel_id)
+        self._persist_channels(channel_ids, durable)
+        print(f"System >> {len(channel_ids)} kanal {old_owner_id} -> {new_owner_id} sahibine aktarildi")
+        return len(channel_ids)
+
+    def _persist_channels(self, channel_ids: List[str], durable: Optional[bool] = None):
+        # mark_dirty sonrası kayıt: write-behind kuyruğuna ver (durable=True ise bekleyenlerle hemen yaz)
+        # veya group commit'e bildir
+        if self.__writer is None:
+            self.__committer.record(durable)
+            return
+        self.__writer.submit(channel_ids)
+        if durable:
+            self.__writer.drain()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # Bekleyen değişiklikleri diske yaz (write-behind modunda yazılana kadar bekle; timeout dolarsa False)
+        if self.__writer is not None:
+            return self.__writer.flush(timeout)
+        self.__committer.flush()
+        return True
+
+    def get_pending_write_count(self) -> int:
+        return self.__writer.pending if self.__writer is not None else self.__committer.pending
+
+    def close(self):
+        if self.__writer is not None:
+            self.__writer.close()
+        else:
+            self.__committer.flush()
+        if self.__lock is not None:
+            self.__lock.close()
+
     def _validate_channel_data(self, channel: BaseChannel) -> bool:
         # Kanal verilerini doğrula
         return (channel.channel_id and len(channel.channel_id.strip()) >= 3 and
@@ -496,12 +1633,27 @@ class ChannelRepository:
         return (isinstance(description, str) and description.strip() and
                 10 <= len(description.strip()) <= 500)
 
+    @_reads
     def get_channel_by_category(self, category: str) -> List[BaseChannel]:
-        # sadece belirli bir kategoriye ait olanları seçip ayıklar
-        filtered_channels = []
-
-        for ch in self.__channels.values():
-            if ch.category.lower() == category.lower():
-                filtered_channels.append(ch)
-
-        return filtered_channels
\ No newline at end of file
+        # Kategori indeksinden (büyük/küçük harf duyarsız); lazy modda sadece eşleşen kanallar materialize edilir
+        return self.find_channels(category=category)
+
+    @_reads
+    def find_channels(self, category: Optional[str] = None, channel_type: Optional[ChannelType] = None,
+                      status: Optional[ChannelStatus] = None, owner_id: Optional[str] = None) -> List[BaseChannel]:
+        # Verilen koşulların hepsini sağlayan kanallar (koşul verilmezse tümü). Her koşulun indeks kümesi
+        # alınır ve en küçüğünden başlayarak kesiştirilir; sonuç en küçük kümenin (ekleme) sırasındadır
+        criteria = [(self.__owner_index, owner_id),
+                    (self.__type_index, ChannelType(channel_type) if channel_type is not None else None),
+                    (self.__category_index, category_key(category) if category is not None else None),
+                    (self.__status_index, ChannelStatus(status) if status is not None else None)]
+        candidates = [index.get(key, {}) for index, key in criteria if key is not None]
+        if not candidates:
+            return self.get_all_channels()
+
+        candidates.sort(key=len)
+        channel_ids = list(candidates[0])
+        for other in candidates[1:]:
+            # Sadece kalan (giderek küçülen) id'ler diğer kümede aranır; filter üyelik kontrolünü C'de yapar
+            channel_ids = list(filter(other.__contains__, channel_ids))
+        return [self.__channels[cid] for cid in channel_ids if cid in self.__channels]
\ No newline at end of file
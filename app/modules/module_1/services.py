@@ -13,6 +13,7 @@ from .base import (
 )
 from .implementations import PersonalChannel, BrandChannel, KidsChannel
 from .repository import UserRepository, ChannelRepository
+from .sqlite_repository import create_module1_repositories
 
 
 @dataclass(frozen=True)
@@ -123,14 +124,11 @@ class ChannelService:
         owner_id: Optional[str] = None,
         channel_type: Optional[ChannelType] = None,
         category: Optional[str] = None,
+        status: Optional[ChannelStatus] = None,
     ) -> List[BaseChannel]:
-        if owner_id is not None:
-            return self._channel_repo.get_channels_by_owner(owner_id)
-        if channel_type is not None:
-            return self._channel_repo.get_channels_by_type(channel_type)
-        if category is not None:
-            return self._channel_repo.get_channel_by_category(category)
-        return self._channel_repo.get_all_channels()
+        # Verilen filtrelerin hepsi birlikte uygulanır (repository indeksleri kesiştirir)
+        return self._channel_repo.find_channels(category=category, channel_type=channel_type, status=status,
+                                                owner_id=owner_id)
 
     def change_status(self, channel_id: str, new_status: ChannelStatus, requested_by_user_id: str) -> ServiceResult:
         try:
@@ -173,7 +171,15 @@ class Module1ServiceFacade:
         self,
         user_repo: Optional[UserRepository] = None,
         channel_repo: Optional[ChannelRepository] = None,
+        backend: Optional[str] = None,
+        data_dir: str = ".",
     ):
+        # backend ("json" / "sqlite") verilirse eksik repository'ler data_dir altında o backend ile açılır
+        if backend is not None and (user_repo is None or channel_repo is None):
+            default_users, default_channels = create_module1_repositories(backend, data_dir)
+            user_repo = user_repo or default_users
+            channel_repo = channel_repo or default_channels
+
         self.users = UserService(user_repo=user_repo)
         # aynı user_repo instance'ını paylaşmak için:
         self.channels = ChannelService(channel_repo=channel_repo, user_repo=self.users.repo)
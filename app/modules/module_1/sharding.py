@@ -0,0 +1,167 @@
+import json
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .persistence import FragmentCache, atomic_write_json
+from .snapshot_codecs import read_snapshot
+
+SHARD_LAYOUT_VERSION = 1
+
+
+def shard_for(record_id: str, shard_count: int) -> int:
+    # Süreçler arasında sabit olmalı (yerleşik hash() her çalıştırmada farklı)
+    return zlib.crc32(record_id.encode('utf-8')) % shard_count
+
+
+class ShardedSnapshot:
+    # users.json/channels.json yerine kayıtları id hash'ine göre N dosyaya bölen snapshot düzeni.
+    #   data/users.json -> data/users.shards/manifest.json
+    #                      data/users.shards/users.<N>-000.json ... users.<N>-<N-1>.json
+    # Değişen kayıtların shard'ları "kirli" işaretlenir, kayıtta sadece onlar yeniden yazılır.
+    # Dosya adında shard sayısı olduğu için sayı değiştirildiğinde yeni düzen eskisinin üzerine yazılmaz;
+    # manifest en son yazılır ve geçişin kesinleştiği nokta odur.
+
+    def __init__(self, data_file: str, section: str, shard_count: int, codec: Any):
+        if not isinstance(shard_count, int) or shard_count < 1:
+            raise ValueError("shard count must be a positive integer")
+
+        base, extension = os.path.splitext(data_file)
+        self.directory = base + ".shards"
+        self.manifest_path = os.path.join(self.directory, "manifest.json")
+        self.shard_count = shard_count
+        self.__section = section
+        self.__codec = codec
+        self.__prefix = os.path.basename(base)
+        self.__extension = extension or ".json"
+        self.__members = [{} for _ in range(shard_count)]  # shard -> {record_id: None} (sıralı küme)
+        self.__dirty = set()
+        self.__layout_count = None  # diskteki düzenin shard sayısı (manifest)
+        self.__lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.manifest_path)
+
+    def shard_path(self, index: int, shard_count: Optional[int] = None) -> str:
+        shard_count = shard_count or self.shard_count
+        return os.path.join(self.directory,
+                            f"{self.__prefix}.{shard_count}-{index:03d}{self.__extension}")
+
+    def track(self, record_id: str, dirty: bool = True):
+        # Kaydı shard'ına ekle; dirty=True ise shard bir sonraki write() çağrısında yazılır
+        shard = shard_for(record_id, self.shard_count)
+        with self.__lock:
+            self.__members[shard][record_id] = None
+            if dirty:
+                self.__dirty.add(shard)
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self.__dirty)
+
+    def watched_paths(self) -> List[str]:
+        # Başka süreçlerin yazmalarını fark etmek için izlenecek dosyalar: manifest + mevcut düzenin shard'ları
+        layout_count = self.__layout_count or self.shard_count
+        return [self.manifest_path] + [self.shard_path(index, layout_count) for index in range(layout_count)]
+
+    def member_ids(self, shards: Iterable[int]) -> List[str]:
+        with self.__lock:
+            return [record_id for shard in shards for record_id in self.__members[shard]]
+
+    def read_shards(self, shards: Iterable[int]) -> List[List[Tuple[str, Any]]]:
+        # Verilen shard'ları (mevcut düzenden) paralel oku
+        paths = [self.shard_path(shard, self.__layout_count or self.shard_count) for shard in shards]
+        return self.__read_paths(paths)
+
+    def __read_paths(self, paths: List[str]) -> List[List[Tuple[str, Any]]]:
+        # Shard'lar küçük olduğu için akış okuyucusu yerine hızlı C ayrıştırıcısı (json.load) kullanılır.
+        # Ayrıştırma GIL altında çalıştığı için kazanç çoğunlukla disk okumasının örtüşmesinden gelir.
+        def read_shard(path: str) -> List[Tuple[str, Any]]:
+            if not os.path.exists(path):
+                print(f"System >> Shard dosyasi bulunamadi, bos kabul edildi: {path}")
+                return []
+            return list(read_snapshot(path, self.__section, stream=False)[0])
+
+        if not paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+            return list(pool.map(read_shard, paths))
+
+    def load(self) -> Iterator[Tuple[str, Any]]:
+        # Tüm shard'lar paralel okunur, kayıtlar shard sırasıyla döner
+        with open(self.manifest_path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)['manifest']
+        layout_count = int(manifest['shard_count'])
+        shards = self.__read_paths([self.shard_path(index, layout_count) for index in range(layout_count)])
+
+        self.__layout_count = layout_count
+        if layout_count != self.shard_count:
+            # Shard sayısı değişmiş: tüm kayıtlar yeni düzene göre yeniden yazılmalı
+            print(f"System >> Shard sayisi {layout_count} -> {self.shard_count}, yeniden dagitilacak")
+            self.__dirty = set(range(self.shard_count))
+
+        for records in shards:
+            yield from records
+
+    def write(self, lookup: Callable[[str], Any], serialize: Callable[[Any], Dict[str, Any]],
+              last_modified: datetime, full: bool = False, fragments: Optional[FragmentCache] = None) -> int:
+        # Kirli (full=True ise tüm) shard'ları yaz ve yazılan shard sayısını döndür.
+        # lookup(record_id) saklanan kaydı (nesne veya lazy moddaki ham dict) ya da silinmişse None döner.
+        # fragments verilirse shard içindeki değişmemiş kayıtlar yeniden kodlanmaz (sadece JSON codec'i).
+        # Düzen ilk kez (veya yeni shard sayısıyla) yazılıyorsa manifest'ten önce tüm shard'lar yazılmalı
+        full = full or self.__layout_count != self.shard_count
+        with self.__lock:
+            dirty = set(range(self.shard_count)) if full else self.__dirty
+            self.__dirty = set()
+            members = {shard: list(self.__members[shard]) for shard in dirty}
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for shard in sorted(dirty):
+                records = {}
+                for record_id in members[shard]:
+                    stored = lookup(record_id)
+                    if stored is not None:
+                        records[record_id] = stored
+                with self.__lock:
+                    # Artık bulunmayan (silinen/geri alınan) kayıtlar üyelikten de çıkarılır
+                    for record_id in members[shard]:
+                        if record_id not in records:
+                            self.__members[shard].pop(record_id, None)
+
+                metadata = {'last_modified': last_modified.isoformat(),
+                            f'total_{self.__section}': len(records),
+                            'shard': shard, 'shard_count': self.shard_count}
+                if fragments is not None:
+                    self.__codec.write_fragments(self.shard_path(shard), self.__section,
+                                                 fragments.render(records.items()), metadata)
+                else:
+                    records = {record_id: serialize(stored) for record_id, stored in records.items()}
+                    self.__codec.write(self.shard_path(shard), self.__section, records, metadata, None)
+
+            if self.__layout_count != self.shard_count:
+                self._write_manifest()
+        except BaseException:
+            with self.__lock:
+                self.__dirty |= dirty
+            raise
+        return len(dirty)
+
+    def _write_manifest(self):
+        atomic_write_json(self.manifest_path, {'manifest': {
+            'section': self.__section,
+            'shard_count': self.shard_count,
+            'hash': 'crc32',
+            'version': SHARD_LAYOUT_VERSION,
+        }})
+        old_count, self.__layout_count = self.__layout_count, self.shard_count
+
+        # Eski düzenin dosyaları artık kullanılmıyor
+        if old_count and old_count != self.shard_count:
+            for index in range(old_count):
+                path = self.shard_path(index, old_count)
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,410 @@
+import gc
+import gzip
+import io
+import json
+import struct
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from datetime import datetime, timedelta
+from enum import Enum
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .persistence import atomic_write, iter_snapshot_records
+
+# Kayıt tarafında tarih alanları ISO metin (JSON) veya datetime (binary) olabilir
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_COMPACT = (',', ':')
+
+
+def as_datetime(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SnapshotCodec(ABC):
+    # users.json/channels.json snapshot formatı. Repository yazma formatını isimle seçer (get_codec);
+    # okurken format dosyanın ilk baytlarından tanınır (read_snapshot), bu yüzden codec değiştirmek geçiş gerektirmez.
+    name = ""
+    persists_indexes = False  # indeksler dosyaya yazılıyor mu (yüklemede yeniden türetilmez)
+    supports_fragments = False  # encode_fragment/write_fragments var mı (FragmentCache ile kayıt bazlı kodlama)
+
+    @abstractmethod
+    def write(self, path: str, section: str, records: Dict[str, Dict[str, Any]],
+              metadata: Dict[str, Any], indexes: Optional[Dict[str, Dict[Any, Any]]] = None):
+        pass
+
+    @abstractmethod
+    def read(self, path: str, section: str, stream: bool = True) -> Tuple[Iterable[Tuple[str, Any]], Any]:
+        # (kayıt akışı, dosyada saklanan indeksler veya None)
+        pass
+
+
+class JsonSnapshotCodec(SnapshotCodec):
+    # Mevcut format: girintili (indent=2) JSON. İndeksler dosyaya yazılmaz, yüklemede yeniden kurulur.
+    name = "json"
+    supports_fragments = True
+
+    def write(self, path: str, section: str, records: Dict[str, Dict[str, Any]],
+              metadata: Dict[str, Any], indexes: Optional[Dict[str, Dict[Any, Any]]] = None):
+        data = {section: records, 'metadata': metadata}
+        self._write_text(path, lambda file: json.dump(data, file, indent=2, ensure_ascii=False, default=_json_default))
+
+    def read(self, path: str, section: str, stream: bool = True) -> Tuple[Iterable[Tuple[str, Any]], None]:
+        return iter_snapshot_records(path, section, stream=stream), None
+
+    def _write_text(self, path: str, write_fn: Callable[[Any], Any]):
+        atomic_write(path, write_fn)
+
+    # Parça (fragment) desteği: her kayıt snapshot'taki girintili haliyle ayrı kodlanır, write_fragments
+    # bunları birleştirir. Çıktı json.dump(indent=2) ile byte byte aynıdır; değişmeyen kayıtların
+    # parçaları önbellekten (FragmentCache) tekrar kullanılabilir.
+    def encode_fragment(self, record_id: str, record: Dict[str, Any]) -> str:
+        body = json.dumps(record, indent=2, ensure_ascii=False, default=_json_default)
+        return f"    {json.dumps(record_id, ensure_ascii=False)}: " + body.replace("\n", "\n    ")
+
+    def write_fragments(self, path: str, section: str, fragments: List[str], metadata: Dict[str, Any]):
+        metadata_text = json.dumps(metadata, indent=2, ensure_ascii=False, default=_json_default)
+
+        def write(file):
+            file.write("{\n  " + json.dumps(section, ensure_ascii=False) + ": ")
+            if fragments:
+                file.write("{\n")
+                file.write(",\n".join(fragments))
+                file.write("\n  }")
+            else:
+                file.write("{}")
+            file.write(',\n  "metadata": ' + metadata_text.replace("\n", "\n  ") + "\n}")
+
+        self._write_text(path, write)
+
+
+class CompactJsonSnapshotCodec(JsonSnapshotCodec):
+    # Girintisiz JSON: dosya daha küçük ve kodlama daha hızlı (json.dumps girintisiz çıktıyı C kodlayıcısıyla
+    # üretir, json.dump/indent ise saf Python yoluna düşer). Aynı JSON okuyucusuyla okunur.
+    name = "json-compact"
+
+    def write(self, path: str, section: str, records: Dict[str, Dict[str, Any]],
+              metadata: Dict[str, Any], indexes: Optional[Dict[str, Dict[Any, Any]]] = None):
+        text = json.dumps({section: records, 'metadata': metadata}, separators=_COMPACT,
+                          ensure_ascii=False, default=_json_default)
+        self._write_text(path, lambda file: file.write(text))
+
+    def encode_fragment(self, record_id: str, record: Dict[str, Any]) -> str:
+        return (json.dumps(record_id, ensure_ascii=False) + ':'
+                + json.dumps(record, separators=_COMPACT, ensure_ascii=False, default=_json_default))
+
+    def write_fragments(self, path: str, section: str, fragments: List[str], metadata: Dict[str, Any]):
+        metadata_text = json.dumps(metadata, separators=_COMPACT, ensure_ascii=False, default=_json_default)
+
+        def write(file):
+            file.write('{' + json.dumps(section, ensure_ascii=False) + ':{')
+            file.write(','.join(fragments))
+            file.write('},"metadata":' + metadata_text + '}')
+
+        self._write_text(path, write)
+
+
+class GzipJsonSnapshotCodec(CompactJsonSnapshotCodec):
+    # gzip ile sıkıştırılmış girintisiz JSON. Disk ve kopyalama maliyeti düşer, sıkıştırma CPU'su eklenir.
+    # mtime=0: aynı içerik her zaman aynı byte'lara kodlanır.
+    name = "json-gzip"
+
+    def __init__(self, compresslevel: int = 6):
+        self.compresslevel = compresslevel
+
+    def read(self, path: str, section: str, stream: bool = True) -> Tuple[Iterable[Tuple[str, Any]], None]:
+        return iter_snapshot_records(path, section, stream=stream, opener=gzip.open), None
+
+    def _write_text(self, path: str, write_fn: Callable[[Any], Any]):
+        def write(file):
+            with gzip.GzipFile(fileobj=file, mode='wb', compresslevel=self.compresslevel, mtime=0) as compressed:
+                with io.TextIOWrapper(compressed, encoding='utf-8') as text:
+                    write_fn(text)
+
+        atomic_write(path, write, binary=True)
+
+
+# --- Binary snapshot ---
+#
+# Sütun bazlı (columnar) düzen: her alan tüm kayıtlar için tek blokta tutulur, böylece çözme işi
+# kayıt başına Python döngüsü yerine array/bytes.decode gibi C seviyesindeki toplu işlemlerle yapılır.
+#
+#   header : b"VPSN" | u16 version | u8 section | u32 row_count
+#   columns: şemadaki sırayla, her sütun uzunluk önekli parçalardan oluşur
+#   indexes: u8 index_count, her indeks için ad + tür + anahtarlar + satır numaraları
+#
+# Enum alanları (UserRole, ChannelType, ChannelStatus ...) sözlük kodlanır: değer tablosu + küçük int kodlar.
+# Tarihler 1970-01-01'den itibaren mikro saniye (int64) olarak saklanır.
+
+BINARY_MAGIC = b"VPSN"
+BINARY_VERSION = 1
+
+_STR, _ENUM, _INT, _BOOL, _TIMESTAMP, _STR_LIST = range(6)
+_INDEX_MAP, _INDEX_MULTIMAP = 1, 2
+_NO_TIMESTAMP = -1 << 63
+
+_SECTIONS = {
+    'users': (1, [
+        ('user_id', _STR, ''), ('username', _STR, ''), ('email', _STR, ''), ('password_hash', _STR, ''),
+        ('role', _ENUM, 'viewer'), ('user_type', _ENUM, 'ViewerUser'),
+        ('created_at', _TIMESTAMP, None), ('is_active', _BOOL, True),
+    ]),
+    'channels': (2, [
+        ('channel_id', _STR, ''), ('name', _STR, ''), ('description', _STR, ''), ('owner_id', _STR, ''),
+        ('channel_type', _ENUM, 'public'), ('status', _ENUM, 'active'),
+        ('created_at', _TIMESTAMP, None), ('updated_at', _TIMESTAMP, None),
+        ('subscriber_count', _INT, 0), ('video_count', _INT, 0),
+        ('moderators', _STR_LIST, ()), ('tags', _STR_LIST, ()),
+        ('category', _ENUM, 'other'), ('channel_class', _ENUM, 'PublicChannel'),
+    ]),
+}
+
+_LENGTH = struct.Struct('<Q')
+_STRINGS_HEADER = struct.Struct('<BI')
+_SEPARATED, _LENGTH_PREFIXED = 0, 1
+_HEADER = struct.Struct('<4sHBI')
+
+
+def _array_bytes(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _bytes_array(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class _Writer:
+    def __init__(self):
+        self.parts = []
+
+    def part(self, data: bytes):
+        self.parts.append(_LENGTH.pack(len(data)))
+        self.parts.append(data)
+
+    def strings(self, values: List[str]):
+        # Metinler NUL ile ayrılır, okurken tek str.split yeterli olur.
+        # Değerlerden biri NUL içeriyorsa uzunluk tablosuna geri dönülür.
+        text = '\x00'.join(values)
+        if text.count('\x00') == max(len(values) - 1, 0):
+            self.part(_STRINGS_HEADER.pack(_SEPARATED, len(values)))
+        else:
+            self.part(_STRINGS_HEADER.pack(_LENGTH_PREFIXED, len(values)))
+            self.part(_array_bytes(array('I', map(len, values))))
+            text = ''.join(values)
+        self.part(text.encode('utf-8'))
+
+    def enum(self, values: List[str]):
+        table = list(dict.fromkeys(values))
+        codes = {value: code for code, value in enumerate(table)}
+        self.strings(table)
+        self.part(_array_bytes(array('B' if len(table) <= 256 else 'I', map(codes.__getitem__, values))))
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int):
+        self.data = data
+        self.offset = offset
+
+    def part(self) -> bytes:
+        (length,) = _LENGTH.unpack_from(self.data, self.offset)
+        start = self.offset + _LENGTH.size
+        self.offset = start + length
+        return self.data[start:self.offset]
+
+    def strings(self) -> List[str]:
+        mode, count = _STRINGS_HEADER.unpack(self.part())
+        if mode == _SEPARATED:
+            text = self.part().decode('utf-8')
+            return text.split('\x00') if count else []
+        lengths = _bytes_array('I', self.part())
+        text = self.part().decode('utf-8')
+        ends = list(accumulate(lengths))
+        return [text[end - length:end] for end, length in zip(ends, lengths)]
+
+    def enum(self) -> List[str]:
+        table = self.strings()
+        codes = self.part()
+        codes = codes if len(table) <= 256 else _bytes_array('I', codes)
+        return [table[code] for code in codes]
+
+
+class BinarySnapshotCodec(SnapshotCodec):
+    # Sürümlü, sütun bazlı binary snapshot. İndeksler de dosyaya yazılır, yüklemede yeniden türetilmez.
+    name = "binary"
+    persists_indexes = True
+
+    def write(self, path: str, section: str, records: Dict[str, Dict[str, Any]],
+              metadata: Dict[str, Any], indexes: Optional[Dict[str, Dict[Any, Any]]] = None):
+        data = self.encode(section, records, indexes or {})
+        atomic_write(path, lambda file: file.write(data), binary=True)
+
+    def read(self, path: str, section: str, stream: bool = True) -> Tuple[Iterable[Tuple[str, Any]], Any]:
+        with open(path, 'rb') as file:
+            data = file.read()
+        return self.decode(section, data)
+
+    def encode(self, section: str, records: Dict[str, Dict[str, Any]], indexes: Dict[str, Dict[Any, Any]]) -> bytes:
+        section_code, columns = _SECTIONS[section]
+        rows = list(records.values())
+        writer = _Writer()
+
+        for field, kind, default in columns:
+            values = [row.get(field, default) for row in rows]
+            if kind == _STR:
+                writer.strings(values)
+            elif kind == _ENUM:
+                writer.enum(values)
+            elif kind == _INT:
+                writer.part(_array_bytes(array('q', values)))
+            elif kind == _BOOL:
+                writer.part(bytes(bool(value) for value in values))
+            elif kind == _TIMESTAMP:
+                writer.part(_array_bytes(array('q', [
+                    (as_datetime(value) - _EPOCH) // _MICROSECOND if value is not None else _NO_TIMESTAMP
+                    for value in values
+                ])))
+            elif kind == _STR_LIST:
+                writer.part(_array_bytes(array('I', map(len, values))))
+                writer.strings([item for value in values for item in value])
+
+        # İndeks değerleri kayıt id'si yerine satır numarası olarak yazılır
+        row_of = {record_id: row for row, record_id in enumerate(records)}
+        index_parts = [struct.pack('<B', len(indexes))]
+        for name, index in indexes.items():
+            index_writer = _Writer()
+            multimap = any(not isinstance(value, str) for value in index.values())
+            index_writer.strings([name])
+            index_writer.part(struct.pack('<B', _INDEX_MULTIMAP if multimap else _INDEX_MAP))
+            if multimap:
+                index = {key: [row_of[v] for v in ids if v in row_of] for key, ids in index.items()}
+                index_writer.strings([key.value if isinstance(key, Enum) else key for key in index])
+                index_writer.part(_array_bytes(array('I', map(len, index.values()))))
+                index_writer.part(_array_bytes(array('I', [row for rows in index.values() for row in rows])))
+            else:
+                index = {key: row_of[v] for key, v in index.items() if v in row_of}
+                index_writer.strings([key.value if isinstance(key, Enum) else key for key in index])
+                index_writer.part(_array_bytes(array('I', index.values())))
+            index_parts.extend(index_writer.parts)
+
+        header = _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, section_code, len(rows))
+        return b''.join([header, *writer.parts, *index_parts])
+
+    def decode(self, section: str, data: bytes) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
+        # Milyonlarca küçük nesne oluşturulurken döngüsel GC taramaları süreyi katlıyor; çözme boyunca durdurulur
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._decode(section, data)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _decode(self, section: str, data: bytes) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
+        magic, version, section_code, row_count = _HEADER.unpack_from(data, 0)
+        expected_code, columns = _SECTIONS[section]
+        if magic != BINARY_MAGIC or version != BINARY_VERSION or section_code != expected_code:
+            raise ValueError(f"Unsupported binary snapshot (version={version}, section={section_code})")
+
+        reader = _Reader(data, _HEADER.size)
+        fields = []
+        for field, kind, default in columns:
+            if kind == _STR:
+                values = reader.strings()
+            elif kind == _ENUM:
+                values = reader.enum()
+            elif kind == _INT:
+                values = _bytes_array('q', reader.part()).tolist()
+            elif kind == _BOOL:
+                values = [bool(value) for value in reader.part()]
+            elif kind == _TIMESTAMP:
+                # Aynı anda oluşturulan kayıtlar aynı zamanı paylaşır, her farklı değer bir kez çevrilir
+                stamps = _bytes_array('q', reader.part())
+                converted = {value: _EPOCH + timedelta(microseconds=value) if value != _NO_TIMESTAMP else None
+                             for value in set(stamps)}
+                values = list(map(converted.__getitem__, stamps))
+            else:
+                counts = _bytes_array('I', reader.part())
+                flat = reader.strings()
+                ends = list(accumulate(counts))
+                values = [flat[end - count:end] for end, count in zip(ends, counts)]
+            fields.append((field, values))
+
+        names = [field for field, _ in fields]
+        rows = [dict(zip(names, row)) for row in zip(*(values for _, values in fields))]
+        ids = fields[0][1]
+        if len(ids) != row_count:
+            raise ValueError(f"Binary snapshot is truncated: expected {row_count} rows, found {len(ids)}")
+
+        indexes = {}
+        (index_count,) = struct.unpack_from('<B', data, reader.offset)
+        reader.offset += 1
+        for _ in range(index_count):
+            name = reader.strings()[0]
+            (kind,) = struct.unpack('<B', reader.part())
+            keys = reader.strings()
+            if kind == _INDEX_MULTIMAP:
+                counts = _bytes_array('I', reader.part())
+                row_numbers = _bytes_array('I', reader.part())
+                ends = list(accumulate(counts))
+                index_ids = list(map(ids.__getitem__, row_numbers))
+                indexes[name] = {key: index_ids[end - count:end] for key, end, count in zip(keys, ends, counts)}
+            else:
+                indexes[name] = dict(zip(keys, map(ids.__getitem__, _bytes_array('I', reader.part()))))
+
+        return list(zip(ids, rows)), indexes
+
+
+_CODECS = {
+    JsonSnapshotCodec.name: JsonSnapshotCodec,
+    CompactJsonSnapshotCodec.name: CompactJsonSnapshotCodec,
+    GzipJsonSnapshotCodec.name: GzipJsonSnapshotCodec,
+    BinarySnapshotCodec.name: BinarySnapshotCodec,
+}
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def codec_names() -> List[str]:
+    return list(_CODECS)
+
+
+def get_codec(codec: Any = "json") -> SnapshotCodec:
+    # İsimle (veya doğrudan codec nesnesiyle) snapshot codec'i seç
+    if not isinstance(codec, str):
+        return codec
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown snapshot codec '{codec}', expected one of {sorted(_CODECS)}")
+    return _CODECS[codec]()
+
+
+def detect_codec(path: str) -> SnapshotCodec:
+    # Dosya formatını ilk baytlardan tanı. Girintili ve girintisiz JSON aynı okuyucuyu kullanır.
+    with open(path, 'rb') as file:
+        head = file.read(len(BINARY_MAGIC))
+    if head == BINARY_MAGIC:
+        return BinarySnapshotCodec()
+    if head.startswith(GZIP_MAGIC):
+        return GzipJsonSnapshotCodec()
+    return JsonSnapshotCodec()
+
+
+def read_snapshot(path: str, section: str, stream: bool = True):
+    # Repository hangi codec ile yazarsa yazsın mevcut dosya okunabilir
+    return detect_codec(path).read(path, section, stream=stream)
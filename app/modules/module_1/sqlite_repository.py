@@ -0,0 +1,639 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from .base import (
+    AdminUser,
+    BaseChannel,
+    BaseUser,
+    ChannelNotFoundException,
+    ChannelStatus,
+    ChannelType,
+    DuplicateChannelException,
+    DuplicateUserException,
+    UserNotFoundException,
+    UserRole,
+)
+from .persistence import GroupCommitter
+from .repository import ChannelRepository, UserRepository, category_key
+
+# 2: category_key lower() yerine category_key() ile (JSON repository ile aynı katlama)
+SCHEMA_VERSION = 2
+
+_USER_COLUMNS = ('user_id', 'username', 'email', 'password_hash', 'role', 'user_type', 'created_at', 'is_active')
+_CHANNEL_COLUMNS = ('channel_id', 'name', 'description', 'owner_id', 'channel_type', 'status', 'created_at',
+                    'updated_at', 'subscriber_count', 'video_count', 'moderators', 'tags', 'category',
+                    'channel_class')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    username_key TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL,
+    email_key TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL,
+    user_type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    is_active INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_role ON users (role);
+
+CREATE TABLE IF NOT EXISTS channels (
+    channel_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    owner_id TEXT NOT NULL,
+    channel_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    subscriber_count INTEGER NOT NULL,
+    video_count INTEGER NOT NULL,
+    moderators TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    category TEXT NOT NULL,
+    category_key TEXT NOT NULL,
+    channel_class TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS channels_owner ON channels (owner_id);
+CREATE INDEX IF NOT EXISTS channels_type ON channels (channel_type);
+CREATE INDEX IF NOT EXISTS channels_category ON channels (category_key);
+"""
+
+
+class _SqliteDatabase:
+    # Tek bir sqlite bağlantısı: WAL modu, açık (explicit) transaction yönetimi ve batch desteği.
+    # Group commit zamanlayıcısı başka thread'den commit edebildiği için tüm erişim tek kilitle yapılır.
+    # Aynı dosyayı açan user/channel repository'leri bağlantıyı paylaşır; ayrı bağlantılar bekleyen
+    # (durable=False) transaction boyunca birbirinin yazma kilidini beklerdi.
+
+    _open = {}  # abspath -> _SqliteDatabase
+    _open_lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, path: str, synchronous: str = "NORMAL") -> "_SqliteDatabase":
+        key = os.path.abspath(path)
+        with cls._open_lock:
+            database = cls._open.get(key)
+            if database is None:
+                database = cls._open[key] = cls(path, synchronous)
+            database.users += 1
+            return database
+
+    def __init__(self, path: str, synchronous: str = "NORMAL"):
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid sqlite synchronous mode '{synchronous}'")
+        self.path = path
+        self.lock = threading.RLock()
+        self.in_batch = False
+        self.users = 0  # bu bağlantıyı kullanan repository sayısı
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"PRAGMA synchronous={synchronous}")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(f"Database schema version {version} is newer than supported {SCHEMA_VERSION}")
+        self.conn.executescript(_SCHEMA)
+        if version < 2:
+            # Eski veritabanlarındaki lower() ile üretilmiş kategori anahtarları yeniden hesaplanır
+            rows = self.conn.execute("SELECT channel_id, category FROM channels").fetchall()
+            self.conn.execute("BEGIN")
+            self.conn.executemany("UPDATE channels SET category_key = ? WHERE channel_id = ?",
+                                  [(category_key(row['category']), row['channel_id']) for row in rows])
+            self.conn.execute("COMMIT")
+        self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        with self.lock:
+            return self.conn.execute(sql, tuple(params)).fetchall()
+
+    def write(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Cursor:
+        # Tek satırlık değişiklik; açık bir transaction yoksa başlatılır, commit çağırana bırakılır.
+        # Hata olursa sadece bu işlem için başlatılan transaction geri alınır (bekleyen değişiklikler korunur).
+        with self.lock:
+            started = not self.conn.in_transaction
+            if started:
+                self.conn.execute("BEGIN")
+            try:
+                return self.conn.execute(sql, tuple(params))
+            except Exception:
+                if started:
+                    self.conn.execute("ROLLBACK")
+                raise
+
+    def data_version(self) -> int:
+        # Başka bir bağlantı (süreç) commit ettiğinde değişir; bu bağlantının yazmaları değiştirmez
+        return self.query("PRAGMA data_version")[0][0]
+
+    def commit(self):
+        with self.lock:
+            if self.conn.in_transaction and not self.in_batch:
+                self.conn.execute("COMMIT")
+
+    @contextmanager
+    def batch(self):
+        # Blok tek transaction içinde çalışır; hata olursa ROLLBACK
+        with self.lock:
+            if self.in_batch:
+                yield
+                return
+
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            self.in_batch = True
+            try:
+                yield
+            except BaseException:
+                self.in_batch = False
+                self.conn.execute("ROLLBACK")
+                raise
+            self.in_batch = False
+
+    def release(self):
+        # Son kullanan repository kapanınca bağlantıyı kapat
+        with self._open_lock, self.lock:
+            self.commit()
+            self.users -= 1
+            if self.users == 0:
+                self._open.pop(os.path.abspath(self.path), None)
+                self.conn.close()
+
+
+class SqliteUserRepository:
+    # UserRepository ile aynı public API, kayıtlar sqlite (WAL) tablosunda.
+    # username/email aramaları UNIQUE indekslerle yapılır, her değişiklik tek satırlık UPDATE/INSERT'tir.
+
+    # Kayıt formatı ve doğrulama JSON repository ile birebir aynıdır
+    _serialize_user = UserRepository._serialize_user
+    _deserialize_user = UserRepository._deserialize_user
+    _validate_user_data = UserRepository._validate_user_data
+    _build_user = UserRepository._build_user
+    validate_username = staticmethod(UserRepository.validate_username)
+    validate_email = staticmethod(UserRepository.validate_email)
+
+    def __init__(self, db_file: str = "module1.db", synchronous: str = "NORMAL"):
+        print(f"System >> Baslatildi SqliteUserRepository veritabaniyla: {db_file}")
+        self.__db = _SqliteDatabase.acquire(db_file, synchronous)  # Private attribute
+        self.__data_version = self.__db.data_version()
+        print(f"System >> SqliteUserRepository baslatildi birlikte {self.get_user_count()} users")
+
+    def _row_to_user(self, row: sqlite3.Row) -> Optional[BaseUser]:
+        data = dict(zip(_USER_COLUMNS, (row[column] for column in _USER_COLUMNS)))
+        data['is_active'] = bool(data['is_active'])
+        return self._deserialize_user(data)
+
+    def _user_params(self, user: BaseUser) -> tuple:
+        data = self._serialize_user(user)
+        return (data['username'], data['username'].lower(), data['email'], data['email'].lower(),
+                data['password_hash'], data['role'], data['user_type'], data['created_at'],
+                int(data['is_active']), data['user_id'])
+
+    @staticmethod
+    def _duplicate_error(user: BaseUser, error: sqlite3.IntegrityError) -> DuplicateUserException:
+        # Hangi UNIQUE kısıtının ihlal edildiği hata mesajından okunur
+        message = str(error)
+        if 'users.username_key' in message:
+            return DuplicateUserException(f"Username '{user.username}' already exists")
+        if 'users.email_key' in message:
+            return DuplicateUserException(f"Email '{user.email}' already exists")
+        return DuplicateUserException(f"User with ID {user.user_id} already exists")
+
+    def _insert_user(self, user: BaseUser):
+        try:
+            self.__db.write(
+                "INSERT INTO users (username, username_key, email, email_key, password_hash, role, "
+                "user_type, created_at, is_active, user_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._user_params(user),
+            )
+        except sqlite3.IntegrityError as e:
+            raise self._duplicate_error(user, e) from e
+
+    def _update_user_columns(self, user_id: str, **columns: Any):
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        self.__db.write(f"UPDATE users SET {assignments} WHERE user_id = ?", (*columns.values(), user_id))
+        self.__db.commit()
+
+    @contextmanager
+    def batch(self):
+        # Blok içindeki tüm yazmalar tek transaction ve tek commit; hata olursa geri alınır
+        with self.__db.batch():
+            yield self
+        self.__db.commit()
+
+    def create_user(self, user: BaseUser) -> BaseUser:
+        if not isinstance(user, BaseUser):
+            raise TypeError("User must be instance of BaseUser")
+
+        print(f"System >> Kullanici olusturma {user.user_id} username ile  '{user.username}'")
+
+        if not self._validate_user_data(user):
+            raise ValueError("User validation failed")
+
+        self._insert_user(user)
+        self.__db.commit()
+        print(f"System >> Kullanici {user.user_id} olusturuldu ve kaydedildi (basarili)")
+        return user
+
+    def create_users_bulk(self, records: Iterable[Any]) -> List[Dict[str, Any]]:
+        # Tüm kayıtlar tek transaction'da eklenir; hatalı kayıtlar atlanır, geçerliler tek commit ile yazılır
+        report = []
+        created = 0
+
+        with self.batch():
+            for index, record in enumerate(records):
+                user_id = record.user_id if isinstance(record, BaseUser) else record.get('user_id')
+                try:
+                    user = self._build_user(record)
+                    self._insert_user(user)
+                except Exception as e:
+                    report.append({'index': index, 'user_id': user_id, 'ok': False,
+                                   'error': f"{type(e).__name__}: {e}"})
+                    continue
+                created += 1
+                report.append({'index': index, 'user_id': user.user_id, 'ok': True, 'error': None})
+
+        print(f"System >> Toplu kullanici ekleme: {created} eklendi, {len(report) - created} reddedildi")
+        return report
+
+    def get_user_by_id(self, user_id: str) -> BaseUser:
+        if not isinstance(user_id, str) or not user_id.strip():
+            raise ValueError("User ID must be non-empty string")
+
+        user_id = user_id.strip()
+        rows = self.__db.query("SELECT * FROM users WHERE user_id = ?", (user_id,))
+        if not rows:
+            raise UserNotFoundException(f"User with ID {user_id} not found")
+        return self._row_to_user(rows[0])
+
+    def get_user_by_username(self, username: str) -> BaseUser:
+        if not isinstance(username, str) or not username.strip():
+            raise ValueError("Username must be non-empty string")
+
+        rows = self.__db.query("SELECT * FROM users WHERE username_key = ?", (username.strip().lower(),))
+        if not rows:
+            raise UserNotFoundException(f"User with username '{username}' not found")
+        return self._row_to_user(rows[0])
+
+    def get_all_users(self) -> List[BaseUser]:
+        return [self._row_to_user(row) for row in self.__db.query("SELECT * FROM users ORDER BY rowid")]
+
+    def get_users_by_role(self, role: UserRole) -> List[BaseUser]:
+        rows = self.__db.query("SELECT * FROM users WHERE role = ? ORDER BY rowid", (role.value,))
+        return [self._row_to_user(row) for row in rows]
+
+    def get_user_count(self) -> int:
+        return self.__db.query("SELECT COUNT(*) FROM users")[0][0]
+
+    def set_user_active(self, user_id: str, is_active: bool) -> BaseUser:
+        """Kullanıcının aktif/pasif durumunu değiştirir ve veritabanına yazar."""
+        user = self.get_user_by_id(user_id)
+        user.is_active = bool(is_active)
+        self._update_user_columns(user.user_id, is_active=int(user.is_active))
+        return user
+
+    def update_user_password(self, user_id: str, new_password: str) -> BaseUser:
+        """Kullanıcının şifresini değiştirir ve veritabanına yazar."""
+        user = self.get_user_by_id(user_id)
+        user.password = new_password
+        self._update_user_columns(user.user_id, password_hash=user.password)
+        return user
+
+    def update_user(self, user: BaseUser) -> BaseUser:
+        # Kullanıcının tüm alanlarını tek satırlık UPDATE ile yaz (username/email değişebilir)
+        if not isinstance(user, BaseUser):
+            raise TypeError("User must be instance of BaseUser")
+        if not self._validate_user_data(user):
+            raise ValueError("User validation failed")
+
+        try:
+            cursor = self.__db.write(
+                "UPDATE users SET username = ?, username_key = ?, email = ?, email_key = ?, password_hash = ?, "
+                "role = ?, user_type = ?, created_at = ?, is_active = ? WHERE user_id = ?",
+                self._user_params(user),
+            )
+        except sqlite3.IntegrityError as e:
+            raise self._duplicate_error(user, e) from e
+        self.__db.commit()
+        if cursor.rowcount == 0:
+            raise UserNotFoundException(f"User with ID {user.user_id} not found")
+        return user
+
+    def delete_user(self, user_id: str):
+        cursor = self.__db.write("DELETE FROM users WHERE user_id = ?", (user_id,))
+        self.__db.commit()
+        if cursor.rowcount == 0:
+            raise UserNotFoundException(f"User with ID {user_id} not found")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # Her yazma zaten commit edilir; UserRepository.flush ile uyumluluk için açık transaction kapatılır
+        self.__db.commit()
+        return True
+
+    def get_pending_write_count(self) -> int:
+        return 0
+
+    def mark_dirty(self, user_id: str):
+        # Dönen nesneler her okumada satırdan yeniden kurulur; repository dışında değiştirilen nesne
+        # update_user ile yazılmalı. UserRepository ile uyumluluk için hiçbir şey yapmaz.
+        pass
+
+    def refresh(self) -> bool:
+        # Okumalar zaten veritabanının son halini görür; başka bir süreç commit ettiyse True döner
+        version = self.__db.data_version()
+        changed = version != self.__data_version
+        self.__data_version = version
+        return changed
+
+    @property
+    def read_only(self) -> bool:
+        return False
+
+    def promote(self):
+        # sqlite repository'leri replica olarak açılmaz, her zaman yazılabilir
+        pass
+
+    def compact(self):
+        # JSON journal ile uyumluluk için; WAL dosyasını ana veritabanına aktarır
+        self.__db.commit()
+        self.__db.query("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        self.__db.release()
+
+    @classmethod
+    def create_with_default_admin(cls, db_file: str = "module1.db"):
+        repo = cls(db_file)
+        if not repo.get_users_by_role(UserRole.ADMIN):
+            try:
+                repo.create_user(AdminUser("admin_default", "admin", "admin@system.local",
+                                           "hashed_admin_password_123", UserRole.ADMIN))
+                print(f"System >> Varsayilan yonetici kullanicisi basariyla olusturuldu")
+            except Exception as e:
+                print(f"System >> Error creating default admin: {e}")
+        return repo
+
+
+class SqliteChannelRepository:
+    # ChannelRepository ile aynı public API, kayıtlar sqlite (WAL) tablosunda.
+    # owner/type/category sorguları SQL indeksleriyle yapılır. commit_window/commit_max_ops verilirse
+    # durable=False yazmalar açık transaction'da bekler ve tek COMMIT ile birlikte yazılır.
+
+    _serialize_channel = ChannelRepository._serialize_channel
+    _deserialize_channel = ChannelRepository._deserialize_channel
+    _validate_channel_data = ChannelRepository._validate_channel_data
+    validate_channel_name = staticmethod(ChannelRepository.validate_channel_name)
+    validate_channel_description = staticmethod(ChannelRepository.validate_channel_description)
+
+    def __init__(self, db_file: str = "module1.db", commit_window: Optional[float] = None,
+                 commit_max_ops: Optional[int] = None, synchronous: str = "NORMAL"):
+        print(f"System >> SqliteChannelRepository'nin veritabanıyla başlatılması: {db_file}")
+        self.__db = _SqliteDatabase.acquire(db_file, synchronous)  # Private attribute
+        self.__data_version = self.__db.data_version()
+
+        if commit_window is None and commit_max_ops is None:
+            commit_max_ops = 1
+        self.__committer = GroupCommitter(self.__db.commit, window=commit_window, max_ops=commit_max_ops)
+
+        print(f"System >> SqliteChannelRepository initialized with {self.get_channel_count()} channels")
+
+    def _row_to_channel(self, row: sqlite3.Row) -> Optional[BaseChannel]:
+        data = dict(zip(_CHANNEL_COLUMNS, (row[column] for column in _CHANNEL_COLUMNS)))
+        data['moderators'] = json.loads(data['moderators'])
+        data['tags'] = json.loads(data['tags'])
+        return self._deserialize_channel(data)
+
+    def _rows_to_channels(self, rows: List[sqlite3.Row]) -> List[BaseChannel]:
+        return [channel for channel in map(self._row_to_channel, rows) if channel is not None]
+
+    def _channel_params(self, channel: BaseChannel) -> tuple:
+        data = self._serialize_channel(channel)
+        return (data['name'], data['description'], data['owner_id'], data['channel_type'], data['status'],
+                data['created_at'], data['updated_at'], data['subscriber_count'], data['video_count'],
+                json.dumps(data['moderators']), json.dumps(data['tags']), data['category'],
+                category_key(data['category']), data['channel_class'], data['channel_id'])
+
+    def _record(self, durable: Optional[bool] = None):
+        # batch() içindeyse commit blok sonuna bırakılır
+        if not self.__db.in_batch:
+            self.__committer.record(durable)
+
+    @contextmanager
+    def batch(self):
+        # Bekleyen group commit yazmaları önce diske aktarılır, böylece ROLLBACK onları geri almaz
+        self.__committer.flush()
+        with self.__db.batch():
+            yield self
+        self.__committer.record(durable=True)
+
+    def create_channel(self, channel: BaseChannel, durable: Optional[bool] = None) -> BaseChannel:
+        if not isinstance(channel, BaseChannel):
+            raise TypeError("Channel must be instance of BaseChannel")
+
+        print(f"System >> Kanal olusturuluyor {channel.channel_id} adiyla '{channel.name}'")
+
+        if not self._validate_channel_data(channel):
+            raise ValueError("Channel validation failed")
+
+        try:
+            self.__db.write(
+                "INSERT INTO channels (name, description, owner_id, channel_type, status, created_at, updated_at, "
+                "subscriber_count, video_count, moderators, tags, category, category_key, channel_class, "
+                "channel_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._channel_params(channel),
+            )
+        except sqlite3.IntegrityError as e:
+            raise DuplicateChannelException(f"Channel with ID {channel.channel_id} already exists") from e
+
+        self._record(durable)
+        print(f"System >> Kanal {channel.channel_id} başarıyla oluşturuldu ve kaydedildi")
+        return channel
+
+    def get_channel_by_id(self, channel_id: str) -> BaseChannel:
+        if not isinstance(channel_id, str) or not channel_id.strip():
+            raise ValueError("Channel ID must be non-empty string")
+
+        channel_id = channel_id.strip()
+        rows = self.__db.query("SELECT * FROM channels WHERE channel_id = ?", (channel_id,))
+        channel = self._row_to_channel(rows[0]) if rows else None
+        if channel is None:
+            raise ChannelNotFoundException(f"Channel with ID {channel_id} not found")
+        return channel
+
+    def get_all_channels(self) -> List[BaseChannel]:
+        return self._rows_to_channels(self.__db.query("SELECT * FROM channels ORDER BY rowid"))
+
+    def get_channels_by_owner(self, owner_id: str) -> List[BaseChannel]:
+        rows = self.__db.query("SELECT * FROM channels WHERE owner_id = ? ORDER BY rowid", (owner_id,))
+        return self._rows_to_channels(rows)
+
+    def get_channels_by_type(self, channel_type: ChannelType) -> List[BaseChannel]:
+        rows = self.__db.query("SELECT * FROM channels WHERE channel_type = ? ORDER BY rowid",
+                               (channel_type.value,))
+        return self._rows_to_channels(rows)
+
+    def get_channel_by_category(self, category: str) -> List[BaseChannel]:
+        rows = self.__db.query("SELECT * FROM channels WHERE category_key = ? ORDER BY rowid",
+                               (category_key(category),))
+        return self._rows_to_channels(rows)
+
+    def find_channels(self, category: Optional[str] = None, channel_type: Optional[ChannelType] = None,
+                      status: Optional[ChannelStatus] = None, owner_id: Optional[str] = None) -> List[BaseChannel]:
+        # ChannelRepository.find_channels ile aynı: verilen koşulların hepsi (sqlite en seçici indeksi kendisi seçer)
+        clauses, params = [], []
+        for column, value in (('owner_id', owner_id),
+                              ('channel_type', ChannelType(channel_type).value if channel_type is not None else None),
+                              ('category_key', category_key(category) if category is not None else None),
+                              ('status', ChannelStatus(status).value if status is not None else None)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.__db.query(f"SELECT * FROM channels{where} ORDER BY rowid", tuple(params))
+        return self._rows_to_channels(rows)
+
+    def get_channel_count(self) -> int:
+        return self.__db.query("SELECT COUNT(*) FROM channels")[0][0]
+
+    def set_channel_status(self, channel_id: str, new_status: ChannelStatus,
+                           durable: Optional[bool] = None) -> BaseChannel:
+        """Kanal durumunu değiştirir ve veritabanına yazar."""
+        channel = self.get_channel_by_id(channel_id)
+        channel.change_status(new_status)
+        self.__db.write("UPDATE channels SET status = ?, updated_at = ? WHERE channel_id = ?",
+                        (channel.status.value, channel.updated_at.isoformat(), channel.channel_id))
+        self._record(durable)
+        return channel
+
+    def increment_channel_video_count(self, channel_id: str, delta: int = 1,
+                                      durable: Optional[bool] = None) -> BaseChannel:
+        # Sayaç SQL içinde artırılır, okuma-değiştirme-yazma yarışı olmaz
+        if delta <= 0:
+            raise ValueError("delta must be positive")
+        channel = self.get_channel_by_id(channel_id)
+        channel.video_count += delta
+        channel.updated_at = datetime.now()
+        self.__db.write("UPDATE channels SET video_count = video_count + ?, updated_at = ? WHERE channel_id = ?",
+                        (delta, channel.updated_at.isoformat(), channel.channel_id))
+        self._record(durable)
+        return channel
+
+    def update_channel(self, channel: BaseChannel, durable: Optional[bool] = None) -> BaseChannel:
+        # Kanalın tüm alanlarını tek satırlık UPDATE ile yaz
+        if not isinstance(channel, BaseChannel):
+            raise TypeError("Channel must be instance of BaseChannel")
+        if not self._validate_channel_data(channel):
+            raise ValueError("Channel validation failed")
+
+        cursor = self.__db.write(
+            "UPDATE channels SET name = ?, description = ?, owner_id = ?, channel_type = ?, status = ?, "
+            "created_at = ?, updated_at = ?, subscriber_count = ?, video_count = ?, moderators = ?, tags = ?, "
+            "category = ?, category_key = ?, channel_class = ? WHERE channel_id = ?",
+            self._channel_params(channel),
+        )
+        self._record(durable)
+        if cursor.rowcount == 0:
+            raise ChannelNotFoundException(f"Channel with ID {channel.channel_id} not found")
+        return channel
+
+    def delete_channel(self, channel_id: str, durable: Optional[bool] = None):
+        cursor = self.__db.write("DELETE FROM channels WHERE channel_id = ?", (channel_id,))
+        self._record(durable)
+        if cursor.rowcount == 0:
+            raise ChannelNotFoundException(f"Channel with ID {channel_id} not found")
+
+    def rename_owner(self, old_owner_id: str, new_owner_id: str, durable: Optional[bool] = None) -> int:
+        # Eski sahibin tüm kanallarını yeni sahibe aktar, aktarılan kanal sayısını döndür
+        if not isinstance(new_owner_id, str) or not new_owner_id.strip():
+            raise ValueError("Owner ID must be non-empty string")
+        new_owner_id = new_owner_id.strip()
+        if old_owner_id == new_owner_id:
+            return 0
+        cursor = self.__db.write("UPDATE channels SET owner_id = ?, updated_at = ? WHERE owner_id = ?",
+                                 (new_owner_id, datetime.now().isoformat(), old_owner_id))
+        self._record(durable)
+        return cursor.rowcount
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # Group commit penceresinde bekleyen yazmaları hemen commit et
+        self.__committer.flush()
+        return True
+
+    def get_pending_write_count(self) -> int:
+        return self.__committer.pending
+
+    def mark_dirty(self, channel_id: str):
+        # Dönen nesneler her okumada satırdan yeniden kurulur; repository dışında değiştirilen nesne
+        # update_channel ile yazılmalı. ChannelRepository ile uyumluluk için hiçbir şey yapmaz.
+        pass
+
+    def refresh(self) -> bool:
+        # Okumalar zaten veritabanının son halini görür; başka bir süreç commit ettiyse True döner
+        version = self.__db.data_version()
+        changed = version != self.__data_version
+        self.__data_version = version
+        return changed
+
+    @property
+    def read_only(self) -> bool:
+        return False
+
+    def promote(self):
+        # sqlite repository'leri replica olarak açılmaz, her zaman yazılabilir
+        pass
+
+    def close(self):
+        self.flush()
+        self.__db.release()
+
+
+def create_module1_repositories(backend: str = "json", data_dir: str = ".", shards: Optional[int] = None,
+                                codec: str = "json", shared: bool = False, write_behind: bool = False,
+                                **channel_options):
+    # Yapılandırmaya göre (user_repo, channel_repo) çiftini oluştur.
+    # shards verilirse JSON repository'leri shard düzenini kullanır (mevcut tek dosya ilk açılışta dağıtılır).
+    # codec JSON backend'inin snapshot yazma formatıdır; mevcut dosya hangi formatta olursa olsun okunur.
+    # shared=True: JSON dosyalarını birden fazla süreç kullanıyorsa yazmalar dosya kilidiyle yapılır,
+    # diğer süreçlerin değişiklikleri okumada yüklenir (sqlite bunu zaten kendisi yapar).
+    # write_behind=True: JSON repository'leri değişiklikleri arka plan thread'inde yazar; shared modda
+    # kuyruk dolunca çağıran yazmayı kendisi yapar (sqlite'ta group commit ayarları kullanılır).
+    # "sqlite" seçildiğinde veritabanı ilk kez oluşturuluyorsa mevcut users.json/channels.json içe aktarılır.
+    users_file = os.path.join(data_dir, "users.json")
+    channels_file = os.path.join(data_dir, "channels.json")
+
+    if backend == "json":
+        backpressure = "sync" if shared else "block"
+        if write_behind:
+            channel_options.update(write_behind=True, backpressure=backpressure)
+        return (UserRepository(users_file, shards=shards, codec=codec, shared=shared,
+                               write_behind=write_behind, backpressure=backpressure),
+                ChannelRepository(channels_file, shards=shards, codec=codec, shared=shared, **channel_options))
+    if backend != "sqlite":
+        raise ValueError(f"Unknown Module 1 backend '{backend}', expected 'json' or 'sqlite'")
+
+    db_file = os.path.join(data_dir, "module1.db")
+    is_new = not os.path.exists(db_file)
+    user_repo = SqliteUserRepository(db_file)
+    channel_repo = SqliteChannelRepository(db_file, **channel_options)
+
+    def has_json(data_file: str) -> bool:
+        return os.path.exists(data_file) or os.path.isdir(os.path.splitext(data_file)[0] + ".shards")
+
+    if is_new and has_json(users_file):
+        print(f"System >> {users_file} sqlite veritabanina aktariliyor")
+        user_repo.create_users_bulk(UserRepository(users_file, shards=shards).get_all_users())
+    if is_new and has_json(channels_file):
+        print(f"System >> {channels_file} sqlite veritabanina aktariliyor")
+        with channel_repo.batch():
+            for channel in ChannelRepository(channels_file, shards=shards).get_all_channels():
+                channel_repo.create_channel(channel)
+
+    return user_repo, channel_repo
@@ -10,7 +10,7 @@ Exception sınıfları ve yardımcı fonksiyonlar da bu dosyada yer alır.
 from abc import ABC, abstractmethod
 from enum import Enum
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 import uuid
 import re
 
@@ -76,6 +76,10 @@ class VideoBase(ABC):
     Tüm videolar için temel sınıftır.
     Her video tipinde olması gereken ortak özellikleri ve mecburi metotları barındırır.
     """
+    # Durum/görünürlük/başlık değişikliklerini dinleyenler (örn. depo indeksleri). Sınıf düzeyindeki boş
+    # varsayılan, __init__ çağrılmadan kurulan nesnelerde (row_to_video) de geçerlidir.
+    _listeners: Tuple[Callable[["VideoBase", str], None], ...] = ()
+
     def __init__(
         self,
         channel_id: str,
@@ -125,7 +129,9 @@ class VideoBase(ABC):
     def title(self, new_title: str):
         if not new_title:
             raise ValueError("Başlık boş bırakılamaz.")
-        self._title = new_title
+        if new_title != getattr(self, "_title", None):
+            self._title = new_title
+            self._notify("title")
 
     @property
     def description(self) -> str:
@@ -147,7 +153,9 @@ class VideoBase(ABC):
     def visibility(self, new_visibility: VideoVisibility):
         if not isinstance(new_visibility, VideoVisibility):
             raise InvalidVisibilityError(f"Hatalı görünürlük tipi: {new_visibility}")
-        self._visibility = new_visibility
+        if new_visibility != self._visibility:
+            self._visibility = new_visibility
+            self._notify("visibility")
 
     @property
     def status(self) -> VideoStatus:
@@ -167,15 +175,34 @@ class VideoBase(ABC):
 
     # --- Metotlar ---
 
+    def add_listener(self, callback: Callable[["VideoBase", str], None]):
+        """
+        Değişiklik dinleyicisi ekler. callback(video, alan) durum ("status"), görünürlük
+        ("visibility"), başlık ("title") veya etiketler ("tags", add_tag/remove_tag ile)
+        değiştikten sonra çağrılır.
+        """
+        if callback not in self._listeners:
+            self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback: Callable[["VideoBase", str], None]):
+        """Dinleyiciyi çıkarır (kayıtlı değilse bir şey yapmaz)."""
+        self._listeners = tuple(listener for listener in self._listeners if listener != callback)
+
+    def _notify(self, field: str):
+        for listener in self._listeners:
+            listener(self, field)
+
     def add_tag(self, tag: str):
         """Etiket ekler (tekrarı önler)."""
         if tag not in self._tags:
             self._tags.append(tag)
+            self._notify("tags")
 
     def remove_tag(self, tag: str):
         """Varsa etiketi siler."""
         if tag in self._tags:
             self._tags.remove(tag)
+            self._notify("tags")
 
     @abstractmethod
     def get_video_type(self) -> str:
@@ -228,6 +255,7 @@ class VideoBase(ABC):
             # Yayınlandıysa tarihi atar
             if new_status == VideoStatus.PUBLISHED and self._published_at is None:
                 self._published_at = datetime.now()
+            self._notify("status")
         else:
             raise InvalidVideoStatusError(self._status.value, new_status.value, self._video_id)
 
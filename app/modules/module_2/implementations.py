@@ -151,6 +151,7 @@ class LiveStreamVideo(VideoBase):
             self._status = new_status
             if self._published_at is None:
                 self._published_at = datetime.now()
+            self._notify("status")
             return
 
         # Diğer durumlar için normal akış devam eder.
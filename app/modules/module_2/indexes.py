@@ -0,0 +1,361 @@
+"""
+Video Repository İndeksleri
+===========================
+
+VideoRepository'nin bellek içi ikincil indekslerini barındırır.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+from itertools import compress, groupby, islice
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Eşleşen slot oranı 1/_SPARSE_RATIO'nun altındaysa slot'lar bytes.find ile atlanarak toplanır
+_SPARSE_RATIO = 64
+# Trigram kesişiminde sıradaki posting listesi aday kümesinden bu kat büyükse kesişim durdurulur;
+# kalan adaylar zaten tam metinle doğrulanır.
+_INTERSECT_RATIO = 8
+# Etiket posting'inin sıralı dizisindeki silinmiş slot'lar bu değeri ve canlı slot sayısını geçince dizi yeniden yazılır
+_TAG_STALE_MIN = 64
+
+# lower() çıktısı üzerinde karakter karakter uygulanır: ı -> i ve İ.lower()'ın ürettiği birleşik nokta
+# (U+0307) atılır, son sigma normal sigmaya çevrilir. Karakter bazlı olduğu için lower() ile alt metin
+# olan her sorgu katlanmış halde de alt metin kalır (indeks aday kaybetmez).
+_FOLD_TABLE = str.maketrans({"\u0131": "i", "\u0307": None, "\u03c2": "\u03c3"})
+
+
+class BitmapIndex:
+    """
+    Düşük kardinaliteli bir sütun (durum, görünürlük, video tipi) için değer başına bitmap tutar.
+
+    Her kayıt, depo tarafından verilen sabit bir sıra numarasına (slot) karşılık gelir. Bitmap'ler
+    slot başına bir byte (1/0) olan bytearray'lerdir: tek kaydın güncellenmesi O(1)'dir, sorguda ise
+    MmapVideoRepository'deki maskeler gibi int.from_bytes ile tamsayıya çevrilip AND'lenir.
+    """
+
+    def __init__(self):
+        self._bitmaps: Dict[Hashable, bytearray] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self._values: List[Optional[Hashable]] = []  # slot -> indekslenen değer
+
+    def set(self, slot: int, value: Hashable):
+        """Slot'un değerini günceller; eski değerin bitmap'indeki biti temizlenir."""
+        values = self._values
+        if slot >= len(values):
+            values.extend([None] * (slot + 1 - len(values)))
+        old = values[slot]
+        if old == value:
+            return
+        if old is not None:
+            self._bitmaps[old][slot] = 0
+            self._counts[old] -= 1
+
+        bitmap = self._bitmaps.get(value)
+        if bitmap is None:
+            bitmap = self._bitmaps[value] = bytearray()
+            self._counts[value] = 0
+        if slot >= len(bitmap):
+            # Kapasite iki katına çıkarılarak büyütülür (sıralı eklemede amortize O(1))
+            bitmap.extend(bytes(max(slot + 1, 2 * len(bitmap)) - len(bitmap)))
+        bitmap[slot] = 1
+        self._counts[value] += 1
+        values[slot] = value
+
+    def discard(self, slot: int):
+        """Slot'u indeksten çıkarır."""
+        if slot < len(self._values) and self._values[slot] is not None:
+            old = self._values[slot]
+            self._bitmaps[old][slot] = 0
+            self._counts[old] -= 1
+            self._values[slot] = None
+
+    def mask(self, value: Hashable) -> int:
+        """Değere sahip slot'ların maskesi (bit yerine byte: slot i -> i. byte'ın en düşük biti)."""
+        bitmap = self._bitmaps.get(value)
+        return int.from_bytes(bitmap, "little") if bitmap else 0
+
+    def count(self, value: Hashable) -> int:
+        """Değere sahip kayıt sayısı (bitmap taranmadan tutulan sayaç)."""
+        return self._counts.get(value, 0)
+
+    def counts(self) -> Dict[Hashable, int]:
+        """Değer -> kayıt sayısı (sıfır olanlar hariç)."""
+        return {value: count for value, count in self._counts.items() if count}
+
+    def clear(self):
+        self._bitmaps.clear()
+        self._counts.clear()
+        self._values.clear()
+
+
+def select_slots(items: List[Any], masks: Iterable[int]) -> List[Any]:
+    """
+    Maskelerin AND'ini alıp bit'i açık slot'lardaki öğeleri (slot sırasıyla) döndürür.
+
+    Argümanlar:
+        items: Slot -> öğe listesi.
+        masks: BitmapIndex.mask ile üretilmiş maskeler (en az bir tane).
+
+    Döndürür:
+        List[Any]: Seçilen öğeler.
+    """
+    masks = iter(masks)
+    combined = next(masks)
+    for mask in masks:
+        if not combined:
+            break
+        combined &= mask
+    if not combined:
+        return []
+    selected = combined.to_bytes(len(items), "little")
+    if selected.count(1) * _SPARSE_RATIO < len(items):
+        # Seyrek sonuç: compress tüm slot'ları dolaşır, bytes.find ise sadece eşleşmelerde durur
+        results = []
+        find = selected.find
+        position = find(1)
+        while position >= 0:
+            results.append(items[position])
+            position = find(1, position + 1)
+        return results
+    return list(compress(items, selected))
+
+
+def fold_text(text: str) -> str:
+    """Metni trigram anahtarları için katlar (küçük harf + Türkçe i/ı/İ birleştirmesi)."""
+    return text.lower().translate(_FOLD_TABLE)
+
+
+def trigrams(text: str) -> Set[str]:
+    """Katlanmış metnin 3 karakterlik alt metinleri."""
+    folded = fold_text(text)
+    return {folded[i:i + 3] for i in range(len(folded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Başlıklardaki alt metin aramaları için trigram -> slot indeksi.
+
+    Posting listeleri sadece eklenen array('I')'lerdir (video başına ~len(başlık) x 4 byte).
+    Silinen veya başlığı değişen videoların eski girdileri hemen çıkarılmaz, "bayat" sayılır:
+    adaylar her zaman tam metinle doğrulandığı için yanlış sonuç üretmezler. Bayat girdiler
+    çoğalınca depo indeksi yeniden kurar.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, array] = {}
+        self.stale = 0
+
+    def add(self, slot: int, text: str):
+        postings = self._postings
+        for gram in trigrams(text):
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array("I")
+            posting.append(slot)
+
+    def _postings_for(self, needle: str) -> Optional[List[array]]:
+        grams = trigrams(needle)
+        if not grams:
+            return None
+        empty = array("I")
+        return sorted((self._postings.get(gram, empty) for gram in grams), key=len)
+
+    def estimate(self, needle: str) -> Optional[int]:
+        """
+        Aramanın aday sayısı için üst sınır (en kısa posting listesi).
+        Sorgu 3 karakterden kısaysa indeks kullanılamaz ve None döner.
+        """
+        postings = self._postings_for(needle)
+        return None if postings is None else len(postings[0])
+
+    def candidates(self, needle: str) -> Optional[List[int]]:
+        """
+        Başlığında aranan metni içerebilecek slot'lar (artan sırayla).
+        Kesişim en kısa posting listesinden başlar.
+
+        Döndürür:
+            Optional[List[int]]: Aday slot'lar; sorgu 3 karakterden kısaysa None.
+        """
+        postings = self._postings_for(needle)
+        if postings is None:
+            return None
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result or len(posting) > _INTERSECT_RATIO * len(result):
+                break
+            result.intersection_update(posting)
+        return sorted(result)
+
+    def clear(self):
+        self._postings.clear()
+        self.stale = 0
+
+
+class _TagPosting:
+    """
+    Bir etiketin slot'ları: üyelik kontrolü için küme ve sıralı okuma için artan array('I').
+    Silinen slot'lar diziden hemen çıkarılmaz (kümeyle elenir); çoğalınca dizi yeniden yazılır.
+    """
+
+    __slots__ = ("members", "ordered", "stale")
+
+    def __init__(self):
+        self.members: Set[int] = set()
+        self.ordered = array("I")
+        self.stale = 0
+
+    def add(self, slot: int):
+        self.members.add(slot)
+        ordered = self.ordered
+        if not ordered or slot > ordered[-1]:
+            # Yeni videolar en büyük slot'u alır: sıralı ekleme sona yazılır
+            ordered.append(slot)
+            return
+        position = bisect_left(ordered, slot)
+        if position < len(ordered) and ordered[position] == slot:
+            self.stale -= 1  # bayat girdi yeniden canlandı
+        else:
+            ordered.insert(position, slot)
+
+    def discard(self, slot: int):
+        self.members.discard(slot)
+        self.stale += 1
+        if self.stale > max(_TAG_STALE_MIN, len(self.members)):
+            self.ordered = array("I", sorted(self.members))
+            self.stale = 0
+
+    def __iter__(self) -> Iterator[int]:
+        """Canlı slot'lar, artan sırayla."""
+        if self.stale:
+            return filter(self.members.__contains__, self.ordered)
+        return iter(self.ordered)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+
+class TagIndex:
+    """
+    Etiket -> slot indeksi ve kanal başına etiket sayaçları (facet'ler).
+
+    Her slot'un en son indekslenen (kanal, etiketler) çifti tutulur ve güncellemede sadece fark
+    uygulanır. Posting'ler hem küme hem sıralı dizi olduğu için AND sorgusu en kısa listeyi sırayla
+    okuyup diğer kümelerde arar: sonuç ayrıca sıralanmaz ve limit dolunca okuma durur.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, _TagPosting] = {}
+        self._facets: Dict[str, Dict[str, int]] = {}  # kanal -> etiket -> video sayısı
+        self._entries: Dict[int, Tuple[str, FrozenSet[str]]] = {}  # slot -> (kanal, etiketler)
+
+    def set(self, slot: int, channel_id: str, tags: Iterable[str]):
+        """Slot'un etiketlerini günceller; eski etiketlerden kalkanlar çıkarılır, yeniler eklenir."""
+        entry = (channel_id, frozenset(tags))
+        old = self._entries.get(slot)
+        if old == entry:
+            return
+        added = entry[1]
+        if old is not None:
+            old_channel, old_tags = old
+            if old_channel == channel_id:
+                self._remove(slot, old_channel, old_tags - added)
+                added = added - old_tags
+            else:
+                self._remove(slot, old_channel, old_tags)
+        postings = self._postings
+        facet = self._facets.setdefault(channel_id, {})
+        for tag in added:
+            posting = postings.get(tag)
+            if posting is None:
+                posting = postings[tag] = _TagPosting()
+            posting.add(slot)
+            facet[tag] = facet.get(tag, 0) + 1
+        if entry[1]:
+            self._entries[slot] = entry
+        else:
+            self._entries.pop(slot, None)
+            if not facet:
+                del self._facets[channel_id]
+
+    def _remove(self, slot: int, channel_id: str, tags: Iterable[str]):
+        facet = self._facets[channel_id]
+        for tag in tags:
+            posting = self._postings[tag]
+            posting.discard(slot)
+            if not posting:
+                del self._postings[tag]
+            facet[tag] -= 1
+            if not facet[tag]:
+                del facet[tag]
+        if not facet:
+            del self._facets[channel_id]
+
+    def discard(self, slot: int):
+        """Slot'u indeksten çıkarır."""
+        entry = self._entries.pop(slot, None)
+        if entry is not None:
+            self._remove(slot, *entry)
+
+    def count(self, tag: str) -> int:
+        """Etikete sahip kayıt sayısı."""
+        posting = self._postings.get(tag)
+        return len(posting) if posting is not None else 0
+
+    def select(self, tags: Iterable[str], match_all: bool = True, limit: Optional[int] = None) -> List[int]:
+        """
+        Etiketlerin hepsine (match_all) veya herhangi birine sahip slot'lar (artan sırayla).
+
+        AND sorgusunda en kısa posting listesi sırayla okunur ve her slot kısadan uzuna diğer
+        etiketlerin kümelerinde aranır (filter zinciri); OR sorgusunda limit verildiyse sıralı
+        listeler birleştirilerek okunur.
+
+        Argümanlar:
+            tags: Aranan etiketler.
+            match_all: True ise AND, False ise OR.
+            limit: Verilirse en fazla bu kadar slot döner ve okuma limit dolunca durur.
+
+        Döndürür:
+            List[int]: Seçilen slot'lar.
+        """
+        postings = [self._postings.get(tag) for tag in set(tags)]
+        if match_all:
+            if not postings or None in postings:
+                return []
+            postings.sort(key=len)
+            slots = iter(postings[0])
+            for posting in postings[1:]:
+                slots = filter(posting.members.__contains__, slots)
+        else:
+            postings = [posting for posting in postings if posting is not None]
+            if not postings:
+                return []
+            if limit is None:
+                return sorted(set().union(*(posting.members for posting in postings)))
+            slots = (slot for slot, _ in groupby(heapq.merge(*postings)))
+        return list(islice(slots, limit))
+
+    def facets(self, channel_id: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Etiket -> video sayısı çiftleri, sayıya göre azalan (eşitlikte etikete göre) sırayla.
+
+        Argümanlar:
+            channel_id: Verilirse sadece o kanalın videoları sayılır.
+            limit: Döndürülecek en fazla etiket sayısı.
+        """
+        if channel_id is None:
+            return rank_tags(((tag, len(posting)) for tag, posting in self._postings.items()), limit)
+        return rank_tags(self._facets.get(channel_id, {}).items(), limit)
+
+    def clear(self):
+        self._postings.clear()
+        self._facets.clear()
+        self._entries.clear()
+
+
+def rank_tags(counts: Iterable[Tuple[str, int]], limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """(etiket, sayı) çiftlerini sayıya göre azalan, eşitlikte etiket sırasıyla döndürür (en fazla limit kadar)."""
+    key = lambda item: (-item[1], item[0])
+    if limit is not None:
+        return heapq.nsmallest(limit, counts, key=key)
+    return sorted(counts, key=key)
@@ -0,0 +1,633 @@
+"""
+Memory-Mapped Video Repository
+==============================
+
+Okuma ağırlıklı katalog sunumu için VideoRepository'nin bellek eşlemeli (mmap) sürümüdür.
+Sık sorgulanan sayısal alanlar sabit genişlikli kayıtlar halinde mmap ile açılan dosyada,
+metinler ise ayrı bir "heap" dosyasında tutulur.
+
+Dosyalar (base_path öneki ile):
+    <base>.rec   başlık + sabit genişlikli (72 byte) video kayıtları
+    <base>.heap  video_id ve diğer alanların (başlık, açıklama, etiketler, alt tip alanları) JSON'u
+    <base>.idx   video_id -> kayıt sırası için diskte açık adresli hash tablosu
+    <base>.chan  kanal ID'leri (satır numarası = kanal sıra numarası)
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base import VideoBase, VideoStatus, VideoVisibility, RepositoryError
+from .query import INDEXED_FIELDS, QueryPlan, VideoQuery
+from .repository import (
+    VideoRepository, check_count_field, check_tag_query, count_tags, match_tags, order_channel_videos,
+    row_to_video, _EXTRA_FIELDS, _encode_extra
+)
+
+logger = logging.getLogger("VideoModule")
+
+_MAGIC = b"VMRC"
+_INDEX_MAGIC = b"VMIX"
+_VERSION = 1
+_HEADER_SIZE = 64
+_HEADER = struct.Struct("<4sIIQQ")  # magic, sürüm, kayıt boyutu, kayıt sayısı (silinenler dahil), canlı kayıt
+_INDEX_HEADER = struct.Struct("<4sIQQQ")  # magic, sürüm, kapasite, dolu slot, indekslenmiş kayıt sayısı
+
+# Kayıt düzeni (little endian, 8 byte hizalı):
+#   0 id_off Q | 8 blob_off Q | 16 created_us q | 24 published_us q | 32 view_count Q | 40 likes Q
+#   48 id_len I | 52 blob_len I | 56 channel I | 60 duration i | 64 status B | 65 visibility B
+#   66 type B | 67 flags B | 68 (boş)
+_RECORD = struct.Struct("<QQqqQQIIIiBBBB4x")
+_RECORD_SIZE = _RECORD.size
+_CREATED = struct.Struct("<q")
+_ID_REF = struct.Struct("<Q8x8x8x8x8xI")
+_CREATED_OFFSET = 16
+_CHANNEL_OFFSET = 56
+_STATUS_OFFSET = 64
+_VISIBILITY_OFFSET = 65
+_TYPE_OFFSET = 66
+_FLAGS_OFFSET = 67
+
+_DELETED = 1
+_HAS_PUBLISHED = 2
+
+_SLOT = struct.Struct("<QI4x")  # hash, kayıt sırası + 1 (0 = boş slot)
+_TOMBSTONE = 0xFFFFFFFF
+_MAX_LOAD = 0.7
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_TYPE_CODES = {"StandardVideo": 1, "LiveStreamVideo": 2, "ShortVideo": 3}
+_TYPE_NAMES = {code: name for name, code in _TYPE_CODES.items()}
+_STATUS_CODES = {member: code for code, member in enumerate(VideoStatus)}
+_STATUS_VALUES = [member.value for member in VideoStatus]
+_VISIBILITY_CODES = {member: code for code, member in enumerate(VideoVisibility)}
+_VISIBILITY_VALUES = [member.value for member in VideoVisibility]
+
+# bytes.translate tabloları: sütun byte'ını eşleşme maskesine (1/0) çevirir
+_ALIVE_TABLE = bytes(0 if value & _DELETED else 1 for value in range(256))
+_EQUAL_TABLES: Dict[int, bytes] = {}
+
+
+def _equal_table(value: int) -> bytes:
+    table = _EQUAL_TABLES.get(value)
+    if table is None:
+        table = _EQUAL_TABLES[value] = bytes(1 if byte == value else 0 for byte in range(256))
+    return table
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _hash_id(video_id: str) -> int:
+    # Süreçler arasında sabit olmalı (yerleşik hash() her çalıştırmada farklı)
+    return int.from_bytes(hashlib.blake2b(video_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class MmapVideoRepository(VideoRepository):
+    """
+    Videoları bellek eşlemeli sabit genişlikli kayıtlarda tutan depo sınıfıdır.
+    VideoRepository ile aynı API'yi sunar.
+
+    - Açılış O(1)'dir (sadece kanal listesi okunur); kayıt sayfaları işletim sistemi tarafından
+      ihtiyaç oldukça belleğe alınır.
+    - filter_videos eşlenen sütunları tarar: durum/görünürlük/kanal/silinme koşulları bytes.translate
+      ile maskeye çevrilip birleştirilir, reddedilen kayıtlar için Python nesnesi oluşturulmaz.
+    - Video nesnesi sadece döndürülecek kayıtlar için kurulur (her okumada yeni nesne).
+
+    Güncellemede eski metin heap'te kalır (heap sadece büyür); silinen kayıtlar işaretlenir.
+    """
+
+    def __init__(self, base_path: str = "videos", initial_capacity: int = 1024):
+        """
+        Argümanlar:
+            base_path: Dosya öneki (<base>.rec, <base>.heap, <base>.idx, <base>.chan).
+            initial_capacity: Yeni katalogda yer ayrılacak kayıt sayısı.
+
+        Raise eder:
+            RepositoryError: Dosyalar okunamazsa veya biçim uyumsuzsa.
+        """
+        # Bellek içi sözlük/indeks kullanılmadığı için VideoRepository.__init__ çağrılmaz. Temel sınıfın
+        # indeks yardımcıları (_index_*, _bitmap_slots, bitmap/etiket indeksleri) burada hiç çağrılmaz;
+        # onları okuyan public metotlar (count_by, find_by_tags, tag_facets, plan) bu sınıfta yeniden yazılır.
+        self.base_path = base_path
+        self._initial_capacity = max(16, initial_capacity)
+        try:
+            self._open_files()
+        except (OSError, ValueError, struct.error) as e:
+            raise RepositoryError(f"Video kataloğu açılamadı ({base_path}): {e}") from e
+        logger.info(f"MmapVideoRepository açıldı: {self._live} video ({self.base_path})")
+
+    # --- Dosya yönetimi ---
+
+    def _open_files(self):
+        rec_path = self.base_path + ".rec"
+        if not os.path.exists(rec_path) or os.path.getsize(rec_path) == 0:
+            self._create_files()
+
+        self._rec_file = open(rec_path, "r+b")
+        self._records = mmap.mmap(self._rec_file.fileno(), 0)
+        magic, version, record_size, self._total, self._live = _HEADER.unpack_from(self._records, 0)
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD_SIZE:
+            raise ValueError("kayıt dosyası biçimi tanınmadı")
+        self._capacity = (len(self._records) - _HEADER_SIZE) // _RECORD_SIZE
+
+        self._heap = open(self.base_path + ".heap", "r+b")
+        self._heap_size = self._heap.seek(0, os.SEEK_END)
+
+        self._idx_file = open(self.base_path + ".idx", "r+b")
+        self._index = mmap.mmap(self._idx_file.fileno(), 0)
+        magic, version, self._index_capacity, self._used_slots, indexed = _INDEX_HEADER.unpack_from(self._index, 0)
+        if magic != _INDEX_MAGIC or version != _VERSION:
+            raise ValueError("indeks dosyası biçimi tanınmadı")
+
+        with open(self.base_path + ".chan", "r", encoding="utf-8") as file:
+            self._channel_ids = file.read().splitlines()
+        self._channel_ordinals = {channel_id: ordinal for ordinal, channel_id in enumerate(self._channel_ids)}
+        self._chan_file = open(self.base_path + ".chan", "a", encoding="utf-8")
+
+        # Çökme sonrası indeks kayıtların gerisinde kalmışsa baştan kurulur
+        if indexed != self._total:
+            logger.warning(f"{self.base_path}.idx güncel değil, yeniden kuruluyor")
+            self._rebuild_index(self._index_capacity)
+
+    def _create_files(self):
+        with open(self.base_path + ".rec", "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, _RECORD_SIZE, 0, 0).ljust(_HEADER_SIZE, b"\0"))
+            file.truncate(_HEADER_SIZE + self._initial_capacity * _RECORD_SIZE)
+        self._write_empty_index(self.base_path + ".idx", self._initial_capacity * 2)
+        open(self.base_path + ".heap", "wb").close()
+        open(self.base_path + ".chan", "w", encoding="utf-8").close()
+
+    @staticmethod
+    def _write_empty_index(path: str, slots: int):
+        # Slot sayısı 2'nin kuvveti (maske ile mod alınır)
+        slots = 1 << max(4, (slots - 1).bit_length())
+        with open(path, "wb") as file:
+            file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _VERSION, slots, 0, 0).ljust(_HEADER_SIZE, b"\0"))
+            file.truncate(_HEADER_SIZE + slots * _SLOT.size)
+
+    def _write_header(self):
+        _HEADER.pack_into(self._records, 0, _MAGIC, _VERSION, _RECORD_SIZE, self._total, self._live)
+
+    def _write_index_header(self):
+        _INDEX_HEADER.pack_into(self._index, 0, _INDEX_MAGIC, _VERSION, self._index_capacity, self._used_slots,
+                                self._total)
+
+    def _grow_records(self):
+        # Kapasite iki katına çıkarılır; mmap yeniden açılır
+        self._capacity *= 2
+        self._records.close()
+        self._rec_file.truncate(_HEADER_SIZE + self._capacity * _RECORD_SIZE)
+        self._records = mmap.mmap(self._rec_file.fileno(), 0)
+
+    # --- Heap ve kayıt erişimi ---
+
+    def _heap_append(self, data: bytes) -> int:
+        offset = self._heap_size
+        self._heap.seek(offset)
+        self._heap.write(data)
+        self._heap_size += len(data)
+        return offset
+
+    def _heap_read(self, offset: int, length: int) -> bytes:
+        self._heap.seek(offset)
+        return self._heap.read(length)
+
+    def _flags(self, ordinal: int) -> int:
+        return self._records[_HEADER_SIZE + ordinal * _RECORD_SIZE + _FLAGS_OFFSET]
+
+    def _record_id(self, ordinal: int) -> str:
+        id_off, id_len = _ID_REF.unpack_from(self._records, _HEADER_SIZE + ordinal * _RECORD_SIZE)
+        return self._heap_read(id_off, id_len).decode("utf-8")
+
+    def _channel_ordinal(self, channel_id: str) -> int:
+        ordinal = self._channel_ordinals.get(channel_id)
+        if ordinal is None:
+            if "\n" in channel_id:
+                raise RepositoryError("Kanal ID'si satır sonu içeremez")
+            ordinal = self._channel_ordinals[channel_id] = len(self._channel_ids)
+            self._channel_ids.append(channel_id)
+            self._chan_file.write(channel_id + "\n")
+            self._chan_file.flush()
+        return ordinal
+
+    def _materialize(self, ordinal: int) -> VideoBase:
+        """Kaydı okuyup video nesnesini kurar."""
+        (id_off, blob_off, created_us, published_us, view_count, likes, id_len, blob_len, channel,
+         duration, status, visibility, type_code, flags) = _RECORD.unpack_from(
+            self._records, _HEADER_SIZE + ordinal * _RECORD_SIZE)
+        title, description, tags, *extras = json.loads(self._heap_read(blob_off, blob_len))
+        row = [
+            self._heap_read(id_off, id_len).decode("utf-8"),
+            _TYPE_NAMES[type_code],
+            self._channel_ids[channel],
+            title,
+            description,
+            duration,
+            _VISIBILITY_VALUES[visibility],
+            _STATUS_VALUES[status],
+            _from_micros(created_us).isoformat(),
+            _from_micros(published_us).isoformat() if flags & _HAS_PUBLISHED else None,
+            tags,
+            view_count,
+            likes,
+            *extras,
+        ]
+        return row_to_video(row)
+
+    # --- Disk üzerindeki hash indeksi ---
+
+    def _index_lookup(self, video_id: str) -> Optional[int]:
+        """video_id'nin kayıt sırasını döndürür; yoksa None."""
+        target = _hash_id(video_id)
+        mask = self._index_capacity - 1
+        slot = target & mask
+        while True:
+            slot_hash, stored = _SLOT.unpack_from(self._index, _HEADER_SIZE + slot * _SLOT.size)
+            if stored == 0:
+                return None
+            if stored != _TOMBSTONE and slot_hash == target:
+                ordinal = stored - 1
+                if not self._flags(ordinal) & _DELETED and self._record_id(ordinal) == video_id:
+                    return ordinal
+            slot = (slot + 1) & mask
+
+    def _index_insert(self, video_id: str, ordinal: int):
+        # Doluluk kontrolü çağırana aittir (save yeni kayıttan önce gerekirse _rebuild_index çağırır)
+        mask = self._index_capacity - 1
+        target = _hash_id(video_id)
+        slot = target & mask
+        while True:
+            offset = _HEADER_SIZE + slot * _SLOT.size
+            if _SLOT.unpack_from(self._index, offset)[1] == 0:
+                _SLOT.pack_into(self._index, offset, target, ordinal + 1)
+                self._used_slots += 1
+                return
+            slot = (slot + 1) & mask
+
+    def _index_remove(self, video_id: str, ordinal: int):
+        # Silinen slot tombstone olur (zincir kopmasın diye boşaltılmaz)
+        mask = self._index_capacity - 1
+        slot = _hash_id(video_id) & mask
+        while True:
+            offset = _HEADER_SIZE + slot * _SLOT.size
+            stored = _SLOT.unpack_from(self._index, offset)[1]
+            if stored == 0:
+                return
+            if stored == ordinal + 1:
+                _SLOT.pack_into(self._index, offset, 0, _TOMBSTONE)
+                return
+            slot = (slot + 1) & mask
+
+    def _rebuild_index(self, slots: int):
+        """İndeksi canlı kayıtlardan yeniden kurar (tombstone'lar temizlenir)."""
+        slots = max(slots, 2 * int(self._live / _MAX_LOAD) + 16)
+        self._index.close()
+        self._idx_file.close()
+        path = self.base_path + ".idx"
+        self._write_empty_index(path + ".tmp", slots)
+        os.replace(path + ".tmp", path)
+        self._idx_file = open(path, "r+b")
+        self._index = mmap.mmap(self._idx_file.fileno(), 0)
+        self._index_capacity = _INDEX_HEADER.unpack_from(self._index, 0)[2]
+        self._used_slots = 0
+        for ordinal in range(self._total):
+            if not self._flags(ordinal) & _DELETED:
+                self._index_insert(self._record_id(ordinal), ordinal)
+        self._write_index_header()
+
+    # --- VideoRepository API ---
+
+    def save(self, video: VideoBase) -> VideoBase:
+        """
+        Videoyu kataloğa kaydeder. Video varsa kaydı yerinde güncellenir, yoksa sona eklenir.
+
+        Argümanlar:
+            video (VideoBase): Kaydedilecek video nesnesi.
+
+        Döndürür:
+            VideoBase: Kaydedilen video nesnesi.
+        """
+        video_type = video.get_video_type()
+        if video_type not in _TYPE_CODES:
+            raise RepositoryError(f"Bilinmeyen video tipi: {video_type}")
+        blob = [video.title, video.description, list(video.tags)]
+        blob.extend(_encode_extra(getattr(video, field, None)) for field in _EXTRA_FIELDS[video_type])
+
+        try:
+            ordinal = self._index_lookup(video.video_id)
+            if ordinal is None:
+                id_bytes = video.video_id.encode("utf-8")
+                id_off, id_len = self._heap_append(id_bytes), len(id_bytes)
+            else:
+                id_off, id_len = _ID_REF.unpack_from(self._records, _HEADER_SIZE + ordinal * _RECORD_SIZE)
+            blob_bytes = json.dumps(blob, ensure_ascii=False).encode("utf-8")
+            blob_off = self._heap_append(blob_bytes)
+            self._heap.flush()
+
+            published_at = video.published_at
+            record = (
+                id_off, blob_off, _to_micros(video.created_at), _to_micros(published_at) if published_at else 0,
+                getattr(video, "_view_count", 0), getattr(video, "_likes", 0), id_len, len(blob_bytes),
+                self._channel_ordinal(video.channel_id), video.duration_seconds, _STATUS_CODES[video.status],
+                _VISIBILITY_CODES[video.visibility], _TYPE_CODES[video_type],
+                _HAS_PUBLISHED if published_at else 0,
+            )
+            if ordinal is None:
+                if self._total == self._capacity:
+                    self._grow_records()
+                if self._used_slots + 1 > self._index_capacity * _MAX_LOAD:
+                    self._rebuild_index(self._index_capacity * 2)
+                ordinal = self._total
+                _RECORD.pack_into(self._records, _HEADER_SIZE + ordinal * _RECORD_SIZE, *record)
+                self._total += 1
+                self._live += 1
+                self._write_header()
+                self._index_insert(video.video_id, ordinal)
+                self._write_index_header()
+            else:
+                _RECORD.pack_into(self._records, _HEADER_SIZE + ordinal * _RECORD_SIZE, *record)
+        except (OSError, ValueError, struct.error) as e:
+            raise RepositoryError(f"Video kaydı yazılamadı: {e}") from e
+        self._publish("save", video)
+        return video
+
+    def find_by_id(self, video_id: str) -> Optional[VideoBase]:
+        """
+        ID ile video bulur (disk üzerindeki hash indeksiyle).
+
+        Argümanlar:
+            video_id: Video ID'si.
+
+        Döndürür:
+            Optional[VideoBase]: Bulunursa nesne, bulunamazsa None döner.
+        """
+        ordinal = self._index_lookup(video_id)
+        return None if ordinal is None else self._materialize(ordinal)
+
+    def delete(self, video_id: str) -> bool:
+        """
+        Videoyu silindi olarak işaretler.
+
+        Argümanlar:
+            video_id (str): Silinecek video ID'si.
+
+        Döndürür:
+            bool: Silme başarılıysa True, aksi halde False.
+        """
+        ordinal = self._index_lookup(video_id)
+        if ordinal is None:
+            return False
+        offset = _HEADER_SIZE + ordinal * _RECORD_SIZE + _FLAGS_OFFSET
+        self._records[offset] |= _DELETED
+        self._live -= 1
+        self._write_header()
+        self._index_remove(video_id, ordinal)
+        self._publish("delete", video_id)
+        return True
+
+    def _scan(self, status: Optional[VideoStatus] = None, visibility: Optional[VideoVisibility] = None,
+              channel_id: Optional[str] = None, video_type: Optional[str] = None) -> Iterable[int]:
+        """
+        Eşleşen kayıt sıralarını döndürür. Her byte sütunu (adım = kayıt boyutu) tek dilimle okunur,
+        bytes.translate ile 1/0 maskesine çevrilir ve maskeler tamsayı AND'i ile birleştirilir.
+        """
+        total = self._total
+        if total == 0:
+            return []
+        start = _HEADER_SIZE
+        stop = _HEADER_SIZE + total * _RECORD_SIZE
+
+        def column_mask(offset: int, table: bytes) -> int:
+            with memoryview(self._records) as view:
+                column = view[start + offset:stop:_RECORD_SIZE].tobytes()
+            return int.from_bytes(column.translate(table), "little")
+
+        mask = column_mask(_FLAGS_OFFSET, _ALIVE_TABLE)
+        if channel_id is not None:
+            channel = self._channel_ordinals.get(channel_id)
+            if channel is None:
+                return []
+            # 4 byte'lık kanal sıra numarası: her byte ayrı sütun olarak karşılaştırılır
+            for position, byte in enumerate(channel.to_bytes(4, "little")):
+                mask &= column_mask(_CHANNEL_OFFSET + position, _equal_table(byte))
+        if status is not None:
+            mask &= column_mask(_STATUS_OFFSET, _equal_table(_STATUS_CODES[status]))
+        if visibility is not None:
+            mask &= column_mask(_VISIBILITY_OFFSET, _equal_table(_VISIBILITY_CODES[visibility]))
+        if video_type is not None:
+            if video_type not in _TYPE_CODES:
+                return []
+            mask &= column_mask(_TYPE_OFFSET, _equal_table(_TYPE_CODES[video_type]))
+        return itertools.compress(range(total), mask.to_bytes(total, "little"))
+
+    def find_all(self) -> List[VideoBase]:
+        """Tüm videoları eklenme sırasıyla listeler."""
+        return [self._materialize(ordinal) for ordinal in self._scan()]
+
+    def find_by_channel(
+        self,
+        channel_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+        order_by: str = "created_at"
+    ) -> List[VideoBase]:
+        """
+        Belirli bir kanala ait videoları zamana göre sıralı getirir.
+        Katalog kanal başına sıralı indeks tutmaz; kanal maskesiyle seçilen kayıtlar sıralanır.
+        created_at aralığı kayıtlar nesneye çevrilmeden önce created_us alanından elenir.
+
+        Argümanlar:
+            channel_id: Kanal ID'si.
+            since: Bu zamandan (dahil) sonraki videolar.
+            until: Bu zamana (dahil) kadar olan videolar.
+            limit: Döndürülecek en fazla video sayısı.
+            newest_first: True ise en yeni video başta olur.
+            order_by: "created_at" veya "published_at".
+
+        Döndürür:
+            List[VideoBase]: O kanala ait videolar.
+        """
+        if order_by == "created_at":
+            videos = self.filter_videos(channel_id=channel_id, date_from=since, date_to=until)
+        else:
+            videos = self.filter_videos(channel_id=channel_id)
+        return order_channel_videos(videos, since, until, limit, newest_first, order_by)
+
+    def find_by_tags(self, tags: Iterable[str], match: str = "all", limit: Optional[int] = None) -> List[VideoBase]:
+        """
+        Etiketlere göre video bulur. Etiketler heap'teki JSON kısmında tutulduğu için kayıtlar
+        sırayla nesneye çevrilip kontrol edilir; limit dolunca tarama durur.
+
+        Argümanlar:
+            tags: Aranan etiketler.
+            match: "all" ise etiketlerin hepsine, "any" ise herhangi birine sahip videolar.
+            limit: Döndürülecek en fazla video sayısı.
+
+        Döndürür:
+            List[VideoBase]: Eşleşen videolar (eklenme sırasıyla).
+
+        Raise eder:
+            ValueError: match geçersizse veya limit negatifse.
+        """
+        check_tag_query(match, limit)
+        return match_tags(map(self._materialize, self._scan()), tags, match, limit)
+
+    def tag_facets(self, channel_id: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Etiketlerin video sayılarını döndürür; kanal verilirse sadece kanal maskesinden geçen
+        kayıtlar okunur.
+
+        Argümanlar:
+            channel_id: Verilirse sadece o kanalın videoları sayılır.
+            limit: Döndürülecek en fazla etiket sayısı (en çok kullanılanlar).
+
+        Döndürür:
+            List[Tuple[str, int]]: (etiket, video sayısı) çiftleri.
+
+        Raise eder:
+            ValueError: limit negatifse.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative")
+        return count_tags(map(self._materialize, self._scan(channel_id=channel_id)), limit)
+
+    def filter_videos(
+        self,
+        status: Optional[VideoStatus] = None,
+        visibility: Optional[VideoVisibility] = None,
+        channel_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        video_type: Optional[str] = None
+    ) -> List[VideoBase]:
+        """
+        Videoları belirli kriterlere göre filtreler.
+        Durum, görünürlük, tip ve kanal koşulları eşlenen sütunlar üzerinde maskelerle; tarih aralığı sadece
+        bu koşulları geçen kayıtların created_us alanı okunarak değerlendirilir.
+
+        Argümanlar:
+            status: Videonun durumuna göre filtreleme yapar.
+            visibility: Görünürlük ayarına göre filtreler.
+            channel_id: Belirli bir kanalın videolarını getirir.
+            date_from: Oluşturulma tarihi bu tarihten sonra olanlar.
+            date_to: Oluşturulma tarihi bu tarihten önce olanlar.
+            video_type: Video tipi (get_video_type değeri).
+
+        Döndürür:
+            List[VideoBase]: Kriterlere uyan Video nesnelerinin listesi (eklenme sırasıyla).
+        """
+        ordinals = self._scan(status, visibility, channel_id or None, video_type or None)
+        if date_from or date_to:
+            low = _to_micros(date_from) if date_from else None
+            high = _to_micros(date_to) if date_to else None
+            records = self._records
+            matched = []
+            for ordinal in ordinals:
+                created_us = _CREATED.unpack_from(records, _HEADER_SIZE + ordinal * _RECORD_SIZE + _CREATED_OFFSET)[0]
+                if (low is None or created_us >= low) and (high is None or created_us <= high):
+                    matched.append(ordinal)
+            ordinals = matched
+        return [self._materialize(ordinal) for ordinal in ordinals]
+
+    def plan(self, query: VideoQuery) -> QueryPlan:
+        """
+        Sorgu için erişim planını döndürür.
+        Katalogda ayrı erişim yolları yoktur: indekslenebilir koşullar filter_videos'un sütun
+        maskeleriyle uygulanır, kalan koşullar (başlık, süre) okunan nesneler üzerinde kontrol edilir.
+
+        Argümanlar:
+            query: Çalıştırılacak sorgu.
+
+        Döndürür:
+            QueryPlan: Tek adımlı plan (satır tahmini yok).
+        """
+        return QueryPlan("column_scan", None, 0.0, INDEXED_FIELDS,
+                         lambda: self.filter_videos(**query.filter_arguments()))
+
+    def count_by(self, field: str) -> Dict[Any, int]:
+        """
+        Bir sütunun değer dağılımını döndürür. Kayıtlar nesneye çevrilmez: sütun tek dilimle okunur,
+        her değer için eşleşme maskesi canlı kayıt maskesiyle AND'lenip bitleri sayılır.
+
+        Argümanlar:
+            field: "status", "visibility" veya "video_type".
+
+        Döndürür:
+            Dict[Any, int]: Değer -> video sayısı (sıfır olanlar hariç).
+
+        Raise eder:
+            ValueError: Alan geçersizse.
+        """
+        check_count_field(field)
+        offset, codes = {
+            "status": (_STATUS_OFFSET, _STATUS_CODES),
+            "visibility": (_VISIBILITY_OFFSET, _VISIBILITY_CODES),
+            "video_type": (_TYPE_OFFSET, _TYPE_CODES),
+        }[field]
+        total = self._total
+        if total == 0:
+            return {}
+        start = _HEADER_SIZE
+        stop = _HEADER_SIZE + total * _RECORD_SIZE
+        with memoryview(self._records) as view:
+            alive = view[start + _FLAGS_OFFSET:stop:_RECORD_SIZE].tobytes()
+            column = view[start + offset:stop:_RECORD_SIZE].tobytes()
+        alive_mask = int.from_bytes(alive.translate(_ALIVE_TABLE), "little")
+        counts = {}
+        for value, code in codes.items():
+            # Maskede her kayıt bir byte'ın en düşük bitidir: açık bit sayısı = kayıt sayısı
+            count = (int.from_bytes(column.translate(_equal_table(code)), "little") & alive_mask).bit_count()
+            if count:
+                counts[value] = count
+        return counts
+
+    def count(self) -> int:
+        """Depodaki toplam video sayısını döndürür."""
+        return self._live
+
+    def clear(self):
+        """
+        Kataloğu tamamen temizler (tüm dosyalar boşaltılır).
+        Bu işlem geri alınamaz.
+        """
+        self.close()
+        self._create_files()
+        self._open_files()
+        self._publish("clear", None)
+
+    def exists(self, video_id: str) -> bool:
+        """Video var mı kontrol eder."""
+        return self._index_lookup(video_id) is not None
+
+    def flush(self):
+        """Eşlenen sayfaları ve heap dosyasını diske yazar."""
+        self._heap.flush()
+        os.fsync(self._heap.fileno())
+        self._records.flush()
+        self._index.flush()
+
+    def close(self):
+        """Dosyaları diske yazıp kapatır."""
+        if self._records.closed:
+            return
+        self.flush()
+        self._records.close()
+        self._index.close()
+        for file in (self._rec_file, self._idx_file, self._heap, self._chan_file):
+            file.close()
@@ -0,0 +1,166 @@
+"""
+Video Sorguları ve Sorgu Planı
+==============================
+
+filter_videos ve VideoService.search_videos koşullarını tek bir sorgu nesnesinde toplar.
+Depo, sorgu için erişim yollarını (kanal indeksi, tarih sırası, bitmap'ler, etiket indeksi,
+tam tarama) indeks istatistiklerine göre maliyetlendirir ve en ucuz olanı seçer.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from .base import VideoBase, VideoStatus, VideoVisibility
+
+# Maliyet birimi: bir videonun Python'da okunup koşullarının kontrol edilmesi (~1.5 us)
+ROW_COST = 1.0
+# Koşul kontrolü gerekmeden sadece okunan aday başına maliyet
+FETCH_COST = 0.1
+# Bitmap yolunda slot başına sabit maliyet (maskeden slot toplama) ve her ek maske için ek maliyet
+SLOT_COST = 0.01
+MASK_COST = 0.002
+# Zaman sıralı yolların adayları eklenme sırasına çevrilirken sıralanır
+ORDER_COST = 0.2
+
+INDEXED_FIELDS = frozenset({"status", "visibility", "channel_id", "date_from", "date_to", "video_type"})
+
+
+class VideoQuery:
+    """
+    Video filtreleme koşulları. Verilmeyen (None) koşullar uygulanmaz.
+
+    Argümanlar:
+        status: Video durumu.
+        visibility: Görünürlük ayarı.
+        channel_id: Kanal ID'si.
+        date_from: Oluşturulma tarihi bu tarihten (dahil) sonra olanlar.
+        date_to: Oluşturulma tarihi bu tarihe (dahil) kadar olanlar.
+        video_type: Video tipi (get_video_type değeri).
+        title_contains: Başlıkta (büyük/küçük harf duyarsız) geçmesi gereken metin.
+        min_duration: En az süre (saniye).
+        tags: Videonun sahip olması gereken etiketlerin hepsi.
+    """
+
+    FIELDS = ("status", "visibility", "channel_id", "date_from", "date_to", "video_type",
+              "title_contains", "min_duration", "tags")
+
+    def __init__(
+        self,
+        status: Optional[VideoStatus] = None,
+        visibility: Optional[VideoVisibility] = None,
+        channel_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        video_type: Optional[str] = None,
+        title_contains: Optional[str] = None,
+        min_duration: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None
+    ):
+        self.status = status
+        self.visibility = visibility
+        self.channel_id = channel_id
+        self.date_from = date_from
+        self.date_to = date_to
+        self.video_type = video_type
+        self.title_contains = title_contains
+        self.min_duration = min_duration
+        self.tags = tuple(tags) if tags else None
+
+    def conditions(self) -> Dict[str, Any]:
+        """Verilmiş (boş olmayan) koşullar."""
+        return {field: getattr(self, field) for field in self.FIELDS if getattr(self, field)}
+
+    def filter_arguments(self) -> Dict[str, Any]:
+        """filter_videos'un doğrudan uygulayabildiği koşullar."""
+        return {field: value for field, value in self.conditions().items() if field in INDEXED_FIELDS}
+
+    def predicate(self, covered: FrozenSet[str] = frozenset()) -> Optional[Callable[[VideoBase], bool]]:
+        """
+        Erişim yolunun garanti etmediği koşulları kontrol eden fonksiyonu döndürür.
+
+        Argümanlar:
+            covered: Erişim yolunun zaten uyguladığı koşullar.
+
+        Döndürür:
+            Optional[Callable]: Kontrol edilecek koşul kalmadıysa None.
+        """
+        checks: List[Callable[[VideoBase], bool]] = []
+        remaining = {field: value for field, value in self.conditions().items() if field not in covered}
+        if "status" in remaining:
+            checks.append(lambda video, value=self.status: video.status == value)
+        if "visibility" in remaining:
+            checks.append(lambda video, value=self.visibility: video.visibility == value)
+        if "channel_id" in remaining:
+            checks.append(lambda video, value=self.channel_id: video.channel_id == value)
+        if "video_type" in remaining:
+            checks.append(lambda video, value=self.video_type: video.get_video_type() == value)
+        if "date_from" in remaining:
+            checks.append(lambda video, value=self.date_from: video.created_at >= value)
+        if "date_to" in remaining:
+            checks.append(lambda video, value=self.date_to: video.created_at <= value)
+        if "min_duration" in remaining:
+            checks.append(lambda video, value=self.min_duration: video.duration_seconds >= value)
+        if "title_contains" in remaining:
+            needle = self.title_contains.lower()
+            checks.append(lambda video: needle in video.title.lower())
+        if "tags" in remaining:
+            required = frozenset(self.tags)
+            checks.append(lambda video: required.issubset(video.tags))
+
+        if not checks:
+            return None
+        # all(...) üreteci yerine "and" zinciri: satır başına üreteç kurulmaz, ilk başarısız koşulda durulur
+        predicate = checks[0]
+        for check in checks[1:]:
+            predicate = _both(predicate, check)
+        return predicate
+
+    def __repr__(self):
+        conditions = ", ".join(f"{field}={value!r}" for field, value in self.conditions().items())
+        return f"VideoQuery({conditions})"
+
+
+def _both(first: Callable[[VideoBase], bool], second: Callable[[VideoBase], bool]) -> Callable[[VideoBase], bool]:
+    return lambda video: first(video) and second(video)
+
+
+class QueryPlan:
+    """
+    Bir sorgu için seçilebilecek erişim yolu.
+
+    Argümanlar:
+        access_path: Yolun adı (örn. "channel_range", "bitmap", "full_scan").
+        estimated_rows: Yolun okuyacağı tahmini aday sayısı (bilinmiyorsa None).
+        cost: Tahmini maliyet (ROW_COST birimiyle).
+        covered: Yolun kendisinin uyguladığı koşullar; kalanlar adaylar üzerinde kontrol edilir.
+        fetch: Adayları döndüren fonksiyon.
+        ordered_by_time: Adaylar eklenme sırası yerine zaman sırasıyla geliyorsa True.
+    """
+
+    def __init__(
+        self,
+        access_path: str,
+        estimated_rows: Optional[int],
+        cost: float,
+        covered: FrozenSet[str],
+        fetch: Callable[[], List[VideoBase]],
+        ordered_by_time: bool = False
+    ):
+        self.access_path = access_path
+        self.estimated_rows = estimated_rows
+        self.cost = cost
+        self.covered = covered
+        self.fetch = fetch
+        self.ordered_by_time = ordered_by_time
+        self.alternatives: List["QueryPlan"] = []
+
+    def describe(self) -> Dict[str, Any]:
+        """Planın explain çıktısındaki özeti."""
+        return {
+            "access_path": self.access_path,
+            "estimated_rows": self.estimated_rows,
+            "cost": round(self.cost, 1),
+        }
+
+    def __repr__(self):
+        return f"<QueryPlan {self.access_path} rows~{self.estimated_rows} cost={self.cost:.1f}>"
@@ -6,9 +6,74 @@ Veritabanı işlemlerini simüle eden katmandır.
 Bu katman, verilerin kalıcı olarak saklanması, sorgulanması ve yönetilmesinden sorumludur.
 """
 
-from typing import List, Optional, Dict, Union
+import gc
+import itertools
+import json
+import logging
+import os
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Optional, Dict, Tuple, Union
 from datetime import datetime
-from .base import VideoBase, VideoStatus, VideoVisibility, VideoNotFoundError
+from .base import (
+    VideoBase, VideoStatus, VideoVisibility, VideoNotFoundError,
+    RepositoryError, VideoMetadata
+)
+from .indexes import BitmapIndex, TagIndex, TrigramIndex, rank_tags, select_slots
+from .query import FETCH_COST, MASK_COST, ORDER_COST, ROW_COST, SLOT_COST, QueryPlan, VideoQuery
+
+logger = logging.getLogger("VideoModule")
+
+# Zaman indeksi anahtarı: (zaman, sıra no, video_id). Sıra no aynı zamanlı videoları eklenme sırasında tutar.
+_TimelineKey = Tuple[datetime, int, str]
+_TIMELINE_ORDERS = ("created_at", "published_at")
+# count_by ile değer dağılımı alınabilen alanlar
+COUNT_BY_FIELDS = ("status", "visibility", "video_type")
+# Silinen slot sayısı bu değeri ve canlı video sayısını geçince bitmap'ler sıkıştırılarak yeniden kurulur
+_SLOT_COMPACT_MIN = 4096
+
+
+class _ChannelTimeline:
+    """
+    Bir kanalın videolarını created_at ve published_at'e göre ayrı ayrı sıralı tutan indeks.
+    Yayınlanmamış videolar sadece created_at listesinde bulunur.
+    """
+
+    __slots__ = ("created", "published")
+
+    def __init__(self):
+        self.created: List[_TimelineKey] = []
+        self.published: List[_TimelineKey] = []
+
+    @staticmethod
+    def _discard(keys: List[_TimelineKey], key: _TimelineKey):
+        """Anahtarın konumunu bisect ile bulup listeden çıkarır (list.remove gibi baştan taramaz)."""
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            del keys[index]
+
+    def add(self, created_key: _TimelineKey, published_key: Optional[_TimelineKey]):
+        insort(self.created, created_key)
+        if published_key:
+            insort(self.published, published_key)
+
+    def remove(self, created_key: _TimelineKey, published_key: Optional[_TimelineKey]):
+        self._discard(self.created, created_key)
+        if published_key:
+            self._discard(self.published, published_key)
+
+    def __len__(self) -> int:
+        return len(self.created)
+
+
+def _time_slice(keys: List[_TimelineKey], since: Optional[datetime], until: Optional[datetime]) -> Tuple[int, int]:
+    """Sıralı anahtarlarda [since, until] (dahil) aralığının başlangıç/bitiş konumlarını bisect ile bulur."""
+    low = bisect_left(keys, (since,)) if since else 0
+    high = bisect_right(keys, (until, float("inf"))) if until else len(keys)
+    return low, high
+
 
 class VideoRepository:
     """
@@ -17,10 +82,203 @@ class VideoRepository:
     Repository kullanılarak veri erişimi soyutlanır.
     """
 
+    # Depo olaylarının aboneleri (örn. tam metin arama indeksi). Sınıf düzeyindeki boş varsayılan,
+    # VideoRepository.__init__'i çağırmayan alt sınıflarda (SQLite, mmap) da geçerlidir.
+    _observers: Tuple[Callable[[str, Any], None], ...] = ()
+
+    def subscribe(self, callback: Callable[[str, Any], None]):
+        """
+        Depo olaylarına abone olur. callback(olay, veri) şu durumlarda çağrılır:
+        ("save", video) kayıttan sonra, ("delete", video_id) silmeden sonra, ("clear", None) temizlemeden sonra.
+        """
+        if callback not in self._observers:
+            self._observers = self._observers + (callback,)
+
+    def unsubscribe(self, callback: Callable[[str, Any], None]):
+        """Aboneliği kaldırır (abone değilse bir şey yapmaz)."""
+        self._observers = tuple(observer for observer in self._observers if observer != callback)
+
+    def _publish(self, event: str, payload: Any):
+        for observer in self._observers:
+            observer(event, payload)
+
     def __init__(self):
         # Veritabanı tablosunu simüle eder.
         self._videos: Dict[str, VideoBase] = {}
-        self._channel_index: Dict[str, List[str]] = {} 
+        # Kanal -> zamana göre sıralı indeks; video -> (kanal, created anahtarı, published anahtarı)
+        self._channel_index: Dict[str, _ChannelTimeline] = {}
+        self._timeline_keys: Dict[str, Tuple[str, _TimelineKey, Optional[_TimelineKey]]] = {}
+        self._timeline_sequence = 0
+        # Tüm videoların zaman sırası (kanal verilmeden tarih aralığı sorguları için)
+        self._timeline = _ChannelTimeline()
+        # Durum/görünürlük/tip bitmap indeksleri; her video eklenme sırasında bir slot alır
+        self._bitmap_slots: Dict[str, int] = {}
+        self._slot_videos: List[Optional[VideoBase]] = []  # slot -> video (silinmişse None)
+        self._dead_slots = 0
+        self._status_index = BitmapIndex()
+        self._visibility_index = BitmapIndex()
+        self._type_index = BitmapIndex()
+        # Etiket -> slot indeksi ve kanal başına etiket sayaçları
+        self._tag_index = TagIndex()
+        # Başlık trigram indeksi ilk başlık aramasında kurulur (slot'lar üzerinden)
+        self._title_index: Optional[TrigramIndex] = None
+
+    def _timeline_entry(self, video: VideoBase) -> Tuple[str, _TimelineKey, Optional[_TimelineKey]]:
+        """Videonun kanal indeksindeki anahtarlarını üretir; tekrar kaydedilen video sıra numarasını korur."""
+        previous = self._timeline_keys.get(video.video_id)
+        if previous:
+            sequence = previous[1][1]
+        else:
+            self._timeline_sequence += 1
+            sequence = self._timeline_sequence
+        created_key = (video.created_at, sequence, video.video_id)
+        published_key = (video.published_at, sequence, video.video_id) if video.published_at else None
+        return video.channel_id, created_key, published_key
+
+    def _index_video(self, video: VideoBase):
+        """
+        Videoyu kanal indeksine ekler. Kanalı veya zamanları değişmişse eski anahtarları çıkarılır
+        (örn. yayınlanan videonun published_at'i ilk kayıttan sonra oluşur).
+        """
+        entry = self._timeline_entry(video)
+        previous = self._timeline_keys.get(video.video_id)
+        if previous == entry:
+            return
+        if previous:
+            self._unindex_video(video.video_id)
+        channel_id, created_key, published_key = entry
+        timeline = self._channel_index.get(channel_id)
+        if timeline is None:
+            timeline = self._channel_index[channel_id] = _ChannelTimeline()
+        timeline.add(created_key, published_key)
+        self._timeline.add(created_key, published_key)
+        self._timeline_keys[video.video_id] = entry
+
+    def _unindex_video(self, video_id: str):
+        """Videoyu kanal indeksinden çıkarır; boşalan kanalın indeksi de silinir."""
+        entry = self._timeline_keys.pop(video_id, None)
+        if entry is None:
+            return
+        channel_id, created_key, published_key = entry
+        self._timeline.remove(created_key, published_key)
+        timeline = self._channel_index.get(channel_id)
+        if timeline is not None:
+            timeline.remove(created_key, published_key)
+            if not timeline:
+                del self._channel_index[channel_id]
+
+    def _index_attributes(self, video: VideoBase):
+        """Videonun durum, görünürlük, tip bitmap'lerini ve etiketlerini günceller (yeni videoya slot ayırır)."""
+        slot = self._bitmap_slots.get(video.video_id)
+        if slot is None:
+            slot = self._bitmap_slots[video.video_id] = len(self._slot_videos)
+            self._slot_videos.append(video)
+            added, replaced = True, False
+        else:
+            added, replaced = False, self._slot_videos[slot] is not video
+            self._slot_videos[slot] = video
+        self._status_index.set(slot, video.status)
+        self._visibility_index.set(slot, video.visibility)
+        self._type_index.set(slot, video.get_video_type())
+        self._tag_index.set(slot, video.channel_id, video.tags)
+        if self._title_index is not None and (added or replaced):
+            # Aynı ID ile yeni nesne kaydedildiyse başlığı farklı olabilir
+            self._title_index.add(slot, video.title)
+            if replaced:
+                self._mark_title_stale()
+
+    def _unindex_attributes(self, video_id: str):
+        """Videonun slot'unu bitmap'lerden çıkarır; boş slot'lar çoğalınca bitmap'ler sıkıştırılır."""
+        slot = self._bitmap_slots.pop(video_id, None)
+        if slot is None:
+            return
+        self._slot_videos[slot] = None
+        for index in (self._status_index, self._visibility_index, self._type_index, self._tag_index):
+            index.discard(slot)
+        if self._title_index is not None:
+            self._mark_title_stale()
+        self._dead_slots += 1
+        if self._dead_slots > max(_SLOT_COMPACT_MIN, len(self._bitmap_slots)):
+            self._rebuild_bitmaps()
+
+    def _rebuild_bitmaps(self):
+        """Slot'ları videoların eklenme sırasına göre baştan dağıtıp bitmap'leri ve etiket indeksini yeniden kurar."""
+        self._bitmap_slots = {}
+        self._slot_videos = []
+        self._dead_slots = 0
+        for index in (self._status_index, self._visibility_index, self._type_index, self._tag_index):
+            index.clear()
+        # Slot numaraları değiştiği için trigram indeksi bir sonraki aramada yeniden kurulur
+        self._title_index = None
+        for video in self._videos.values():
+            self._index_attributes(video)
+
+    def _title_trigrams(self) -> TrigramIndex:
+        """Başlık trigram indeksini döndürür; henüz yoksa mevcut slot'lardan kurar."""
+        if self._title_index is None:
+            index = TrigramIndex()
+            for slot, video in enumerate(self._slot_videos):
+                if video is not None:
+                    index.add(slot, video.title)
+            self._title_index = index
+        return self._title_index
+
+    def _mark_title_stale(self):
+        """Trigram indeksinde bayat girdi oluştu; canlı video sayısını aşarsa indeks bırakılır."""
+        self._title_index.stale += 1
+        if self._title_index.stale > max(_SLOT_COMPACT_MIN, len(self._bitmap_slots)):
+            self._title_index = None
+
+    def _rebuild_indexes(self):
+        """_videos doğrudan doldurulduktan sonra (yükleme) tüm indeksleri ve dinleyicileri kurar."""
+        for video in self._videos.values():
+            video.add_listener(self._on_video_changed)
+        self._rebuild_channel_index()
+        self._rebuild_bitmaps()
+
+    def _on_video_changed(self, video: VideoBase, field: str):
+        """
+        Depodaki bir videonun durumu/görünürlüğü/başlığı/etiketleri save beklenmeden değiştiğinde
+        indeksleri günceller; filter_videos eskiden olduğu gibi nesnelerin anlık halini yansıtır.
+        """
+        if self._videos.get(video.video_id) is not video:
+            return
+        slot = self._bitmap_slots[video.video_id]
+        if field == "status":
+            self._status_index.set(slot, video.status)
+            # Yayınlanan videonun published_at'i ilk kez atanmış olabilir
+            self._index_video(video)
+        elif field == "visibility":
+            self._visibility_index.set(slot, video.visibility)
+        elif field == "tags":
+            self._tag_index.set(slot, video.channel_id, video.tags)
+        elif field == "title" and self._title_index is not None:
+            # Eski başlığın trigram'ları bayat kalır; aramada tam metin doğrulaması onları eler
+            self._title_index.add(slot, video.title)
+            self._mark_title_stale()
+
+    def _rebuild_channel_index(self):
+        """
+        Kanal indeksini tüm videolardan yeniden kurar. Toplu yüklemede tek tek insort yerine
+        anahtarlar eklenip her kanal bir kez sıralanır.
+        """
+        self._channel_index.clear()
+        self._timeline_keys.clear()
+        self._timeline = _ChannelTimeline()
+        for video in self._videos.values():
+            entry = self._timeline_entry(video)
+            channel_id, created_key, published_key = entry
+            timeline = self._channel_index.get(channel_id)
+            if timeline is None:
+                timeline = self._channel_index[channel_id] = _ChannelTimeline()
+            for timeline in (timeline, self._timeline):
+                timeline.created.append(created_key)
+                if published_key:
+                    timeline.published.append(published_key)
+            self._timeline_keys[video.video_id] = entry
+        for timeline in (*self._channel_index.values(), self._timeline):
+            timeline.created.sort()
+            timeline.published.sort()
 
     def save(self, video: VideoBase) -> VideoBase:
         """
@@ -34,15 +292,20 @@ class VideoRepository:
         Döndürür:
             VideoBase: Kaydedilen video nesnesi.
         """
+        # Aynı ID ile farklı bir nesne kaydediliyorsa eskisinin değişiklikleri artık izlenmez
+        previous = self._videos.get(video.video_id)
+        if previous is not None and previous is not video:
+            previous.remove_listener(self._on_video_changed)
+
         # Veriyi kaydet
         self._videos[video.video_id] = video
-        
-        # Kanal indeksini güncelle
-        if video.channel_id not in self._channel_index:
-            self._channel_index[video.channel_id] = []
-        if video.video_id not in self._channel_index[video.channel_id]:
-            self._channel_index[video.channel_id].append(video.video_id)
-            
+        video.add_listener(self._on_video_changed)
+
+        # Kanal ve bitmap indekslerini güncelle
+        self._index_video(video)
+        self._index_attributes(video)
+        self._publish("save", video)
+
         return video
 
     def find_by_id(self, video_id: str) -> Optional[VideoBase]:
@@ -86,14 +349,14 @@ class VideoRepository:
             bool: Silme başarılıysa True, aksi halde False dödürür.
         """
         if video_id in self._videos:
-            video = self._videos[video_id]
-            if video.channel_id in self._channel_index:
-                if video_id in self._channel_index[video.channel_id]:
-                    self._channel_index[video.channel_id].remove(video_id) 
+            # İndeksten siler.
+            self._videos[video_id].remove_listener(self._on_video_changed)
+            self._unindex_video(video_id)
             del self._videos[video_id]
+            self._unindex_attributes(video_id)
+            self._publish("delete", video_id)
             return True
         return False
-    # İndeksten siler.
 
     def find_all(self) -> List[VideoBase]:
         """
@@ -104,21 +367,66 @@ class VideoRepository:
         """
         return list(self._videos.values())
 
-    def find_by_channel(self, channel_id: str) -> List[VideoBase]:
+    def find_by_channel(
+        self,
+        channel_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+        order_by: str = "created_at"
+    ) -> List[VideoBase]:
         """
-        Belirli bir kanala ait videoları filtreler.
-        İndeks kullanarak daha hızlı erişim sağlar.
-        
-        Args:
+        Belirli bir kanala ait videoları zamana göre sıralı getirir.
+        Kanal indeksi sıralı olduğu için aralığın sınırları bisect ile bulunur; sadece istenen
+        dilimdeki (en fazla limit kadar) video okunur.
+
+        Argümanlar:
             channel_id: Kanal ID'si.
-            
-        Returns:
+            since: Bu zamandan (dahil) sonraki videolar.
+            until: Bu zamana (dahil) kadar olan videolar.
+            limit: Döndürülecek en fazla video sayısı.
+            newest_first: True ise en yeni video başta olur.
+            order_by: "created_at" veya "published_at". published_at sıralamasında
+                sadece yayınlanmış videolar döner.
+
+        Döndürür:
             List[VideoBase]: O kanala ait videolar.
+
+        Raise eder:
+            ValueError: order_by geçersizse veya limit negatifse.
+        """
+        check_channel_query(order_by, limit)
+        timeline = self._channel_index.get(channel_id)
+        if timeline is None:
+            return []
+        keys = timeline.published if order_by == "published_at" else timeline.created
+        low, high = _time_slice(keys, since, until)
+        positions = range(high - 1, low - 1, -1) if newest_first else range(low, high)
+        if limit is not None:
+            positions = positions[:limit]
+        return [self._videos[keys[position][2]] for position in positions]
+
+    def find_by_tags(self, tags: Iterable[str], match: str = "all", limit: Optional[int] = None) -> List[VideoBase]:
+        """
+        Etiketlere göre video bulur. "all" sorgusu etiket indeksinde en kısa posting listesinden
+        başlayarak eklenme sırasıyla kesişir; limit dolunca okuma durur ve sadece sonuç kadar
+        video okunur.
+
+        Argümanlar:
+            tags: Aranan etiketler (büyük/küçük harf duyarlı, add_tag ile aynı).
+            match: "all" ise etiketlerin hepsine, "any" ise herhangi birine sahip videolar.
+            limit: Döndürülecek en fazla video sayısı.
+
+        Döndürür:
+            List[VideoBase]: Eşleşen videolar (eklenme sırasıyla).
+
+        Raise eder:
+            ValueError: match geçersizse veya limit negatifse.
         """
-        # İndeksten ID'leri alır.
-        video_ids = self._channel_index.get(channel_id, [])
-        # Nesneleri getirir.
-        return [self._videos[vid] for vid in video_ids if vid in self._videos]
+        check_tag_query(match, limit)
+        slot_videos = self._slot_videos
+        return [slot_videos[slot] for slot in self._tag_index.select(tags, match == "all", limit)]
 
     def filter_videos(
         self,
@@ -126,13 +434,17 @@ class VideoRepository:
         visibility: Optional[VideoVisibility] = None,
         channel_id: Optional[str] = None,
         date_from: Optional[datetime] = None,
-        date_to: Optional[datetime] = None
+        date_to: Optional[datetime] = None,
+        video_type: Optional[str] = None
     ) -> List[VideoBase]:
         """
         Videoları belirli kriterlere göre filtreler.
         Bu metot, karmaşık sorguları simüle etmek için kullanılır.
         Her parametre opsiyoneldir; sadece verilen parametreler filtrelemeye dahil edilir.
 
+        Kriterler VideoQuery'ye çevrilip execute ile çalıştırılır; başlangıç kümesi (kanal indeksi,
+        tarih sırası, bitmap'ler veya tam tarama) planlayıcı tarafından seçilir.
+
         Argümanlar:
             status: Videonun durumuna göre filtreleme yapar.
                 (Örn: Sadece YAYINDA olanları getirir.).
@@ -143,38 +455,177 @@ class VideoRepository:
             channel_id: Belirli bir kanalın videolarını getirir.
             date_from: Oluşturulma tarihi bu tarihten sonra olanlar.
             date_to: Oluşturulma tarihi bu tarihten önce olanlar.
+            video_type: Video tipi (get_video_type değeri, örn. "ShortVideo").
 
         Döndürür:
-            List[VideoBase]: Kriterlere uyan Video nesnelerinin listesi.
+            List[VideoBase]: Kriterlere uyan Video nesnelerinin listesi (eklenme sırasıyla).
             Eğer hiçbir kriter verilmezse tüm videoları döndürür.
         """
-        # Başlangıç kümesi: Kanal ID varsa indeksten, yoksa hepsinden alır.
-        if channel_id:
-            start_list = self.find_by_channel(channel_id)
-        else:
-            start_list = list(self._videos.values())
+        return self.execute(VideoQuery(status=status, visibility=visibility, channel_id=channel_id,
+                                       date_from=date_from, date_to=date_to, video_type=video_type))
 
-        results = []
-        for v in start_list:
-            # Durum kontrolü
-            if status and v.status != status:
-                continue
-            
-            # Görünürlük kontrolü
-            if visibility and v.visibility != visibility:
-                continue
-                
-            # Tarih aralığı kontrolü (Başlangıç)
-            if date_from and v.created_at < date_from:
-                continue
-                
-            # Tarih aralığı kontrolü (Bitiş)
-            if date_to and v.created_at > date_to:
-                continue
-                
-            results.append(v)
+    def plan(self, query: VideoQuery) -> QueryPlan:
+        """
+        Sorgu için erişim yollarını maliyetlendirip en ucuzunu seçer.
+
+        Kanal ve tarih yollarının okuyacağı aday sayısı zaman indekslerinde bisect ile kesin olarak,
+        bitmap yolununki değer sayaçlarından (koşullar bağımsız varsayılarak), etiket ve başlık
+        araması yollarınınki en kısa posting listesinden (üst sınır) tahmin edilir.
+        Aday başına maliyete, yolun uygulamadığı koşulların kontrolü de eklenir.
+
+        Argümanlar:
+            query: Çalıştırılacak sorgu.
+
+        Döndürür:
+            QueryPlan: Seçilen plan (diğer adaylar alternatives listesinde).
+        """
+        conditions = query.conditions()
+        total = len(self._videos)
+
+        def row_cost(covered) -> float:
+            return ROW_COST if set(conditions) - covered else FETCH_COST
+
+        plans = []
+        date_fields = frozenset(field for field in ("date_from", "date_to") if field in conditions)
+        if query.channel_id:
+            timeline = self._channel_index.get(query.channel_id)
+            low, high = _time_slice(timeline.created, query.date_from, query.date_to) if timeline else (0, 0)
+            covered = date_fields | {"channel_id"}
+            plans.append(QueryPlan(
+                "channel_range", high - low, (high - low) * (row_cost(covered) + ORDER_COST), covered,
+                lambda: self.find_by_channel(query.channel_id, since=query.date_from, until=query.date_to),
+                ordered_by_time=True))
+        if date_fields:
+            keys = self._timeline.created
+            low, high = _time_slice(keys, query.date_from, query.date_to)
+            plans.append(QueryPlan(
+                "date_range", high - low, (high - low) * (row_cost(date_fields) + ORDER_COST), date_fields,
+                lambda: [self._videos[key[2]] for key in keys[low:high]],
+                ordered_by_time=True))
+        bitmaps = [(field, index, conditions[field]) for field, index in (
+            ("status", self._status_index), ("visibility", self._visibility_index),
+            ("video_type", self._type_index)) if field in conditions]
+        if bitmaps:
+            estimated = float(total)
+            for _, index, value in bitmaps:
+                estimated *= index.count(value) / total if total else 0
+            covered = frozenset(field for field, _, _ in bitmaps)
+            plans.append(QueryPlan(
+                "bitmap", round(estimated),
+                len(self._slot_videos) * (SLOT_COST + MASK_COST * len(bitmaps)) + estimated * row_cost(covered),
+                covered,
+                lambda: select_slots(self._slot_videos, [index.mask(value) for _, index, value in bitmaps])))
+        if query.tags:
+            estimated = min(self._tag_index.count(tag) for tag in query.tags)
+            slot_videos = self._slot_videos
+            plans.append(QueryPlan(
+                "tag_index", estimated, estimated * row_cost(frozenset({"tags"})), frozenset({"tags"}),
+                lambda: [slot_videos[slot] for slot in self._tag_index.select(query.tags)]))
+        if query.title_contains:
+            index = self._title_trigrams()
+            estimated = index.estimate(query.title_contains)
+            if estimated is not None:
+                slot_videos = self._slot_videos
+
+                def title_candidates() -> List[VideoBase]:
+                    slots = index.candidates(query.title_contains)
+                    return [video for video in map(slot_videos.__getitem__, slots) if video is not None]
+
+                # Adaylar (üst sınır) tam metinle doğrulanır: başlık koşulu kapsanmış sayılmaz
+                plans.append(QueryPlan("title_trigram", estimated, estimated * (ROW_COST + ORDER_COST),
+                                       frozenset(), title_candidates))
+        plans.append(QueryPlan("full_scan", total, total * row_cost(frozenset()), frozenset(),
+                               lambda: list(self._videos.values())))
+
+        best = min(plans, key=lambda plan: plan.cost)
+        best.alternatives = [plan for plan in plans if plan is not best]
+        return best
+
+    def _run(self, plan: QueryPlan, query: VideoQuery) -> Tuple[List[VideoBase], int]:
+        """Planın adaylarını okuyup kalan koşulları uygular; (sonuçlar, okunan aday sayısı) döndürür."""
+        candidates = plan.fetch()
+        predicate = query.predicate(plan.covered)
+        results = [video for video in candidates if predicate(video)] if predicate else candidates
+        if plan.ordered_by_time and len(results) > 1:
+            # Hangi yol seçilirse seçilsin sonuçlar eklenme sırasıyla döner
+            slots = self._bitmap_slots
+            results.sort(key=lambda video: slots[video.video_id])
+        return results, len(candidates)
+
+    def execute(self, query: VideoQuery) -> List[VideoBase]:
+        """
+        Sorguyu planlayıcının seçtiği erişim yoluyla çalıştırır.
+
+        Argümanlar:
+            query: Çalıştırılacak sorgu.
+
+        Döndürür:
+            List[VideoBase]: Koşullara uyan videolar (eklenme sırasıyla).
+        """
+        return self._run(self.plan(query), query)[0]
+
+    def explain(self, query: VideoQuery) -> Dict[str, Any]:
+        """
+        Sorguyu çalıştırıp seçilen planı, okunan/dönen satır sayılarını ve süreyi raporlar.
+
+        Argümanlar:
+            query: Çalıştırılacak sorgu.
+
+        Döndürür:
+            Dict[str, Any]: access_path, estimated_rows, cost, rows_examined, rows_returned,
+            elapsed_ms ve maliyete göre sıralı alternatives.
+        """
+        started = time.perf_counter()
+        plan = self.plan(query)
+        results, examined = self._run(plan, query)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return {
+            "query": repr(query),
+            **plan.describe(),
+            "rows_examined": examined,
+            "rows_returned": len(results),
+            "elapsed_ms": round(elapsed_ms, 3),
+            "alternatives": [alternative.describe()
+                             for alternative in sorted(plan.alternatives, key=lambda alternative: alternative.cost)],
+        }
+
+    def count_by(self, field: str) -> Dict[Any, int]:
+        """
+        Bitmap indeksli bir sütunun değer dağılımını döndürür (videolar taranmaz).
+
+        Argümanlar:
+            field: "status", "visibility" veya "video_type".
+
+        Döndürür:
+            Dict[Any, int]: Değer -> video sayısı.
+
+        Raise eder:
+            ValueError: Alan indeksli değilse.
+        """
+        check_count_field(field)
+        indexes = {"status": self._status_index, "visibility": self._visibility_index,
+                   "video_type": self._type_index}
+        return indexes[field].counts()
+
+    def tag_facets(self, channel_id: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Etiketlerin video sayılarını döndürür. Sayaçlar etiket indeksiyle birlikte güncel tutulur,
+        videolar taranmaz.
+
+        Argümanlar:
+            channel_id: Verilirse sadece o kanalın videoları sayılır.
+            limit: Döndürülecek en fazla etiket sayısı (en çok kullanılanlar).
+
+        Döndürür:
+            List[Tuple[str, int]]: (etiket, video sayısı) çiftleri; sayıya göre azalan, eşitlikte
+            etiket sırasıyla.
 
-        return results
+        Raise eder:
+            ValueError: limit negatifse.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative")
+        return self._tag_index.facets(channel_id, limit)
 
     def count(self) -> int:
         """
@@ -187,9 +638,426 @@ class VideoRepository:
         Depoyu tamamen temizler.
         Bu işlem geri alınamaz.
         """
+        for video in self._videos.values():
+            video.remove_listener(self._on_video_changed)
         self._videos.clear()
         self._channel_index.clear()
+        self._timeline_keys.clear()
+        self._timeline = _ChannelTimeline()
+        self._rebuild_bitmaps()
+        self._publish("clear", None)
     
     def exists(self, video_id: str) -> bool:
         """Video var mı kontrol eder."""
-        return video_id in self._videos
\ No newline at end of file
+        return video_id in self._videos
+
+# Kayıt satırı düzeni (pozisyonel JSON dizisi):
+#   ortak alanlar (VIDEO_ROW_FIELDS) + alt tipe özgü alanlar (_EXTRA_FIELDS sırasıyla)
+# Anahtar isimleri her satırda tekrar edilmediği için dosya küçülür ve JSON çözme ~5 kat hızlanır.
+VIDEO_ROW_FIELDS = (
+    "video_id", "type", "channel_id", "title", "description", "duration_seconds", "visibility",
+    "status", "created_at", "published_at", "tags", "view_count", "likes",
+)
+_EXTRA_FIELDS = {
+    "StandardVideo": ("resolution", "has_subtitles", "allow_comments", "metadata"),
+    "LiveStreamVideo": ("scheduled_start_time", "is_live", "chat_enabled", "max_concurrent_viewers"),
+    "ShortVideo": ("music_track_id", "filter_used", "aspect_ratio"),
+}
+
+# Enum(value) çağrısı yavaş olduğu için yüklemede doğrudan sözlükten bakılır
+_VISIBILITY_BY_VALUE = {member.value: member for member in VideoVisibility}
+_STATUS_BY_VALUE = {member.value: member for member in VideoStatus}
+_VIDEO_CLASSES: Dict[str, type] = {}
+_REPLAY_CHUNK_LINES = 10000
+
+
+def check_channel_query(order_by: str, limit: Optional[int]):
+    """
+    find_by_channel parametrelerini doğrular.
+
+    Raise eder:
+        ValueError: order_by geçersizse veya limit negatifse.
+    """
+    if order_by not in _TIMELINE_ORDERS:
+        raise ValueError(f"order_by must be one of {_TIMELINE_ORDERS}, got {order_by!r}")
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be non-negative")
+
+
+def check_count_field(field: str):
+    """
+    count_by alanını doğrular.
+
+    Raise eder:
+        ValueError: Alan COUNT_BY_FIELDS içinde değilse.
+    """
+    if field not in COUNT_BY_FIELDS:
+        raise ValueError(f"field must be one of {COUNT_BY_FIELDS}, got {field!r}")
+
+
+def check_tag_query(match: str, limit: Optional[int]):
+    """
+    find_by_tags parametrelerini doğrular.
+
+    Raise eder:
+        ValueError: match "all"/"any" değilse veya limit negatifse.
+    """
+    if match not in ("all", "any"):
+        raise ValueError(f"match must be 'all' or 'any', got {match!r}")
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be non-negative")
+
+
+def match_tags(videos: Iterable[VideoBase], tags: Iterable[str], match: str, limit: Optional[int]) -> List[VideoBase]:
+    """Etiket indeksi olmayan depolar için find_by_tags: videolar sırayla kontrol edilir."""
+    wanted = frozenset(tags)
+    if not wanted:
+        return []
+    if match == "all":
+        matched = (video for video in videos if wanted.issubset(video.tags))
+    else:
+        matched = (video for video in videos if not wanted.isdisjoint(video.tags))
+    return list(itertools.islice(matched, limit))
+
+
+def count_tags(videos: Iterable[VideoBase], limit: Optional[int]) -> List[Tuple[str, int]]:
+    """Etiket indeksi olmayan depolar için tag_facets: etiketler videolar üzerinden sayılır."""
+    return rank_tags(Counter(tag for video in videos for tag in set(video.tags)).items(), limit)
+
+
+def order_channel_videos(
+    videos: List[VideoBase],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    newest_first: bool = False,
+    order_by: str = "created_at"
+) -> List[VideoBase]:
+    """
+    Kanal indeksi tutmayan depolar için find_by_channel sıralamasını (eklenme sırasıyla verilmiş)
+    video listesi üzerinde uygular. Eşit zamanlı videolar eklenme sırasını korur.
+    """
+    check_channel_query(order_by, limit)
+    if order_by == "published_at":
+        videos = [video for video in videos if video.published_at]
+    moment = attrgetter(order_by)
+    videos = [video for video in videos
+              if (since is None or moment(video) >= since) and (until is None or moment(video) <= until)]
+    # sort kararlı: newest_first'te eşit zamanlılar için eklenme sırası da ters çevrilir
+    videos.sort(key=moment)
+    if newest_first:
+        videos.reverse()
+    return videos if limit is None else videos[:limit]
+
+
+def _video_classes() -> Dict[str, type]:
+    """Tip adı -> video sınıfı eşlemesini (ilk çağrıda) kurar."""
+    if not _VIDEO_CLASSES:
+        # Lazy import: implementations bu modülü içe aktardığı için döngüsel import olmaması için burada.
+        from .implementations import StandardVideo, LiveStreamVideo, ShortVideo
+        _VIDEO_CLASSES.update(
+            {"StandardVideo": StandardVideo, "LiveStreamVideo": LiveStreamVideo, "ShortVideo": ShortVideo}
+        )
+    return _VIDEO_CLASSES
+
+
+def _encode_extra(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, VideoMetadata):
+        return [value.resolution, value.codec, value.bitrate_kbps, value.last_updated.isoformat()]
+    return value
+
+
+def _decode_extra(field: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if field == "scheduled_start_time":
+        return datetime.fromisoformat(value)
+    if field == "metadata":
+        metadata = VideoMetadata.__new__(VideoMetadata)
+        metadata.resolution, metadata.codec, metadata.bitrate_kbps, last_updated = value
+        metadata.last_updated = datetime.fromisoformat(last_updated)
+        return metadata
+    return value
+
+
+def video_to_row(video: VideoBase) -> List[Any]:
+    """
+    Video nesnesini JSON'a yazılabilir pozisyonel bir listeye çevirir.
+    to_dict()'ten farkı; istatistikleri ve alt tipe özgü tüm alanları da içermesidir,
+    böylece satır row_to_video ile birebir geri kurulabilir.
+
+    Argümanlar:
+        video (VideoBase): Serileştirilecek video.
+
+    Döndürür:
+        List[Any]: VIDEO_ROW_FIELDS + alt tip alanları sırasıyla değerler.
+    """
+    video_type = video.get_video_type()
+    row = [
+        video.video_id,
+        video_type,
+        video.channel_id,
+        video.title,
+        video.description,
+        video.duration_seconds,
+        video.visibility.value,
+        video.status.value,
+        video.created_at.isoformat(),
+        video.published_at.isoformat() if video.published_at else None,
+        list(video.tags),
+        getattr(video, "_view_count", 0),
+        getattr(video, "_likes", 0),
+    ]
+    row.extend(_encode_extra(getattr(video, field, None)) for field in _EXTRA_FIELDS.get(video_type, ()))
+    return row
+
+
+def row_to_video(row: List[Any]) -> VideoBase:
+    """
+    video_to_row ile üretilmiş satırı tekrar video nesnesine çevirir.
+    Nesne __init__ çağrılmadan (__new__ ile) kurulur; böylece yeni uuid üretilmez,
+    created_at/published_at ve durum bilgisi kayıttaki haliyle korunur.
+
+    Argümanlar:
+        row (List[Any]): Kayıt satırı.
+
+    Döndürür:
+        VideoBase: Geri kurulan video nesnesi.
+
+    Raise eder:
+        RepositoryError: Kayıt tipi bilinmiyorsa.
+    """
+    (video_id, video_type, channel_id, title, description, duration_seconds, visibility, status,
+     created_at, published_at, tags, view_count, likes, *extras) = row
+
+    video_class = _video_classes().get(video_type)
+    if video_class is None:
+        raise RepositoryError(f"Bilinmeyen video tipi: {video_type}")
+
+    video = video_class.__new__(video_class)
+    state = {
+        "_video_id": video_id,
+        "_channel_id": channel_id,
+        "_title": title,
+        "_description": description,
+        "_duration_seconds": duration_seconds,
+        "_visibility": _VISIBILITY_BY_VALUE[visibility],
+        "_status": _STATUS_BY_VALUE[status],
+        "_created_at": datetime.fromisoformat(created_at),
+        "_published_at": datetime.fromisoformat(published_at) if published_at else None,
+        "_tags": tags or [],
+        "_view_count": view_count,
+        "_likes": likes,
+    }
+    for field, value in zip(_EXTRA_FIELDS[video_type], extras):
+        state[field] = _decode_extra(field, value)
+
+    video.__dict__.update(state)
+    return video
+
+
+class PersistentVideoRepository(VideoRepository):
+    """
+    Videoları diskte kalıcı tutan depo sınıfıdır.
+    VideoRepository ile aynı API'yi sunar; sorgular yine bellekteki sözlük ve indeks üzerinden yapılır.
+
+    Kayıt formatı tek bir append-only JSON Lines dosyasıdır, her satır bir JSON dizisidir:
+        ["put", <video_to_row alanları>]  -> video eklendi/güncellendi
+        ["del", "<video_id>"]             -> video silindi
+    Her save/delete sadece tek satır ekler (tüm katalog yeniden yazılmaz).
+    Ölü satır sayısı canlı kayıtlara göre büyüdüğünde dosya sıkıştırılır (compact).
+    """
+
+    def __init__(
+        self,
+        data_file: str = "videos.jsonl",
+        fsync: bool = False,
+        compact_min_entries: int = 10000,
+        compact_ratio: float = 1.0,
+    ):
+        """
+        Argümanlar:
+            data_file: Kayıt dosyasının yolu.
+            fsync: True ise her yazmada os.fsync çağrılır (daha yavaş, güç kesintisine dayanıklı).
+            compact_min_entries: Sıkıştırma için gereken en az ölü satır sayısı.
+            compact_ratio: Ölü satır / canlı kayıt oranı bu değeri aşınca sıkıştırma yapılır.
+        """
+        super().__init__()
+        self.data_file = data_file
+        self._fsync = fsync
+        self._compact_min_entries = compact_min_entries
+        self._compact_ratio = compact_ratio
+        self._dead_entries = 0
+
+        self._load()
+        self._file = open(self.data_file, "a", encoding="utf-8")
+        logger.info(f"PersistentVideoRepository yüklendi: {len(self._videos)} video ({self.data_file})")
+
+    def _load(self):
+        """Kayıt dosyasını baştan sona okuyup son durumu belleğe kurar."""
+        if not os.path.exists(self.data_file):
+            return
+
+        # Milyonlarca nesne kurulurken döngüsel GC taramaları yükleme süresini ikiye katlıyor
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._replay()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _replay(self):
+        """Satırları sırayla uygular; her video için sadece son "put" kaydından nesne kurulur."""
+        latest: Dict[str, List[Any]] = {}
+        lines = 0
+        good_offset = 0
+        chunk: List[bytes] = []
+
+        def apply(entries: List[List[Any]]):
+            for entry in entries:
+                if entry[0] == "put":
+                    latest[entry[1]] = entry
+                elif entry[0] == "del":
+                    latest.pop(entry[1], None)
+
+        with open(self.data_file, "rb") as file:
+            for raw in file:
+                if not raw.endswith(b"\n"):
+                    # Yarıda kalmış son satır (çökme): atılır ve dosyadan kesilir
+                    logger.warning(f"{self.data_file}: yarım kalmış son kayıt atlandı")
+                    break
+                good_offset += len(raw)
+                lines += 1
+                chunk.append(raw)
+                if len(chunk) >= _REPLAY_CHUNK_LINES:
+                    apply(self._decode_lines(chunk))
+                    chunk = []
+            apply(self._decode_lines(chunk))
+
+        if good_offset != os.path.getsize(self.data_file):
+            with open(self.data_file, "r+b") as file:
+                file.truncate(good_offset)
+
+        for video_id, entry in latest.items():
+            try:
+                video = row_to_video(entry[1:])
+            except (KeyError, ValueError, TypeError, RepositoryError) as e:
+                logger.warning(f"Video kaydı yüklenemedi ({video_id}): {e}")
+                continue
+            self._videos[video_id] = video
+        self._rebuild_indexes()
+
+        self._dead_entries = lines - len(self._videos)
+
+    def _decode_lines(self, chunk: List[bytes]) -> List[List[Any]]:
+        """
+        Satır grubunu tek bir json.loads çağrısıyla çözer (satır başına çağrıdan belirgin şekilde hızlı).
+        Grupta bozuk satır varsa satır satır çözülüp bozuk olanlar atlanır.
+        """
+        if not chunk:
+            return []
+        try:
+            return json.loads(b"[" + b",".join(chunk) + b"]")
+        except ValueError:
+            pass
+
+        entries = []
+        for raw in chunk:
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                entry = None
+            if isinstance(entry, list) and len(entry) >= 2:
+                entries.append(entry)
+            elif raw.strip():
+                logger.warning(f"{self.data_file}: bozuk satır atlandı")
+        return entries
+
+    def _append(self, entry: List[Any]):
+        """Tek bir değişikliği dosyanın sonuna ekler."""
+        try:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+        except OSError as e:
+            raise RepositoryError(f"Video kaydı diske yazılamadı: {e}") from e
+
+    def _maybe_compact(self):
+        if self._dead_entries >= max(self._compact_min_entries, self._compact_ratio * len(self._videos)):
+            self.compact()
+
+    def save(self, video: VideoBase) -> VideoBase:
+        """
+        Videoyu bellekte kaydeder ve değişikliği kayıt dosyasına tek satır olarak ekler.
+
+        Argümanlar:
+            video (VideoBase): Kaydedilecek video nesnesi.
+
+        Döndürür:
+            VideoBase: Kaydedilen video nesnesi.
+        """
+        existed = video.video_id in self._videos
+        self._append(["put", *video_to_row(video)])
+        super().save(video)
+        if existed:
+            self._dead_entries += 1
+            self._maybe_compact()
+        return video
+
+    def delete(self, video_id: str) -> bool:
+        """
+        Videoyu siler ve silme işlemini kayıt dosyasına ekler.
+
+        Argümanlar:
+            video_id (str): Silinecek video ID'si.
+
+        Döndürür:
+            bool: Silme başarılıysa True, aksi halde False.
+        """
+        if video_id not in self._videos:
+            return False
+        self._append(["del", video_id])
+        super().delete(video_id)
+        # Hem eski "put" satırı hem de "del" satırı artık ölü
+        self._dead_entries += 2
+        self._maybe_compact()
+        return True
+
+    def clear(self):
+        """Depoyu ve kayıt dosyasını tamamen temizler. Bu işlem geri alınamaz."""
+        super().clear()
+        self._file.close()
+        self._file = open(self.data_file, "w", encoding="utf-8")
+        self._dead_entries = 0
+
+    def compact(self):
+        """
+        Kayıt dosyasını sadece canlı videoları içerecek şekilde yeniden yazar.
+        Geçici dosyaya yazılıp os.replace ile değiştirildiği için yarıda kalırsa eski dosya bozulmaz.
+        """
+        temp_file = self.data_file + ".tmp"
+        self._file.close()
+        try:
+            with open(temp_file, "w", encoding="utf-8") as file:
+                for video in self._videos.values():
+                    file.write(json.dumps(["put", *video_to_row(video)], ensure_ascii=False))
+                    file.write("\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_file, self.data_file)
+        except OSError as e:
+            raise RepositoryError(f"Video kayıt dosyası sıkıştırılamadı: {e}") from e
+        finally:
+            self._file = open(self.data_file, "a", encoding="utf-8")
+
+        logger.info(f"Video kayıt dosyası sıkıştırıldı: {self._dead_entries} ölü satır silindi")
+        self._dead_entries = 0
+
+    def close(self):
+        """Kayıt dosyasını kapatır."""
+        if not self._file.closed:
+            self._file.close()
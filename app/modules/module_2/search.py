@@ -0,0 +1,330 @@
+"""
+Video Modülü - Tam Metin Arama
+==============================
+
+Video başlığı, açıklaması ve etiketleri üzerinde BM25 ile sıralı arama yapan motor.
+VideoService'in yanında çalışır; depoya abone olup kayıt/silme işlemlerinde indeksi günceller.
+"""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .base import VideoBase
+from .indexes import fold_text
+from .query import VideoQuery
+from .repository import VideoRepository
+
+_TOKEN = re.compile(r"\w+")
+
+# Alan ağırlıkları. Posting'lerde varint olarak saklanabilmeleri için _WEIGHT_SCALE ile çarpılmış
+# tamsayılardır (başlık 2, etiketler 1.5, açıklama 1).
+FIELD_WEIGHTS = {"title": 4, "tags": 3, "description": 2}
+_WEIGHT_SCALE = 2
+
+# Posting listeleri bu kadar girdilik bloklara bölünür; bloğun başlangıç dokümanı ve byte konumu
+# tutulduğu için tek bir dokümanın girdisi sadece kendi bloğu çözülerek bulunabilir
+_BLOCK_SIZE = 128
+
+# Bayat (silinmiş/güncellenmiş) doküman sayısı bu değeri ve canlı doküman sayısını geçince
+# posting listeleri yeniden yazılır
+_COMPACT_MIN = 4096
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Metni arama terimlerine böler. Terimler trigram indeksiyle aynı şekilde katlanır
+    (küçük harf + Türkçe i/ı/İ birleştirmesi): "IŞIK", "ışık" ve "işik" aynı terimdir.
+    """
+    return _TOKEN.findall(fold_text(text))
+
+
+def _encode_varint(value: int, out: bytearray):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_postings(data: Any, doc: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    (doküman farkı, ağırlıklı tf) varint çiftlerini (doküman, ağırlıklı tf) olarak çözer.
+    doc, ilk farkın ekleneceği doküman numarasıdır (bloğun başlangıç dokümanı).
+    """
+    value = 0
+    shift = 0
+    pending = False
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        if pending:
+            yield doc, value
+        else:
+            doc += value
+        pending = not pending
+        value = 0
+        shift = 0
+
+
+class _Term:
+    """Bir terimin sıkıştırılmış posting listesi ve istatistikleri."""
+
+    __slots__ = ("postings", "last_doc", "count", "block_docs", "block_offsets", "df", "max_tf")
+
+    def __init__(self):
+        self.postings = bytearray()  # artan doküman numarasıyla (fark, ağırlıklı tf) varint çiftleri
+        self.last_doc = 0
+        self.count = 0
+        # Blok başına: bloktan önceki son doküman (farkların tabanı) ve bloğun byte konumu
+        self.block_docs = array("I")
+        self.block_offsets = array("I")
+        self.df = 0  # terimi içeren canlı doküman sayısı
+        self.max_tf = 0  # görülen en büyük ağırlıklı tf (skor üst sınırı için)
+
+    def append(self, doc: int, tf: int):
+        if self.count % _BLOCK_SIZE == 0:
+            self.block_docs.append(self.last_doc)
+            self.block_offsets.append(len(self.postings))
+        _encode_varint(doc - self.last_doc, self.postings)
+        _encode_varint(tf, self.postings)
+        self.last_doc = doc
+        self.count += 1
+        if tf > self.max_tf:
+            self.max_tf = tf
+
+    def lookup(self, docs: List[int]) -> Iterator[Tuple[int, int]]:
+        """
+        Verilen (artan sıralı) dokümanların girdilerini döndürür; sadece bu dokümanların
+        bulunabileceği bloklar çözülür.
+        """
+        block_docs, offsets = self.block_docs, self.block_offsets
+        view = memoryview(self.postings)
+        position = 0
+        while position < len(docs) and docs[position] <= self.last_doc:
+            # İlk bloğun tabanı 0'dır ve 0 numaralı dokümanı da içerir
+            block = max(bisect_left(block_docs, docs[position]) - 1, 0)
+            end = offsets[block + 1] if block + 1 < len(offsets) else len(view)
+            for doc, tf in _decode_postings(view[offsets[block]:end], block_docs[block]):
+                while position < len(docs) and docs[position] < doc:
+                    position += 1
+                if position == len(docs):
+                    return
+                if docs[position] == doc:
+                    yield doc, tf
+                    position += 1
+            # Bloğun son dokümanından büyük olmayan adaylar bu blokta yoktu
+            last = block_docs[block + 1] if block + 1 < len(block_docs) else self.last_doc
+            while position < len(docs) and docs[position] <= last:
+                position += 1
+
+
+class VideoSearchEngine:
+    """
+    Başlık, açıklama ve etiketler üzerinde BM25 sıralı tam metin arama motoru.
+
+    - Her video kaydında yeni bir doküman numarası alır; posting listeleri sadece sona eklenir ve
+      doküman farkları varint ile sıkıştırılır.
+    - Güncellenen/silinen videoların eski girdileri bayat kalır ve aramada atlanır; bayat girdiler
+      çoğalınca listeler yeniden yazılır.
+    - En iyi k sonuç terim terim (en yüksek skor üst sınırından başlayarak) toplanır. Henüz
+      işlenmemiş terimlerin üst sınırları toplamı k'ıncı skoru geçemediğinde yeni aday kabul
+      edilmez; kalan terimler sadece mevcut adayların skorlarını günceller ve posting listelerinin
+      sadece bu adayları içerebilecek blokları çözülür.
+    """
+
+    def __init__(self, repository: VideoRepository, k1: float = 1.2, b: float = 0.75):
+        """
+        Argümanlar:
+            repository: İndekslenecek depo. Mevcut videolar hemen indekslenir, sonraki
+                kayıt/silme işlemleri abonelikle izlenir.
+            k1: BM25 terim frekansı doygunluk parametresi.
+            b: BM25 doküman uzunluğu normalizasyon parametresi.
+        """
+        self.repository = repository
+        self.k1 = k1
+        self.b = b
+        self._reset()
+        for video in repository.find_all():
+            self.index(video)
+        repository.subscribe(self._on_repository_event)
+
+    def _reset(self):
+        self._terms: Dict[str, _Term] = {}
+        self._doc_ids: Dict[str, int] = {}  # video_id -> doküman
+        # doküman -> (video_id, terimler, ağırlıklı uzunluk, içerik imzası)
+        self._docs: Dict[int, Tuple[str, Tuple[str, ...], float, int]] = {}
+        self._next_doc = 0
+        self._total_length = 0.0
+        self._stale = 0
+
+    def close(self):
+        """Depo aboneliğini kaldırır."""
+        self.repository.unsubscribe(self._on_repository_event)
+
+    def _on_repository_event(self, event: str, payload: Any):
+        if event == "save":
+            self.index(payload)
+        elif event == "delete":
+            self.remove(payload)
+        elif event == "clear":
+            self._reset()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def index(self, video: VideoBase):
+        """
+        Videoyu indeksler. Başlığı, açıklaması ve etiketleri değişmediyse bir şey yapılmaz;
+        değiştiyse eski doküman bayat işaretlenip yenisi eklenir.
+
+        Argümanlar:
+            video: İndekslenecek video.
+        """
+        signature = hash((video.title, video.description, tuple(video.tags)))
+        doc = self._doc_ids.get(video.video_id)
+        if doc is not None:
+            if self._docs[doc][3] == signature:
+                return
+            self.remove(video.video_id)
+
+        weights: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            texts = video.tags if field == "tags" else (getattr(video, field) or "",)
+            for text in texts:
+                for token in tokenize(text):
+                    weights[token] += weight
+
+        doc = self._next_doc
+        self._next_doc += 1
+        terms = self._terms
+        for token, tf in weights.items():
+            term = terms.get(token)
+            if term is None:
+                term = terms[token] = _Term()
+            term.append(doc, tf)
+            term.df += 1
+
+        length = sum(weights.values()) / _WEIGHT_SCALE
+        self._docs[doc] = (video.video_id, tuple(weights), length, signature)
+        self._doc_ids[video.video_id] = doc
+        self._total_length += length
+
+    def remove(self, video_id: str):
+        """Videoyu indeksten çıkarır (posting girdileri bayat kalır)."""
+        doc = self._doc_ids.pop(video_id, None)
+        if doc is None:
+            return
+        _, terms, length, _ = self._docs.pop(doc)
+        for token in terms:
+            self._terms[token].df -= 1
+        self._total_length -= length
+        self._stale += 1
+        if self._stale > max(_COMPACT_MIN, len(self._docs)):
+            self._compact()
+
+    def _compact(self):
+        """Posting listelerini sadece canlı dokümanlarla yeniden yazar; boşalan terimleri siler."""
+        docs = self._docs
+        for token in list(self._terms):
+            term = self._terms[token]
+            if term.df == 0:
+                del self._terms[token]
+                continue
+            compacted = _Term()
+            compacted.df = term.df
+            for doc, tf in _decode_postings(term.postings):
+                if doc in docs:
+                    compacted.append(doc, tf)
+            self._terms[token] = compacted
+        self._stale = 0
+
+    def search(self, text: str, limit: int = 10,
+               filters: Optional[VideoQuery] = None) -> List[Tuple[VideoBase, float]]:
+        """
+        Metne en alakalı videoları BM25 skoruyla sıralı döndürür.
+
+        Argümanlar:
+            text: Arama metni (terimlerden en az birini içeren videolar aday olur).
+            limit: Döndürülecek en fazla sonuç sayısı.
+            filters: Sonuçların ayrıca sağlaması gereken koşullar (örn. görünürlük, en az süre).
+                Koşullar aday kabul edilirken kontrol edildiği için en iyi k sonuç filtrelenmiş
+                videolar arasından seçilir.
+
+        Döndürür:
+            List[Tuple[VideoBase, float]]: (video, skor) çiftleri, skora göre azalan sırada.
+        """
+        live = len(self._docs)
+        if limit <= 0 or not live:
+            return []
+        k1, b = self.k1, self.b
+        length_norm = k1 * (1 - b)
+        length_factor = k1 * b / (self._total_length / live)
+
+        terms = []
+        for token in dict.fromkeys(tokenize(text)):
+            term = self._terms.get(token)
+            if term is None or term.df <= 0:
+                continue
+            idf = math.log(1 + (live - term.df + 0.5) / (term.df + 0.5))
+            max_tf = term.max_tf / _WEIGHT_SCALE
+            # Doküman uzunluğu sıfıra giderken skorun ulaşabileceği en büyük değer
+            bound = idf * max_tf * (k1 + 1) / (max_tf + length_norm)
+            terms.append((bound, idf, term))
+        terms.sort(key=itemgetter(0), reverse=True)
+
+        accepts = self._acceptor(filters)
+        docs = self._docs
+        scores: Dict[int, float] = {}
+        rejected: Set[int] = set()
+        remaining = sum(bound for bound, _, _ in terms)
+        admitting = True
+        for bound, idf, term in terms:
+            remaining -= bound
+            if not admitting and len(scores) * _BLOCK_SIZE < term.count:
+                # Sadece mevcut adayların blokları çözülür
+                entries = term.lookup(sorted(scores))
+            else:
+                entries = _decode_postings(term.postings)
+            for doc, tf in entries:
+                entry = docs.get(doc)
+                if entry is None:
+                    continue  # bayat girdi
+                score = scores.get(doc)
+                if score is None:
+                    if not admitting or doc in rejected:
+                        continue
+                    if accepts is not None and not accepts(entry[0]):
+                        rejected.add(doc)
+                        continue
+                    score = 0.0
+                tf /= _WEIGHT_SCALE
+                scores[doc] = score + idf * tf * (k1 + 1) / (tf + length_norm + length_factor * entry[2])
+            if admitting and len(scores) >= limit and heapq.nlargest(limit, scores.values())[-1] >= remaining:
+                # Yeni bir aday kalan terimlerin hepsinden tam puan alsa bile k'ıncı skora ulaşamaz
+                admitting = False
+
+        results = []
+        for doc, score in heapq.nlargest(limit, scores.items(), key=itemgetter(1)):
+            video = self.repository.find_by_id(docs[doc][0])
+            if video is not None:
+                results.append((video, score))
+        return results
+
+    def _acceptor(self, filters: Optional[VideoQuery]) -> Optional[Callable[[str], bool]]:
+        """Filtre koşullarını video ID'si üzerinden kontrol eden fonksiyon (koşul yoksa None)."""
+        predicate = filters.predicate() if filters is not None else None
+        if predicate is None:
+            return None
+        find = self.repository.find_by_id
+
+        def accepts(video_id: str) -> bool:
+            video = find(video_id)
+            return video is not None and predicate(video)
+        return accepts
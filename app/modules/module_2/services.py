@@ -19,7 +19,9 @@ from .base import (
     VideoStatus,
     VideoUploadError,
 )
+from .query import VideoQuery
 from .repository import VideoRepository
+from .search import VideoSearchEngine
 
 logger = logging.getLogger("VideoModule")
 
@@ -29,6 +31,8 @@ class VideoService:
 
     def __init__(self, repository: VideoRepository):
         self.repository = repository
+        # Tam metin arama motoru ilk sıralı aramada kurulur
+        self._search_engine: Optional[VideoSearchEngine] = None
 
     def create_standard_video(
         self,
@@ -186,23 +190,48 @@ class VideoService:
         visibility: Optional[VideoVisibility] = None,
         min_duration: Optional[int] = None,
     ) -> List[VideoBase]:
-        """Arama ve filtreleme."""
-        all_videos = self.repository.find_all()
-        results: List[VideoBase] = []
-
-        for video in all_videos:
-            match = True
-            if visibility and video.visibility != visibility:
-                match = False
-            if min_duration and video.duration_seconds < min_duration:
-                match = False
-            if query and query.lower() not in video.title.lower():
-                match = False
-
-            if match:
-                results.append(video)
-
-        return results
+        """Arama ve filtreleme. Başlangıç kümesini deponun sorgu planlayıcısı seçer."""
+        return self.repository.execute(self._search_query(query, visibility, min_duration))
+
+    def search_videos_ranked(
+        self,
+        query: str,
+        visibility: Optional[VideoVisibility] = None,
+        min_duration: Optional[int] = None,
+        limit: int = 10,
+    ) -> List[VideoBase]:
+        """
+        Başlık, açıklama ve etiketlerde alaka düzeyine (BM25) göre sıralı arama.
+        search_videos'un görünürlük/süre filtreleriyle birlikte kullanılabilir.
+
+        Argümanlar:
+            query: Arama metni.
+            visibility: Sadece bu görünürlükteki videolar.
+            min_duration: En az süre (saniye).
+            limit: En fazla sonuç sayısı.
+
+        Döndürür:
+            List[VideoBase]: En alakalıdan başlayarak videolar.
+        """
+        if self._search_engine is None:
+            self._search_engine = VideoSearchEngine(self.repository)
+        filters = VideoQuery(visibility=visibility, min_duration=min_duration)
+        return [video for video, _ in self._search_engine.search(query, limit, filters)]
+
+    def explain_search(
+        self,
+        query: Optional[str] = None,
+        visibility: Optional[VideoVisibility] = None,
+        min_duration: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """search_videos ile aynı aramayı çalıştırıp planını ve süresini raporlar (bkz. VideoRepository.explain)."""
+        return self.repository.explain(self._search_query(query, visibility, min_duration))
+
+    @staticmethod
+    def _search_query(
+        query: Optional[str], visibility: Optional[VideoVisibility], min_duration: Optional[int]
+    ) -> VideoQuery:
+        return VideoQuery(visibility=visibility, min_duration=min_duration, title_contains=query)
 
     def get_video_statistics(self, video_id: str) -> Dict[str, Any]:
         """Video detayları ve istatistikleri."""
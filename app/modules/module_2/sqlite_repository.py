@@ -0,0 +1,493 @@
+"""
+SQLite Video Repository
+=======================
+
+VideoRepository'nin çok thread'li servis kullanımı için SQLite (WAL) tabanlı sürümüdür.
+Her thread kendi bağlantısını kullanır; WAL modunda okuyucular yazıcıyı beklemez.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base import VideoBase, VideoStatus, VideoVisibility, RepositoryError
+from .query import INDEXED_FIELDS, QueryPlan, VideoQuery
+from .indexes import rank_tags
+from .repository import (
+    VideoRepository, check_channel_query, check_count_field, check_tag_query, order_channel_videos, row_to_video,
+    video_to_row
+)
+
+logger = logging.getLogger("VideoModule")
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    visibility TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS videos_channel ON videos (channel_id, created_at);
+CREATE INDEX IF NOT EXISTS videos_status ON videos (status, visibility, created_at);
+CREATE INDEX IF NOT EXISTS videos_created ON videos (created_at);
+"""
+
+# SQL metinleri sabit tutulur: sqlite3 her bağlantıda derlenmiş ifadeleri SQL metnine göre önbelleğe alır,
+# böylece save/find_by_id her çağrıda yeniden derlenmez (prepared statement).
+_SAVE_SQL = (
+    "INSERT INTO videos (video_id, channel_id, status, visibility, created_at, data) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (video_id) DO UPDATE SET channel_id = excluded.channel_id, status = excluded.status, "
+    "visibility = excluded.visibility, created_at = excluded.created_at, data = excluded.data"
+)
+_FIND_BY_ID_SQL = "SELECT data FROM videos WHERE video_id = ?"
+_DELETE_SQL = "DELETE FROM videos WHERE video_id = ?"
+_EXISTS_SQL = "SELECT 1 FROM videos WHERE video_id = ?"
+_COUNT_SQL = "SELECT COUNT(*) FROM videos"
+_FIND_ALL_SQL = "SELECT data FROM videos ORDER BY rowid"
+# count_by alanı -> gruplanacak SQL ifadesi (video tipi ayrı sütun olmadığı için JSON satırından okunur)
+_COUNT_BY_COLUMNS = {"status": "status", "visibility": "visibility", "video_type": "json_extract(data, '$[1]')"}
+_COUNT_BY_VALUES = {
+    "status": {member.value: member for member in VideoStatus},
+    "visibility": {member.value: member for member in VideoVisibility},
+}
+
+_STATEMENT_CACHE_SIZE = 256
+
+
+def _time_key(value: datetime) -> str:
+    # Sabit genişlikli ISO metni: TEXT sütunda sözlük sırası zaman sırasıyla aynı olur
+    return value.isoformat(timespec="microseconds")
+
+
+def _decode_rows(rows: List[tuple]) -> List[VideoBase]:
+    """Son sütundaki (data) JSON satırlarını tek json.loads çağrısıyla çözüp video nesnelerini kurar."""
+    if not rows:
+        return []
+    decoded = json.loads("[" + ",".join(row[-1] for row in rows) + "]")
+    return [row_to_video(row) for row in decoded]
+
+
+class SqliteVideoRepository(VideoRepository):
+    """
+    Videoları SQLite (WAL) veritabanında tutan depo sınıfıdır.
+    VideoRepository ile aynı API'yi sunar, ancak bellekte sözlük tutmaz; her okuma veritabanından yapılır.
+
+    - Her thread ilk erişimde kendi bağlantısını açar (thread başına bağlantı havuzu).
+    - filter_videos sorgusu Python döngüsü yerine indeksli SQL sorgusuna çevrilir.
+    - save_many tek transaction içinde executemany ile toplu yazar.
+    - Yazmalar tek bir kilitle sıralanır; okuyucular WAL sayesinde yazıcıyı beklemez.
+
+    Not: Okunan nesneler her çağrıda yeniden kurulur; bir videoda yapılan değişiklik save çağrılana
+    kadar veritabanına yansımaz.
+    """
+
+    def __init__(self, db_file: str = "videos.db", synchronous: str = "NORMAL"):
+        """
+        Argümanlar:
+            db_file: Veritabanı dosyasının yolu.
+            synchronous: SQLite PRAGMA synchronous değeri (OFF, NORMAL, FULL, EXTRA).
+
+        Raise eder:
+            RepositoryError: Ayar geçersizse veya veritabanı açılamazsa.
+        """
+        # Bellek içi sözlük/indeks kullanılmadığı için VideoRepository.__init__ çağrılmaz. Temel sınıfın
+        # indeks yardımcıları (_index_*, _bitmap_slots, bitmap/etiket indeksleri) burada hiç çağrılmaz;
+        # onları okuyan public metotlar (count_by, find_by_tags, tag_facets, plan) bu sınıfta yeniden yazılır.
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise RepositoryError(f"Geçersiz sqlite synchronous değeri: {synchronous}")
+        self.db_file = db_file
+        self._synchronous = synchronous
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closed = False
+
+        conn = self._connection()
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                raise RepositoryError(
+                    f"Veritabanı şema sürümü ({version}) desteklenen sürümden ({SCHEMA_VERSION}) yeni"
+                )
+            with self._write_lock:
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Video veritabanı açılamadı: {e}") from e
+        logger.info(f"SqliteVideoRepository açıldı: {self.count()} video ({self.db_file})")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Çağıran thread'in bağlantısını döndürür; yoksa açıp havuza ekler."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        if self._closed:
+            raise RepositoryError("SqliteVideoRepository kapatıldı")
+
+        try:
+            # check_same_thread=False sadece close() diğer thread'lerin bağlantılarını kapatabilsin diye;
+            # her bağlantı yalnızca kendi thread'i tarafından kullanılır.
+            conn = sqlite3.connect(
+                self.db_file, isolation_level=None, check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+            conn.execute("PRAGMA busy_timeout=5000")
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Video veritabanına bağlanılamadı: {e}") from e
+
+        with self._pool_lock:
+            self._connections.append(conn)
+        self._local.conn = conn
+        return conn
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[tuple]:
+        try:
+            return self._connection().execute(sql, tuple(params)).fetchall()
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Video sorgusu başarısız: {e}") from e
+
+    def _write(self, sql: str, rows: List[tuple]) -> int:
+        """Satırları tek transaction içinde yazar; değişen satır sayısını döndürür."""
+        conn = self._connection()
+        with self._write_lock:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if len(rows) == 1:
+                        changed = conn.execute(sql, rows[0]).rowcount
+                    else:
+                        changed = conn.executemany(sql, rows).rowcount
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                raise RepositoryError(f"Video kaydı veritabanına yazılamadı: {e}") from e
+        return changed
+
+    @staticmethod
+    def _save_params(video: VideoBase) -> tuple:
+        return (
+            video.video_id,
+            video.channel_id,
+            video.status.value,
+            video.visibility.value,
+            _time_key(video.created_at),
+            json.dumps(video_to_row(video), ensure_ascii=False),
+        )
+
+    def save(self, video: VideoBase) -> VideoBase:
+        """
+        Videoyu veritabanına kaydeder (varsa günceller).
+
+        Argümanlar:
+            video (VideoBase): Kaydedilecek video nesnesi.
+
+        Döndürür:
+            VideoBase: Kaydedilen video nesnesi.
+        """
+        self._write(_SAVE_SQL, [self._save_params(video)])
+        self._publish("save", video)
+        return video
+
+    def save_many(self, videos: Iterable[VideoBase]) -> int:
+        """
+        Videoları tek transaction içinde executemany ile toplu kaydeder.
+
+        Argümanlar:
+            videos: Kaydedilecek video nesneleri.
+
+        Döndürür:
+            int: Kaydedilen video sayısı.
+        """
+        videos = list(videos)
+        rows = [self._save_params(video) for video in videos]
+        if not rows:
+            return 0
+        self._write(_SAVE_SQL, rows)
+        for video in videos:
+            self._publish("save", video)
+        return len(rows)
+
+    def find_by_id(self, video_id: str) -> Optional[VideoBase]:
+        """
+        ID ile video bulur.
+
+        Argümanlar:
+            video_id: Video ID'si.
+
+        Döndürür:
+            Optional[VideoBase]: Bulunursa nesne, bulunamazsa None döner.
+        """
+        rows = self._query(_FIND_BY_ID_SQL, (video_id,))
+        if not rows:
+            return None
+        return row_to_video(json.loads(rows[0][0]))
+
+    def delete(self, video_id: str) -> bool:
+        """
+        Videoyu siler.
+
+        Argümanlar:
+            video_id (str): Silinecek video ID'si.
+
+        Döndürür:
+            bool: Silme başarılıysa True, aksi halde False.
+        """
+        deleted = self._write(_DELETE_SQL, [(video_id,)]) > 0
+        if deleted:
+            self._publish("delete", video_id)
+        return deleted
+
+    def find_all(self) -> List[VideoBase]:
+        """Tüm videoları eklenme sırasıyla listeler."""
+        return _decode_rows(self._query(_FIND_ALL_SQL))
+
+    def find_by_channel(
+        self,
+        channel_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+        order_by: str = "created_at"
+    ) -> List[VideoBase]:
+        """
+        Belirli bir kanala ait videoları zamana göre sıralı getirir.
+        created_at sıralamasında aralık, sıra ve limit videos_channel (channel_id, created_at) indeksinden
+        okunur; indeks satırları rowid'yi de içerdiği için eşit zamanlılar eklenme sırasında kalır.
+        published_at sütun olarak tutulmadığından o sıralama kanalın videoları üzerinde Python'da yapılır.
+
+        Argümanlar:
+            channel_id: Kanal ID'si.
+            since: Bu zamandan (dahil) sonraki videolar.
+            until: Bu zamana (dahil) kadar olan videolar.
+            limit: Döndürülecek en fazla video sayısı.
+            newest_first: True ise en yeni video başta olur.
+            order_by: "created_at" veya "published_at".
+
+        Döndürür:
+            List[VideoBase]: O kanala ait videolar.
+
+        Raise eder:
+            ValueError: order_by geçersizse veya limit negatifse.
+        """
+        check_channel_query(order_by, limit)
+        if order_by == "published_at":
+            return order_channel_videos(self.filter_videos(channel_id=channel_id),
+                                        since, until, limit, newest_first, order_by)
+
+        sql = "SELECT rowid, data FROM videos WHERE channel_id = ?"
+        params: List[Any] = [channel_id]
+        if since:
+            sql += " AND created_at >= ?"
+            params.append(_time_key(since))
+        if until:
+            sql += " AND created_at <= ?"
+            params.append(_time_key(until))
+        direction = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY created_at {direction}, rowid {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return _decode_rows(self._query(sql, params))
+
+    def find_by_tags(self, tags: Iterable[str], match: str = "all", limit: Optional[int] = None) -> List[VideoBase]:
+        """
+        Etiketlere göre video bulur. Etiketler ayrı tabloda tutulmadığı için JSON satırındaki
+        etiket dizisi json_each ile açılır (tablo taraması); eşleşme ve sayım SQL'de yapılır.
+
+        Argümanlar:
+            tags: Aranan etiketler.
+            match: "all" ise etiketlerin hepsine, "any" ise herhangi birine sahip videolar.
+            limit: Döndürülecek en fazla video sayısı.
+
+        Döndürür:
+            List[VideoBase]: Eşleşen videolar (eklenme sırasıyla).
+
+        Raise eder:
+            ValueError: match geçersizse veya limit negatifse.
+        """
+        check_tag_query(match, limit)
+        wanted = sorted(set(tags))
+        if not wanted or limit == 0:
+            return []
+        sql = (
+            "SELECT rowid, data FROM videos WHERE rowid IN ("
+            "SELECT videos.rowid FROM videos, json_each(videos.data, '$[10]') AS tag "
+            f"WHERE tag.value IN ({', '.join('?' * len(wanted))}) GROUP BY videos.rowid"
+        )
+        params: List[Any] = list(wanted)
+        if match == "all":
+            sql += " HAVING COUNT(DISTINCT tag.value) = ?"
+            params.append(len(wanted))
+        sql += ") ORDER BY rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return _decode_rows(self._query(sql, params))
+
+    def tag_facets(self, channel_id: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Etiketlerin video sayılarını döndürür (json_each ile SQL'de gruplanır; kanal verilirse
+        videos_channel indeksiyle sadece o kanalın satırları okunur).
+
+        Argümanlar:
+            channel_id: Verilirse sadece o kanalın videoları sayılır.
+            limit: Döndürülecek en fazla etiket sayısı (en çok kullanılanlar).
+
+        Döndürür:
+            List[Tuple[str, int]]: (etiket, video sayısı) çiftleri; sayıya göre azalan, eşitlikte
+            etiket sırasıyla.
+
+        Raise eder:
+            ValueError: limit negatifse.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative")
+        sql = ("SELECT tag.value, COUNT(DISTINCT videos.rowid) "
+               "FROM videos, json_each(videos.data, '$[10]') AS tag")
+        params: List[Any] = []
+        if channel_id is not None:
+            sql += " WHERE videos.channel_id = ?"
+            params.append(channel_id)
+        sql += " GROUP BY tag.value"
+        return rank_tags(self._query(sql, params), limit)
+
+    def filter_videos(
+        self,
+        status: Optional[VideoStatus] = None,
+        visibility: Optional[VideoVisibility] = None,
+        channel_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        video_type: Optional[str] = None
+    ) -> List[VideoBase]:
+        """
+        Videoları belirli kriterlere göre filtreler.
+        Kriterler tek bir SQL WHERE ifadesine çevrilir; SQLite uygun indeksi
+        (kanal, durum/görünürlük veya tarih) kendisi seçer. Video tipi ayrı sütun olmadığı için
+        JSON satırından (data) okunur.
+
+        Argümanlar:
+            status: Videonun durumuna göre filtreleme yapar.
+            visibility: Görünürlük ayarına göre filtreler.
+            channel_id: Belirli bir kanalın videolarını getirir.
+            date_from: Oluşturulma tarihi bu tarihten sonra olanlar.
+            date_to: Oluşturulma tarihi bu tarihten önce olanlar.
+            video_type: Video tipi (get_video_type değeri).
+
+        Döndürür:
+            List[VideoBase]: Kriterlere uyan Video nesnelerinin listesi (eklenme sırasıyla).
+        """
+        conditions = []
+        params: List[Any] = []
+        # Kanal verilmişse durum/görünürlük terimleri "+" ile indeks dışı bırakılır: birkaç değerli
+        # status sütunu istatistik (ANALYZE) yokken planlayıcıya daha seçici görünüp kanal indeksinin
+        # önüne geçebiliyor.
+        unindexed = "+" if channel_id else ""
+        if channel_id:
+            conditions.append("channel_id = ?")
+            params.append(channel_id)
+        if status:
+            conditions.append(f"{unindexed}status = ?")
+            params.append(status.value)
+        if visibility:
+            conditions.append(f"{unindexed}visibility = ?")
+            params.append(visibility.value)
+        if date_from:
+            conditions.append("created_at >= ?")
+            params.append(_time_key(date_from))
+        if date_to:
+            conditions.append("created_at <= ?")
+            params.append(_time_key(date_to))
+        if video_type:
+            conditions.append("json_extract(data, '$[1]') = ?")
+            params.append(video_type)
+
+        sql = "SELECT rowid, data FROM videos"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        # En fazla 2^6 farklı SQL metni oluşur; hepsi bağlantının ifade önbelleğinde kalır.
+        # Eklenme sırası Python'da sağlanır: SQL'de ORDER BY rowid, planlayıcıyı indeks yerine
+        # tüm tabloyu rowid sırasıyla taramaya itiyor.
+        rows = self._query(sql, params)
+        rows.sort()
+        return _decode_rows(rows)
+
+    def plan(self, query: VideoQuery) -> QueryPlan:
+        """
+        Sorgu için erişim planını döndürür.
+        Tüm indekslenebilir koşullar filter_videos ile tek SQL ifadesine çevrilir; erişim yolunu
+        SQLite'ın kendi planlayıcısı seçer. Kalan koşullar (başlık, süre) satırlar okunduktan sonra
+        kontrol edilir.
+
+        Argümanlar:
+            query: Çalıştırılacak sorgu.
+
+        Döndürür:
+            QueryPlan: Tek adımlı plan (satır tahmini yok).
+        """
+        return QueryPlan("sql", None, 0.0, INDEXED_FIELDS,
+                         lambda: self.filter_videos(**query.filter_arguments()))
+
+    def count_by(self, field: str) -> Dict[Any, int]:
+        """
+        Bir sütunun değer dağılımını GROUP BY ile döndürür.
+
+        Argümanlar:
+            field: "status", "visibility" veya "video_type".
+
+        Döndürür:
+            Dict[Any, int]: Değer -> video sayısı (durum ve görünürlük enum olarak).
+
+        Raise eder:
+            ValueError: Alan geçersizse.
+        """
+        check_count_field(field)
+        column = _COUNT_BY_COLUMNS[field]
+        rows = self._query(f"SELECT {column}, COUNT(*) FROM videos GROUP BY {column}")
+        values = _COUNT_BY_VALUES.get(field)
+        return {values[value] if values else value: count for value, count in rows}
+
+    def count(self) -> int:
+        """Depodaki toplam video sayısını döndürür."""
+        return self._query(_COUNT_SQL)[0][0]
+
+    def clear(self):
+        """
+        Depoyu tamamen temizler.
+        Bu işlem geri alınamaz.
+        """
+        self._write("DELETE FROM videos", [()])
+        self._publish("clear", None)
+
+    def exists(self, video_id: str) -> bool:
+        """Video var mı kontrol eder."""
+        return bool(self._query(_EXISTS_SQL, (video_id,)))
+
+    def close(self):
+        """Havuzdaki tüm bağlantıları kapatır. Kapatıldıktan sonra depo kullanılamaz."""
+        with self._pool_lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+        with self._write_lock:
+            for conn in connections:
+                try:
+                    # Sorgulanan tablolar için planlayıcı istatistiklerini (gerekirse) günceller
+                    conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.warning(f"PRAGMA optimize başarısız: {e}")
+                conn.close()
+        self._local = threading.local()
@@ -0,0 +1,495 @@
+"""
+Modül 1 (Kullanıcı/Kanal) persistence benchmark'ları.
+
+Kullanım:
+    python benchmarks/bench_module_1.py user-journal --sizes 1000 10000 100000 1000000
+    python benchmarks/bench_module_1.py user-bulk --sizes 10000 500000
+    python benchmarks/bench_module_1.py streaming-load --sizes 1000000 10000000
+    python benchmarks/bench_module_1.py lazy-load --sizes 100000 1000000
+    python benchmarks/bench_module_1.py snapshot-codec --sizes 100000 1000000
+    python benchmarks/bench_module_1.py sharded-save --sizes 100000 --shards 1 16 64
+    python benchmarks/bench_module_1.py dirty-save --sizes 100000 --changed 1 100 10000
+    python benchmarks/bench_module_1.py codec-micro --sizes 100000 --codecs json json-compact json-gzip binary
+    python benchmarks/bench_module_1.py write-behind --sizes 10000 100000 --writes 200
+    python benchmarks/bench_module_1.py channel-query --sizes 100000 1000000
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from app.modules.module_1.base import ChannelStatus, ChannelType, UserRole, ViewerUser
+from app.modules.module_1.persistence import iter_stored
+from app.modules.module_1.repository import ChannelRepository, UserRepository
+from app.modules.module_1.snapshot_codecs import codec_names, get_codec, read_snapshot
+
+
+@contextlib.contextmanager
+def quiet():
+    # Repository'lerin "System >> ..." çıktılarını ölçümden uzak tut
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def write_users_snapshot(path, count):
+    # count adet kullanıcıyı doğrudan users.json formatında yaz (repository üzerinden değil)
+    created_at = datetime.now().isoformat()
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{\n  "users": {\n')
+        for i in range(count):
+            record = {
+                "user_id": f"user_{i}", "username": f"user_{i}", "email": f"user_{i}@bench.local",
+                "password_hash": "bench_password", "role": UserRole.VIEWER.value,
+                "user_type": "ViewerUser", "created_at": created_at, "is_active": True,
+            }
+            file.write(f'    "user_{i}": {json.dumps(record)}{"," if i < count - 1 else ""}\n')
+        file.write(f'  }},\n  "metadata": {{"last_modified": "{created_at}", "total_users": {count}}}\n}}\n')
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def bench_user_journal(sizes, writes, legacy_limit, legacy_writes):
+    print(f"{'mode':<8} {'users':>9} {'mean_us':>10} {'p50_us':>10} {'p99_us':>10}")
+    for size in sizes:
+        modes = ["journal"] + (["rewrite"] if size <= legacy_limit else [])
+        for mode in modes:
+            temp_dir = tempfile.mkdtemp()
+            try:
+                data_file = os.path.join(temp_dir, "users.json")
+                write_users_snapshot(data_file, size)
+                with quiet():
+                    repo = UserRepository(data_file, journal=(mode == "journal"))
+                    samples = []
+                    for i in range(writes if mode == "journal" else legacy_writes):
+                        user = ViewerUser(f"new_{i}", f"new_{i}", f"new_{i}@bench.local", "bench_password")
+                        started = time.perf_counter()
+                        repo.create_user(user)
+                        samples.append((time.perf_counter() - started) * 1e6)
+                    repo.close()
+                print(f"{mode:<8} {size:>9} {statistics.mean(samples):>10.1f} "
+                      f"{percentile(samples, 0.5):>10.1f} {percentile(samples, 0.99):>10.1f}")
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_user_bulk(sizes):
+    # create_users_bulk: tek geçiş + tek kayıt ile toplu kullanıcı içe aktarma süresi
+    print(f"{'users':>9} {'total_s':>9} {'users_per_s':>12}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            records = ({"user_id": f"bulk_{i}", "username": f"bulk_{i}", "email": f"bulk_{i}@bench.local",
+                        "password": "bench_password", "role": "viewer"} for i in range(size))
+            with quiet():
+                repo = UserRepository(os.path.join(temp_dir, "users.json"))
+                started = time.perf_counter()
+                repo.create_users_bulk(records)
+                elapsed = time.perf_counter() - started
+            print(f"{size:>9} {elapsed:>9.2f} {size / elapsed:>12.0f}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _load_child(path, mode):
+    # Ayrı süreçte yükleme yap ve en yüksek RSS değerini raporla (ölçümler birbirini etkilemesin)
+    import resource
+
+    before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    with quiet():
+        if mode == "json":
+            # Eski yol: tüm dosya json.load ile okunur, sonra nesneler kurulur
+            repo = UserRepository(os.path.join(os.path.dirname(path), "unused.json"))
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            users = {}
+            for user_id, record in data["users"].items():
+                users[user_id] = repo._deserialize_user(record)
+                repo._update_indexes(users[user_id])
+            count = len(users)
+        else:
+            count = UserRepository(path).get_user_count()
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"count": count, "seconds": elapsed, "peak_mb": (peak_kb - before_kb) / 1024}))
+
+
+def bench_streaming_load(sizes):
+    # json.load + nesne kurma ile akış okuyucusunun süre ve tepe bellek karşılaştırması
+    print(f"{'mode':<8} {'users':>9} {'file_mb':>9} {'load_s':>8} {'peak_rss_mb':>12}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            data_file = os.path.join(temp_dir, "users.json")
+            write_users_snapshot(data_file, size)
+            file_mb = os.path.getsize(data_file) / (1024 * 1024)
+            for mode in ("json", "stream"):
+                output = subprocess.run(
+                    [sys.executable, __file__, "_load-child", "--path", data_file, "--mode", mode],
+                    check=True, capture_output=True, text=True,
+                ).stdout
+                stats = json.loads(output.strip().splitlines()[-1])
+                print(f"{mode:<8} {stats['count']:>9} {file_mb:>9.1f} {stats['seconds']:>8.2f} "
+                      f"{stats['peak_mb']:>12.1f}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_lazy_load(sizes):
+    # Eager ve lazy modda açılış süresi ve ilk get_user_by_id gecikmesi
+    print(f"{'mode':<6} {'users':>9} {'startup_s':>10} {'first_get_us':>13}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            data_file = os.path.join(temp_dir, "users.json")
+            write_users_snapshot(data_file, size)
+            for lazy in (False, True):
+                with quiet():
+                    started = time.perf_counter()
+                    repo = UserRepository(data_file, lazy=lazy)
+                    startup = time.perf_counter() - started
+                    started = time.perf_counter()
+                    repo.get_user_by_id(f"user_{size // 2}")
+                    first_get = (time.perf_counter() - started) * 1e6
+                print(f"{'lazy' if lazy else 'eager':<6} {size:>9} {startup:>10.2f} {first_get:>13.1f}")
+                del repo
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_snapshot_codec(sizes):
+    # Her codec için: dosya boyutu, repository üzerinden kaydetme ve (indeksler dahil) eager/lazy yükleme süresi
+    print(f"{'codec':<12} {'users':>9} {'file_mb':>9} {'save_s':>8} {'load_s':>8} {'lazy_load_s':>12}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            source_file = os.path.join(temp_dir, "source.json")
+            write_users_snapshot(source_file, size)
+            for codec in codec_names():
+                data_file = os.path.join(temp_dir, f"users.{codec}")
+                shutil.copyfile(source_file, data_file)
+                with quiet():
+                    repo = UserRepository(data_file, codec=codec)
+                    started = time.perf_counter()
+                    repo._save_to_file()
+                    save = time.perf_counter() - started
+                    del repo
+
+                    started = time.perf_counter()
+                    repo = UserRepository(data_file, codec=codec)
+                    load = time.perf_counter() - started
+                    assert repo.get_user_by_username(f"user_{size - 1}").user_id == f"user_{size - 1}"
+                    del repo
+
+                    started = time.perf_counter()
+                    repo = UserRepository(data_file, codec=codec, lazy=True)
+                    lazy_load = time.perf_counter() - started
+                    del repo
+                file_mb = os.path.getsize(data_file) / (1024 * 1024)
+                print(f"{codec:<12} {size:>9} {file_mb:>9.1f} {save:>8.2f} {load:>8.2f} {lazy_load:>12.2f}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_sharded_save(sizes, shard_counts, writes):
+    # Tek değişiklik sonrası kayıt süresi: tek dosya (shards=1 -> eski düzen) ve N shard, ayrıca açılış süresi
+    print(f"{'shards':>7} {'users':>9} {'open_s':>8} {'save_mean_ms':>13} {'written_mb':>11}")
+    for size in sizes:
+        for shards in shard_counts:
+            temp_dir = tempfile.mkdtemp()
+            try:
+                data_file = os.path.join(temp_dir, "users.json")
+                write_users_snapshot(data_file, size)
+                with quiet():
+                    UserRepository(data_file, shards=shards if shards > 1 else None)  # gerekirse geçiş
+                    started = time.perf_counter()
+                    repo = UserRepository(data_file, shards=shards if shards > 1 else None)
+                    open_s = time.perf_counter() - started
+
+                    samples = []
+                    for i in range(writes):
+                        started = time.perf_counter()
+                        repo.set_user_active(f"user_{(i * 7919) % size}", i % 2 == 0)
+                        samples.append((time.perf_counter() - started) * 1000)
+                if shards > 1:
+                    written = os.path.getsize(os.path.join(temp_dir, "users.shards", f"users.{shards}-000.json"))
+                else:
+                    written = os.path.getsize(data_file)
+                print(f"{shards:>7} {size:>9} {open_s:>8.2f} {statistics.mean(samples):>13.1f} "
+                      f"{written / (1024 * 1024):>11.2f}")
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_dirty_save(sizes, changed_counts):
+    # Parça önbelleğiyle kayıt: CPU süresi değişen kayıt sayısıyla orantılı olmalı (dosya yazımı hâlâ tam boy).
+    # full_cpu_ms önbellek olmadan (tüm kayıtlar yeniden kodlanarak) aynı kaydın CPU süresidir.
+    print(f"{'users':>9} {'changed':>8} {'encoded':>8} {'save_cpu_ms':>12} {'full_cpu_ms':>12}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            data_file = os.path.join(temp_dir, "users.json")
+            write_users_snapshot(data_file, size)
+            with quiet():
+                repo = UserRepository(data_file)
+                getattr(repo, "_save_changes")()  # önbelleği doldur
+            fragments = getattr(repo, "_UserRepository__fragments")
+
+            for changed in changed_counts:
+                encoded = fragments.encoded
+                with quiet():
+                    started = time.process_time()
+                    with repo.batch():
+                        for i in range(changed):
+                            repo.set_user_active(f"user_{(i * 7919) % size}", i % 2 == 0)
+                    save_cpu = (time.process_time() - started) * 1000
+
+                    started = time.process_time()
+                    getattr(repo, "_save_to_file")()
+                    full_cpu = (time.process_time() - started) * 1000
+                print(f"{size:>9} {changed:>8} {fragments.encoded - encoded - size:>8} "
+                      f"{save_cpu:>12.1f} {full_cpu:>12.1f}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _codec_records(section, count):
+    # Repository'nin _serialize_* çıktısıyla aynı şekilde kayıtlar
+    created_at = datetime.now().isoformat()
+    if section == "users":
+        return {f"user_{i}": {
+            "user_id": f"user_{i}", "username": f"user_{i}", "email": f"user_{i}@bench.local",
+            "password_hash": "bench_password", "role": UserRole.VIEWER.value, "user_type": "ViewerUser",
+            "created_at": created_at, "is_active": i % 10 != 0,
+        } for i in range(count)}
+    return {f"channel_{i}": {
+        "channel_id": f"channel_{i}", "name": f"Kanal {i}", "description": f"Bench kanal açıklaması {i}",
+        "owner_id": f"user_{i % 5000}", "channel_type": "public", "status": "active",
+        "created_at": created_at, "updated_at": created_at, "subscriber_count": i * 3, "video_count": i % 50,
+        "moderators": [], "tags": ["müzik", "eğitim"][:i % 3], "category": "education",
+        "channel_class": "PersonalChannel",
+    } for i in range(count)}
+
+
+def bench_codec_micro(sizes, codecs, repeat):
+    # Codec başına saf kodlama/çözme süresi (repository ve indeks kurulumu dışarıda), en iyi `repeat` ölçüm
+    print(f"{'section':<9} {'codec':<12} {'records':>9} {'file_mb':>9} {'encode_ms':>10} {'decode_ms':>10} "
+          f"{'bulk_decode_ms':>15}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for section in ("users", "channels"):
+                records = _codec_records(section, size)
+                metadata = {"last_modified": datetime.now().isoformat(), f"total_{section}": size}
+                for name in codecs:
+                    codec = get_codec(name)
+                    path = os.path.join(temp_dir, f"{section}.{name}")
+                    encode, decode, bulk_decode = [], [], []
+                    for _ in range(repeat):
+                        started = time.perf_counter()
+                        codec.write(path, section, records, metadata, {})
+                        encode.append(time.perf_counter() - started)
+
+                        started = time.perf_counter()
+                        decoded = list(read_snapshot(path, section)[0])
+                        decode.append(time.perf_counter() - started)
+
+                        started = time.perf_counter()
+                        list(read_snapshot(path, section, stream=False)[0])
+                        bulk_decode.append(time.perf_counter() - started)
+                    assert len(decoded) == size
+                    file_mb = os.path.getsize(path) / (1024 * 1024)
+                    print(f"{section:<9} {name:<12} {size:>9} {file_mb:>9.2f} {min(encode) * 1000:>10.0f} "
+                          f"{min(decode) * 1000:>10.0f} {min(bulk_decode) * 1000:>15.0f}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_write_behind(sizes, writes):
+    # UserService.deactivate_user yolundaki set_user_active gecikmesi: senkron kayıt ve write-behind.
+    # flush_ms write-behind modunda son değişiklikten sonra kuyruğun diske yazılma süresidir.
+    print(f"{'users':>9} {'mode':<13} {'writes':>7} {'p50_us':>10} {'p99_us':>10} {'disk_writes':>12} "
+          f"{'flush_ms':>9}")
+    for size in sizes:
+        for write_behind in (False, True):
+            temp_dir = tempfile.mkdtemp()
+            try:
+                data_file = os.path.join(temp_dir, "users.json")
+                write_users_snapshot(data_file, size)
+                with quiet():
+                    repo = UserRepository(data_file, write_behind=write_behind)
+                    getattr(repo, "_save_changes")()  # parça önbelleğini doldur
+
+                samples = []
+                with quiet():
+                    for i in range(writes):
+                        started = time.perf_counter()
+                        repo.set_user_active(f"user_{(i * 7919) % size}", False)
+                        samples.append(time.perf_counter() - started)
+                    started = time.perf_counter()
+                    repo.flush()
+                    flush_ms = (time.perf_counter() - started) * 1000
+                    writer = getattr(repo, "_UserRepository__writer")
+                    disk_writes = writer.writes if writer is not None else writes
+                    repo.close()
+
+                mode = "write-behind" if write_behind else "sync"
+                print(f"{size:>9} {mode:<13} {writes:>7} {statistics.median(samples) * 1e6:>10.0f} "
+                      f"{percentile(samples, 0.99) * 1e6:>10.0f} {disk_writes:>12} {flush_ms:>9.1f}")
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+_BENCH_CATEGORIES = ["Müzik", "education", "Gaming", "sports", "news", "comedy", "science", "travel", "food",
+                     "tech"]
+
+
+def bench_channel_query(sizes, repeat):
+    # Kategori sorgusu ve kategori x tip x durum birleşik sorgusu: eski tam tarama ve indeks kesişimi.
+    # Kanallar lazy modda yüklenir; sadece sonuç kümesi materialize edilir (iki yöntemde de aynı).
+    print(f"{'channels':>9} {'query':<26} {'results':>8} {'scan_ms':>9} {'index_ms':>9} {'speedup':>8}")
+    types = [ChannelType.PERSONAL, ChannelType.BRAND, ChannelType.KIDS]
+    statuses = [ChannelStatus.ACTIVE] * 8 + [ChannelStatus.SUSPENDED, ChannelStatus.ARCHIVED]
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            created_at = datetime.now().isoformat()
+            records = {f"channel_{i}": {
+                "channel_id": f"channel_{i}", "name": f"Kanal {i}", "description": f"Bench kanal açıklaması {i}",
+                "owner_id": f"user_{i % 5000}", "channel_type": types[i % 3].value,
+                "status": statuses[(i // 7) % 10].value, "created_at": created_at, "updated_at": created_at,
+                "subscriber_count": 0, "video_count": 0, "moderators": [], "tags": [],
+                "category": _BENCH_CATEGORIES[(i // 3) % 10],
+                "channel_class": f"{types[i % 3].value.capitalize()}Channel",
+            } for i in range(size)}
+            data_file = os.path.join(temp_dir, "channels.json")
+            get_codec("json-compact").write(data_file, "channels", records,
+                                            {"last_modified": created_at, "total_channels": size}, None)
+            del records
+            with quiet():
+                repo = ChannelRepository(data_file, lazy=True)
+            channels = getattr(repo, "_ChannelRepository__channels")
+
+            def scan_category():
+                # Eski get_channel_by_category: her kanalın kategorisi küçük harfe çevrilip karşılaştırılır
+                return [channels[cid] for cid, ch in list(iter_stored(channels))
+                        if (ch.get('category', 'other') if type(ch) is dict else ch.category).lower() == "müzik"]
+
+            def scan_combined():
+                return [ch for ch in scan_category()
+                        if ch.channel_type == ChannelType.BRAND and ch.status == ChannelStatus.SUSPENDED]
+
+            queries = [
+                ("category", scan_category, lambda: repo.get_channel_by_category("MÜZIK")),
+                ("category x type x status", scan_combined,
+                 lambda: repo.find_channels(category="müzik", channel_type=ChannelType.BRAND,
+                                            status=ChannelStatus.SUSPENDED)),
+            ]
+            for name, scan, indexed in queries:
+                scan_times, index_times = [], []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    expected = scan()
+                    scan_times.append(time.perf_counter() - started)
+                    started = time.perf_counter()
+                    found = indexed()
+                    index_times.append(time.perf_counter() - started)
+                assert [ch.channel_id for ch in found] == [ch.channel_id for ch in expected]
+                scan_ms, index_ms = min(scan_times) * 1000, min(index_times) * 1000
+                print(f"{size:>9} {name:<26} {len(found):>8} {scan_ms:>9.1f} {index_ms:>9.2f} "
+                      f"{scan_ms / max(index_ms, 1e-6):>7.0f}x")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    journal = sub.add_parser("user-journal", help="create_user yazma gecikmesi: journal vs tam dosya yazımı")
+    journal.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    journal.add_argument("--writes", type=int, default=2000)
+    journal.add_argument("--legacy-limit", type=int, default=10000,
+                         help="tam dosya yazımı modunun ölçüleceği en büyük kullanıcı sayısı")
+    journal.add_argument("--legacy-writes", type=int, default=100)
+
+    bulk = sub.add_parser("user-bulk", help="create_users_bulk toplu içe aktarma hızı")
+    bulk.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+
+    streaming = sub.add_parser("streaming-load", help="json.load ve akış okuyucusu: süre ve tepe bellek")
+    streaming.add_argument("--sizes", type=int, nargs="+", default=[100000, 500000])
+
+    lazy = sub.add_parser("lazy-load", help="eager ve lazy açılış süresi")
+    lazy.add_argument("--sizes", type=int, nargs="+", default=[100000, 500000])
+
+    codec = sub.add_parser("snapshot-codec", help="JSON ve binary snapshot kaydetme/yükleme süresi")
+    codec.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+
+    sharded = sub.add_parser("sharded-save", help="tek dosya ve shard düzeninde değişiklik başına kayıt süresi")
+    sharded.add_argument("--sizes", type=int, nargs="+", default=[100000])
+    sharded.add_argument("--shards", type=int, nargs="+", default=[1, 16, 64])
+    sharded.add_argument("--writes", type=int, default=20)
+
+    dirty = sub.add_parser("dirty-save", help="parça önbelleğiyle kayıt: değişen kayıt sayısına göre CPU süresi")
+    dirty.add_argument("--sizes", type=int, nargs="+", default=[100000])
+    dirty.add_argument("--changed", type=int, nargs="+", default=[1, 100, 10000])
+
+    micro = sub.add_parser("codec-micro", help="codec başına dosya boyutu ve kodlama/çözme süresi")
+    micro.add_argument("--sizes", type=int, nargs="+", default=[100000])
+    micro.add_argument("--codecs", nargs="+", default=codec_names(), choices=codec_names())
+    micro.add_argument("--repeat", type=int, default=3)
+
+    behind = sub.add_parser("write-behind", help="senkron ve write-behind modunda değişiklik başına gecikme")
+    behind.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    behind.add_argument("--writes", type=int, default=200)
+
+    query = sub.add_parser("channel-query", help="kategori ve birleşik kanal sorguları: tarama ve indeks")
+    query.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    query.add_argument("--repeat", type=int, default=3)
+
+    child = sub.add_parser("_load-child")
+    child.add_argument("--path", required=True)
+    child.add_argument("--mode", choices=["json", "stream"], required=True)
+
+    args = parser.parse_args()
+    if args.bench == "user-journal":
+        bench_user_journal(args.sizes, args.writes, args.legacy_limit, args.legacy_writes)
+    elif args.bench == "user-bulk":
+        bench_user_bulk(args.sizes)
+    elif args.bench == "streaming-load":
+        bench_streaming_load(args.sizes)
+    elif args.bench == "lazy-load":
+        bench_lazy_load(args.sizes)
+    elif args.bench == "snapshot-codec":
+        bench_snapshot_codec(args.sizes)
+    elif args.bench == "sharded-save":
+        bench_sharded_save(args.sizes, args.shards, args.writes)
+    elif args.bench == "dirty-save":
+        bench_dirty_save(args.sizes, args.changed)
+    elif args.bench == "codec-micro":
+        bench_codec_micro(args.sizes, args.codecs, args.repeat)
+    elif args.bench == "write-behind":
+        bench_write_behind(args.sizes, args.writes)
+    elif args.bench == "channel-query":
+        bench_channel_query(args.sizes, args.repeat)
+    elif args.bench == "_load-child":
+        _load_child(args.path, args.mode)
+
+
+if __name__ == "__main__":
+    main()
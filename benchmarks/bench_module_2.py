@@ -0,0 +1,503 @@
+"""
+Modül 2 (Video) repository benchmark'ları.
+
+Kullanım:
+    python benchmarks/bench_module_2.py persistent-load --sizes 100000 1000000
+    python benchmarks/bench_module_2.py sqlite-concurrency --videos 100000 --readers 1 4 16
+    python benchmarks/bench_module_2.py mmap-catalog --sizes 1000000
+    python benchmarks/bench_module_2.py channel-page --sizes 10000 100000
+    python benchmarks/bench_module_2.py bitmap-filter --sizes 100000 1000000
+    python benchmarks/bench_module_2.py query-plan --sizes 1000000
+    python benchmarks/bench_module_2.py title-search --sizes 100000 1000000
+    python benchmarks/bench_module_2.py ranked-search --sizes 100000 1000000
+    python benchmarks/bench_module_2.py tag-query --sizes 100000 1000000
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from app.modules.module_2.base import VideoStatus, VideoVisibility
+from app.modules.module_2.implementations import LiveStreamVideo, ShortVideo, StandardVideo
+from app.modules.module_2.query import VideoQuery
+from app.modules.module_2.repository import PersistentVideoRepository, VideoRepository, video_to_row
+from app.modules.module_2.search import VideoSearchEngine
+from app.modules.module_2.mmap_repository import MmapVideoRepository
+from app.modules.module_2.sqlite_repository import SqliteVideoRepository
+
+# "VideoModule" logger'ının INFO satırları ölçümü etkilemesin
+logging.getLogger("VideoModule").setLevel(logging.WARNING)
+
+
+def make_video(i, channels=1000):
+    # Üç alt tipten dönüşümlü örnek video
+    channel_id = f"chan_{i % channels}"
+    kind = i % 3
+    if kind == 0:
+        video = StandardVideo(channel_id, f"Video {i}", "benchmark video", 60 + i % 3600,
+                              visibility=VideoVisibility.PUBLIC, tags=["bench", f"t{i % 50}"])
+    elif kind == 1:
+        video = ShortVideo(channel_id, f"Short {i}", "benchmark short", 5 + i % 55, music_track_id=f"m{i % 100}")
+    else:
+        video = LiveStreamVideo(channel_id, f"Live {i}", "benchmark live")
+    if i % 2 == 0:
+        if kind != 2:
+            video.transition_status(VideoStatus.PROCESSING)
+        video.transition_status(VideoStatus.PUBLISHED)
+    return video
+
+
+def write_video_log(path, count):
+    # count adet videoyu doğrudan kayıt dosyası formatında yaz (repository üzerinden değil)
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(count):
+            file.write(json.dumps(["put", *video_to_row(make_video(i))], ensure_ascii=False))
+            file.write("\n")
+
+
+def bench_persistent_load(sizes, writes):
+    # Açılış (tüm kaydı okuyup nesneleri kurma) süresi ve tek save gecikmesi
+    print(f"{'videos':>9} {'file_mb':>9} {'load_s':>8} {'save_mean_us':>13} {'save_p99_us':>12}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            data_file = os.path.join(temp_dir, "videos.jsonl")
+            write_video_log(data_file, size)
+            file_mb = os.path.getsize(data_file) / (1024 * 1024)
+
+            started = time.perf_counter()
+            repo = PersistentVideoRepository(data_file)
+            load = time.perf_counter() - started
+            assert repo.count() == size
+
+            videos = repo.find_by_channel("chan_1")
+            samples = []
+            for i in range(writes):
+                video = videos[i % len(videos)]
+                video.title = f"updated {i}"
+                started = time.perf_counter()
+                repo.save(video)
+                samples.append((time.perf_counter() - started) * 1e6)
+            repo.close()
+
+            samples.sort()
+            print(f"{size:>9} {file_mb:>9.1f} {load:>8.2f} {statistics.mean(samples):>13.1f} "
+                  f"{samples[int(len(samples) * 0.99)]:>12.1f}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_sqlite_concurrency(videos, reader_counts, duration):
+    # N okuyucu thread (find_by_id + kanal filtresi) ve tek yazıcı thread (save) aynı anda çalışır
+    print(f"{'readers':>8} {'reads_per_s':>12} {'read_p99_us':>12} {'writes_per_s':>13} {'write_p99_us':>13}")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        repo = SqliteVideoRepository(os.path.join(temp_dir, "videos.db"))
+        batch = []
+        for i in range(videos):
+            batch.append(make_video(i))
+            if len(batch) == 10000:
+                repo.save_many(batch)
+                batch = []
+        repo.save_many(batch)
+        video_ids = [video.video_id for video in repo.filter_videos(channel_id="chan_1")]
+
+        for readers in reader_counts:
+            stop = threading.Event()
+            read_samples = [[] for _ in range(readers)]
+            write_samples = []
+
+            def read_loop(samples, offset):
+                i = offset
+                while not stop.is_set():
+                    started = time.perf_counter()
+                    repo.find_by_id(video_ids[i % len(video_ids)])
+                    if i % 10 == 0:
+                        repo.filter_videos(channel_id=f"chan_{i % 1000}", status=VideoStatus.PUBLISHED)
+                    samples.append((time.perf_counter() - started) * 1e6)
+                    i += 1
+
+            def write_loop():
+                i = 0
+                while not stop.is_set():
+                    video = make_video(videos + i)
+                    started = time.perf_counter()
+                    repo.save(video)
+                    write_samples.append((time.perf_counter() - started) * 1e6)
+                    i += 1
+
+            threads = [threading.Thread(target=read_loop, args=(read_samples[n], n * 7919)) for n in range(readers)]
+            threads.append(threading.Thread(target=write_loop))
+            for thread in threads:
+                thread.start()
+            time.sleep(duration)
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+            reads = sorted(sample for samples in read_samples for sample in samples)
+            write_samples.sort()
+            print(f"{readers:>8} {len(reads) / duration:>12.0f} {reads[int(len(reads) * 0.99)]:>12.1f} "
+                  f"{len(write_samples) / duration:>13.0f} {write_samples[int(len(write_samples) * 0.99)]:>13.1f}")
+        repo.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_mmap_catalog(sizes):
+    # Açılış süresi, find_by_id gecikmesi ve eşlenen sütunlar üzerinde filtre taraması
+    print(f"{'videos':>9} {'build_s':>8} {'open_ms':>8} {'get_us':>7} {'channel_ms':>11} "
+          f"{'status_vis_ms':>14} {'date_ms':>8}")
+    for size in sizes:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            base_path = os.path.join(temp_dir, "videos")
+            repo = MmapVideoRepository(base_path, initial_capacity=size)
+            started = time.perf_counter()
+            video_ids = [repo.save(make_video(i)).video_id for i in range(size)]
+            build = time.perf_counter() - started
+            repo.close()
+
+            started = time.perf_counter()
+            repo = MmapVideoRepository(base_path)
+            open_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            for i in range(1000):
+                repo.find_by_id(video_ids[(i * 7919) % size])
+            get_us = (time.perf_counter() - started) * 1000
+
+            timings = []
+            for query in ({"channel_id": "chan_1"},
+                          {"status": VideoStatus.PUBLISHED, "visibility": VideoVisibility.PRIVATE},
+                          {"date_from": datetime.now()}):
+                started = time.perf_counter()
+                repo.filter_videos(**query)
+                timings.append((time.perf_counter() - started) * 1000)
+            repo.close()
+            print(f"{size:>9} {build:>8.1f} {open_ms:>8.2f} {get_us:>7.1f} {timings[0]:>11.1f} "
+                  f"{timings[1]:>14.1f} {timings[2]:>8.1f}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def bench_channel_page(sizes, pages):
+    # Tek büyük kanal: son 20 video sayfası, bir günlük aralık ve silme gecikmesi.
+    # "scan_ms" karşılaştırma için kanalın tüm videolarını tarayıp sıralayan yoldur.
+    print(f"{'videos':>9} {'page_us':>8} {'range_us':>9} {'scan_ms':>8} {'delete_us':>10}")
+    base_time = datetime(2024, 1, 1)
+    for size in sizes:
+        repo = VideoRepository()
+        videos = []
+        for i in range(size):
+            video = make_video(i, channels=1)
+            video._created_at = base_time + timedelta(minutes=(i * 7919) % size)
+            videos.append(repo.save(video))
+
+        started = time.perf_counter()
+        for _ in range(pages):
+            repo.find_by_channel("chan_0", newest_first=True, limit=20)
+        page_us = (time.perf_counter() - started) / pages * 1e6
+
+        since = base_time + timedelta(minutes=size // 2)
+        started = time.perf_counter()
+        for _ in range(pages):
+            repo.find_by_channel("chan_0", since=since, until=since + timedelta(days=1), limit=20)
+        range_us = (time.perf_counter() - started) / pages * 1e6
+
+        started = time.perf_counter()
+        sorted(repo.filter_videos(channel_id="chan_0"), key=lambda video: video.created_at, reverse=True)[:20]
+        scan_ms = (time.perf_counter() - started) * 1000
+
+        deletes = min(1000, size)
+        started = time.perf_counter()
+        for video in videos[:deletes]:
+            repo.delete(video.video_id)
+        delete_us = (time.perf_counter() - started) / deletes * 1e6
+        print(f"{size:>9} {page_us:>8.1f} {range_us:>9.1f} {scan_ms:>8.1f} {delete_us:>10.2f}")
+
+
+def bench_bitmap_filter(sizes, repeats):
+    # Moderasyon panosu sorguları: bitmap AND + nesne okuma ile tüm videoları tarayan döngü karşılaştırılır
+    queries = [
+        ("published+public", {"status": VideoStatus.PUBLISHED, "visibility": VideoVisibility.PUBLIC}),
+        ("blocked", {"status": VideoStatus.BLOCKED}),
+        ("short+uploaded", {"video_type": "ShortVideo", "status": VideoStatus.UPLOADED}),
+    ]
+    print(f"{'videos':>9} {'query':>17} {'rows':>8} {'bitmap_ms':>10} {'scan_ms':>8} {'transition_us':>14}")
+    for size in sizes:
+        repo = VideoRepository()
+        videos = [repo.save(make_video(i)) for i in range(size)]
+        for video in videos[::97]:
+            if video.status == VideoStatus.PUBLISHED:
+                video.transition_status(VideoStatus.BLOCKED)
+
+        for name, query in queries:
+            started = time.perf_counter()
+            for _ in range(repeats):
+                rows = repo.filter_videos(**query)
+            bitmap_ms = (time.perf_counter() - started) / repeats * 1000
+
+            started = time.perf_counter()
+            expected = [video for video in videos
+                        if all(getattr(video, field) == value for field, value in query.items()
+                               if field != "video_type")
+                        and video.get_video_type() == query.get("video_type", video.get_video_type())]
+            scan_ms = (time.perf_counter() - started) * 1000
+            assert len(rows) == len(expected)
+
+            # Durum geçişinin (dinleyici üzerinden bitmap güncellemesi) maliyeti
+            video = expected[0] if expected else videos[0]
+            started = time.perf_counter()
+            for _ in range(1000):
+                video.visibility = VideoVisibility.UNLISTED
+                video.visibility = VideoVisibility.PUBLIC
+            transition_us = (time.perf_counter() - started) / 2000 * 1e6
+            print(f"{size:>9} {name:>17} {len(rows):>8} {bitmap_ms:>10.1f} {scan_ms:>8.1f} {transition_us:>14.1f}")
+
+
+def bench_query_plan(sizes):
+    # Planlayıcının seçtiği yol ile tam taramanın karşılaştırılması (explain çıktısından)
+    print(f"{'videos':>9} {'query':>22} {'path':>14} {'est':>8} {'examined':>9} {'rows':>8} "
+          f"{'plan_ms':>8} {'scan_ms':>8}")
+    base_time = datetime(2024, 1, 1)
+    for size in sizes:
+        repo = VideoRepository()
+        for i in range(size):
+            video = make_video(i)
+            video._created_at = base_time + timedelta(seconds=(i * 7919) % size)
+            repo.save(video)
+        queries = [
+            ("channel+public", VideoQuery(channel_id="chan_7", visibility=VideoVisibility.PUBLIC)),
+            ("published+public", VideoQuery(status=VideoStatus.PUBLISHED, visibility=VideoVisibility.PUBLIC)),
+            ("last-hour+short", VideoQuery(date_from=base_time + timedelta(seconds=size - 3600),
+                                           video_type="ShortVideo")),
+            ("title+min_duration", VideoQuery(title_contains="video 12", min_duration=600)),
+        ]
+        for name, query in queries:
+            report = repo.explain(query)
+            full_scan, predicate = repo.plan(VideoQuery()), query.predicate()
+            started = time.perf_counter()
+            expected = [video for video in full_scan.fetch() if predicate(video)]
+            scan_ms = (time.perf_counter() - started) * 1000
+            assert len(expected) == report["rows_returned"]
+            print(f"{size:>9} {name:>22} {report['access_path']:>14} {report['estimated_rows']:>8} "
+                  f"{report['rows_examined']:>9} {report['rows_returned']:>8} {report['elapsed_ms']:>8.1f} "
+                  f"{scan_ms:>8.1f}")
+
+
+def make_titles(count, seed=7):
+    # Hecelerden üretilmiş ~5000 kelimelik sözlükten 3-6 kelimelik başlıklar (Türkçe harfler dahil)
+    rng = random.Random(seed)
+    syllables = ["ka", "le", "mi", "ro", "su", "ta", "ne", "şe", "çi", "ğu", "ıl", "ön", "ük", "İz", "ba", "de"]
+    words = sorted({"".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(6000)})
+    return words, [" ".join(rng.choice(words) for _ in range(rng.randint(3, 6))).capitalize()
+                   for _ in range(count)]
+
+
+def bench_title_search(sizes, repeats):
+    # Trigram indeksli başlık araması ile eski doğrusal tarama (her başlığı her çağrıda lower())
+    print(f"{'videos':>9} {'query':>14} {'rows':>7} {'index_ms':>9} {'scan_ms':>8} {'build_s':>8}")
+    for size in sizes:
+        words, titles = make_titles(size)
+        repo = VideoRepository()
+        for i, title in enumerate(titles):
+            repo.save(StandardVideo(f"chan_{i % 1000}", title, "benchmark", 60))
+
+        started = time.perf_counter()
+        repo.plan(VideoQuery(title_contains="ilk"))  # ilk başlık sorgusu indeksi kurar
+        build = time.perf_counter() - started
+
+        queries = [("rare word", words[len(words) // 2]), ("phrase", " ".join(titles[size // 3].split()[1:3])),
+                   ("common", "ka"), ("syllable", "şeka"), ("turkish", "İZ")]
+        for name, needle in queries:
+            started = time.perf_counter()
+            for _ in range(repeats):
+                rows = repo.execute(VideoQuery(title_contains=needle))
+            index_ms = (time.perf_counter() - started) / repeats * 1000
+
+            started = time.perf_counter()
+            expected = [video for video in repo.find_all() if needle.lower() in video.title.lower()]
+            scan_ms = (time.perf_counter() - started) * 1000
+            assert rows == expected
+            print(f"{size:>9} {name:>14} {len(rows):>7} {index_ms:>9.2f} {scan_ms:>8.1f} {build:>8.1f}")
+
+
+def bench_ranked_search(sizes, repeats):
+    # BM25 top-10 (erken sonlandırmalı) ile tüm adayların skorlanması; indeks kurulum ve kayıt maliyeti
+    print(f"{'videos':>9} {'query':>10} {'top10_ms':>9} {'all_ms':>8} {'filtered_ms':>12} "
+          f"{'build_s':>8} {'save_us':>8} {'postings_mb':>12}")
+    for size in sizes:
+        words, titles = make_titles(size)
+        descriptions = make_titles(size, seed=11)[1]
+        repo = VideoRepository()
+        for i in range(size):
+            # "video" her açıklamada, "eğitim" yarısında geçer: sık terimlerle erken sonlandırma ölçülür
+            description = f"{descriptions[i]} video" + (" eğitim" if i % 2 else "")
+            repo.save(StandardVideo(f"chan_{i % 1000}", titles[i], description, 60 + i % 600,
+                                    visibility=VideoVisibility.PUBLIC if i % 3 else VideoVisibility.PRIVATE,
+                                    tags=[words[i % len(words)]]))
+
+        started = time.perf_counter()
+        engine = VideoSearchEngine(repo)
+        build = time.perf_counter() - started
+        postings_mb = sum(len(term.postings) for term in engine._terms.values()) / (1024 * 1024)
+
+        started = time.perf_counter()
+        for i in range(1000):
+            repo.save(StandardVideo("chan_new", titles[i], descriptions[-i - 1], 60))
+        save_us = (time.perf_counter() - started) / 1000 * 1e6
+
+        queries = [("rare", words[len(words) // 2]),
+                   ("two words", " ".join(titles[size // 2].split()[:2])),
+                   ("rare+common", f"{words[len(words) // 3]} eğitim video"),
+                   ("common", "eğitim video")]
+        public = VideoQuery(visibility=VideoVisibility.PUBLIC, min_duration=300)
+        for name, text in queries:
+            timings = []
+            for limit, filters in ((10, None), (size * 2, None), (10, public)):
+                started = time.perf_counter()
+                for _ in range(repeats):
+                    engine.search(text, limit=limit, filters=filters)
+                timings.append((time.perf_counter() - started) / repeats * 1000)
+            print(f"{size:>9} {name:>10} {timings[0]:>9.1f} {timings[1]:>8.1f} {timings[2]:>12.1f} "
+                  f"{build:>8.1f} {save_us:>8.1f} {postings_mb:>12.1f}")
+
+
+def bench_tag_query(sizes, repeats):
+    # Etiket indeksi: AND/OR sorguları, kanal facet'leri ve add_tag maliyeti; tüm videoları tarayan döngüyle karşılaştırılır
+    print(f"{'videos':>9} {'query':>20} {'rows':>8} {'index_ms':>9} {'scan_ms':>8}")
+    rng = random.Random(7)
+    vocabulary = [f"tag{rank}" for rank in range(10000)]
+    # Zipf benzeri dağılım: ilk etiketler çok sık, sondakiler nadir
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    for size in sizes:
+        repo = VideoRepository()
+        videos = []
+        for i in range(size):
+            tags = list(dict.fromkeys(rng.choices(vocabulary, cum_weights=cum_weights, k=4)))
+            videos.append(repo.save(StandardVideo(f"chan_{i % 1000}", f"Video {i}", "D", 60, tags=tags)))
+
+        queries = [
+            ("rare AND rare", ["tag300", "tag500"], "all", None),
+            ("common AND rare", ["tag0", "tag700"], "all", None),
+            ("common AND common", ["tag0", "tag1"], "all", 20),
+            ("rare OR rare", ["tag3000", "tag5000", "tag7000"], "any", None),
+            ("common OR rare", ["tag2", "tag9000"], "any", 20),
+        ]
+        for name, tags, match, limit in queries:
+            started = time.perf_counter()
+            for _ in range(repeats):
+                rows = repo.find_by_tags(tags, match, limit)
+            index_ms = (time.perf_counter() - started) / repeats * 1000
+
+            wanted = set(tags)
+            started = time.perf_counter()
+            if match == "all":
+                expected = [video for video in videos if wanted.issubset(video.tags)]
+            else:
+                expected = [video for video in videos if not wanted.isdisjoint(video.tags)]
+            scan_ms = (time.perf_counter() - started) * 1000
+            assert rows == expected[:limit]
+            label = f"{name}" + (f" [{limit}]" if limit else "")
+            print(f"{size:>9} {label:>20} {len(rows):>8} {index_ms:>9.3f} {scan_ms:>8.1f}")
+
+        for name, channel_id in (("facets chan top10", "chan_7"), ("facets all top10", None)):
+            started = time.perf_counter()
+            for _ in range(repeats):
+                facets = repo.tag_facets(channel_id, limit=10)
+            index_ms = (time.perf_counter() - started) / repeats * 1000
+            started = time.perf_counter()
+            counts = {}
+            for video in videos:
+                if channel_id is None or video.channel_id == channel_id:
+                    for tag in set(video.tags):
+                        counts[tag] = counts.get(tag, 0) + 1
+            scan_ms = (time.perf_counter() - started) * 1000
+            assert facets == sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:10]
+            print(f"{size:>9} {name:>20} {len(facets):>8} {index_ms:>9.3f} {scan_ms:>8.1f}")
+
+        video = videos[size // 2]
+        started = time.perf_counter()
+        for _ in range(1000):
+            video.add_tag("bench")
+            video.remove_tag("bench")
+        print(f"{size:>9} {'add+remove tag (us)':>20} {'':>8} {(time.perf_counter() - started) / 1000 * 1e6:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    persistent = sub.add_parser("persistent-load", help="PersistentVideoRepository açılış süresi ve save gecikmesi")
+    persistent.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    persistent.add_argument("--writes", type=int, default=2000)
+
+    concurrency = sub.add_parser("sqlite-concurrency", help="SqliteVideoRepository: çok okuyucu + tek yazıcı")
+    concurrency.add_argument("--videos", type=int, default=100000)
+    concurrency.add_argument("--readers", type=int, nargs="+", default=[1, 4, 16])
+    concurrency.add_argument("--duration", type=float, default=5.0, help="her ölçümün süresi (saniye)")
+
+    catalog = sub.add_parser("mmap-catalog", help="MmapVideoRepository açılış, okuma ve filtre süreleri")
+    catalog.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+
+    page = sub.add_parser("channel-page", help="VideoRepository kanal zaman indeksi: sayfa, aralık ve silme")
+    page.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    page.add_argument("--pages", type=int, default=1000)
+
+    bitmap = sub.add_parser("bitmap-filter", help="VideoRepository durum/görünürlük/tip bitmap filtreleri")
+    bitmap.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    bitmap.add_argument("--repeats", type=int, default=5)
+
+    planner = sub.add_parser("query-plan", help="VideoRepository sorgu planlayıcısı: seçilen yol ve explain")
+    planner.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+
+    title = sub.add_parser("title-search", help="Başlık trigram indeksi ile doğrusal tarama karşılaştırması")
+    title.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    title.add_argument("--repeats", type=int, default=5)
+
+    ranked = sub.add_parser("ranked-search", help="VideoSearchEngine BM25 top-k araması")
+    ranked.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    ranked.add_argument("--repeats", type=int, default=3)
+
+    tags = sub.add_parser("tag-query", help="VideoRepository etiket indeksi: AND/OR sorguları ve facet'ler")
+    tags.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    tags.add_argument("--repeats", type=int, default=20)
+
+    args = parser.parse_args()
+    if args.bench == "persistent-load":
+        bench_persistent_load(args.sizes, args.writes)
+    elif args.bench == "sqlite-concurrency":
+        bench_sqlite_concurrency(args.videos, args.readers, args.duration)
+    elif args.bench == "mmap-catalog":
+        bench_mmap_catalog(args.sizes)
+    elif args.bench == "channel-page":
+        bench_channel_page(args.sizes, args.pages)
+    elif args.bench == "bitmap-filter":
+        bench_bitmap_filter(args.sizes, args.repeats)
+    elif args.bench == "query-plan":
+        bench_query_plan(args.sizes)
+    elif args.bench == "title-search":
+        bench_title_search(args.sizes, args.repeats)
+    elif args.bench == "ranked-search":
+        bench_ranked_search(args.sizes, args.repeats)
+    elif args.bench == "tag-query":
+        bench_tag_query(args.sizes, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
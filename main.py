@@ -5,13 +5,14 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
 
 # Module-1 (User/Channel)
-from app.modules.module_1.base import ChannelStatus, UserRole
+from app.modules.module_1.base import ChannelNotFoundException, ChannelStatus, UserNotFoundException, UserRole
 from app.modules.module_1.implementations import PersonalChannel, BrandChannel, KidsChannel,AdminUser
-from app.modules.module_1.repository import UserRepository, ChannelRepository
+from app.modules.module_1.replication import LogShippingReplica
+from app.modules.module_1.sqlite_repository import create_module1_repositories
 
 # Module-2 (Video)
 from app.modules.module_2.base import VideoStatus, VideoVisibility
-from app.modules.module_2.repository import VideoRepository
+from app.modules.module_2.repository import PersistentVideoRepository
 from app.modules.module_2.services import VideoService
 
 def ask(msg, default=None):
@@ -128,21 +129,7 @@ def edit_user(user_repo):
             new_user.is_active = new_active
 
             # Eğer buraya kadar geldiyse veriler GEÇERLİDİR. Kayda geçebiliriz.
-            users = getattr(user_repo, "_UserRepository__users")
-            username_index = getattr(user_repo, "_UserRepository__username_index")
-            email_index = getattr(user_repo, "_UserRepository__email_index")
-
-            # Eski indeksleri temizle ve yenilerini yaz
-            username_index.pop(u.username.lower(), None)
-            email_index.pop(u.email.lower(), None)
-
-            users[user_id] = new_user
-            username_index[new_user.username.lower()] = new_user.user_id
-            email_index[new_user.email.lower()] = new_user.user_id
-
-            setattr(user_repo, "_UserRepository__last_modified", datetime.now())
-            getattr(user_repo, "_save_to_file")()
-
+            user_repo.update_user(new_user)
             print("Kullanıcı başarıyla güncellendi.")
             break  # BAŞARILI: Döngüden çık
 
@@ -155,23 +142,11 @@ def delete_user(user_repo):
     print("\n--> USER SİL\n")
     user_id = ask("User ID")
 
-    users = getattr(user_repo, "_UserRepository__users")
-    if user_id not in users:
+    try:
+        user_repo.delete_user(user_id)
+        print("Kullanıcı silindi")
+    except UserNotFoundException:
         print("Kullanıcı bulunamadı")
-        return
-
-    username_index = getattr(user_repo, "_UserRepository__username_index")
-    email_index = getattr(user_repo, "_UserRepository__email_index")
-    u = users[user_id]
-
-    username_index.pop(u.username.lower(), None)
-    email_index.pop(u.email.lower(), None)
-    del users[user_id]
-
-    setattr(user_repo, "_UserRepository__last_modified", datetime.now())
-    getattr(user_repo, "_save_to_file")()
-
-    print("Kullanıcı silindi")
 
 
 def list_channels(channel_repo):
@@ -218,12 +193,7 @@ def edit_channel(channel_repo):
     ch.category = ask("Category", getattr(ch, "category", "other"))
     ch.updated_at = datetime.now()
 
-    channels = getattr(channel_repo, "_ChannelRepository__channels")
-    channels[ch.channel_id] = ch
-
-    setattr(channel_repo, "_ChannelRepository__last_modified", datetime.now())
-    getattr(channel_repo, "_save_to_file")()
-
+    channel_repo.update_channel(ch)
     print("Kanal güncellendi")
 
 
@@ -249,26 +219,11 @@ def delete_channel(channel_repo):
     print("\n--> KANAL SİL\n")
     channel_id = ask("Channel ID")
 
-    channels = getattr(channel_repo, "_ChannelRepository__channels")
-    if channel_id not in channels:
+    try:
+        channel_repo.delete_channel(channel_id)
+        print("Kanal silindi")
+    except ChannelNotFoundException:
         print("Kanal bulunamadı")
-        return
-
-    owner_index = getattr(channel_repo, "_ChannelRepository__owner_index")
-    type_index = getattr(channel_repo, "_ChannelRepository__type_index")
-    ch = channels[channel_id]
-
-    if ch.owner_id in owner_index and channel_id in owner_index[ch.owner_id]:
-        owner_index[ch.owner_id].remove(channel_id)
-    if ch.channel_type in type_index and channel_id in type_index[ch.channel_type]:
-        type_index[ch.channel_type].remove(channel_id)
-
-    del channels[channel_id]
-
-    setattr(channel_repo, "_ChannelRepository__last_modified", datetime.now())
-    getattr(channel_repo, "_save_to_file")()
-
-    print("Kanal silindi")
 
 
 def choose_visibility(default=VideoVisibility.PRIVATE):
@@ -319,7 +274,8 @@ def upload_video(video_service, channel_repo):
 
     if video.status == VideoStatus.PUBLISHED:
         try:
-            channel_repo.increment_channel_video_count(channel_id, 1)
+            # Sayaç artışı group commit ile toplu yazılır, her videoda channels.json yeniden yazılmaz
+            channel_repo.increment_channel_video_count(channel_id, 1, durable=False)
         except Exception:
             pass
 
@@ -382,13 +338,41 @@ def dashboard(channel_repo, video_repo):
 
 
 def main():
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
+    # MODULE1_DATA_DIR: kayıtların tutulduğu dizin (varsayılan main.py yanındaki data/)
+    data_dir = os.environ.get("MODULE1_DATA_DIR") or os.path.join(os.path.dirname(__file__), "data")
     os.makedirs(data_dir, exist_ok=True)
 
-    user_repo = UserRepository(os.path.join(data_dir, "users.json"))
-    channel_repo = ChannelRepository(os.path.join(data_dir, "channels.json"))
+    # Depolama backend'i: MODULE1_BACKEND=json (varsayılan, users.json/channels.json) veya sqlite (module1.db)
+    backend = os.environ.get("MODULE1_BACKEND", "json")
+    # MODULE1_SHARDS=N: JSON kayıtları data/users.shards ve data/channels.shards altında N dosyaya bölünür
+    shards = int(os.environ["MODULE1_SHARDS"]) if os.environ.get("MODULE1_SHARDS") else None
+    # MODULE1_CODEC: JSON snapshot yazma formatı (json, json-compact, json-gzip, binary)
+    codec = os.environ.get("MODULE1_CODEC", "json")
+    # MODULE1_SHARED=1: aynı data/ dizinini birden fazla main.py/servis süreci kullanabilir; yazmalar dosya
+    # kilidiyle yapılır, diğer süreçlerin değişiklikleri okurken yüklenir (her işlem kilit + stat maliyeti öder)
+    shared = os.environ.get("MODULE1_SHARED", "0") == "1"
+    # MODULE1_WRITE_BEHIND=1: değişiklikler arka plan thread'inde yazılır, işlemler disk yazmasını beklemez
+    write_behind = os.environ.get("MODULE1_WRITE_BEHIND", "0") == "1"
+    # MODULE1_COMMIT_WINDOW=<saniye>: kanal değişiklikleri bu süre boyunca bellekte toplanıp tek yazmayla
+    # kaydedilir. Pencere içinde süreç çökerse/öldürülürse onaylanmış değişiklikler kaybolur; varsayılan
+    # her değişikliğin hemen (senkron) yazılmasıdır
+    commit_window = (float(os.environ["MODULE1_COMMIT_WINDOW"])
+                     if os.environ.get("MODULE1_COMMIT_WINDOW") else None)
+    # MODULE1_REPLICA_OF=<primary data dizini>: bu süreç rapor/dashboard için read-only replica olarak çalışır,
+    # primary'nin dosyaları saniyede bir data/ dizinine taşınır (yazma menüleri hata verir)
+    replica_of = os.environ.get("MODULE1_REPLICA_OF")
+    if replica_of:
+        replica = LogShippingReplica(replica_of, data_dir)
+        replica.sync()
+        replica.start(interval=1.0)
+        user_repo, channel_repo = replica.open_repositories()
+    else:
+        user_repo, channel_repo = create_module1_repositories(backend, data_dir, shards=shards, codec=codec,
+                                                              shared=shared, write_behind=write_behind,
+                                                              commit_window=commit_window)
 
-    video_repo = VideoRepository()  # RAM
+    # Video kataloğu data/videos.jsonl dosyasında kalıcı tutulur (her değişiklik tek satır eklenir)
+    video_repo = PersistentVideoRepository(os.path.join(data_dir, "videos.jsonl"))
     video_service = VideoService(video_repo)
 
     while True:
@@ -473,6 +457,9 @@ def main():
                 pause()
 
             elif sec == "0":
+                user_repo.flush()
+                channel_repo.flush()
+                video_repo.close()
                 print("Çıkış")
                 break
 
@@ -5,8 +5,11 @@ project_root = os.path.abspath(os.path.join(current_dir, '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import json
 import tempfile
 import shutil
+import subprocess
+import time
 from datetime import datetime
 from typing import List, Dict, Any
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -342,6 +345,1157 @@ def test_status_and_category():
     return result
 
 
+def test_user_journal():
+    # Journal (append-only günlük) modunda kalıcılık testleri
+    print_test_header("USER JOURNAL TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        data_file = os.path.join(temp_dir, "journal_users.json")
+        repo = UserRepository(data_file, journal=True, compact_min_entries=5, compact_ratio=0.5)
+        repo.create_user(ViewerUser("j_001", "journal1", "j1@test.com", "password_123"))
+        repo.create_user(ContentCreatorUser("j_002", "journal2", "j2@test.com", "password_123"))
+        repo.set_user_active("j_001", False)
+        repo.update_user_password("j_002", "new_password_123")
+
+        result.assert_true(not os.path.exists(data_file), "Snapshot compaction oncesi yazilmadi")
+        result.assert_true(os.path.exists(data_file + ".journal"), "Journal dosyasi olusturuldu")
+        repo.close()
+
+        reopened = UserRepository(data_file, journal=True)
+        result.assert_equal(reopened.get_user_count(), 2, "Journal replay ile kullanicilar yuklendi")
+        result.assert_true(not reopened.get_user_by_id("j_001").is_active, "Aktiflik degisikligi replay edildi")
+        result.assert_equal(reopened.get_user_by_id("j_002").password, "new_password_123",
+                            "Sifre degisikligi replay edildi")
+        result.assert_equal(reopened.get_user_by_username("JOURNAL2").user_id, "j_002", "Username indeksi kuruldu")
+        reopened.close()
+
+        # 5. kayıtta compaction tetiklenir: snapshot yazılır, günlük boşalır
+        repo = UserRepository(data_file, journal=True, compact_min_entries=5, compact_ratio=0.5)
+        repo.create_user(ViewerUser("j_003", "journal3", "j3@test.com", "password_123"))
+        result.assert_true(os.path.exists(data_file), "Compaction snapshot'i yazdi")
+        result.assert_equal(os.path.getsize(data_file + ".journal"), 0, "Compaction sonrasi journal bos")
+        repo.close()
+
+        result.assert_equal(UserRepository(data_file).get_user_count(), 3, "Snapshot journal olmadan okunabiliyor")
+
+    except Exception as e:
+        result.assert_true(False, f"User journal testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_channel_group_commit():
+    # Group commit (toplu yazma) testleri
+    print_test_header("CHANNEL GROUP COMMIT TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    def saved_channel_ids(path):
+        if not os.path.exists(path):
+            return set()
+        with open(path, 'r', encoding='utf-8') as file:
+            return set(json.load(file)['channels'])
+
+    try:
+        data_file = os.path.join(temp_dir, "gc_channels.json")
+        repo = ChannelRepository(data_file, commit_max_ops=3)
+        repo.create_channel(PersonalChannel("gc_001", "Group Commit 1", "group commit test channel", "owner_gc"))
+        repo.create_channel(PersonalChannel("gc_002", "Group Commit 2", "group commit test channel", "owner_gc"))
+        result.assert_equal(saved_channel_ids(data_file), set(), "max_ops dolmadan dosya yazilmadi")
+        result.assert_equal(repo.get_pending_write_count(), 2, "Bekleyen yazma sayisi dogru")
+
+        repo.increment_channel_video_count("gc_001")
+        result.assert_equal(saved_channel_ids(data_file), {"gc_001", "gc_002"}, "max_ops dolunca tek yazma yapildi")
+
+        repo.set_channel_status("gc_002", ChannelStatus.SUSPENDED, durable=True)
+        result.assert_equal(repo.get_pending_write_count(), 0, "durable=True aninda yazdi")
+
+        repo.create_channel(PersonalChannel("gc_003", "Group Commit 3", "group commit test channel", "owner_gc"))
+        repo.flush()
+        result.assert_true("gc_003" in saved_channel_ids(data_file), "flush bekleyen degisiklikleri yazdi")
+        result.assert_equal([f for f in os.listdir(temp_dir) if f.endswith(".tmp")], [],
+                            "Atomik yazmadan gecici dosya kalmadi")
+
+        window_file = os.path.join(temp_dir, "gc_window.json")
+        window_repo = ChannelRepository(window_file, commit_window=0.05)
+        window_repo.create_channel(PersonalChannel("gc_004", "Group Commit 4", "group commit test channel", "owner_gc"))
+        result.assert_equal(saved_channel_ids(window_file), set(), "Pencere dolmadan dosya yazilmadi")
+        time.sleep(0.3)
+        result.assert_equal(saved_channel_ids(window_file), {"gc_004"}, "Pencere sonunda zamanlayici yazdi")
+
+    except Exception as e:
+        result.assert_true(False, f"Channel group commit testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_repository_batch():
+    # batch() unit-of-work testleri
+    print_test_header("REPOSITORY BATCH TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        users_file = os.path.join(temp_dir, "batch_users.json")
+        user_repo = UserRepository(users_file)
+        with user_repo.batch():
+            user_repo.create_user(ViewerUser("b_001", "batch1", "b1@test.com", "password_123"))
+            user_repo.create_user(ViewerUser("b_002", "batch2", "b2@test.com", "password_123"))
+            user_repo.set_user_active("b_001", False)
+            result.assert_true(not os.path.exists(users_file), "Batch icinde dosya yazilmadi")
+        result.assert_equal(UserRepository(users_file).get_user_count(), 2, "Batch sonunda tek kayit yapildi")
+
+        try:
+            with user_repo.batch():
+                user_repo.create_user(ViewerUser("b_003", "batch3", "b3@test.com", "password_123"))
+                user_repo.set_user_active("b_002", False)
+                user_repo.create_user(ViewerUser("b_004", "BATCH1", "b4@test.com", "password_123"))
+            result.assert_true(False, "Duplicate username batch sonunda yakalanmadi")
+        except DuplicateUserException:
+            result.assert_true(True, "Duplicate username batch sonunda yakalandi")
+
+        result.assert_equal(user_repo.get_user_count(), 2, "Basarisiz batch eklemeleri geri alindi")
+        result.assert_true(user_repo.get_user_by_id("b_002").is_active, "Basarisiz batch durum degisikligi geri alindi")
+        result.assert_equal(user_repo.get_user_by_username("batch1").user_id, "b_001", "Username indeksi geri yuklendi")
+
+        channels_file = os.path.join(temp_dir, "batch_channels.json")
+        channel_repo = ChannelRepository(channels_file)
+        with channel_repo.batch():
+            for i in range(5):
+                channel_repo.create_channel(PersonalChannel(f"bc_{i:03d}", f"Batch Channel {i}",
+                                                            "batch channel description", "owner_batch"))
+            channel_repo.set_channel_status("bc_000", ChannelStatus.ARCHIVED)
+        result.assert_equal(ChannelRepository(channels_file).get_channel_count(), 5, "Kanal batch'i kaydedildi")
+
+        try:
+            with channel_repo.batch():
+                channel_repo.create_channel(PersonalChannel("bc_100", "Batch Channel X",
+                                                            "batch channel description", "owner_batch"))
+                channel_repo.set_channel_status("bc_001", ChannelStatus.SUSPENDED)
+                raise RuntimeError("import failed")
+        except RuntimeError:
+            pass
+        result.assert_equal(channel_repo.get_channel_count(), 5, "Hata sonrasi kanal eklemesi geri alindi")
+        result.assert_equal(channel_repo.get_channel_by_id("bc_001").status, ChannelStatus.ACTIVE,
+                            "Hata sonrasi durum degisikligi geri alindi")
+        result.assert_equal(len(channel_repo.get_channels_by_owner("owner_batch")), 5, "Owner indeksi geri alindi")
+
+    except Exception as e:
+        result.assert_true(False, f"Repository batch testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_user_bulk_import():
+    # create_users_bulk testleri
+    print_test_header("TOPLU KULLANICI EKLEME TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        data_file = os.path.join(temp_dir, "bulk_users.json")
+        repo = UserRepository(data_file)
+        repo.create_user(ViewerUser("bulk_000", "existing", "existing@test.com", "password_123"))
+
+        report = repo.create_users_bulk([
+            {"user_id": "bulk_001", "username": "bulk1", "email": "bulk1@test.com",
+             "password": "password_123", "role": "admin"},
+            {"user_id": "bulk_002", "username": "bulk2", "email": "bulk2@test.com",
+             "password": "password_123", "role": UserRole.CONTENT_CREATOR, "is_active": False},
+            {"user_id": "bulk_003", "username": "EXISTING", "email": "bulk3@test.com", "password": "password_123"},
+            {"user_id": "bulk_004", "username": "bulk4", "email": "BULK1@test.com", "password": "password_123"},
+            {"user_id": "bulk_005", "username": "bulk5", "email": "bulk5@test.com", "password": "short"},
+            {"user_id": "bulk_006", "username": "bulk6", "email": "invalid-email", "password": "password_123"},
+        ])
+
+        result.assert_equal([r["ok"] for r in report], [True, True, False, False, False, False],
+                            "Kayit bazli rapor dogru")
+        result.assert_true("Username" in report[2]["error"], "Mevcut username reddedildi")
+        result.assert_true("Email" in report[3]["error"], "Batch ici duplicate email reddedildi")
+        result.assert_true(isinstance(repo.get_user_by_id("bulk_001"), AdminUser), "Role gore AdminUser olusturuldu")
+        result.assert_true(not repo.get_user_by_id("bulk_002").is_active, "is_active alani uygulandi")
+
+        reloaded = UserRepository(data_file)
+        result.assert_equal(reloaded.get_user_count(), 3, "Gecerli kayitlar tek seferde kaydedildi")
+
+    except Exception as e:
+        result.assert_true(False, f"User bulk import testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_streaming_loader():
+    # iter_json_section akış okuyucusu testleri
+    print_test_header("STREAMING LOADER TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        from app.modules.module_1.persistence import iter_json_section
+
+        data = {
+            "metadata": {"last_modified": "2025-01-01T00:00:00", "total": 3},
+            "users": {
+                "u1": {"name": "Şamil \"İ\" ğüöç", "count": 1234567, "tags": ["a", {"b": [1.5, None, True]}]},
+                "u2": {"name": "x" * 300, "count": -98765.25e3},
+                "u3": {},
+            },
+            "extra": [1, 2, 3],
+        }
+        path = os.path.join(temp_dir, "stream.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2, ensure_ascii=False)
+
+        for chunk_size in (1, 7, 64, 1 << 20):
+            records = dict(iter_json_section(path, "users", chunk_size=chunk_size))
+            result.assert_equal(records, data["users"], f"chunk_size={chunk_size} ile kayitlar json.load ile ayni")
+
+        result.assert_equal(list(iter_json_section(path, "channels")), [], "Olmayan bolum bos doner")
+
+        users_file = os.path.join(temp_dir, "stream_users.json")
+        repo = UserRepository(users_file)
+        repo.create_user(ViewerUser("s_001", "stream1", "s1@test.com", "password_123"))
+        repo.create_user(ViewerUser("s_002", "stream2", "s2@test.com", "password_123"))
+        reloaded = UserRepository(users_file)
+        result.assert_equal(reloaded.get_user_by_username("stream2").user_id, "s_002", "Repository akisla yuklendi")
+
+    except Exception as e:
+        result.assert_true(False, f"Streaming loader testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_lazy_materialization():
+    # lazy=True modunda kayıtların ilk erişimde kurulması testleri
+    print_test_header("LAZY MATERIALIZATION TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        users_file = os.path.join(temp_dir, "lazy_users.json")
+        repo = UserRepository(users_file)
+        repo.create_user(AdminUser("l_001", "lazyadmin", "l1@test.com", "password_123"))
+        repo.create_user(ViewerUser("l_002", "lazyviewer", "l2@test.com", "password_123"))
+        repo.create_user(ViewerUser("l_003", "lazyviewer3", "l3@test.com", "password_123"))
+
+        lazy_repo = UserRepository(users_file, lazy=True)
+        users = getattr(lazy_repo, "_UserRepository__users")
+        result.assert_equal(users.materialized_count(), 0, "Baslangicta hic kullanici nesnesi kurulmadi")
+        result.assert_equal(lazy_repo.get_user_by_username("LAZYVIEWER").user_id, "l_002",
+                            "Indeksler ham kayittan kuruldu")
+        result.assert_true(lazy_repo.get_user_by_id("l_002") is lazy_repo.get_user_by_id("l_002"),
+                           "Kurulan nesne onbellekte tutuldu")
+        result.assert_equal(users.materialized_count(), 1, "Sadece erisilen kullanici kuruldu")
+
+        admins = lazy_repo.get_users_by_role(UserRole.ADMIN)
+        result.assert_equal([u.user_id for u in admins], ["l_001"], "Rol filtresi ham kayit uzerinden calisti")
+        result.assert_equal(users.materialized_count(), 2, "Rol filtresi sadece eslesenleri kurdu")
+
+        all_users = lazy_repo.get_all_users()
+        result.assert_true(isinstance(all_users, LazySequence), "get_all_users lazy gorunum dondurdu")
+        result.assert_equal(len(all_users), 3, "Lazy gorunum uzunlugu dogru")
+        result.assert_equal(users.materialized_count(), 2, "Gorunum olusturmak nesne kurmadi")
+
+        lazy_repo.set_user_active("l_003", False)
+        reloaded = UserRepository(users_file)
+        result.assert_true(not reloaded.get_user_by_id("l_003").is_active, "Lazy repo degisikligi kaydetti")
+        result.assert_equal(reloaded.get_user_by_id("l_001").email, "l1@test.com",
+                            "Kurulmamis kayit ayni haliyle geri yazildi")
+
+        channels_file = os.path.join(temp_dir, "lazy_channels.json")
+        channel_repo = ChannelRepository(channels_file)
+        game_channel = PersonalChannel("lc_001", "Lazy Gaming", "lazy channel description", "l_001")
+        game_channel.category = "gaming"
+        channel_repo.create_channel(game_channel)
+        channel_repo.create_channel(KidsChannel("lc_002", "Lazy Kids", "lazy channel description", "l_002"))
+
+        lazy_channels = ChannelRepository(channels_file, lazy=True)
+        channel_map = getattr(lazy_channels, "_ChannelRepository__channels")
+        result.assert_equal(len(lazy_channels.get_channels_by_type(ChannelType.KIDS)), 1,
+                            "Kanal tip indeksi ham kayittan kuruldu")
+        result.assert_equal([c.channel_id for c in lazy_channels.get_channel_by_category("GAMING")], ["lc_001"],
+                            "Kategori filtresi ham kayit uzerinden calisti")
+        result.assert_equal(channel_map.materialized_count(), 2, "Sadece erisilen kanallar kuruldu")
+
+    except Exception as e:
+        result.assert_true(False, f"Lazy materialization testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_binary_snapshot():
+    # codec="binary" snapshot formatı ve kalıcı indeks testleri
+    print_test_header("BINARY SNAPSHOT TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        users_file = os.path.join(temp_dir, "users.bin")
+        repo = UserRepository(users_file, codec="binary")
+        admin = AdminUser("b_001", "binadmin", "b1@test.com", "password_123")
+        repo.create_user(admin)
+        repo.create_user(ViewerUser("b_002", "BinViewer", "b2@test.com", "password_123"))
+        repo.set_user_active("b_002", False)
+
+        with open(users_file, "rb") as f:
+            result.assert_equal(f.read(4), b"VPSN", "Snapshot binary formatta yazildi")
+
+        reloaded = UserRepository(users_file, codec="binary")
+        result.assert_equal(reloaded.get_user_count(), 2, "Kullanicilar binary snapshot'tan yuklendi")
+        result.assert_equal(reloaded.get_user_by_username("binviewer").user_id, "b_002",
+                            "Username indeksi dosyadan geldi")
+        viewer = reloaded.get_user_by_id("b_002")
+        result.assert_true(not viewer.is_active and viewer.role == UserRole.VIEWER, "Rol ve durum korundu")
+        result.assert_equal(reloaded.get_user_by_id("b_001").created_at, admin.created_at,
+                            "Olusturma zamani mikro saniye hassasiyetle korundu")
+        result.assert_raises(DuplicateUserException, reloaded.create_user,
+                             ViewerUser("b_003", "other", "B1@test.com", "password_123"))
+
+        # JSON'dan binary'ye geçiş: format okurken tanınır
+        json_file = os.path.join(temp_dir, "users.json")
+        UserRepository(json_file).create_user(ViewerUser("j_001", "jsonuser", "j1@test.com", "password_123"))
+        migrated = UserRepository(json_file, codec="binary")
+        migrated.set_user_active("j_001", False)
+        result.assert_equal(UserRepository(json_file).get_user_by_username("jsonuser").is_active, False,
+                            "JSON snapshot okundu ve binary olarak yeniden yazildi")
+
+        channels_file = os.path.join(temp_dir, "channels.bin")
+        channel_repo = ChannelRepository(channels_file, codec="binary")
+        kids = KidsChannel("bc_001", "Binary Kids", "binary channel description", "b_001")
+        kids.tags = ["egitim", "çizgi film"]
+        kids.category = "education"
+        channel_repo.create_channel(kids)
+        channel_repo.create_channel(BrandChannel("bc_002", "Binary Brand", "binary channel description", "b_001"))
+        channel_repo.set_channel_status("bc_002", ChannelStatus.SUSPENDED)
+
+        channels = ChannelRepository(channels_file, codec="binary")
+        result.assert_equal(len(channels.get_channels_by_owner("b_001")), 2, "Sahip indeksi dosyadan geldi")
+        result.assert_equal([c.channel_id for c in channels.get_channels_by_type(ChannelType.KIDS)], ["bc_001"],
+                            "Tip indeksi dosyadan geldi")
+        loaded_kids = channels.get_channel_by_id("bc_001")
+        result.assert_true(isinstance(loaded_kids, KidsChannel) and loaded_kids.tags == ["egitim", "çizgi film"],
+                           "Kanal sinifi ve etiketler korundu")
+        result.assert_equal(channels.get_channel_by_id("bc_002").status, ChannelStatus.SUSPENDED,
+                            "Kanal durumu korundu")
+
+        lazy_channels = ChannelRepository(channels_file, lazy=True, codec="binary")
+        result.assert_equal([c.channel_id for c in lazy_channels.get_channel_by_category("education")],
+                            ["bc_001"], "Lazy mod binary snapshot ile calisti")
+
+    except Exception as e:
+        result.assert_true(False, f"Binary snapshot testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_sqlite_repositories():
+    # SqliteUserRepository / SqliteChannelRepository: JSON repository ile aynı API
+    print_test_header("SQLITE REPOSITORY TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        import sqlite3
+        from app.modules.module_1.sqlite_repository import (
+            SqliteChannelRepository,
+            SqliteUserRepository,
+            create_module1_repositories,
+        )
+
+        # Aynı public API: JSON repository'sinin her public metodu/özelliği sqlite'ta da olmalı
+        def public_names(cls):
+            return {name for name in dir(cls) if not name.startswith('_')}
+
+        result.assert_equal(public_names(SqliteUserRepository), public_names(UserRepository),
+                            "SqliteUserRepository API'si UserRepository ile ayni")
+        result.assert_equal(public_names(SqliteChannelRepository), public_names(ChannelRepository),
+                            "SqliteChannelRepository API'si ChannelRepository ile ayni")
+
+        db_file = os.path.join(temp_dir, "module1.db")
+        users = SqliteUserRepository(db_file)
+        users.create_user(AdminUser("s_001", "SqlAdmin", "s1@test.com", "password_123"))
+        users.create_user(ViewerUser("s_002", "sqlviewer", "s2@test.com", "password_123"))
+        result.assert_raises(DuplicateUserException, users.create_user,
+                             ViewerUser("s_003", "SQLADMIN", "s3@test.com", "password_123"))
+        result.assert_equal(users.get_user_by_username("sqladmin").user_id, "s_001",
+                            "Username aramasi buyuk/kucuk harf duyarsiz")
+        result.assert_equal([u.user_id for u in users.get_users_by_role(UserRole.VIEWER)], ["s_002"],
+                            "Rol sorgusu indeksten geldi")
+
+        users.set_user_active("s_002", False)
+        try:
+            with users.batch():
+                users.create_user(ViewerUser("s_004", "batchuser", "s4@test.com", "password_123"))
+                users.create_user(ViewerUser("s_005", "batchuser", "s5@test.com", "password_123"))
+        except DuplicateUserException:
+            pass
+        result.assert_equal(users.get_user_count(), 2, "Basarisiz batch geri alindi")
+
+        report = users.create_users_bulk([
+            {"user_id": "s_006", "username": "bulk6", "email": "s6@test.com", "password": "password_123"},
+            {"user_id": "s_007", "username": "bulk6", "email": "s7@test.com", "password": "password_123"},
+        ])
+        result.assert_equal([r["ok"] for r in report], [True, False], "Toplu eklemede tekrar reddedildi")
+
+        channels = SqliteChannelRepository(db_file, commit_max_ops=10)
+        kids = KidsChannel("sc_001", "Sql Kids", "sqlite channel description", "s_001")
+        kids.category = "Education"
+        channels.create_channel(kids, durable=True)
+        channels.create_channel(BrandChannel("sc_002", "Sql Brand", "sqlite channel description", "s_001"),
+                                durable=False)
+        result.assert_equal(channels.get_pending_write_count(), 1, "durable=False yazma commit bekliyor")
+        channels.increment_channel_video_count("sc_001", 2, durable=False)
+        channels.flush()
+        result.assert_equal(channels.get_pending_write_count(), 0, "flush bekleyen yazmalari commit etti")
+
+        users.close()
+        channels.close()
+
+        reopened_users = SqliteUserRepository(db_file)
+        reopened = SqliteChannelRepository(db_file)
+        result.assert_true(not reopened_users.get_user_by_id("s_002").is_active, "Kullanici durumu kalici")
+        result.assert_equal(len(reopened.get_channels_by_owner("s_001")), 2, "Sahip sorgusu")
+        result.assert_equal([c.channel_id for c in reopened.get_channels_by_type(ChannelType.KIDS)], ["sc_001"],
+                            "Tip sorgusu")
+        result.assert_equal([c.channel_id for c in reopened.get_channel_by_category("education")], ["sc_001"],
+                            "Kategori sorgusu buyuk/kucuk harf duyarsiz")
+        loaded = reopened.get_channel_by_id("sc_001")
+        result.assert_true(isinstance(loaded, KidsChannel) and loaded.video_count == 2,
+                           "Kanal sinifi ve sayac korundu")
+
+        reopened.delete_channel("sc_002")
+        result.assert_raises(ChannelNotFoundException, reopened.get_channel_by_id, "sc_002")
+
+        # refresh: sadece başka bir bağlantının (sürecin) commit'i fark edilir
+        result.assert_true(not reopened_users.refresh(), "Kendi yazmalari refresh'i tetiklemedi")
+        other = sqlite3.connect(db_file)
+        other.execute("UPDATE users SET is_active = 1 WHERE user_id = 's_002'")
+        other.commit()
+        other.close()
+        result.assert_true(reopened_users.refresh(), "Diger baglantinin yazmasi fark edildi")
+        result.assert_true(reopened.refresh() and not reopened.refresh(), "Kanal repository'si de fark etti")
+        result.assert_true(reopened_users.get_user_by_id("s_002").is_active, "Guncel satir okundu")
+        result.assert_equal((reopened_users.flush(), reopened_users.get_pending_write_count()), (True, 0),
+                            "Kullanici flush'i bekleyen yazma birakmadi")
+        reopened_users.close()
+        reopened.close()
+
+        # JSON dosyalarından ilk açılışta içe aktarma
+        json_dir = os.path.join(temp_dir, "json_data")
+        os.makedirs(json_dir)
+        UserRepository(os.path.join(json_dir, "users.json")).create_user(
+            ViewerUser("m_001", "migrated", "m1@test.com", "password_123"))
+        ChannelRepository(os.path.join(json_dir, "channels.json")).create_channel(
+            PersonalChannel("mc_001", "Migrated", "migrated channel description", "m_001"))
+        migrated_users, migrated_channels = create_module1_repositories("sqlite", json_dir)
+        result.assert_equal(migrated_users.get_user_by_username("migrated").user_id, "m_001",
+                            "Kullanicilar JSON'dan aktarildi")
+        result.assert_equal(migrated_channels.get_channel_count(), 1, "Kanallar JSON'dan aktarildi")
+        migrated_users.close()
+        migrated_channels.close()
+
+    except Exception as e:
+        result.assert_true(False, f"Sqlite repository testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_sharded_snapshots():
+    # Shard modu: kayıtlar id hash'ine göre N dosyaya bölünür, değişiklikte sadece ilgili shard yazılır
+    print_test_header("SHARD DOSYA DUZENI TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        users_file = os.path.join(temp_dir, "users.json")
+        channels_file = os.path.join(temp_dir, "channels.json")
+        plain = UserRepository(users_file)
+        plain.create_users_bulk([{"user_id": f"sh_{i:03d}", "username": f"shard{i}", "email": f"sh{i}@test.com",
+                                  "password": "password_123"} for i in range(40)])
+
+        # Tek dosyadan geçiş: ilk açılışta shard'lara dağıtılır, eski dosya yedeklenir
+        users = UserRepository(users_file, shards=4)
+        shard_dir = os.path.join(temp_dir, "users.shards")
+        result.assert_true(not os.path.exists(users_file) and os.path.exists(users_file + ".pre-shard"),
+                           "Tek dosya yedeklendi")
+        result.assert_equal(sorted(f for f in os.listdir(shard_dir) if f.startswith("users.")),
+                            [f"users.4-00{i}.json" for i in range(4)], "4 shard dosyasi yazildi")
+
+        before = {f: os.path.getmtime(os.path.join(shard_dir, f)) for f in os.listdir(shard_dir)}
+        time.sleep(0.02)
+        users.set_user_active("sh_007", False)
+        changed = [f for f in before if os.path.getmtime(os.path.join(shard_dir, f)) != before[f]]
+        result.assert_equal(len(changed), 1, "Degisiklik sadece kendi shard'ini yeniden yazdi")
+
+        # Shard sayısı değişince yeni düzene yeniden dağıtılır, eski dosyalar silinir
+        resharded = UserRepository(users_file, shards=8)
+        result.assert_equal(resharded.get_user_count(), 40, "Yeniden dagitimda kayit kaybi yok")
+        result.assert_true(not resharded.get_user_by_id("sh_007").is_active, "Shard'daki degisiklik kalici")
+        result.assert_equal(len([f for f in os.listdir(shard_dir) if f.startswith("users.")]), 8,
+                            "Eski duzenin dosyalari silindi")
+
+        channels = ChannelRepository(channels_file, shards=3)
+        channels.create_channel(PersonalChannel("shc_001", "Sharded", "sharded channel description", "sh_001"))
+        channels.increment_channel_video_count("shc_001", 3)
+        reopened = ChannelRepository(channels_file, shards=3)
+        result.assert_equal(reopened.get_channel_by_id("shc_001").video_count, 3, "Kanal shard'i kalici")
+
+    except Exception as e:
+        result.assert_true(False, f"Sharded snapshot testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_fragment_cache():
+    # Parça önbelleği: kayıtta sadece değişen kayıtlar yeniden kodlanır, çıktı json.dump ile aynı kalır
+    print_test_header("KAYIT PARCA ONBELLEGI TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        users_file = os.path.join(temp_dir, "users.json")
+        users = UserRepository(users_file)
+        users.create_users_bulk([{"user_id": f"fc_{i:03d}", "username": f"frag{i}", "email": f"fc{i}@test.com",
+                                  "password": "password_123"} for i in range(30)])
+        fragments = getattr(users, "_UserRepository__fragments")
+
+        encoded = fragments.encoded
+        users.set_user_active("fc_004", False)
+        result.assert_equal(fragments.encoded - encoded, 1, "Tek degisiklikte tek kayit yeniden kodlandi")
+
+        with open(users_file, 'r', encoding='utf-8') as file:
+            text = file.read()
+        data = json.loads(text)
+        result.assert_equal(text, json.dumps(data, indent=2, ensure_ascii=False), "Cikti json.dump ile ayni")
+        result.assert_true(not data['users']['fc_004']['is_active'], "Degisiklik dosyada")
+
+        # Repository dışından değiştirilen kayıt mark_dirty ile işaretlenir
+        user = users.get_user_by_id("fc_010")
+        user.is_active = False
+        users.mark_dirty("fc_010")
+        getattr(users, "_save_changes")()
+        reopened = UserRepository(users_file)
+        result.assert_true(not reopened.get_user_by_id("fc_010").is_active, "mark_dirty ile degisiklik kaydedildi")
+
+        channels_file = os.path.join(temp_dir, "channels.json")
+        channels = ChannelRepository(channels_file, shards=2)
+        for i in range(6):
+            channels.create_channel(PersonalChannel(f"fch_{i:02d}", f"Frag {i}", "fragment channel description",
+                                                    "fc_001"))
+        channel_fragments = getattr(channels, "_ChannelRepository__fragments")
+        encoded = channel_fragments.encoded
+        channels.increment_channel_video_count("fch_03", 2)
+        result.assert_equal(channel_fragments.encoded - encoded, 1, "Shard modunda da tek kayit kodlandi")
+        result.assert_equal(ChannelRepository(channels_file, shards=2).get_channel_by_id("fch_03").video_count, 2,
+                            "Shard parcasi kalici")
+
+    except Exception as e:
+        result.assert_true(False, f"Fragment cache testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_snapshot_codecs():
+    # Codec katmanı: her codec ile yazılan snapshot, format belirtilmeden geri okunabilmeli
+    print_test_header("SNAPSHOT CODEC TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        from app.modules.module_1.snapshot_codecs import codec_names, get_codec
+
+        sizes = {}
+        for name in codec_names():
+            users_file = os.path.join(temp_dir, f"users.{name}")
+            repo = UserRepository(users_file, codec=name)
+            repo.create_users_bulk([{"user_id": f"cd_{i:02d}", "username": f"codec{i}", "email": f"cd{i}@test.com",
+                                     "password": "password_123"} for i in range(20)])
+            repo.set_user_active("cd_05", False)
+            sizes[name] = os.path.getsize(users_file)
+
+            # Okuyan taraf farklı codec'le açılsa da format dosyadan tanınır
+            for lazy in (False, True):
+                reopened = UserRepository(users_file, lazy=lazy)
+                result.assert_true(reopened.get_user_count() == 20 and not reopened.get_user_by_id("cd_05").is_active,
+                                   f"{name} snapshot okundu (lazy={lazy})")
+
+        result.assert_true(sizes["json-compact"] < sizes["json"], "Girintisiz JSON daha kucuk")
+        result.assert_true(sizes["json-gzip"] < sizes["json-compact"], "gzip JSON daha kucuk")
+        with open(os.path.join(temp_dir, "users.json-gzip"), "rb") as f:
+            result.assert_equal(f.read(2), b"\x1f\x8b", "gzip snapshot sikistirilmis yazildi")
+        result.assert_raises(ValueError, get_codec, "yaml")
+
+        channels_file = os.path.join(temp_dir, "channels.json")
+        channels = ChannelRepository(channels_file, codec="json-gzip", shards=2)
+        channels.create_channel(PersonalChannel("cdc_01", "Codec", "codec channel description", "cd_01"))
+        result.assert_equal(ChannelRepository(channels_file, shards=2).get_channel_by_id("cdc_01").name, "Codec",
+                            "gzip shard dosyalari okundu")
+
+    except Exception as e:
+        result.assert_true(False, f"Snapshot codec testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_shared_repositories():
+    # shared=True: aynı dosyaları kullanan repository'ler (süreçler) birbirinin değişikliğini görür ve ezmez
+    print_test_header("COKLU SUREC (SHARED) TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        users_file = os.path.join(temp_dir, "users.json")
+        first = UserRepository(users_file, shared=True)
+        second = UserRepository(users_file, shared=True)
+        first.create_user(ViewerUser("sp_001", "shared1", "sp1@test.com", "password_123"))
+        second.create_user(ViewerUser("sp_002", "shared2", "sp2@test.com", "password_123"))
+        result.assert_equal(first.get_user_count(), 2, "Diger surecin kaydi okundu")
+        result.assert_equal(UserRepository(users_file).get_user_count(), 2, "Son yazan digerini ezmedi")
+        result.assert_raises(DuplicateUserException, second.create_user,
+                             ViewerUser("sp_003", "SHARED1", "sp3@test.com", "password_123"))
+
+        # Sadece değişen kayıt yeniden yüklenir, diğer nesneler aynı kalır
+        untouched = first.get_user_by_id("sp_001")
+        second.set_user_active("sp_002", False)
+        result.assert_true(first.refresh(), "Degisiklik fark edildi")
+        result.assert_true(not first.get_user_by_id("sp_002").is_active, "Degisen kayit uygulandi")
+        result.assert_true(first.get_user_by_id("sp_001") is untouched, "Degismeyen kayit yeniden kurulmadi")
+        result.assert_true(not first.refresh(), "Dosya degismediyse yeniden okunmadi")
+
+        journal_file = os.path.join(temp_dir, "journal_users.json")
+        writer = UserRepository(journal_file, journal=True, shared=True)
+        reader = UserRepository(journal_file, journal=True, shared=True)
+        writer.create_user(ViewerUser("sj_001", "journal1", "sj1@test.com", "password_123"))
+        result.assert_equal(reader.get_user_by_username("journal1").user_id, "sj_001",
+                            "Journal'a eklenen satir diger surecte okundu")
+        writer.close()
+        reader.close()
+
+        # Gerçek süreçler: aynı kanalın sayacını eşzamanlı artırınca hiçbir artış kaybolmamalı
+        channels_file = os.path.join(temp_dir, "channels.json")
+        ChannelRepository(channels_file, shards=2, shared=True).create_channel(
+            PersonalChannel("spc_001", "Shared", "shared channel description", "sp_001"))
+        script = (
+            "import sys, contextlib, io\n"
+            f"sys.path.insert(0, {project_root!r})\n"
+            "from app.modules.module_1.repository import ChannelRepository\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            f"    repo = ChannelRepository({channels_file!r}, shards=2, shared=True)\n"
+            "    for _ in range(10):\n"
+            "        repo.increment_channel_video_count('spc_001')\n"
+        )
+        workers = [subprocess.Popen([sys.executable, "-c", script]) for _ in range(4)]
+        codes = [worker.wait(timeout=60) for worker in workers]
+        result.assert_equal(codes, [0, 0, 0, 0], "Surecler hatasiz bitti")
+        result.assert_equal(ChannelRepository(channels_file, shards=2).get_channel_by_id("spc_001").video_count,
+                            40, "Eszamanli artislarin hicbiri kaybolmadi")
+
+    except Exception as e:
+        result.assert_true(False, f"Shared repository testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_write_behind():
+    # Write-behind: değişiklik hemen döner, arka plan thread'i birleştirilmiş yazmaları yapar
+    print_test_header("WRITE-BEHIND TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        import queue
+        import threading
+        from app.modules.module_1.persistence import WriteBehindQueue
+
+        # Yavaş yazma: ilk yazma serbest bırakılana kadar bekler, bu sırada gelen değişiklikler birleşir
+        release = threading.Event()
+        batches = []
+
+        def slow_write(ids):
+            release.wait(5)
+            batches.append(list(ids))
+
+        writer = WriteBehindQueue(slow_write, max_pending=3, backpressure="error")
+        started = time.perf_counter()
+        writer.submit(["a"])
+        result.assert_true(time.perf_counter() - started < 0.5, "submit yazmayi beklemedi")
+        time.sleep(0.05)
+        for _ in range(10):
+            writer.submit(["b", "c"])
+        result.assert_equal(writer.pending, 3, "Ayni id'ler kuyrukta birlesti (yazilan a + b, c)")
+        writer.submit(["d"])
+        try:
+            writer.submit(["e"])
+            result.assert_true(False, "Dolu kuyrukta queue.Full bekleniyordu")
+        except queue.Full:
+            result.assert_true(True, "backpressure='error' ile queue.Full")
+        result.assert_true(not writer.flush(timeout=0.05), "Yazma bitmeden flush(timeout) False dondu")
+        release.set()
+        result.assert_true(writer.flush(timeout=5), "flush tum yazmalari bekledi")
+        result.assert_equal(batches, [["a"], ["b", "c", "d"]], "Bekleyen degisiklikler tek yazmada yazildi")
+        writer.close()
+        try:
+            writer.submit(["f"])
+            result.assert_true(False, "Kapali kuyruga ekleme hata vermeliydi")
+        except RuntimeError:
+            result.assert_true(True, "Kapali kuyruk yeni degisiklik kabul etmiyor")
+
+        # Repository entegrasyonu: close() kuyruğu boşaltır
+        users_file = os.path.join(temp_dir, "users.json")
+        users = UserRepository(users_file, write_behind=True)
+        users.create_users_bulk([{"user_id": f"wb_{i:03d}", "username": f"wbuser{i}", "email": f"wb{i}@test.com",
+                                  "password": "password_123"} for i in range(20)])
+        for i in range(20):
+            users.set_user_active(f"wb_{i:03d}", False)
+        users.close()
+        reopened = UserRepository(users_file)
+        result.assert_true(all(not reopened.get_user_by_id(f"wb_{i:03d}").is_active for i in range(20)),
+                           "close() bekleyen kullanici yazmalarini bosaltti")
+
+        channels_file = os.path.join(temp_dir, "channels.json")
+        channels = ChannelRepository(channels_file, write_behind=True)
+        channels.create_channel(PersonalChannel("wbch_01", "Write Behind", "write behind channel", "wb_001"))
+        for _ in range(50):
+            channels.increment_channel_video_count("wbch_01")
+        result.assert_true(channels.flush(timeout=5), "Kanal flush(timeout) tamamlandi")
+        result.assert_equal(channels.get_pending_write_count(), 0, "Bekleyen kanal yazmasi kalmadi")
+        result.assert_equal(ChannelRepository(channels_file).get_channel_by_id("wbch_01").video_count, 50,
+                            "Kanal degisiklikleri kalici")
+        channels.close()
+
+        try:
+            UserRepository(os.path.join(temp_dir, "shared.json"), shared=True, write_behind=True)
+            result.assert_true(False, "shared + block kombinasyonu reddedilmeliydi")
+        except ValueError:
+            result.assert_true(True, "shared modda backpressure='block' reddedildi")
+
+    except Exception as e:
+        result.assert_true(False, f"Write-behind testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_log_shipping_replica():
+    # Log shipping: primary dizinindeki değişiklikler replica dizinine taşınır, replica read-only okunur
+    print_test_header("LOG SHIPPING REPLICA TESTLERI")
+    result = TestResult()
+    primary_dir = tempfile.mkdtemp()
+    replica_dir = tempfile.mkdtemp()
+
+    try:
+        from app.modules.module_1.replication import LogShippingReplica
+
+        users = UserRepository(os.path.join(primary_dir, "users.json"), journal=True, shared=True)
+        channels = ChannelRepository(os.path.join(primary_dir, "channels.json"), shards=2, shared=True)
+        users.create_users_bulk([{"user_id": f"rp_{i:02d}", "username": f"replica{i}", "email": f"rp{i}@test.com",
+                                  "password": "password_123"} for i in range(10)])
+        for i in range(4):
+            channels.create_channel(PersonalChannel(f"rpch_{i}", f"Replica {i}", "replica channel", "rp_01"))
+
+        replica = LogShippingReplica(primary_dir, replica_dir, fsync=False)
+        result.assert_true(not replica.status()['in_sync'], "Ilk senkronizasyondan once gecikme var")
+        result.assert_true(replica.sync() > 0, "Ilk senkronizasyonda dosyalar tasindi")
+        result.assert_true(replica.status()['in_sync'], "Senkronizasyon sonrasi gecikme yok")
+
+        replica_users, replica_channels = replica.open_repositories()
+        result.assert_equal(replica_users.get_user_count(), 10, "Replica kullanicilari okundu")
+        result.assert_equal(len(replica_channels.get_channels_by_owner("rp_01")), 4, "Replica kanallari okundu")
+        try:
+            replica_users.set_user_active("rp_01", False)
+            result.assert_true(False, "Read-only replica'ya yazma reddedilmeliydi")
+        except PermissionError:
+            result.assert_true(True, "Read-only replica yazmayi reddetti")
+
+        # Journal'a eklenen satırlar dosyanın sonuna eklenerek taşınır
+        users.set_user_active("rp_03", False)
+        channels.increment_channel_video_count("rpch_2", 3)
+        status = replica.status()
+        result.assert_true(status['pending_files'] >= 2 and status['pending_bytes'] > 0, "Gecikme olculdu")
+        replica_journal = os.path.join(replica_dir, "users.json.journal")
+        journal_inode = os.stat(replica_journal).st_ino
+        result.assert_equal(replica.sync(), 2, "Sadece degisen journal ve shard tasindi")
+        result.assert_equal(os.stat(replica_journal).st_ino, journal_inode, "Journal kopyalanmadan sonuna eklendi")
+        result.assert_true(not replica_users.get_user_by_id("rp_03").is_active, "Journal degisikligi replica'da")
+        result.assert_equal(replica_channels.get_channel_by_id("rpch_2").video_count, 3,
+                            "Shard degisikligi replica'da")
+
+        # Yeniden başlatılan replica kaldığı yerden devam eder
+        restarted = LogShippingReplica(primary_dir, replica_dir, fsync=False)
+        result.assert_equal(restarted.sync(), 0, "Yeniden baslatmada degismeyen dosyalar tasinmadi")
+
+        users.set_user_active("rp_09", False)
+        replica.promote()
+        result.assert_true(not replica_users.get_user_by_id("rp_09").is_active, "Yukseltmede son degisiklik tasindi")
+        result.assert_true(replica.promoted and not replica_users.read_only, "Replica yukseltildi")
+        replica_users.set_user_active("rp_04", False)
+        result.assert_true(not UserRepository(os.path.join(replica_dir, "users.json"), journal=True)
+                           .get_user_by_id("rp_04").is_active, "Yukseltilen replica'ya yazildi")
+        try:
+            replica.sync()
+            result.assert_true(False, "Yukseltilen replica senkronize edilmemeli")
+        except RuntimeError:
+            result.assert_true(True, "Yukseltme sonrasi log shipping durdu")
+
+    except Exception as e:
+        result.assert_true(False, f"Log shipping replica testing failed: {e}")
+
+    finally:
+        shutil.rmtree(primary_dir, ignore_errors=True)
+        shutil.rmtree(replica_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_update_delete_apis():
+    # update/delete/rename_owner: bellekteki kayıt, indeksler ve dosya tutarlı kalmalı
+    print_test_header("GUNCELLEME / SILME API TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        from app.modules.module_1.sqlite_repository import SqliteChannelRepository
+
+        users_file = os.path.join(temp_dir, "users.json")
+        users = UserRepository(users_file, journal=True)
+        users.create_users_bulk([{"user_id": f"ud_{i}", "username": f"updel{i}", "email": f"ud{i}@test.com",
+                                  "password": "password_123"} for i in range(3)])
+
+        renamed = ViewerUser("ud_0", "renamed0", "renamed0@test.com", "password_123")
+        users.update_user(renamed)
+        result.assert_equal(users.get_user_by_username("renamed0").user_id, "ud_0", "Yeni username indekslendi")
+        try:
+            users.get_user_by_username("updel0")
+            result.assert_true(False, "Eski username indeksten silinmeliydi")
+        except UserNotFoundException:
+            result.assert_true(True, "Eski username indeksten silindi")
+        try:
+            users.update_user(ViewerUser("ud_1", "renamed0", "other@test.com", "password_123"))
+            result.assert_true(False, "Baska kullanicinin username'i reddedilmeliydi")
+        except DuplicateUserException:
+            result.assert_true(True, "update_user duplicate username reddetti")
+
+        # Saklanan nesne yerinde değiştirilip geri verilirse eski anahtarlar yine de silinmeli
+        in_place = users.get_user_by_id("ud_1")
+        in_place.username = "inplace1"
+        in_place.email = "inplace1@test.com"
+        users.update_user(in_place)
+        result.assert_equal(users.get_user_by_username("inplace1").user_id, "ud_1",
+                            "Yerinde degisen username indekslendi")
+        try:
+            users.get_user_by_username("updel1")
+            result.assert_true(False, "Yerinde degisen kullanicinin eski username'i silinmeliydi")
+        except UserNotFoundException:
+            result.assert_true(True, "Yerinde degisen kullanicinin eski username'i silindi")
+        users.create_user(ViewerUser("ud_3", "updel1", "ud1@test.com", "password_123"))
+        result.assert_equal(users.get_user_by_username("updel1").user_id, "ud_3",
+                            "Eski username/email yeni kullaniciya verilebildi")
+        users.delete_user("ud_3")
+
+        users.delete_user("ud_2")
+        try:
+            users.delete_user("ud_2")
+            result.assert_true(False, "Olmayan kullanici silinememeli")
+        except UserNotFoundException:
+            result.assert_true(True, "Olmayan kullanici icin UserNotFoundException")
+        reopened = UserRepository(users_file, journal=True)
+        result.assert_equal(reopened.get_user_count(), 2, "Silme kalici")
+        result.assert_equal(reopened.get_user_by_username("renamed0").email, "renamed0@test.com",
+                            "Guncelleme kalici")
+
+        # Kanal indeksleri set tabanlı: güncelleme/silme/sahip değişikliği her indekste tutarlı
+        for codec in ("json", "binary"):
+            channels_file = os.path.join(temp_dir, f"channels.{codec}")
+            channels = ChannelRepository(channels_file, codec=codec)
+            for i in range(4):
+                channels.create_channel(PersonalChannel(f"udch_{i}", f"Update {i}", "update channel", "owner_a"))
+
+            moved = PersonalChannel("udch_1", "Update 1", "update channel", "owner_b")
+            channels.update_channel(moved)
+            channels.delete_channel("udch_2")
+            result.assert_equal([ch.channel_id for ch in channels.get_channels_by_owner("owner_a")],
+                                ["udch_0", "udch_3"], f"{codec}: owner indeksi guncellendi")
+            result.assert_equal(channels.rename_owner("owner_a", "owner_c"), 2, f"{codec}: rename_owner sayisi")
+            result.assert_equal(channels.get_channels_by_owner("owner_a"), [], f"{codec}: eski sahip bos")
+
+            try:
+                with channels.batch():
+                    channels.delete_channel("udch_0")
+                    channels.rename_owner("owner_c", "owner_d")
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+            result.assert_equal(len(channels.get_channels_by_owner("owner_c")), 2, f"{codec}: batch geri alindi")
+
+            reopened = ChannelRepository(channels_file)
+            result.assert_equal([ch.channel_id for ch in reopened.get_channels_by_owner("owner_c")],
+                                ["udch_0", "udch_3"], f"{codec}: sahip degisikligi kalici")
+            result.assert_equal(len(reopened.get_channels_by_type(ChannelType.PERSONAL)), 3,
+                                f"{codec}: tip indeksi kalici")
+
+        sqlite_channels = SqliteChannelRepository(os.path.join(temp_dir, "module1.db"))
+        sqlite_channels.create_channel(PersonalChannel("sqch_0", "Sqlite 0", "sqlite channel", "owner_a"))
+        result.assert_equal(sqlite_channels.rename_owner("owner_a", "owner_b"), 1, "Sqlite rename_owner")
+        result.assert_equal(sqlite_channels.get_channel_by_id("sqch_0").owner_id, "owner_b", "Sqlite sahip degisti")
+        sqlite_channels.close()
+
+    except Exception as e:
+        result.assert_true(False, f"Update/delete API testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_channel_query_indexes():
+    # Kategori/durum indeksleri: oluşturma, yükleme ve değişikliklerde tutarlı, birleşik sorgular kesişimle
+    print_test_header("KANAL SORGU INDEKSI TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        from app.modules.module_1.services import ChannelService
+
+        channels_file = os.path.join(temp_dir, "channels.json")
+        channels = ChannelRepository(channels_file)
+        for i, (cls, category) in enumerate([(PersonalChannel, "Müzik"), (BrandChannel, "MÜZIK"),
+                                             (PersonalChannel, "gaming"), (KidsChannel, "müzik")]):
+            channel = cls(f"qch_{i}", f"Query {i}", "query channel description", "q_owner")
+            channel.category = category
+            channels.create_channel(channel)
+
+        result.assert_equal([ch.channel_id for ch in channels.get_channel_by_category("MüZiK")],
+                            ["qch_0", "qch_1", "qch_3"], "Kategori buyuk/kucuk harf duyarsiz")
+
+        channels.set_channel_status("qch_3", ChannelStatus.SUSPENDED)
+        result.assert_equal([ch.channel_id for ch in channels.find_channels(category="müzik",
+                                                                             status=ChannelStatus.ACTIVE)],
+                            ["qch_0", "qch_1"], "Durum degisikligi indekste")
+        result.assert_equal([ch.channel_id for ch in channels.find_channels(
+            category="müzik", channel_type=ChannelType.PERSONAL, status="active")], ["qch_0"],
+            "Kategori x tip x durum kesisimi")
+
+        # Yerinde değiştirilip update_channel ile kaydedilen kanal eski kategoriden çıkar
+        channel = channels.get_channel_by_id("qch_0")
+        channel.category = "Gaming"
+        channels.update_channel(channel)
+        result.assert_equal([ch.channel_id for ch in channels.get_channel_by_category("gaming")],
+                            ["qch_2", "qch_0"], "Kategori degisikligi indekste")
+        result.assert_equal(len(channels.get_channel_by_category("müzik")), 2, "Eski kategori kovasi guncellendi")
+
+        try:
+            with channels.batch():
+                channels.set_channel_status("qch_1", ChannelStatus.ARCHIVED)
+                result.assert_equal(len(channels.find_channels(status=ChannelStatus.ARCHIVED)), 1,
+                                    "Batch icinde durum indeksi guncel")
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        result.assert_equal(channels.find_channels(status=ChannelStatus.ARCHIVED), [],
+                            "Batch geri alininca durum indeksi eski haline dondu")
+
+        for lazy in (False, True):
+            reopened = ChannelRepository(channels_file, lazy=lazy)
+            result.assert_equal([ch.channel_id for ch in reopened.find_channels(category="gaming")],
+                                ["qch_0", "qch_2"], f"lazy={lazy}: yuklemede kategori indeksi")
+            result.assert_equal([ch.channel_id for ch in reopened.find_channels(status=ChannelStatus.SUSPENDED)],
+                                ["qch_3"], f"lazy={lazy}: yuklemede durum indeksi")
+
+        service = ChannelService(channels, UserRepository(os.path.join(temp_dir, "users.json")))
+        result.assert_equal([ch.channel_id for ch in service.list_channels(category="MÜZIK",
+                                                                            channel_type=ChannelType.BRAND)],
+                            ["qch_1"], "ChannelService.list_channels filtreleri birlikte uyguluyor")
+
+    except Exception as e:
+        result.assert_true(False, f"Channel query index testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_category_key_backends():
+    # JSON ve sqlite kanal repository'leri kategoriyi aynı category_key ile katlar; aynı sorgu aynı sonucu verir
+    print_test_header("KATEGORI ANAHTARI BACKEND TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        import sqlite3
+        from app.modules.module_1.sqlite_repository import SqliteChannelRepository
+
+        db_file = os.path.join(temp_dir, "module1.db")
+        json_channels = ChannelRepository(os.path.join(temp_dir, "channels.json"))
+        sqlite_channels = SqliteChannelRepository(db_file)
+        for i, category in enumerate(["Straße", "MÜZİK", "müzik", "Müzik", "ılık", "Gaming"]):
+            for repo in (json_channels, sqlite_channels):
+                channel = PersonalChannel(f"ck_{i}", f"Category {i}", "category channel description", "ck_owner")
+                channel.category = category
+                repo.create_channel(channel)
+
+        for query in ("STRASSE", "straße", "müzik", "MÜZİK", "MÜZIK", "ILIK", "gaming", "yok"):
+            expected = [ch.channel_id for ch in json_channels.get_channel_by_category(query)]
+            result.assert_equal([ch.channel_id for ch in sqlite_channels.get_channel_by_category(query)], expected,
+                                f"'{query}' iki backend'de ayni")
+            result.assert_equal([ch.channel_id for ch in sqlite_channels.find_channels(category=query,
+                                                                                        owner_id="ck_owner")],
+                                [ch.channel_id for ch in json_channels.find_channels(category=query,
+                                                                                      owner_id="ck_owner")],
+                                f"'{query}' find_channels iki backend'de ayni")
+        result.assert_equal([ch.channel_id for ch in json_channels.get_channel_by_category("MÜZİK")],
+                            ["ck_1", "ck_2", "ck_3"], "Türkçe I/İ katlamasi")
+        result.assert_equal([ch.channel_id for ch in json_channels.get_channel_by_category("STRASSE")],
+                            ["ck_0"], "casefold katlamasi")
+        sqlite_channels.close()
+
+        # Eski (sürüm 1) veritabanındaki lower() anahtarları açılışta yeniden hesaplanır
+        conn = sqlite3.connect(db_file)
+        conn.execute("UPDATE channels SET category_key = lower(category)")
+        conn.execute("PRAGMA user_version=1")
+        conn.commit()
+        conn.close()
+        migrated = SqliteChannelRepository(db_file)
+        result.assert_equal([ch.channel_id for ch in migrated.get_channel_by_category("müzik")],
+                            ["ck_1", "ck_2", "ck_3"], "Sürüm 1 veritabani anahtarlari tasindi")
+        migrated.close()
+
+    except Exception as e:
+        result.assert_true(False, f"Category key backend testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+
+def test_create_channel_rollback():
+    # Kayıt başarısız olursa create_channel kanalı, indeks kovalarını ve bekleyen kayıt işaretini geri almalı
+    print_test_header("KANAL OLUSTURMA GERI ALMA TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    def fail_persist(channel_ids, durable=None):
+        raise OSError("disk full")
+
+    def index_sizes(repo):
+        return [len(getattr(repo, f"_ChannelRepository__{name}"))
+                for name in ("owner_index", "type_index", "category_index", "status_index", "indexed")]
+
+    try:
+        for shared in (False, True):
+            repo = ChannelRepository(os.path.join(temp_dir, f"rollback_{shared}.json"), shared=shared)
+            repo.create_channel(PersonalChannel("rb_001", "Kept Channel", "kept channel description", "rb_owner"))
+            before = index_sizes(repo)
+
+            failing = BrandChannel("rb_002", "Failed Channel", "failed channel description", "rb_other")
+            failing.category = "Rollback"
+            repo._persist_channels = fail_persist
+            result.assert_raises(OSError, repo.create_channel, failing)
+            del repo._persist_channels
+
+            result.assert_equal(index_sizes(repo), before, f"Indeks boyutlari degismedi (shared={shared})")
+            result.assert_equal(repo.find_channels(owner_id="rb_other"), [], "Sahip indeksinde kalmadi")
+            result.assert_equal(repo.get_channel_by_category("Rollback"), [], "Kategori indeksinde kalmadi")
+            result.assert_equal(repo.get_channel_count(), 1, "Kanal geri alindi")
+            result.assert_true("rb_002" not in getattr(repo, "_ChannelRepository__pending"),
+                               f"Bekleyen kayit isareti temizlendi (shared={shared})")
+
+            repo.create_channel(failing)
+            result.assert_equal([ch.channel_id for ch in repo.find_channels(owner_id="rb_other")], ["rb_002"],
+                                "Ayni kanal tekrar olusturulabildi")
+
+    except Exception as e:
+        result.assert_true(False, f"Create channel rollback testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
+def test_main_exit_sqlite():
+    # main.py ana menüsünden "0" ile çıkış sqlite backend'inde de repository'leri flush edip kapatmalı
+    print_test_header("MAIN CIKIS (SQLITE) TESTLERI")
+    result = TestResult()
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        env = dict(os.environ, MODULE1_BACKEND="sqlite", MODULE1_DATA_DIR=temp_dir)
+        process = subprocess.run([sys.executable, os.path.join(project_root, "main.py")], input="0\n",
+                                 capture_output=True, text=True, encoding="utf-8", env=env, timeout=60)
+        result.assert_equal(process.returncode, 0, "main.py hatasiz bitti")
+        result.assert_true("Çıkış" in process.stdout, "Cikis menusu calisti")
+        result.assert_true("Hata:" not in process.stdout, "Cikista hata yazilmadi")
+        result.assert_true(os.path.exists(os.path.join(temp_dir, "module1.db")), "Veritabani data dizininde")
+
+    except Exception as e:
+        result.assert_true(False, f"Main exit testing failed: {e}")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    result.print_summary()
+    return result
+
 def run_all_tests():
     # Tüm testleri çalıştır
     print(" " * 60)
@@ -383,6 +1537,82 @@ def run_all_tests():
         extra_result = test_additional_behaviors()
         all_results.append(("Additional Behaviors", extra_result))
 
+        # 8. Journal kalıcılık testleri
+        journal_result = test_user_journal()
+        all_results.append(("User Journal", journal_result))
+
+        # 9. Group commit testleri
+        group_commit_result = test_channel_group_commit()
+        all_results.append(("Channel Group Commit", group_commit_result))
+
+        # 10. Batch (unit-of-work) testleri
+        batch_result = test_repository_batch()
+        all_results.append(("Repository Batch", batch_result))
+
+        # 11. Toplu kullanıcı ekleme testleri
+        bulk_result = test_user_bulk_import()
+        all_results.append(("User Bulk Import", bulk_result))
+
+        # 12. Streaming loader testleri
+        streaming_result = test_streaming_loader()
+        all_results.append(("Streaming Loader", streaming_result))
+
+        # 13. Lazy materialization testleri
+        lazy_result = test_lazy_materialization()
+        all_results.append(("Lazy Materialization", lazy_result))
+
+        # 14. Binary snapshot testleri
+        binary_result = test_binary_snapshot()
+        all_results.append(("Binary Snapshot", binary_result))
+
+        # 15. Sqlite repository testleri
+        sqlite_result = test_sqlite_repositories()
+        all_results.append(("Sqlite Repositories", sqlite_result))
+
+        # 16. Shard dosya düzeni testleri
+        shard_result = test_sharded_snapshots()
+        all_results.append(("Sharded Snapshots", shard_result))
+
+        # 17. Kayıt parça önbelleği testleri
+        fragment_result = test_fragment_cache()
+        all_results.append(("Fragment Cache", fragment_result))
+
+        # 18. Snapshot codec testleri
+        codec_result = test_snapshot_codecs()
+        all_results.append(("Snapshot Codecs", codec_result))
+
+        # 19. Çoklu süreç (shared) testleri
+        shared_result = test_shared_repositories()
+        all_results.append(("Shared Repositories", shared_result))
+
+        # 20. Write-behind testleri
+        write_behind_result = test_write_behind()
+        all_results.append(("Write Behind", write_behind_result))
+
+        # 21. Log shipping replica testleri
+        replica_result = test_log_shipping_replica()
+        all_results.append(("Log Shipping Replica", replica_result))
+
+        # 22. Güncelleme/silme API testleri
+        update_delete_result = test_update_delete_apis()
+        all_results.append(("Update/Delete APIs", update_delete_result))
+
+        # 23. Kanal sorgu indeksi testleri
+        query_result = test_channel_query_indexes()
+        all_results.append(("Channel Query Indexes", query_result))
+
+        # 24. Kategori anahtarı backend testleri
+        category_result = test_category_key_backends()
+        all_results.append(("Category Key Backends", category_result))
+
+        # 25. Kanal oluşturma geri alma testleri
+        rollback_result = test_create_channel_rollback()
+        all_results.append(("Create Channel Rollback", rollback_result))
+
+        # 26. main.py çıkış (sqlite) testleri
+        exit_result = test_main_exit_sqlite()
+        all_results.append(("Main Exit Sqlite", exit_result))
+
     except Exception as e:
         print(f"\nSystem >> Test yurutulurken kritik hata : {e}")
         return 1
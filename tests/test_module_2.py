@@ -7,6 +7,9 @@ project_root = os.path.abspath(os.path.join(current_dir, ".."))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import shutil
+import tempfile
+import threading
 import unittest
 from datetime import datetime, timedelta
 
@@ -77,6 +80,37 @@ except ImportError:
         from app.modules.module_2.repository import VideoRepository
 
 
+from app.modules.module_2.repository import PersistentVideoRepository, row_to_video, video_to_row
+from app.modules.module_2.query import VideoQuery
+from app.modules.module_2.search import VideoSearchEngine, _Term
+from app.modules.module_2.sqlite_repository import SqliteVideoRepository
+from app.modules.module_2.mmap_repository import MmapVideoRepository
+
+
+def save_channel_timeline(*repos):
+    """
+    Oluşturulma zamanı eklenme sırasından farklı, bir kısmı yayınlanmış videoları depolara kaydeder
+    ve find_by_channel için karşılaştırma sorgularını döndürür.
+    """
+    base_time = datetime(2024, 1, 1)
+    for i in range(40):
+        video = StandardVideo(f"chan{i % 2}", f"T{i}", "D", 100)
+        video._created_at = base_time + timedelta(hours=(i * 7) % 40)
+        if i % 3 == 0:
+            video._published_at = base_time + timedelta(days=10, hours=40 - i)
+        for repo in repos:
+            repo.save(video)
+    return [
+        {},
+        {"newest_first": True, "limit": 5},
+        {"since": base_time + timedelta(hours=10), "until": base_time + timedelta(hours=20)},
+        {"since": base_time + timedelta(hours=30), "newest_first": True},
+        {"order_by": "published_at"},
+        {"order_by": "published_at", "newest_first": True, "limit": 3,
+         "until": base_time + timedelta(days=10, hours=30)},
+    ]
+
+
 class TestVideoBaseAndUtils(unittest.TestCase):
     """Base sınıf, yardımcı fonksiyonlar ve exception testleri."""
 
@@ -147,6 +181,30 @@ class TestVideoImplementations(unittest.TestCase):
         self.assertEqual(v.duration_seconds, 3600)
 
 
+def save_tagged_videos(*repos):
+    """
+    Farklı kanallarda, etiketleri çakışan (bir kısmında tekrarlı) videoları depolara kaydeder ve
+    find_by_tags için karşılaştırma sorgularını döndürür.
+    """
+    tag_pool = ["python", "oyun", "müzik", "eğitim", "vlog"]
+    for i in range(40):
+        tags = [tag_pool[j] for j in range(len(tag_pool)) if i % (j + 2) == 0]
+        if i % 7 == 0:
+            tags.append(tags[0] if tags else "python")
+        video = StandardVideo(f"chan{i % 3}", f"T{i}", "D", 100, tags=tags)
+        for repo in repos:
+            repo.save(video)
+    return [
+        (["python"], "all", None),
+        (["python", "oyun"], "all", None),
+        (["python", "oyun", "müzik"], "all", 2),
+        (["oyun", "vlog"], "any", None),
+        (["vlog", "yok"], "any", 3),
+        (["python", "yok"], "all", None),
+        ([], "any", None),
+    ]
+
+
 class TestVideoRepository(unittest.TestCase):
     """Repository CRUD ve Filtreleme testleri."""
 
@@ -195,6 +253,688 @@ class TestVideoRepository(unittest.TestCase):
         self.repo.clear()
         self.assertEqual(self.repo.count(), 0)
 
+    def test_bitmap_indexes_follow_status_and_visibility_changes(self):
+        for video in (self.v1, self.v2, self.v3):
+            self.repo.save(video)
+
+        def ids(**query):
+            return [v.video_id for v in self.repo.filter_videos(**query)]
+
+        self.assertEqual(ids(visibility=VideoVisibility.PUBLIC), [self.v1.video_id, self.v3.video_id])
+        self.assertEqual(ids(video_type="ShortVideo"), [self.v3.video_id])
+
+        # save çağrılmadan yapılan değişiklikler de indekse yansır
+        self.v2.transition_status(VideoStatus.PROCESSING)
+        self.v2.transition_status(VideoStatus.PUBLISHED)
+        self.v2.visibility = VideoVisibility.PUBLIC
+        self.assertEqual(ids(status=VideoStatus.PUBLISHED, visibility=VideoVisibility.PUBLIC), [self.v2.video_id])
+        self.assertEqual([v.video_id for v in self.repo.find_by_channel("chan1", order_by="published_at")],
+                         [self.v2.video_id])
+        self.assertEqual(self.repo.count_by("status"), {VideoStatus.UPLOADED: 2, VideoStatus.PUBLISHED: 1})
+        self.assertEqual(ids(status=VideoStatus.UPLOADED, date_from=self.v3.created_at), [self.v3.video_id])
+
+        # Aynı ID ile kaydedilen yeni nesne eskisinin yerini alır; eski nesne artık izlenmez
+        replacement = row_to_video(video_to_row(self.v1))
+        self.repo.save(replacement)
+        self.v1.visibility = VideoVisibility.PRIVATE
+        self.assertIn(self.v1.video_id, ids(visibility=VideoVisibility.PUBLIC))
+
+        self.assertTrue(self.repo.delete(self.v3.video_id))
+        self.v3.transition_status(VideoStatus.BLOCKED)
+        self.assertEqual(ids(video_type="ShortVideo"), [])
+        self.assertEqual(ids(status=VideoStatus.BLOCKED), [])
+        self.repo._rebuild_bitmaps()
+        self.assertEqual(ids(visibility=VideoVisibility.PUBLIC), [self.v1.video_id, self.v2.video_id])
+        with self.assertRaises(ValueError):
+            self.repo.count_by("title")
+
+    def test_planner_picks_selective_path_and_keeps_results(self):
+        base_time = datetime(2024, 1, 1)
+        videos = []
+        for i in range(400):
+            video_class = ShortVideo if i % 4 == 0 else StandardVideo
+            video = video_class(f"chan{i % 40}", f"V{i}", "D", 30 + i % 30,
+                                visibility=VideoVisibility.PUBLIC if i % 3 else VideoVisibility.PRIVATE)
+            # Eklenme sırasından farklı oluşturulma zamanları
+            video._created_at = base_time + timedelta(hours=(i * 37) % 400)
+            if i % 2 == 0:
+                video.transition_status(VideoStatus.PROCESSING)
+            if i % 50 == 0:
+                video.transition_status(VideoStatus.BLOCKED)
+            videos.append(self.repo.save(video))
+
+        def plan_of(**conditions):
+            return self.repo.plan(VideoQuery(**conditions)).access_path
+
+        self.assertEqual(plan_of(), "full_scan")
+        self.assertEqual(plan_of(channel_id="chan3", visibility=VideoVisibility.PUBLIC), "channel_range")
+        self.assertEqual(plan_of(status=VideoStatus.BLOCKED), "bitmap")
+        self.assertEqual(plan_of(date_from=base_time, date_to=base_time + timedelta(hours=5),
+                                 visibility=VideoVisibility.PUBLIC), "date_range")
+
+        queries = [
+            {},
+            {"channel_id": "chan3", "visibility": VideoVisibility.PUBLIC},
+            {"status": VideoStatus.BLOCKED},
+            {"status": VideoStatus.PROCESSING, "video_type": "ShortVideo"},
+            {"date_from": base_time + timedelta(hours=100), "date_to": base_time + timedelta(hours=120)},
+            {"date_from": base_time + timedelta(hours=390), "status": VideoStatus.UPLOADED},
+            {"channel_id": "chan7", "date_to": base_time + timedelta(hours=200), "video_type": "StandardVideo"},
+            {"visibility": VideoVisibility.PRIVATE, "min_duration": 50, "title_contains": "v1"},
+            {"channel_id": "missing"},
+        ]
+        for conditions in queries:
+            query = VideoQuery(**conditions)
+            expected = [v for v in videos if all(
+                (field != "status" or v.status == value)
+                and (field != "visibility" or v.visibility == value)
+                and (field != "channel_id" or v.channel_id == value)
+                and (field != "video_type" or v.get_video_type() == value)
+                and (field != "date_from" or v.created_at >= value)
+                and (field != "date_to" or v.created_at <= value)
+                and (field != "min_duration" or v.duration_seconds >= value)
+                and (field != "title_contains" or value.lower() in v.title.lower())
+                for field, value in conditions.items())]
+            # Seçilen yoldan bağımsız olarak sonuçlar eklenme sırasıyla döner
+            self.assertEqual(self.repo.execute(query), expected, conditions)
+
+            report = self.repo.explain(query)
+            self.assertEqual(report["rows_returned"], len(expected))
+            self.assertGreaterEqual(report["rows_examined"], len(expected))
+            self.assertTrue(all(report["cost"] <= alternative["cost"] for alternative in report["alternatives"]))
+
+        report = self.repo.explain(VideoQuery(channel_id="chan3"))
+        self.assertEqual((report["access_path"], report["estimated_rows"], report["rows_examined"]),
+                         ("channel_range", 10, 10))
+        self.assertIn("full_scan", [alternative["access_path"] for alternative in report["alternatives"]])
+
+    def test_title_search_uses_trigram_index_with_exact_semantics(self):
+        titles = ["İstanbul Turu", "istanbul gezisi", "ISTANBUL Boğazı", "Işık ve Gölge", "ışıklı gece",
+                  "Python Dersi", "PYTHON ileri", "Kısa video", "ΟΔΟΣ", "Yol Rehberi"]
+        videos = [self.repo.save(StandardVideo("chan1", title, "D", 100)) for title in titles]
+
+        def search(needle):
+            return [v.title for v in self.repo.execute(VideoQuery(title_contains=needle))]
+
+        # Sonuçlar her zaman `needle.lower() in title.lower()` ile aynıdır
+        needles = ["istanbul", "İstanbul", "STANBUL", "ışık", "IŞIK", "python", "thon d", "οδος", "ΟΔΟ",
+                   "video", "yok", "gece", "py"]
+        for needle in needles:
+            expected = [t for t in titles if needle.lower() in t.lower()]
+            self.assertEqual(search(needle), expected, needle)
+
+        self.assertEqual(self.repo.plan(VideoQuery(title_contains="python")).access_path, "title_trigram")
+        # 3 karakterden kısa sorgularda indeks kullanılamaz
+        self.assertEqual(self.repo.plan(VideoQuery(title_contains="py")).access_path, "full_scan")
+
+        # Yeniden adlandırma, silme ve aynı ID ile yeni nesne kaydı indeksi günceller
+        videos[5].title = "Java Dersi"
+        self.assertEqual(search("python"), ["PYTHON ileri"])
+        self.assertEqual(search("java"), ["Java Dersi"])
+        self.repo.delete(videos[6].video_id)
+        self.assertEqual(search("python"), [])
+        replacement = row_to_video(video_to_row(videos[9]))
+        replacement.title = "Python Rehberi"
+        self.repo.save(replacement)
+        self.assertEqual(search("rehber"), ["Python Rehberi"])
+        self.repo.save(StandardVideo("chan2", "Yeni Python", "D", 100))
+        self.assertEqual(search("python"), ["Python Rehberi", "Yeni Python"])
+
+    def test_tag_index_queries_and_facets(self):
+        v1 = self.repo.save(StandardVideo("chan1", "A", "D", 100, tags=["python", "eğitim"]))
+        v2 = self.repo.save(StandardVideo("chan1", "B", "D", 100, tags=["python", "oyun"]))
+        v3 = self.repo.save(ShortVideo("chan2", "C", "D", 30, tags=["oyun", "python", "oyun"]))
+        v4 = self.repo.save(StandardVideo("chan2", "D", "D", 100))
+
+        def titles(tags, match="all", limit=None):
+            return [v.title for v in self.repo.find_by_tags(tags, match, limit)]
+
+        self.assertEqual(titles(["python"]), ["A", "B", "C"])
+        self.assertEqual(titles(["oyun", "python"]), ["B", "C"])
+        self.assertEqual(titles(["oyun", "eğitim"], match="any"), ["A", "B", "C"])
+        self.assertEqual(titles(["python"], limit=2), ["A", "B"])
+        self.assertEqual(titles(["python", "yok"]), [])
+        self.assertEqual(titles([]), [])
+        self.assertEqual(self.repo.tag_facets("chan2"), [("oyun", 1), ("python", 1)])
+        self.assertEqual(self.repo.tag_facets(), [("python", 3), ("oyun", 2), ("eğitim", 1)])
+        self.assertEqual(self.repo.tag_facets(limit=1), [("python", 3)])
+        self.assertEqual(self.repo.tag_facets("missing"), [])
+
+        # add_tag/remove_tag save beklenmeden indekse yansır
+        v4.add_tag("oyun")
+        v1.remove_tag("python")
+        self.assertEqual(titles(["oyun"]), ["B", "C", "D"])
+        self.assertEqual(titles(["python"]), ["B", "C"])
+        self.assertEqual(self.repo.tag_facets("chan2"), [("oyun", 2), ("python", 1)])
+        self.assertEqual(self.repo.tag_facets("chan1"), [("eğitim", 1), ("oyun", 1), ("python", 1)])
+
+        # Silme ve aynı ID ile farklı kanal/etiketlerle yeni nesne kaydı
+        self.assertTrue(self.repo.delete(v3.video_id))
+        self.assertEqual(titles(["oyun", "python"]), ["B"])
+        replacement = row_to_video(video_to_row(v2))
+        replacement._channel_id = "chan3"
+        replacement.remove_tag("oyun")
+        self.repo.save(replacement)
+        v2.add_tag("müzik")  # artık depoda olmayan nesne izlenmez
+        self.assertEqual(titles(["müzik"]), [])
+        self.assertEqual(self.repo.tag_facets("chan1"), [("eğitim", 1)])
+        self.assertEqual(self.repo.tag_facets("chan3"), [("python", 1)])
+
+        # VideoQuery(tags=...) etiket indeksinden okunur, diğer koşullar adaylar üzerinde kontrol edilir
+        query = VideoQuery(tags=["python"], channel_id="chan3")
+        self.assertEqual(self.repo.execute(query), [replacement])
+        self.assertEqual(self.repo.plan(VideoQuery(tags=["python"])).access_path, "tag_index")
+
+        with self.assertRaises(ValueError):
+            self.repo.find_by_tags(["python"], match="some")
+        with self.assertRaises(ValueError):
+            self.repo.tag_facets(limit=-1)
+
+    def test_tag_queries_stay_ordered_through_many_edits(self):
+        videos = [self.repo.save(StandardVideo(f"chan{i % 2}", f"V{i}", "D", 100, tags=["a"] if i % 2 else ["a", "b"]))
+                  for i in range(300)]
+        # Ortadaki videolardan etiket kaldırma/geri ekleme: sıralı dizideki bayat girdiler ve yeniden yazma
+        for video in videos[50:250]:
+            video.remove_tag("a")
+        for video in videos[100:150]:
+            video.add_tag("a")
+        self.repo.delete(videos[120].video_id)
+        videos[10].add_tag("c")
+        videos[5].add_tag("c")
+
+        for tags, match in ((["a"], "all"), (["a", "b"], "all"), (["b", "c"], "any"), (["c", "a"], "all")):
+            wanted = set(tags)
+            expected = [v for v in self.repo.find_all()
+                        if (wanted.issubset(v.tags) if match == "all" else not wanted.isdisjoint(v.tags))]
+            self.assertEqual(self.repo.find_by_tags(tags, match), expected, tags)
+            self.assertEqual(self.repo.find_by_tags(tags, match, limit=7), expected[:7], tags)
+        self.assertEqual(self.repo.tag_facets("chan1"), [("a", 75), ("c", 1)])
+
+    def test_find_by_channel_time_range(self):
+        base_time = datetime(2024, 1, 1)
+        videos = []
+        for hours in (5, 1, 3, 3, 9):
+            video = StandardVideo("chan1", f"H{hours}", "D", 100)
+            video._created_at = base_time + timedelta(hours=hours)
+            videos.append(video)
+            self.repo.save(video)
+
+        def titles(**query):
+            return [v.title for v in self.repo.find_by_channel("chan1", **query)]
+
+        # Eşit zamanlılar eklenme sırasında kalır
+        self.assertEqual(titles(), ["H1", "H3", "H3", "H5", "H9"])
+        self.assertEqual(titles(newest_first=True, limit=2), ["H9", "H5"])
+        self.assertEqual(titles(since=base_time + timedelta(hours=3), until=base_time + timedelta(hours=5)),
+                         ["H3", "H3", "H5"])
+        self.assertEqual(titles(limit=0), [])
+        self.assertEqual(self.repo.find_by_channel("missing"), [])
+
+        # published_at sırası ayrı tutulur; kayıttan sonra yayınlanan video yeniden kaydedilince eklenir
+        self.assertEqual(titles(order_by="published_at"), [])
+        videos[4]._published_at = base_time + timedelta(days=1)
+        videos[1]._published_at = base_time + timedelta(days=2)
+        self.repo.save(videos[4])
+        self.repo.save(videos[1])
+        self.assertEqual(titles(order_by="published_at"), ["H9", "H1"])
+        self.assertEqual(titles(order_by="published_at", since=base_time + timedelta(days=2)), ["H1"])
+
+        self.assertTrue(self.repo.delete(videos[1].video_id))
+        self.assertEqual(titles(), ["H3", "H3", "H5", "H9"])
+        self.assertEqual(titles(order_by="published_at"), ["H9"])
+        # Kanal değişikliği indeksi de taşır
+        videos[0]._channel_id = "chan2"
+        self.repo.save(videos[0])
+        self.assertEqual(titles(), ["H3", "H3", "H9"])
+        self.assertEqual([v.title for v in self.repo.find_by_channel("chan2")], ["H5"])
+
+        with self.assertRaises(ValueError):
+            self.repo.find_by_channel("chan1", order_by="title")
+        with self.assertRaises(ValueError):
+            self.repo.find_by_channel("chan1", limit=-1)
+
+
+class TestPersistentVideoRepository(unittest.TestCase):
+    """Kalıcı (append-log) video deposu testleri."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "videos.jsonl")
+        self.repo = PersistentVideoRepository(self.data_file)
+
+    def tearDown(self):
+        self.repo.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def reopen(self, **kwargs):
+        self.repo.close()
+        self.repo = PersistentVideoRepository(self.data_file, **kwargs)
+        return self.repo
+
+    def test_round_trip_all_types(self):
+        standard = StandardVideo("chan1", "Standard", "Desc", 700, resolution="4K", has_subtitles=True,
+                                 tags=["python"])
+        standard.transition_status(VideoStatus.PROCESSING)
+        standard.transition_status(VideoStatus.PUBLISHED)
+        standard._view_count = 42
+        short = ShortVideo("chan1", "Short", "Desc", 20, music_track_id="track-1", filter_used="sepia")
+        live = LiveStreamVideo("chan2", "Live", "Desc", scheduled_start_time=datetime(2030, 1, 2, 3, 4, 5),
+                               chat_enabled=False)
+        live.start_stream()
+        live.max_concurrent_viewers = 1500
+        for video in (standard, short, live):
+            self.repo.save(video)
+
+        repo = self.reopen()
+        self.assertEqual(repo.count(), 3)
+        for original in (standard, short, live):
+            loaded = repo.get_by_id(original.video_id)
+            self.assertIs(type(loaded), type(original))
+            self.assertEqual(loaded.__dict__.keys(), original.__dict__.keys())
+            for key, value in original.__dict__.items():
+                # Dinleyiciler kalıcı değildir: her nesne kendi deposunun indeksine bağlıdır
+                if key not in ("metadata", "_listeners"):
+                    self.assertEqual(getattr(loaded, key), value, key)
+        self.assertEqual(repo.get_by_id(standard.video_id).metadata.resolution, "4K")
+        self.assertEqual([v.video_id for v in repo.find_by_channel("chan1")], [standard.video_id, short.video_id])
+        self.assertEqual(len(repo.filter_videos(status=VideoStatus.PUBLISHED)), 2)
+
+    def test_updates_and_deletes_are_incremental(self):
+        v1 = StandardVideo("chan1", "V1", "D1", 100)
+        v2 = StandardVideo("chan1", "V2", "D2", 100)
+        self.repo.save(v1)
+        self.repo.save(v2)
+        size_before = os.path.getsize(self.data_file)
+
+        v1.title = "V1 updated"
+        self.repo.save(v1)
+        self.repo.delete(v2.video_id)
+        with open(self.data_file, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 4)
+        self.assertGreater(os.path.getsize(self.data_file), size_before)
+
+        repo = self.reopen()
+        self.assertEqual(repo.get_by_id(v1.video_id).title, "V1 updated")
+        self.assertFalse(repo.exists(v2.video_id))
+        self.assertEqual(repo.find_by_channel("chan1"), [repo.get_by_id(v1.video_id)])
+
+    def test_compaction_and_torn_tail(self):
+        repo = self.reopen(compact_min_entries=3, compact_ratio=1.0)
+        video = ShortVideo("chan1", "S", "D", 10)
+        for i in range(6):
+            video.title = f"S{i}"
+            repo.save(video)
+        with open(self.data_file, encoding="utf-8") as f:
+            self.assertLessEqual(len(f.readlines()), 3)
+
+        # Çökme sırasında yarım yazılmış satır yüklemede atılmalı
+        with open(self.data_file, "a", encoding="utf-8") as f:
+            f.write('["put", "abc')
+        repo = self.reopen()
+        self.assertEqual(repo.get_by_id(video.video_id).title, "S5")
+        repo.save(StandardVideo("chan2", "After", "D", 10))
+        self.assertEqual(self.reopen().count(), 2)
+
+    def test_channel_timeline_rebuilt_on_reload(self):
+        memory = VideoRepository()
+        queries = save_channel_timeline(memory, self.repo)
+        repo = self.reopen()
+        for query in queries:
+            expected = [v.video_id for v in memory.find_by_channel("chan1", **query)]
+            self.assertEqual([v.video_id for v in repo.find_by_channel("chan1", **query)], expected, query)
+
+    def test_tag_index_rebuilt_on_reload(self):
+        memory = VideoRepository()
+        queries = save_tagged_videos(memory, self.repo)
+        repo = self.reopen()
+        for tags, match, limit in queries:
+            expected = [v.video_id for v in memory.find_by_tags(tags, match, limit)]
+            self.assertEqual([v.video_id for v in repo.find_by_tags(tags, match, limit)], expected,
+                             (tags, match, limit))
+        self.assertEqual(repo.tag_facets("chan1"), memory.tag_facets("chan1"))
+
+
+class TestSqliteVideoRepository(unittest.TestCase):
+    """SQLite (WAL) video deposu testleri."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_file = os.path.join(self.temp_dir, "videos.db")
+        self.repo = SqliteVideoRepository(self.db_file)
+
+    def tearDown(self):
+        self.repo.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_crud_and_reopen(self):
+        video = StandardVideo("chan1", "Title", "Desc", 700, tags=["python"])
+        self.repo.save(video)
+        video.title = "Updated"
+        self.repo.save(video)
+        self.repo.save(ShortVideo("chan2", "Short", "Desc", 20))
+        self.assertEqual(self.repo.count(), 2)
+        self.assertTrue(self.repo.delete(self.repo.find_by_channel("chan2")[0].video_id))
+        self.assertFalse(self.repo.delete("missing"))
+
+        self.repo.close()
+        self.repo = SqliteVideoRepository(self.db_file)
+        loaded = self.repo.get_by_id(video.video_id)
+        self.assertIs(type(loaded), StandardVideo)
+        self.assertEqual(loaded.title, "Updated")
+        self.assertEqual(loaded.created_at, video.created_at)
+        self.assertEqual(self.repo.count(), 1)
+        with self.assertRaises(VideoNotFoundError):
+            self.repo.get_by_id("missing")
+
+    def test_filter_matches_in_memory_repository(self):
+        memory = VideoRepository()
+        base_time = datetime(2024, 1, 1)
+        videos = []
+        for i in range(60):
+            video = StandardVideo(f"chan{i % 3}", f"V{i}", "D", 100,
+                                  visibility=VideoVisibility.PUBLIC if i % 2 else VideoVisibility.PRIVATE)
+            video._created_at = base_time + timedelta(hours=i)
+            if i % 4 == 0:
+                video.transition_status(VideoStatus.PROCESSING)
+            videos.append(video)
+            memory.save(video)
+        self.assertEqual(self.repo.save_many(videos), 60)
+
+        queries = [
+            {},
+            {"channel_id": "chan1"},
+            {"status": VideoStatus.PROCESSING, "visibility": VideoVisibility.PRIVATE},
+            {"channel_id": "chan2", "date_from": base_time + timedelta(hours=10),
+             "date_to": base_time + timedelta(hours=40)},
+            {"date_from": base_time + timedelta(hours=59)},
+            {"video_type": "StandardVideo", "status": VideoStatus.PROCESSING},
+        ]
+        for query in queries:
+            expected = [v.video_id for v in memory.filter_videos(**query)]
+            self.assertEqual([v.video_id for v in self.repo.filter_videos(**query)], expected, query)
+
+        search = VideoQuery(channel_id="chan1", title_contains="v1", min_duration=100)
+        self.assertEqual([v.video_id for v in self.repo.execute(search)],
+                         [v.video_id for v in memory.execute(search)])
+        self.assertEqual(self.repo.explain(search)["access_path"], "sql")
+
+    def test_find_by_channel_matches_in_memory_repository(self):
+        memory = VideoRepository()
+        queries = save_channel_timeline(memory, self.repo)
+        for query in queries:
+            for channel_id in ("chan0", "chan1"):
+                expected = [v.video_id for v in memory.find_by_channel(channel_id, **query)]
+                self.assertEqual([v.video_id for v in self.repo.find_by_channel(channel_id, **query)],
+                                 expected, query)
+
+    def test_count_by_matches_in_memory_repository(self):
+        memory = VideoRepository()
+        videos = []
+        for i in range(30):
+            video_class = ShortVideo if i % 3 == 0 else StandardVideo
+            video = video_class(f"chan{i % 2}", f"V{i}", "D", 30,
+                                visibility=VideoVisibility.PUBLIC if i % 2 else VideoVisibility.PRIVATE)
+            if i % 4 == 0:
+                video.transition_status(VideoStatus.PROCESSING)
+            videos.append(video)
+            memory.save(video)
+            self.repo.save(video)
+        videos[1].transition_status(VideoStatus.PROCESSING)
+        for repo in (memory, self.repo):
+            repo.save(videos[1])
+            repo.delete(videos[3].video_id)
+
+        for field in ("status", "visibility", "video_type"):
+            self.assertEqual(self.repo.count_by(field), memory.count_by(field), field)
+        with self.assertRaises(ValueError):
+            self.repo.count_by("title")
+
+    def test_tag_queries_match_in_memory_repository(self):
+        memory = VideoRepository()
+        queries = save_tagged_videos(memory, self.repo)
+        for tags, match, limit in queries:
+            expected = [v.video_id for v in memory.find_by_tags(tags, match, limit)]
+            self.assertEqual([v.video_id for v in self.repo.find_by_tags(tags, match, limit)], expected,
+                             (tags, match, limit))
+        for channel_id in (None, "chan0", "chan2", "missing"):
+            self.assertEqual(self.repo.tag_facets(channel_id), memory.tag_facets(channel_id), channel_id)
+        self.assertEqual(self.repo.tag_facets(limit=2), memory.tag_facets(limit=2))
+        query = VideoQuery(tags=["python", "müzik"], channel_id="chan1")
+        self.assertEqual([v.video_id for v in self.repo.execute(query)],
+                         [v.video_id for v in memory.execute(query)])
+
+    def test_concurrent_readers_and_writer(self):
+        video = StandardVideo("chan1", "V0", "D", 100)
+        self.repo.save(video)
+        errors = []
+
+        def reader():
+            try:
+                for _ in range(200):
+                    self.assertIsNotNone(self.repo.find_by_id(video.video_id))
+                    self.repo.filter_videos(channel_id="chan1")
+            except Exception as e:
+                errors.append(e)
+
+        def writer():
+            try:
+                for i in range(100):
+                    self.repo.save(StandardVideo("chan1", f"W{i}", "D", 100))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)] + [threading.Thread(target=writer)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.repo.count(), 101)
+
+
+class TestMmapVideoRepository(unittest.TestCase):
+    """Bellek eşlemeli (mmap) video kataloğu testleri."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.base_path = os.path.join(self.temp_dir, "videos")
+        self.repo = MmapVideoRepository(self.base_path, initial_capacity=16)
+
+    def tearDown(self):
+        self.repo.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def reopen(self):
+        self.repo.close()
+        self.repo = MmapVideoRepository(self.base_path)
+        return self.repo
+
+    def test_round_trip_grow_and_delete(self):
+        videos = [StandardVideo(f"chan{i % 4}", f"V{i}", "D", 100 + i, tags=["t"]) for i in range(100)]
+        for video in videos:
+            self.repo.save(video)
+        live = LiveStreamVideo("chan9", "Live", "D", scheduled_start_time=datetime(2030, 1, 2, 3, 4, 5))
+        live.start_stream()
+        self.repo.save(live)
+        videos[5].title = "Updated"
+        videos[5].transition_status(VideoStatus.PROCESSING)
+        self.repo.save(videos[5])
+        self.assertTrue(self.repo.delete(videos[6].video_id))
+        self.assertFalse(self.repo.delete(videos[6].video_id))
+
+        repo = self.reopen()
+        self.assertEqual(repo.count(), 100)
+        self.assertIsNone(repo.find_by_id(videos[6].video_id))
+        loaded = repo.get_by_id(videos[5].video_id)
+        self.assertEqual((loaded.title, loaded.status, loaded.created_at),
+                         ("Updated", VideoStatus.PROCESSING, videos[5].created_at))
+        loaded_live = repo.get_by_id(live.video_id)
+        self.assertIs(type(loaded_live), LiveStreamVideo)
+        self.assertEqual(loaded_live.published_at, live.published_at)
+        self.assertEqual(loaded_live.scheduled_start_time, live.scheduled_start_time)
+        self.assertEqual([v.video_id for v in repo.find_all()],
+                         [v.video_id for v in videos if v is not videos[6]] + [live.video_id])
+
+    def test_filter_matches_in_memory_repository(self):
+        memory = VideoRepository()
+        base_time = datetime(2024, 1, 1)
+        for i in range(300):
+            # 256'dan fazla kanal: kanal sıra numarasının birden fazla byte'ı karşılaştırılır
+            video = ShortVideo(f"chan{i % 260}", f"S{i}", "D", 30,
+                               visibility=VideoVisibility.PUBLIC if i % 3 else VideoVisibility.UNLISTED)
+            video._created_at = base_time + timedelta(hours=i)
+            if i % 4 == 0:
+                video.transition_status(VideoStatus.PROCESSING)
+            memory.save(video)
+            self.repo.save(video)
+
+        queries = [
+            {"channel_id": "chan1"},
+            {"channel_id": "chan257"},
+            {"channel_id": "missing"},
+            {"status": VideoStatus.PROCESSING, "visibility": VideoVisibility.UNLISTED},
+            {"date_from": base_time + timedelta(hours=10), "date_to": base_time + timedelta(hours=40),
+             "visibility": VideoVisibility.PUBLIC},
+            {"video_type": "ShortVideo", "visibility": VideoVisibility.UNLISTED},
+            {"video_type": "StandardVideo"},
+        ]
+        for query in queries:
+            expected = [v.video_id for v in memory.filter_videos(**query)]
+            self.assertEqual([v.video_id for v in self.repo.filter_videos(**query)], expected, query)
+
+    def test_find_by_channel_matches_in_memory_repository(self):
+        memory = VideoRepository()
+        queries = save_channel_timeline(memory, self.repo)
+        for query in queries:
+            for channel_id in ("chan0", "chan1"):
+                expected = [v.video_id for v in memory.find_by_channel(channel_id, **query)]
+                self.assertEqual([v.video_id for v in self.repo.find_by_channel(channel_id, **query)],
+                                 expected, query)
+
+    def test_count_by_matches_in_memory_repository(self):
+        memory = VideoRepository()
+        videos = []
+        for i in range(30):
+            video_class = ShortVideo if i % 3 == 0 else StandardVideo
+            video = video_class(f"chan{i % 2}", f"V{i}", "D", 30,
+                                visibility=VideoVisibility.PUBLIC if i % 2 else VideoVisibility.PRIVATE)
+            if i % 4 == 0:
+                video.transition_status(VideoStatus.PROCESSING)
+            videos.append(video)
+            memory.save(video)
+            self.repo.save(video)
+        videos[1].transition_status(VideoStatus.PROCESSING)
+        for repo in (memory, self.repo):
+            repo.save(videos[1])
+            repo.delete(videos[3].video_id)
+
+        for field in ("status", "visibility", "video_type"):
+            self.assertEqual(self.repo.count_by(field), memory.count_by(field), field)
+        with self.assertRaises(ValueError):
+            self.repo.count_by("title")
+
+    def test_tag_queries_match_in_memory_repository(self):
+        memory = VideoRepository()
+        queries = save_tagged_videos(memory, self.repo)
+        for tags, match, limit in queries:
+            expected = [v.video_id for v in memory.find_by_tags(tags, match, limit)]
+            self.assertEqual([v.video_id for v in self.repo.find_by_tags(tags, match, limit)], expected,
+                             (tags, match, limit))
+        for channel_id in (None, "chan0", "chan2", "missing"):
+            self.assertEqual(self.repo.tag_facets(channel_id), memory.tag_facets(channel_id), channel_id)
+        self.assertEqual(self.repo.tag_facets(limit=2), memory.tag_facets(limit=2))
+        query = VideoQuery(tags=["python", "müzik"], channel_id="chan1")
+        self.assertEqual([v.video_id for v in self.repo.execute(query)],
+                         [v.video_id for v in memory.execute(query)])
+
+
+class TestVideoSearchEngine(unittest.TestCase):
+    """BM25 tam metin arama motoru testleri."""
+
+    def setUp(self):
+        self.repo = VideoRepository()
+        self.videos = [
+            StandardVideo("c1", "Işık ve Gölge", "Fotoğrafçılık dersi", 600, visibility=VideoVisibility.PUBLIC),
+            StandardVideo("c1", "Python dersi", "Işık hızında kod yazmak", 1200, visibility=VideoVisibility.PUBLIC,
+                          tags=["python", "programlama"]),
+            StandardVideo("c2", "Gece manzarası", "İstanbul ışıkları", 300, tags=["ışık"]),
+            ShortVideo("c2", "Kısa ipucu", "Python list comprehension", 30, visibility=VideoVisibility.PUBLIC),
+            StandardVideo("c3", "Yemek tarifi", "Mercimek çorbası", 900, visibility=VideoVisibility.PUBLIC),
+        ]
+        for video in self.videos:
+            self.repo.save(video)
+        self.engine = VideoSearchEngine(self.repo)
+
+    def titles(self, text, **kwargs):
+        return [video.title for video, _ in self.engine.search(text, **kwargs)]
+
+    def test_ranking_and_turkish_folding(self):
+        # Başlık eşleşmesi açıklama/etiket eşleşmesinden önce gelir; IŞIK/ışık/ışıkları aynı kök değildir
+        self.assertEqual(self.titles("IŞIK"), ["Işık ve Gölge", "Gece manzarası", "Python dersi"])
+        self.assertEqual(self.titles("python")[0], "Python dersi")
+        self.assertEqual(set(self.titles("istanbul")), {"Gece manzarası"})
+        self.assertEqual(self.titles("bulunmayan"), [])
+        self.assertEqual(self.titles("python", limit=0), [])
+
+    def test_top_k_matches_exhaustive_ranking(self):
+        words = ["alfa", "beta", "gama", "delta", "epsilon", "zeta"]
+        # Posting listeleri birden fazla bloğa yayılır; erken durma sonrası blok atlama da denenir
+        for i in range(1500):
+            title = " ".join(words[(i * j) % len(words)] for j in range(1, 2 + i % 4))
+            self.repo.save(StandardVideo(f"c{i % 7}", title, " ".join(words[:i % 6]), 100 + i))
+        for text in ("alfa", "beta gama", "delta zeta alfa", "epsilon beta"):
+            everything = self.engine.search(text, limit=10000)
+            for limit in (1, 3, 10):
+                top = self.engine.search(text, limit=limit)
+                self.assertEqual([round(score, 9) for _, score in top],
+                                 [round(score, 9) for _, score in everything[:limit]], (text, limit))
+
+    def test_block_lookup_matches_full_decode(self):
+        term = _Term()
+        postings = [(doc, doc % 5 + 1) for doc in range(0, 1000, 3)]
+        for doc, tf in postings:
+            term.append(doc, tf)
+        # İlk doküman, blok sınırları, listede olmayanlar ve son dokümandan büyükler
+        docs = [0, 1, 127 * 3, 128 * 3, 129 * 3, 500, 999, 1200, 5000]
+        expected = [(doc, tf) for doc, tf in postings if doc in docs]
+        self.assertEqual(list(term.lookup(docs)), expected)
+        self.assertEqual(list(term.lookup([])), [])
+
+    def test_filters_and_incremental_updates(self):
+        public = VideoQuery(visibility=VideoVisibility.PUBLIC)
+        self.assertEqual(self.titles("ışık", filters=public), ["Işık ve Gölge", "Python dersi"])
+        self.assertEqual(self.titles("python", filters=VideoQuery(min_duration=60)), ["Python dersi"])
+
+        self.videos[4].description = "Python ile yemek tarifi"
+        self.assertNotIn("Yemek tarifi", self.titles("python"))  # save edilene kadar eski içerik
+        self.repo.save(self.videos[4])
+        self.assertIn("Yemek tarifi", self.titles("python"))
+
+        self.repo.delete(self.videos[1].video_id)
+        self.assertNotIn("Python dersi", self.titles("python"))
+        self.engine._compact()
+        self.assertEqual(self.titles("programlama"), [])
+        self.assertEqual(len(self.engine), 4)
+
+        self.repo.clear()
+        self.assertEqual(self.titles("ışık"), [])
+        self.engine.close()
+        self.repo.save(self.videos[0])
+        self.assertEqual(self.titles("ışık"), [])
+
+    def test_works_with_sqlite_repository(self):
+        temp_dir = tempfile.mkdtemp()
+        repo = SqliteVideoRepository(os.path.join(temp_dir, "videos.db"))
+        try:
+            repo.save_many(self.videos)
+            engine = VideoSearchEngine(repo)
+            repo.save(StandardVideo("c4", "Işık ayarları", "Kamera", 100))
+            self.assertEqual({video.title for video, _ in engine.search("ışık", limit=2)},
+                             {"Işık ve Gölge", "Işık ayarları"})
+        finally:
+            repo.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
 
 class TestVideoService(unittest.TestCase):
     """Service katmanı iş mantığı testleri."""
@@ -237,6 +977,12 @@ class TestVideoService(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].title, "Python Tutorial")
 
+        ranked = self.service.search_videos_ranked("tutorial python")
+        self.assertEqual([video.title for video in ranked], ["Python Tutorial", "Java Tutorial"])
+
+        report = self.service.explain_search(query="tutorial", min_duration=600)
+        self.assertEqual((report["access_path"], report["rows_returned"]), ("full_scan", 2))
+
     def test_bulk_upload_simulation(self):
         """Toplu yükleme metodunu test eder."""
         uploads = [